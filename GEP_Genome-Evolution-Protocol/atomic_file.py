@@ -0,0 +1,41 @@
+"""
+atomic_file.py — GEP Critic v3
+Single responsibility: move a finished temp file over its target without
+changing the target's permissions.
+
+Design:
+    - tempfile.mkstemp creates files 0600. Renaming one over a 0644 genome
+      or state file would leave it owner-only, so the temp file first gets
+      the target's current mode, or 0666 minus the umask when the target
+      is new (what open(path, "w") would have produced).
+    - The umask is read once at import: reading it means setting it, which
+      is not safe while other threads create files.
+
+Usage:
+    from atomic_file import replace_file
+
+    fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        f.write(text)
+    replace_file(tmp, path)
+"""
+
+import os
+import stat
+
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def file_mode(path) -> int:
+    """Permission bits path has now, or those a newly created file would get."""
+    try:
+        return stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        return 0o666 & ~_UMASK
+
+
+def replace_file(tmp, path) -> None:
+    """os.replace(tmp, path), keeping path's permissions."""
+    os.chmod(tmp, file_mode(path))
+    os.replace(tmp, path)
@@ -1,16 +1,39 @@
 """
 audit.py — GEP Critic v3
 Single responsibility: read and write the JSONL audit log.
+
+Each log has a SQLite sidecar index (<log>.jsonl.idx) with one row per record:
+id:phase → byte offset, date, action, verdict, asset_id. append_record keeps it
+current; resume and dedup checks read it instead of re-decoding every
+raw_response / phase1_raw blob. The index catches up on lines appended
+without it and rebuilds itself when missing, corrupt or stale (log truncated
+or rewritten). The JSONL file stays the source of truth.
+
+Blob mode (GEP_AUDIT_BLOBS=1, or append_record(..., blobs=True)) moves
+raw_response / phase1_raw into blob_store and keeps only their keys in the
+row (raw_response_blob / phase1_raw_blob). asset_id is computed over the
+full text either way. Read raw text through load_raw(row, field), which
+loads a blob only when asked.
+
+Bulk writers (collect_batch) use AuditWriter: one buffered handle, periodic
+flush + fsync, index rows inserted per flush instead of per record.
 """
 
 import hashlib
 import json
+import os
+import sqlite3
+import time
 from datetime import datetime, timezone
 from pathlib import Path
 
+from blob_store import get_blob, put_blob
 from models import AuditRecord, ReaderReaction
 import paths as _paths
 
+BLOB_FIELDS = ("raw_response", "phase1_raw")
+BLOB_MODE = os.environ.get("GEP_AUDIT_BLOBS", "") == "1"
+
 
 def audit_path(lang: str, version: str, year: int, role: str = "default") -> Path:
     _paths.ensure_dirs()
@@ -30,22 +53,197 @@ def _split_thinking(raw: str | None) -> tuple[str | None, str | None]:
     return None, raw.strip()
 
 
-def load_reviewed_dates(log_path: Path) -> set[str]:
-    reviewed = set()
-    if not log_path.exists():
-        return reviewed
-    with open(log_path, encoding="utf-8") as f:
+# ── Sidecar index ────────────────────────────────────────────────────────────
+
+_INDEX_SCHEMA = 1
+_HEAD_BYTES = 4096  # log prefix hashed to detect a rewritten file
+
+
+def index_path(log_path: Path) -> Path:
+    return log_path.with_name(log_path.name + ".idx")
+
+
+def _head_hash(log_path: Path, length: int) -> str:
+    with open(log_path, "rb") as f:
+        return hashlib.sha256(f.read(length)).hexdigest()
+
+
+def _index_row(rec: dict, offset: int) -> tuple:
+    return (
+        f"{rec['id']}:{rec.get('phase', 0)}",
+        offset,
+        rec.get("date"),
+        rec.get("action"),
+        rec.get("verdict"),
+        rec.get("asset_id"),
+    )
+
+
+def _create_index(conn: sqlite3.Connection) -> None:
+    conn.executescript(
+        """
+        DROP TABLE IF EXISTS meta;
+        DROP TABLE IF EXISTS records;
+        CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT);
+        CREATE TABLE records (
+            key TEXT NOT NULL,
+            offset INTEGER NOT NULL,
+            date TEXT,
+            action TEXT,
+            verdict TEXT,
+            asset_id TEXT
+        );
+        CREATE INDEX records_key ON records (key);
+        """
+    )
+    conn.executemany(
+        "INSERT INTO meta VALUES (?, ?)",
+        [
+            ("schema", str(_INDEX_SCHEMA)),
+            ("size", "0"),
+            ("head", ""),
+            ("head_len", "0"),
+        ],
+    )
+
+
+def _meta(conn: sqlite3.Connection) -> dict[str, str]:
+    return dict(conn.execute("SELECT key, value FROM meta"))
+
+
+def _index_from(conn: sqlite3.Connection, log_path: Path, start: int) -> None:
+    """Index complete lines from byte offset `start` to the end of the log."""
+    size = start
+    rows = []
+    with open(log_path, "rb") as f:
+        f.seek(start)
         for line in f:
-            line = line.strip()
-            if not line:
-                continue
+            if not line.endswith(b"\n"):
+                break  # partial trailing line — picked up once it's complete
+            offset, size = size, size + len(line)
             try:
-                rec = json.loads(line)
-                if rec.get("action") in ("reviewed", "flagged"):
-                    reviewed.add(rec["date"])
-            except (json.JSONDecodeError, KeyError):
+                rows.append(_index_row(json.loads(line), offset))
+            except (json.JSONDecodeError, KeyError, TypeError, AttributeError):
                 pass
-    return reviewed
+    conn.executemany("INSERT INTO records VALUES (?, ?, ?, ?, ?, ?)", rows)
+    head_len = min(size, _HEAD_BYTES)
+    conn.executemany(
+        "UPDATE meta SET value = ? WHERE key = ?",
+        [
+            (str(size), "size"),
+            (_head_hash(log_path, head_len), "head"),
+            (str(head_len), "head_len"),
+        ],
+    )
+
+
+def _open_index(log_path: Path) -> sqlite3.Connection:
+    """Index connection, synced with the log (caught up or rebuilt as needed)."""
+    idx = index_path(log_path)
+    conn = sqlite3.connect(idx)
+    try:
+        meta = _meta(conn)
+    except sqlite3.DatabaseError:  # new, corrupt or foreign file
+        conn.close()
+        idx.unlink(missing_ok=True)
+        conn = sqlite3.connect(idx)
+        meta = {}
+
+    log_size = log_path.stat().st_size if log_path.exists() else 0
+    indexed = int(meta.get("size", -1))
+    if (
+        meta.get("schema") != str(_INDEX_SCHEMA)
+        or indexed > log_size
+        or meta.get("head")
+        != _head_hash(log_path, int(meta.get("head_len", _HEAD_BYTES)))
+    ):
+        with conn:
+            _create_index(conn)
+        indexed = 0
+    if indexed < log_size:
+        with conn:
+            _index_from(conn, log_path, indexed)
+    return conn
+
+
+def _update_index(log_path: Path, row: dict, offset: int, end: int) -> None:
+    """Add the record just appended at `offset`; resync if the index lagged."""
+    _update_index_many(log_path, [(row, offset)], offset, end)
+
+
+def _update_index_many(
+    log_path: Path, rows: list[tuple[dict, int]], start: int, end: int
+) -> None:
+    """Add records appended between byte offsets start and end in one transaction."""
+    try:
+        conn = sqlite3.connect(index_path(log_path))
+        try:
+            if _meta(conn).get("size") == str(start):
+                with conn:
+                    conn.executemany(
+                        "INSERT INTO records VALUES (?, ?, ?, ?, ?, ?)",
+                        [_index_row(row, offset) for row, offset in rows],
+                    )
+                    conn.execute(
+                        "UPDATE meta SET value = ? WHERE key = 'size'", (str(end),)
+                    )
+                return
+        except sqlite3.DatabaseError:
+            pass
+        finally:
+            conn.close()
+        _open_index(log_path).close()
+    except (sqlite3.Error, OSError) as e:
+        # Log lines are written; the index resyncs on next open
+        print(f"  ⚠️  Audit index not updated ({e})")
+
+
+def load_index(log_path: Path) -> dict[str, dict]:
+    """
+    {"id:phase": {offset, date, action, verdict, asset_id}} for the latest
+    record of each id:phase. Reads the sidecar index, not the log bodies.
+    """
+    if not log_path.exists():
+        return {}
+    conn = _open_index(log_path)
+    try:
+        rows = conn.execute(
+            "SELECT key, offset, date, action, verdict, asset_id "
+            "FROM records ORDER BY offset"
+        ).fetchall()
+    finally:
+        conn.close()
+    return {
+        key: {
+            "offset": offset,
+            "date": date,
+            "action": action,
+            "verdict": verdict,
+            "asset_id": asset_id,
+        }
+        for key, offset, date, action, verdict, asset_id in rows
+    }
+
+
+def read_record(log_path: Path, offset: int) -> dict:
+    """Full audit row at a byte offset taken from the index."""
+    with open(log_path, "rb") as f:
+        f.seek(offset)
+        return json.loads(f.readline())
+
+
+def load_reviewed_dates(log_path: Path) -> set[str]:
+    if not log_path.exists():
+        return set()
+    conn = _open_index(log_path)
+    try:
+        rows = conn.execute(
+            "SELECT DISTINCT date FROM records "
+            "WHERE action IN ('reviewed', 'flagged') AND date IS NOT NULL"
+        ).fetchall()
+    finally:
+        conn.close()
+    return {date for (date,) in rows}
 
 
 def compute_asset_id(record: dict) -> str:
@@ -55,7 +253,16 @@ def compute_asset_id(record: dict) -> str:
     return "sha256:" + hashlib.sha256(canonical.encode()).hexdigest()
 
 
-def append_record(log_path: Path, record: AuditRecord):
+def load_raw(row: dict, field: str = "raw_response") -> str | None:
+    """Raw model text of an audit row — inline, or loaded from its blob."""
+    if row.get(field) is not None:
+        return row[field]
+    key = row.get(f"{field}_blob")
+    return get_blob(key) if key else None
+
+
+def _row(record: AuditRecord, blobs: bool | None) -> dict:
+    """Audit row for a record, asset_id included, raw text moved to blobs if asked."""
     row = {
         "date": record.date,
         "id": record.id,
@@ -78,10 +285,87 @@ def append_record(log_path: Path, record: AuditRecord):
         "phase1_raw": record.phase1_raw,
     }
     row["asset_id"] = compute_asset_id(row)
+    use_blobs = BLOB_MODE if blobs is None else blobs
+    if use_blobs:
+        for field in BLOB_FIELDS:
+            if row[field]:
+                row[f"{field}_blob"] = put_blob(row[field])
+                row[field] = None
     row["suggested_reflexion"] = record.suggested_reflexion
     row["suggested_oracion"] = record.suggested_oracion
-    with open(log_path, "a", encoding="utf-8") as f:
-        f.write(json.dumps(row, ensure_ascii=False) + "\n")
+    return row
+
+
+def append_record(log_path: Path, record: AuditRecord, blobs: bool | None = None):
+    """Append one row. blobs=None follows GEP_AUDIT_BLOBS (see module docstring)."""
+    row = _row(record, blobs)
+    line = (json.dumps(row, ensure_ascii=False) + "\n").encode("utf-8")
+    with open(log_path, "ab") as f:
+        offset = f.tell()
+        f.write(line)
+    _update_index(log_path, row, offset, offset + len(line))
+
+
+class AuditWriter:
+    """
+    Single buffered writer for bulk appends (collect_batch).
+    One open handle for the whole run; every flush_every rows or
+    flush_interval_s seconds — and on close — the buffer is flushed and
+    fsynced, then the sidecar index gets those rows in one transaction.
+    Rows and index match what append_record would have written.
+    """
+
+    def __init__(
+        self,
+        log_path: Path,
+        blobs: bool | None = None,
+        flush_every: int = 500,
+        flush_interval_s: float = 2.0,
+    ):
+        self.log_path = Path(log_path)
+        self.blobs = blobs
+        self.flush_every = flush_every
+        self.flush_interval_s = flush_interval_s
+        self._f = open(self.log_path, "ab", buffering=1024 * 1024)
+        self._start = self._f.tell()  # first byte not yet indexed
+        self._pending: list[tuple[dict, int]] = []
+        self._last_flush = time.monotonic()
+
+    def append(self, record: AuditRecord) -> None:
+        row = _row(record, self.blobs)
+        line = (json.dumps(row, ensure_ascii=False) + "\n").encode("utf-8")
+        self._pending.append((row, self._f.tell()))
+        self._f.write(line)
+        if (
+            len(self._pending) >= self.flush_every
+            or time.monotonic() - self._last_flush >= self.flush_interval_s
+        ):
+            self.flush()
+
+    def flush(self) -> None:
+        """Make buffered rows durable (flush + fsync), then index them."""
+        self._f.flush()
+        os.fsync(self._f.fileno())
+        self._last_flush = time.monotonic()
+        if self._pending:
+            end = self._f.tell()
+            _update_index_many(self.log_path, self._pending, self._start, end)
+            self._pending = []
+            self._start = end
+
+    def close(self) -> None:
+        if self._f.closed:
+            return
+        try:
+            self.flush()
+        finally:
+            self._f.close()
+
+    def __enter__(self) -> "AuditWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
 
 
 def build_record(
@@ -9,8 +9,13 @@ Public API:
     client = BatchClient("dashscope_batch_phase1")
     file_id  = client.upload(Path("batch_input.jsonl"))
     batch_id = client.submit(file_id)
-    out_fid  = client.poll(batch_id)
-    path     = client.download(out_fid, Path("results.jsonl"))
+    out_fid  = client.poll(batch_id)              # blocks until done
+    out_fid  = client.check(batch_id)             # one status check, None while running
+    path     = client.download(out_fid, Path("results.jsonl"))  # resumable
+
+Transfers stream in CHUNK_BYTES blocks: uploads read the JSONL from disk,
+downloads write through <dest>.part, resume with HTTP Range after a dropped
+connection and are verified against the file size and any digest header.
 
 Properties:
     client.model        → model name from providers.yml
@@ -19,15 +24,22 @@ Properties:
 
 from __future__ import annotations
 
+import base64
+import hashlib
+import http.client
 import json
 import os
 import time
 import urllib.error
 import urllib.request
+from collections.abc import Iterator
 from pathlib import Path
 
 from cloud_client import _load_config  # single config source of truth
 
+CHUNK_BYTES = 1024 * 1024  # upload / download streaming block
+TRANSFER_RETRIES = 3  # reconnects per upload / download before giving up
+
 
 # ── Exceptions ────────────────────────────────────────────────────────────────
 
@@ -63,6 +75,72 @@ def _api_key(provider: dict) -> str:
     return key
 
 
+_TERMINAL = {"completed", "failed", "expired", "cancelled"}
+
+
+def _output_file_id(batch: dict) -> str | None:
+    """
+    output_file_id of a completed batch object, None while it is still running.
+    Raises BatchAPIError on failed/expired/cancelled.
+    """
+    status = batch.get("status", "unknown")
+    if status == "completed":
+        fid = batch.get("output_file_id")
+        if not fid:
+            raise BatchAPIError(
+                f"Batch completed but output_file_id is missing: {batch}"
+            )
+        return fid
+    if status in _TERMINAL:
+        raise BatchAPIError(f"Batch ended with status='{status}': {batch}")
+    return None
+
+
+def _multipart_chunks(head: bytes, file_path: Path, tail: bytes) -> Iterator[bytes]:
+    """multipart/form-data body read from disk one CHUNK_BYTES block at a time."""
+    yield head
+    with open(file_path, "rb") as f:
+        while chunk := f.read(CHUNK_BYTES):
+            yield chunk
+    yield tail
+
+
+# Digest header token → hashlib name
+_DIGEST_ALGOS = {"sha-256": "sha256", "sha-512": "sha512", "md5": "md5"}
+
+
+def _header_digest(headers, full_body: bool) -> tuple[str, bytes] | None:
+    """
+    (hashlib name, digest) of the whole file if the response advertises one:
+    Repr-Digest / Digest (RFC 9530 / 3230) always describe the full file,
+    Content-MD5 only when the response carries the full body (200, not 206).
+    """
+    for name in ("Repr-Digest", "Digest"):
+        for item in (headers.get(name) or "").split(","):
+            algo, _, value = item.strip().partition("=")
+            if algo.lower() in _DIGEST_ALGOS and value:
+                try:
+                    raw = base64.b64decode(value.strip(":"))
+                except ValueError:
+                    continue
+                return _DIGEST_ALGOS[algo.lower()], raw
+    md5 = headers.get("Content-MD5")
+    if full_body and md5:
+        try:
+            return "md5", base64.b64decode(md5)
+        except ValueError:
+            return None
+    return None
+
+
+def _file_digest(path: Path, algo: str) -> bytes:
+    h = hashlib.new(algo)
+    with open(path, "rb") as f:
+        while chunk := f.read(CHUNK_BYTES):
+            h.update(chunk)
+    return h.digest()
+
+
 # ── Client ────────────────────────────────────────────────────────────────────
 
 
@@ -95,32 +173,45 @@ class BatchClient:
         """
         Upload a JSONL file for batch inference via multipart/form-data.
         Includes the required 'purpose: batch' field.
+        The file is streamed from disk — memory stays flat at any size.
+        The /files endpoint has no partial upload, so a dropped connection
+        resends the file (up to TRANSFER_RETRIES times); build_batch's part
+        caps bound what a retry costs.
         Returns file_id.
         """
         boundary = "GEPBatch01"
-        file_bytes = file_path.read_bytes()
-        body = (
-            (
-                f"--{boundary}\r\n"
-                f'Content-Disposition: form-data; name="purpose"\r\n\r\n'
-                f"batch\r\n"
-                f"--{boundary}\r\n"
-                f'Content-Disposition: form-data; name="file"; filename="{file_path.name}"\r\n'
-                f"Content-Type: application/jsonl\r\n\r\n"
-            ).encode()
-            + file_bytes
-            + f"\r\n--{boundary}--\r\n".encode()
-        )
-
-        req = urllib.request.Request(
-            f"{self._base}/files",
-            data=body,
-            method="POST",
-        )
-        req.add_header("Content-Type", f"multipart/form-data; boundary={boundary}")
-        req.add_header("Authorization", f"Bearer {self._key}")
+        head = (
+            f"--{boundary}\r\n"
+            f'Content-Disposition: form-data; name="purpose"\r\n\r\n'
+            f"batch\r\n"
+            f"--{boundary}\r\n"
+            f'Content-Disposition: form-data; name="file"; filename="{file_path.name}"\r\n'
+            f"Content-Type: application/jsonl\r\n\r\n"
+        ).encode()
+        tail = f"\r\n--{boundary}--\r\n".encode()
+        length = len(head) + file_path.stat().st_size + len(tail)
+
+        for attempt in range(TRANSFER_RETRIES + 1):
+            # The body is streamed from disk — a fresh generator per attempt
+            req = urllib.request.Request(
+                f"{self._base}/files",
+                data=_multipart_chunks(head, file_path, tail),
+                method="POST",
+            )
+            req.add_header("Content-Type", f"multipart/form-data; boundary={boundary}")
+            req.add_header("Content-Length", str(length))
+            req.add_header("Authorization", f"Bearer {self._key}")
+            try:
+                resp = self._do(req)
+                break
+            except (OSError, http.client.HTTPException) as e:
+                if attempt == TRANSFER_RETRIES:
+                    raise BatchAPIError(
+                        f"Upload of {file_path.name} failed after {attempt + 1} attempts: {e}"
+                    ) from e
+                print(f"  ⚠️  Upload of {file_path.name} interrupted — retrying ({e})")
+                time.sleep(min(2**attempt, 30))
 
-        resp = self._do(req)
         file_id = resp.get("id") or resp.get("file_id")
         if not file_id:
             raise BatchAPIError(f"Upload succeeded but no file_id in response: {resp}")
@@ -142,6 +233,18 @@ class BatchClient:
             raise BatchAPIError(f"Submit succeeded but no batch_id in response: {resp}")
         return batch_id
 
+    def status(self, batch_id: str) -> dict:
+        """One GET /v1/batches/{batch_id} — the raw batch object."""
+        return self._get_json(f"{self._base}/batches/{batch_id}")
+
+    def check(self, batch_id: str) -> str | None:
+        """
+        Non-blocking status check.
+        Returns output_file_id when status == 'completed', None while running.
+        Raises BatchAPIError on failed/expired/cancelled.
+        """
+        return _output_file_id(self.status(batch_id))
+
     def poll(
         self,
         batch_id: str,
@@ -154,42 +257,126 @@ class BatchClient:
         Raises BatchAPIError on failed/expired/cancelled.
         Raises TimeoutError if timeout is exceeded.
         """
-        url = f"{self._base}/batches/{batch_id}"
         deadline = time.monotonic() + timeout
-        terminal = {"completed", "failed", "expired", "cancelled"}
 
         while time.monotonic() < deadline:
-            data = self._get_json(url)
-            status = data.get("status", "unknown")
+            data = self.status(batch_id)
             counts = data.get("request_counts", {})
             total = counts.get("total", "?")
             done = counts.get("completed", "?")
-            print(f"    [{status}]  {done}/{total} completed", flush=True)
+            print(
+                f"    [{data.get('status', 'unknown')}]  {done}/{total} completed",
+                flush=True,
+            )
 
-            if status == "completed":
-                fid = data.get("output_file_id")
-                if not fid:
-                    raise BatchAPIError(
-                        f"Batch completed but output_file_id is missing: {data}"
-                    )
+            fid = _output_file_id(data)
+            if fid:
                 return fid
 
-            if status in terminal:
-                raise BatchAPIError(f"Batch ended with status='{status}': {data}")
-
             time.sleep(interval)
 
         raise TimeoutError(f"Batch polling timed out after {timeout}s")
 
     def download(self, file_id: str, dest: Path) -> Path:
-        """Download file content to dest path. Returns dest."""
+        """
+        Stream file content to dest. Returns dest.
+        Bytes land in <dest>.part first. A dropped connection — or a later
+        run finding the .part — resumes from its size with an HTTP Range
+        request. The finished file is checked against the size reported by
+        GET /files/{file_id} and any digest header the server sends, then
+        moved into place.
+        """
+        dest = Path(dest)
+        partial = dest.with_name(dest.name + ".part")
+        expected_size = self._file_size(file_id)
+        digest = None
+
+        for attempt in range(TRANSFER_RETRIES + 1):
+            try:
+                digest = self._fetch_rest(file_id, partial, expected_size) or digest
+                break
+            except (OSError, http.client.HTTPException) as e:
+                have = partial.stat().st_size if partial.exists() else 0
+                if attempt == TRANSFER_RETRIES:
+                    raise BatchAPIError(
+                        f"Download of {file_id} failed after {attempt + 1} attempts "
+                        f"({have:,} bytes kept in {partial.name}): {e}"
+                    ) from e
+                print(f"  ⚠️  Download interrupted at {have:,} bytes — resuming ({e})")
+                time.sleep(min(2**attempt, 30))
+
+        self._verify(partial, expected_size, digest)
+        os.replace(partial, dest)
+        return dest
+
+    def _file_size(self, file_id: str) -> int | None:
+        """`bytes` from the file object, None if the provider doesn't say."""
+        try:
+            size = self._get_json(f"{self._base}/files/{file_id}").get("bytes")
+            return int(size) if size else None
+        except (BatchAPIError, OSError, ValueError, TypeError, AttributeError):
+            return None
+
+    def _fetch_rest(
+        self, file_id: str, partial: Path, expected_size: int | None
+    ) -> tuple[str, bytes] | None:
+        """Append what partial is missing. Returns the advertised digest, if any."""
+        offset = partial.stat().st_size if partial.exists() else 0
+        if expected_size is not None and offset >= expected_size:
+            if offset == expected_size:
+                return None
+            partial.unlink()
+            offset = 0
+
         req = urllib.request.Request(
             f"{self._base}/files/{file_id}/content",
             headers={"Authorization": f"Bearer {self._key}"},
         )
-        with urllib.request.urlopen(req, timeout=300) as resp:
-            dest.write_bytes(resp.read())
-        return dest
+        if offset:
+            req.add_header("Range", f"bytes={offset}-")
+        try:
+            resp = urllib.request.urlopen(req, timeout=120)  # per socket read
+        except urllib.error.HTTPError as e:
+            if e.code == 416 and offset:
+                return None  # nothing past what we already have
+            if e.code == 429 or e.code >= 500:
+                raise  # retried
+            body = e.read().decode("utf-8", errors="replace")
+            raise BatchAPIError(f"HTTP {e.code}: {body[:600]}") from e
+
+        with resp:
+            resumed = resp.status == 206
+            if resumed and not (resp.headers.get("Content-Range") or "").startswith(
+                f"bytes {offset}-"
+            ):
+                partial.unlink()
+                raise OSError("unexpected Content-Range — restarting download")
+            # 200 to a Range request: the server sent the whole file again
+            digest = _header_digest(resp.headers, full_body=not resumed)
+            length = resp.headers.get("Content-Length")
+            received = 0
+            with open(partial, "ab" if resumed else "wb") as f:
+                while chunk := resp.read(CHUNK_BYTES):
+                    f.write(chunk)
+                    received += len(chunk)
+        # http.client ends a short body quietly on read(amt) — check it here
+        if length is not None and received < int(length):
+            raise http.client.IncompleteRead(b"", int(length) - received)
+        return digest
+
+    @staticmethod
+    def _verify(
+        partial: Path, expected_size: int | None, digest: tuple[str, bytes] | None
+    ) -> None:
+        size = partial.stat().st_size if partial.exists() else 0
+        if expected_size is not None and size != expected_size:
+            partial.unlink(missing_ok=True)
+            raise BatchAPIError(
+                f"Downloaded {size:,} bytes, expected {expected_size:,} — discarded"
+            )
+        if digest and _file_digest(partial, digest[0]) != digest[1]:
+            partial.unlink(missing_ok=True)
+            raise BatchAPIError(f"{digest[0]} checksum mismatch — download discarded")
 
     # ── HTTP internals ────────────────────────────────────────────────────
 
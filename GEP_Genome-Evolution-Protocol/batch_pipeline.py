@@ -13,7 +13,12 @@ Usage:
     # Dry run: build JSONL only, print cost estimate, no upload
     python3 batch_pipeline.py ... --dry-run
 
+    # Cap part files (default: provider batch.max_file_mb / max_requests);
+    # parts are uploaded + submitted concurrently as separate batch jobs
+    python3 batch_pipeline.py ... --max-part-mb 100 --max-part-records 5000
+
     # Use an existing JSONL (skip build step, go straight to upload)
+    # --input also takes a batch_input_….manifest.json to reuse every part
     python3 batch_pipeline.py --lang es --version RVR1960 --year 2025 \\
         --phase 1 --provider dashscope_batch_phase1 \\
         --input batch_input_es_RVR1960_2025_p1.jsonl
@@ -24,6 +29,13 @@ Usage:
         --input batch_input_es_RVR1960_2025_p1.jsonl \\
         --results BIJOutputSet_es_RVR1960_2025_results.jsonl
 
+    # Fan-out: build every target, submit all batches up front, poll them
+    # together (exponential backoff) and collect each as soon as it finishes.
+    # Progress lives in data/batch_output/fanout_<hash>.state.json — re-run
+    # the same command after a crash to resume without resubmitting.
+    python3 batch_pipeline.py --year 2025 --phase 1 --provider dashscope \\
+        --targets es:RVR1960,es:NVI,pt,en:KJV:2026
+
 Provider short-names accepted for --provider:
     dashscope   → auto-resolves to dashscope_batch_phase{N} based on --phase
     (or pass the full provider id from providers.yml directly)
@@ -32,8 +44,10 @@ Provider short-names accepted for --provider:
 from __future__ import annotations
 
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 import sys
+import time
 from pathlib import Path
 
 # Load .env for local development (optional)
@@ -46,16 +60,21 @@ except ImportError:
 
 # ── Project imports ───────────────────────────────────────────────────────────
 from audit import audit_path, load_reviewed_dates
-from batch_client import BatchClient
+from batch_client import BatchAPIError, BatchClient
+from batch_state import FanoutState
 from build_batch import (
-    build_batch as build_records,
-    estimate_cost,
+    CostEstimate,
+    iter_records,
     load_entries,
+    load_parts,
+    part_caps,
     phase_suffix,
-    write_jsonl,
+    with_dashscope_fields,
+    write_jsonl_parts,
 )
 from collect_batch import process_results
 from genome import ensure_genome
+from lang_registry import list_languages, list_versions, validate_version
 import paths as _paths
 
 
@@ -77,6 +96,49 @@ def _resolve_provider_id(name: str, phases: list[int]) -> str:
     return name
 
 
+# ── Target matrix ──────────────────────────────────────────────────────────────
+
+
+def parse_targets(spec: str, year: int) -> list[tuple[str, str, int]]:
+    """
+    Expand a --targets spec into (lang, version, year) triples.
+    Comma-separated items, each one of:
+        all                  every version of every registered language
+        es                   every version of one language
+        es:RVR1960           one version, --year
+        es:RVR1960:2026      one version, explicit year
+    Raises ValueError on an unknown language / version or a bad item.
+    """
+    targets: list[tuple[str, str, int]] = []
+    for item in (i.strip() for i in spec.split(",")):
+        if not item:
+            continue
+        fields = item.split(":")
+        if item == "all":
+            pairs = [
+                (lang, v) for lang in list_languages() for v in list_versions(lang)
+            ]
+        elif len(fields) == 1:
+            pairs = [(item, v) for v in list_versions(item)]
+        elif len(fields) in (2, 3):
+            validate_version(fields[0], fields[1])
+            pairs = [(fields[0], fields[1])]
+        else:
+            raise ValueError(
+                f"Bad target '{item}' — use lang, lang:version or lang:version:year"
+            )
+        try:
+            target_year = int(fields[2]) if len(fields) == 3 else year
+        except ValueError:
+            raise ValueError(f"Bad year in target '{item}'") from None
+        for lang, version in pairs:
+            if (lang, version, target_year) not in targets:
+                targets.append((lang, version, target_year))
+    if not targets:
+        raise ValueError(f"No targets in '{spec}'")
+    return targets
+
+
 # ── Build step ─────────────────────────────────────────────────────────────────
 
 
@@ -91,8 +153,13 @@ def _build_jsonl(
     output: str | None,
     provider_id: str,
     no_genome: bool = False,
-) -> Path:
-    """Build the batch JSONL file. Returns the path to the written file."""
+    max_bytes: int | None = None,
+    max_records: int | None = None,
+) -> list[Path]:
+    """
+    Stream the batch JSONL to disk in capped parts.
+    Returns the part paths — [] when every entry is already reviewed.
+    """
     entries = load_entries(lang, version, year, local)
 
     log_path = audit_path(lang, version, year)
@@ -107,7 +174,7 @@ def _build_jsonl(
     else:
         print(f"  🧬 Genome: {frag_count} fragments")
 
-    records = build_records(
+    records = iter_records(
         lang=lang,
         version=version,
         year=year,
@@ -120,19 +187,9 @@ def _build_jsonl(
         phases=phases,
         no_genome=no_genome,
     )
-
-    if not records:
-        print("  ✅ Nothing to build — all entries already reviewed.")
-        sys.exit(0)
-
-    # DashScope requires method + url at record top level (OpenAI-compat batch format)
     if "dashscope" in provider_id:
-        for rec in records:
-            rec.setdefault("method", "POST")
-            rec.setdefault("url", "/v1/chat/completions")
-
-    print(f"  📦 {len(records)} entries → batch")
-    estimate_cost(records, model)
+        records = with_dashscope_fields(records)
+    estimate = CostEstimate()
 
     suffix = phase_suffix(phases)
     model_slug = (
@@ -147,8 +204,228 @@ def _build_jsonl(
         else _paths.BATCH_INPUT_DIR
         / f"batch_input_{lang}_{version}_{year}{suffix}_{model_slug}_{ts}.jsonl"
     )
-    write_jsonl(records, out_path)
-    return out_path
+    manifest = write_jsonl_parts(
+        estimate.observe(records), out_path, max_bytes, max_records
+    )
+
+    if not manifest["parts"]:
+        print("  ✅ Nothing to build — all entries already reviewed.")
+        return []
+
+    print(
+        f"  📦 {manifest['records']} entries → batch ({len(manifest['parts'])} part(s))"
+    )
+    estimate.report(model)
+    return [out_path.parent / p["file"] for p in manifest["parts"]]
+
+
+# ── Upload → Submit → Poll → Download ─────────────────────────────────────────
+
+
+def _results_path(batch_path: Path) -> Path:
+    # The stem already carries model_slug + timestamp (and .partNNN) from the
+    # input name, so the results filename is unique by construction.
+    stem = batch_path.stem.replace("batch_input_", "BIJOutputSet_")
+    return _paths.BATCH_OUTPUT_DIR / f"{stem}_results.jsonl"
+
+
+def _submit_part(client: BatchClient, batch_path: Path) -> str:
+    """Upload one part and submit it as its own batch job. Returns batch_id."""
+    print(f"  📤 Uploading {batch_path.name} …")
+    file_id = client.upload(batch_path)
+    batch_id = client.submit(file_id)
+    print(f"  ✅ {batch_path.name}: file_id = {file_id}  batch_id = {batch_id}")
+    return batch_id
+
+
+def _run_batches(
+    client: BatchClient,
+    batch_paths: list[Path],
+    poll_interval: int,
+    upload_workers: int = 4,
+) -> list[tuple[Path, Path]]:
+    """
+    Upload + submit every part concurrently, then poll and download each.
+    Returns (input_path, results_path) pairs in part order.
+    """
+    print(f"\n  🚀 Uploading + submitting {len(batch_paths)} part(s) …")
+    workers = max(1, min(upload_workers, len(batch_paths)))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        batch_ids = list(pool.map(lambda p: _submit_part(client, p), batch_paths))
+
+    done = []
+    for batch_path, batch_id in zip(batch_paths, batch_ids):
+        print(f"\n  ⏳ Polling {batch_id} every {poll_interval}s …")
+        output_file_id = client.poll(batch_id, interval=poll_interval)
+        print(f"  ✅ output_file_id = {output_file_id}")
+
+        results_path = _results_path(batch_path)
+        print(f"\n  📥 Downloading → {results_path.name} …")
+        client.download(output_file_id, results_path)
+        print(f"  ✅ Saved: {results_path}")
+        done.append((batch_path, results_path))
+    return done
+
+
+# ── Fan-out ────────────────────────────────────────────────────────────────────
+
+
+def _label(target: dict) -> str:
+    return f"{target['lang']}/{target['version']}/{target['year']}"
+
+
+def _submit_state_part(
+    client: BatchClient, state: FanoutState, target: dict, part: dict
+) -> None:
+    """Upload + submit one part, saving file_id and batch_id as soon as known."""
+    batch_path = Path(part["input"])
+    try:
+        if not part.get("file_id"):
+            print(f"  📤 Uploading {batch_path.name} …")
+            state.update(part, file_id=client.upload(batch_path))
+        batch_id = client.submit(part["file_id"])
+    except (BatchAPIError, OSError) as e:
+        print(f"  ❌ {batch_path.name}: {e}")
+        state.update(part, status="failed", error=str(e))
+        state.settle_target(target)
+        return
+    state.update(part, batch_id=batch_id, status="submitted")
+    print(f"  ✅ {batch_path.name}: batch_id = {batch_id}")
+
+
+def _collect_state_part(
+    client: BatchClient,
+    state: FanoutState,
+    target: dict,
+    part: dict,
+    output_file_id: str | None,
+) -> None:
+    """Download (unless already on disk) and collect one finished part."""
+    batch_path = Path(part["input"])
+    if part["status"] == "submitted":
+        results_path = _results_path(batch_path)
+        print(f"\n  📥 {_label(target)}: downloading → {results_path.name} …")
+        try:
+            client.download(output_file_id, results_path)
+        except (BatchAPIError, OSError) as e:
+            print(f"  ⚠️  Download failed, retrying next round: {e}")
+            return
+        state.update(part, results=str(results_path), status="downloaded")
+
+    print(f"\n  📊 {_label(target)}: collecting {Path(part['results']).name} …")
+    process_results(
+        input_path=batch_path,
+        results_path=Path(part["results"]),
+        lang=target["lang"],
+        version=target["version"],
+        year=target["year"],
+        dry_run=False,
+    )
+    state.update(part, status="collected")
+    state.settle_target(target)
+
+
+def run_fanout(
+    args: argparse.Namespace,
+    targets: list[tuple[str, str, int]],
+    provider_id: str,
+    provider_cfg: dict,
+    model: str,
+    phases: list[int],
+) -> FanoutState:
+    """
+    Build every target, submit every part up front, then poll all running
+    batches in one loop — exponential backoff while nothing finishes — and
+    collect each batch as soon as it completes. Progress is saved in a
+    FanoutState, so re-running the same command resumes without resubmitting.
+    """
+    state = FanoutState.open(provider_id, phases, targets, getattr(args, "state", None))
+    print(f"  🗂️  State: {state.path}")
+    client = None if args.dry_run else BatchClient(provider_id)
+    max_bytes, max_records = part_caps(
+        provider_cfg.get("batch") or {},
+        getattr(args, "max_part_mb", None),
+        getattr(args, "max_part_records", None),
+    )
+
+    # ── Build every pending target ────────────────────────────────────────
+    for target in state.targets:
+        if target["status"] != "pending":
+            continue
+        print(f"\n  🏗️  Building {_label(target)} …")
+        try:
+            inputs = _build_jsonl(
+                lang=target["lang"],
+                version=target["version"],
+                year=target["year"],
+                phases=phases,
+                model=model,
+                local=None,
+                skip_reviewed=args.skip_reviewed,
+                output=None,
+                provider_id=provider_id,
+                no_genome=getattr(args, "no_genome", False),
+                max_bytes=max_bytes,
+                max_records=max_records,
+            )
+        except (OSError, ValueError) as e:
+            print(f"  ❌ {_label(target)}: build failed — {e}")
+            state.update(target, status="failed", error=str(e))
+            continue
+        state.set_parts(target, inputs)
+
+    if args.dry_run:
+        print(
+            f"\n  ✅ Dry run complete — {state.summary().get('built', 0)} part(s) built."
+        )
+        print("     Re-run without --dry-run to submit them.\n")
+        return state
+
+    # ── Submit every built part up front ──────────────────────────────────
+    built = state.parts_with("built")
+    if built:
+        print(f"\n  🚀 Uploading + submitting {len(built)} part(s) …")
+        workers = max(1, min(getattr(args, "upload_workers", 4), len(built)))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            list(pool.map(lambda tp: _submit_state_part(client, state, *tp), built))
+
+    # Downloaded before a crash — collect without asking the provider again
+    for target, part in state.parts_with("downloaded"):
+        _collect_state_part(client, state, target, part, None)
+
+    # ── Poll all running batches together ─────────────────────────────────
+    base = args.poll_interval
+    cap = max(base, getattr(args, "max_poll_interval", 600))
+    delay = base
+    while True:
+        finished = 0
+        for target, part in state.parts_with("submitted"):
+            try:
+                output_file_id = client.check(part["batch_id"])
+            except BatchAPIError as e:
+                print(f"  ❌ {_label(target)} {part['batch_id']}: {e}")
+                state.update(part, status="failed", error=str(e))
+                state.settle_target(target)
+                finished += 1
+                continue
+            except OSError as e:
+                print(f"  ⚠️  {_label(target)} {part['batch_id']}: check failed — {e}")
+                continue
+            if output_file_id:
+                _collect_state_part(client, state, target, part, output_file_id)
+                finished += 1
+
+        running = len(state.parts_with("submitted"))
+        if not running:
+            break
+        delay = base if finished else min(delay * 2, cap)
+        print(f"  ⏳ {running} batch(es) running — next check in {delay}s", flush=True)
+        time.sleep(delay)
+
+    print(f"\n{'═' * 60}")
+    for target in state.targets:
+        print(f"  {target['status']:<8} {_label(target)}")
+    return state
 
 
 # ── Pipeline ───────────────────────────────────────────────────────────────────
@@ -168,16 +445,28 @@ def run_pipeline(args: argparse.Namespace) -> None:
     try:
         from cloud_client import _load_config
 
-        model = next(
-            p["model"] for p in _load_config()["providers"] if p["id"] == provider_id
+        provider_cfg = next(
+            p for p in _load_config()["providers"] if p["id"] == provider_id
         )
+        model = provider_cfg["model"]
     except StopIteration:
         print(f"  ❌ Provider '{provider_id}' not found in providers.yml")
         sys.exit(1)
 
+    targets = None
+    if getattr(args, "targets", None):
+        try:
+            targets = parse_targets(args.targets, args.year)
+        except ValueError as e:
+            print(f"  ❌ {e}")
+            sys.exit(1)
+
     print(f"\n{'═' * 60}")
     print("  🚀  GEP Batch Pipeline")
-    print(f"  Lang: {args.lang} | Version: {args.version} | Year: {args.year}")
+    if targets:
+        print(f"  Targets: {len(targets)}  (fan-out)")
+    else:
+        print(f"  Lang: {args.lang} | Version: {args.version} | Year: {args.year}")
     print(f"  Provider: {provider_id}  |  Model: {model}")
     print(f"  Phases: {phases}")
     if args.dry_run:
@@ -186,13 +475,28 @@ def run_pipeline(args: argparse.Namespace) -> None:
         print("  ⚠️  --no-genome: genome suppressed (baseline run)")
     print(f"{'═' * 60}")
 
+    if targets:
+        state = run_fanout(args, targets, provider_id, provider_cfg, model, phases)
+        failed = [t for t in state.targets if t["status"] == "failed"]
+        print(f"{'═' * 60}")
+        if failed:
+            print(f"  ⚠️  {len(failed)} target(s) failed — see {state.path}\n")
+            sys.exit(1)
+        print("  ✅ Pipeline complete.\n")
+        return
+
     # ── Step 1: Build or use existing JSONL ───────────────────────────────
     if args.input:
-        batch_path = _paths.resolve_batch_input(args.input)
-        print(f"  ♻️  Using existing JSONL: {batch_path}")
+        batch_paths = load_parts(_paths.resolve_batch_input(args.input))
+        print(f"  ♻️  Using existing JSONL: {', '.join(p.name for p in batch_paths)}")
     else:
         print("\n  🏗️  Building batch JSONL …")
-        batch_path = _build_jsonl(
+        max_bytes, max_records = part_caps(
+            provider_cfg.get("batch") or {},
+            getattr(args, "max_part_mb", None),
+            getattr(args, "max_part_records", None),
+        )
+        batch_paths = _build_jsonl(
             lang=args.lang,
             version=args.version,
             year=args.year,
@@ -203,50 +507,51 @@ def run_pipeline(args: argparse.Namespace) -> None:
             output=args.output,
             provider_id=provider_id,
             no_genome=getattr(args, "no_genome", False),
+            max_bytes=max_bytes,
+            max_records=max_records,
         )
+        if not batch_paths:
+            sys.exit(0)
 
     if args.dry_run:
+        review = (
+            batch_paths[0]
+            if len(batch_paths) == 1
+            else f"the {len(batch_paths)} parts in {batch_paths[0].parent}"
+        )
         print("\n  ✅ Dry run complete.")
-        print(f"     Review {batch_path} then re-run without --dry-run to submit.\n")
+        print(f"     Review {review} then re-run without --dry-run to submit.\n")
         sys.exit(0)
 
     # ── Steps 2–5: Upload → Submit → Poll → Download ──────────────────────
     if args.results:
+        if len(batch_paths) > 1:
+            print(
+                "  ❌ --results matches a single part — pass that part file as --input"
+            )
+            sys.exit(1)
         results_path = _paths.resolve_batch_output(args.results)
         print(f"  ♻️  Using existing results: {results_path}")
+        collected = [(batch_paths[0], results_path)]
     else:
-        client = BatchClient(provider_id)
-
-        print(f"\n  📤 Uploading {batch_path.name} …")
-        file_id = client.upload(batch_path)
-        print(f"  ✅ file_id = {file_id}")
-
-        print("\n  🚀 Submitting batch …")
-        batch_id = client.submit(file_id)
-        print(f"  ✅ batch_id = {batch_id}")
-
-        print(f"\n  ⏳ Polling every {args.poll_interval}s …")
-        output_file_id = client.poll(batch_id, interval=args.poll_interval)
-        print(f"  ✅ output_file_id = {output_file_id}")
-
-        stem = batch_path.stem.replace("batch_input_", "BIJOutputSet_")
-        results_path = _paths.BATCH_OUTPUT_DIR / f"{stem}_results.jsonl"
-        # NOTE: stem already contains model_slug + timestamp inherited from batch_path name,
-        # so results filename is unique by construction — no extra suffix needed here.
-        print(f"\n  📥 Downloading → {results_path.name} …")
-        client.download(output_file_id, results_path)
-        print(f"  ✅ Saved: {results_path}")
+        collected = _run_batches(
+            BatchClient(provider_id),
+            batch_paths,
+            args.poll_interval,
+            getattr(args, "upload_workers", 4),
+        )
 
     # ── Step 6: Collect ───────────────────────────────────────────────────
-    print("\n  📊 Collecting results …")
-    process_results(
-        input_path=batch_path,
-        results_path=results_path,
-        lang=args.lang,
-        version=args.version,
-        year=args.year,
-        dry_run=False,
-    )
+    for batch_path, results_path in collected:
+        print(f"\n  📊 Collecting results ({results_path.name}) …")
+        process_results(
+            input_path=batch_path,
+            results_path=results_path,
+            lang=args.lang,
+            version=args.version,
+            year=args.year,
+            dry_run=False,
+        )
 
     print(f"{'═' * 60}")
     print("  ✅ Pipeline complete.\n")
@@ -272,13 +577,14 @@ def main() -> None:
             "  python3 batch_pipeline.py --lang es --version RVR1960 --year 2025 \\\n"
             "      --phase 1 --provider dashscope \\\n"
             "      --input batch_input_es_RVR1960_2025_p1.jsonl \\\n"
-            "      --results BIJOutputSet_es_RVR1960_2025_p1_results.jsonl\n"
+            "      --results BIJOutputSet_es_RVR1960_2025_p1_results.jsonl\n\n"
+            "  # Fan-out: every target submitted up front, polled together\n"
+            "  python3 batch_pipeline.py --year 2025 --phase 1 --provider dashscope \\\n"
+            "      --targets es:RVR1960,es:NVI,pt,en:KJV:2026\n"
         ),
     )
-    parser.add_argument("--lang", required=True, help="Language code (es, tl, pt, ...)")
-    parser.add_argument(
-        "--version", required=True, help="Bible version (RVR1960, ASND, ...)"
-    )
+    parser.add_argument("--lang", help="Language code (es, tl, pt, ...)")
+    parser.add_argument("--version", help="Bible version (RVR1960, ASND, ...)")
     parser.add_argument(
         "--year", required=True, type=int, help="Year (2025, 2026, ...)"
     )
@@ -327,7 +633,51 @@ def main() -> None:
         action="store_true",
         help="Suppress genome injection (baseline run without prior pattern knowledge)",
     )
+    parser.add_argument(
+        "--max-part-mb",
+        type=float,
+        default=None,
+        help="Roll over to a new part file past this size (default: provider batch.max_file_mb)",
+    )
+    parser.add_argument(
+        "--max-part-records",
+        type=int,
+        default=None,
+        help="Roll over to a new part file past this many records (default: provider batch.max_requests)",
+    )
+    parser.add_argument(
+        "--upload-workers",
+        type=int,
+        default=4,
+        help="Parts uploaded + submitted concurrently (default: 4)",
+    )
+    parser.add_argument(
+        "--targets",
+        metavar="SPEC",
+        help=(
+            "Fan-out over many targets instead of --lang/--version: comma-separated "
+            "lang, lang:version or lang:version:year, or 'all' (lang_registry)"
+        ),
+    )
+    parser.add_argument(
+        "--state",
+        metavar="FILE",
+        help="Fan-out state file (default: derived from provider, phases and targets)",
+    )
+    parser.add_argument(
+        "--max-poll-interval",
+        type=int,
+        default=600,
+        help="Fan-out poll backoff ceiling in seconds (default: 600)",
+    )
     args = parser.parse_args()
+    if args.targets:
+        if args.input or args.results or args.output or args.local:
+            parser.error(
+                "--input / --results / --output / --local need a single --lang/--version"
+            )
+    elif not (args.lang and args.version):
+        parser.error("--lang and --version are required unless --targets is given")
     run_pipeline(args)
 
 
@@ -0,0 +1,161 @@
+"""
+batch_state.py — GEP Critic v3
+Single responsibility: persist batch fan-out progress so a restarted
+orchestrator resumes polling instead of resubmitting.
+
+Design:
+    - One JSON file per fan-out run in data/batch_output/, named from a hash
+      of (provider, phases, targets): re-running the same command finds it.
+    - Targets are (lang, version, year) with a status:
+          pending → built → (every part) collected = done
+          empty   (nothing to review)      failed (build / submit error)
+    - Each target keeps its batch parts: input path, file_id once uploaded,
+      batch_id once submitted, results path once downloaded, and a status:
+          built → submitted → downloaded → collected        or failed
+    - Reopening a saved state retries whatever never reached the provider:
+      targets that failed to build go back to pending, parts that failed
+      before a batch_id back to built. Submitted batches are never resubmitted.
+    - Every change is saved at once, atomically (tmp + os.replace) under a
+      lock — upload threads and the poll loop share one state.
+
+Usage:
+    from batch_state import FanoutState
+
+    state = FanoutState.open(provider_id, phases, targets)
+    for target, part in state.parts_with("built"): ...
+    state.update(part, batch_id="batch_123", status="submitted")
+    state.settle_target(target)        # done / failed once no part is open
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+
+import paths as _paths
+from atomic_file import replace_file
+
+# Part statuses that still need the orchestrator
+OPEN_PART = {"built", "submitted", "downloaded"}
+
+
+def state_path(provider_id: str, phases: list[int], targets: list[tuple]) -> Path:
+    material = json.dumps([provider_id, sorted(phases), sorted(map(list, targets))])
+    digest = hashlib.sha256(material.encode("utf-8")).hexdigest()[:12]
+    return _paths.BATCH_OUTPUT_DIR / f"fanout_{digest}.state.json"
+
+
+class FanoutState:
+    """Progress of one fan-out run, saved on every change."""
+
+    def __init__(self, path: Path, data: dict):
+        self.path = Path(path)
+        self.data = data
+        self._lock = threading.RLock()
+
+    @classmethod
+    def open(
+        cls,
+        provider_id: str,
+        phases: list[int],
+        targets: list[tuple[str, str, int]],
+        path: Path | None = None,
+    ) -> "FanoutState":
+        """Load the run's saved state, or start a new one."""
+        path = Path(path) if path else state_path(provider_id, phases, targets)
+        if path.exists():
+            state = cls(path, json.loads(path.read_text(encoding="utf-8")))
+            state._reopen()
+            return state
+        state = cls(
+            path,
+            {
+                "provider": provider_id,
+                "phases": sorted(phases),
+                "created": datetime.now(timezone.utc).isoformat(),
+                "targets": [
+                    {
+                        "lang": lang,
+                        "version": version,
+                        "year": year,
+                        "status": "pending",
+                        "parts": [],
+                    }
+                    for lang, version, year in targets
+                ],
+            },
+        )
+        state.save()
+        return state
+
+    def _reopen(self) -> None:
+        for target in self.targets:
+            if target["status"] == "failed" and not target["parts"]:
+                target["status"] = "pending"
+            for part in target["parts"]:
+                if part["status"] == "failed" and not part.get("batch_id"):
+                    part["status"] = "built"
+                    target["status"] = "built"
+        self.save()
+
+    @property
+    def targets(self) -> list[dict]:
+        return self.data["targets"]
+
+    def save(self) -> None:
+        with self._lock:
+            text = json.dumps(self.data, indent=2, ensure_ascii=False)
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    f.write(text)
+                replace_file(tmp, self.path)
+            except BaseException:
+                Path(tmp).unlink(missing_ok=True)
+                raise
+
+    def update(self, item: dict, **fields) -> None:
+        """Set fields on a target or part dict of this state and save."""
+        with self._lock:
+            item.update(fields)
+            self.save()
+
+    def set_parts(self, target: dict, inputs: list[Path]) -> None:
+        with self._lock:
+            target["parts"] = [
+                {"input": str(p), "status": "built", "batch_id": None} for p in inputs
+            ]
+            target["status"] = "built" if inputs else "empty"
+            self.save()
+
+    def parts_with(self, status: str) -> list[tuple[dict, dict]]:
+        """(target, part) pairs whose part has `status`."""
+        with self._lock:
+            return [
+                (t, p)
+                for t in self.targets
+                for p in t["parts"]
+                if p["status"] == status
+            ]
+
+    def settle_target(self, target: dict) -> None:
+        """Mark a target done once none of its parts is still open."""
+        with self._lock:
+            parts = target["parts"]
+            if parts and not any(p["status"] in OPEN_PART for p in parts):
+                failed = any(p["status"] == "failed" for p in parts)
+                target["status"] = "failed" if failed else "done"
+                self.save()
+
+    def summary(self) -> dict:
+        """Count of parts per status, e.g. {"submitted": 3, "collected": 9}."""
+        with self._lock:
+            out: dict[str, int] = {}
+            for t in self.targets:
+                for p in t["parts"]:
+                    out[p["status"]] = out.get(p["status"], 0) + 1
+            return out
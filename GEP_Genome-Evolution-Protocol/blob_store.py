@@ -0,0 +1,81 @@
+"""
+blob_store.py — GEP Critic v3
+Single responsibility: content-addressed, compressed storage for raw model output.
+
+Design:
+    - Blobs are keyed "sha256:<hex>" of their UTF-8 text — the same digest
+      format as audit.compute_asset_id — so identical responses are stored once.
+    - Layout: data/blobs/<hex[:2]>/<hex[2:]>.zst (or .gz), written atomically.
+    - zstd when the zstandard package is installed (pip install zstandard),
+      gzip otherwise. get() reads either, so stores can mix both.
+
+Usage:
+    from blob_store import put_blob, get_blob
+
+    key = put_blob(raw_response)   # "sha256:…"
+    text = get_blob(key)
+"""
+
+import gzip
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+
+import paths as _paths
+from atomic_file import replace_file
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None  # gzip fallback
+
+
+def blob_key(text: str) -> str:
+    return "sha256:" + hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _blob_base(key: str) -> Path:
+    digest = key.removeprefix("sha256:")
+    return _paths.BLOBS_DIR / digest[:2] / digest[2:]
+
+
+def _compress(data: bytes) -> tuple[bytes, str]:
+    if zstandard is not None:
+        return zstandard.ZstdCompressor(level=10).compress(data), ".zst"
+    return gzip.compress(data, compresslevel=6), ".gz"
+
+
+def put_blob(text: str) -> str:
+    """Store text (if not already stored) and return its key."""
+    key = blob_key(text)
+    base = _blob_base(key)
+    if base.with_suffix(".zst").exists() or base.with_suffix(".gz").exists():
+        return key
+    data, suffix = _compress(text.encode("utf-8"))
+    base.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=base.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        replace_file(tmp, base.with_suffix(suffix))
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+    return key
+
+
+def get_blob(key: str) -> str:
+    """Text stored under key. Raises FileNotFoundError if the blob is missing."""
+    base = _blob_base(key)
+    zst = base.with_suffix(".zst")
+    if zst.exists():
+        if zstandard is None:
+            raise RuntimeError(
+                f"Blob {key} is zstd-compressed — pip install zstandard to read it"
+            )
+        with open(zst, "rb") as f:
+            data = zstandard.ZstdDecompressor().stream_reader(f).read()
+        return data.decode("utf-8")
+    with gzip.open(base.with_suffix(".gz"), "rb") as f:
+        return f.read().decode("utf-8")
@@ -8,6 +8,7 @@ Usage:
     python3 build_batch.py --lang tl --version ASND --year 2026 --skip-reviewed
     python3 build_batch.py --lang en --version KJV  --year 2025 --phase 1
     python3 build_batch.py --lang en --version KJV  --year 2025 --phase 1,2
+    python3 build_batch.py --lang en --version KJV  --year 2025 --max-part-mb 100
 
 --phase values:
     2      Phase 2 content only (default — current behavior)
@@ -20,6 +21,12 @@ Output filenames:
     batch_input_en_KJV_2025_p1.jsonl     (--phase 1)
     batch_input_en_KJV_2025_p1p2.jsonl   (--phase 1,2)
 
+Records are streamed to disk as they are rendered. Past a part cap
+(--max-part-mb / --max-part-records, default: the provider's batch.max_file_mb /
+batch.max_requests in providers.yml) output rolls over to
+batch_input_….part001.jsonl, .part002.jsonl, … and
+batch_input_….manifest.json lists every part with its custom_id range.
+
 Each line is a self-contained request:
   {
     "custom_id": "<entry.id>",
@@ -37,7 +44,9 @@ Each line is a self-contained request:
 
 import argparse
 import json
+import os
 import sys
+from collections.abc import Iterable, Iterator
 from datetime import datetime, timezone
 import urllib.request
 from pathlib import Path
@@ -53,6 +62,7 @@ except ImportError:
 
 # ── Project imports ───────────────────────────────────────────────────────────
 from audit import audit_path, load_reviewed_dates
+from corpus import Corpus, open_corpus
 from genome import ensure_genome
 from models import DevotionalEntry
 from prompts import (
@@ -131,6 +141,41 @@ def _thinking_for_provider(provider: str, phases: list[int]) -> bool:
     return False
 
 
+def _batch_cfg_for_provider(provider: str, phases: list[int]) -> dict:
+    """The `batch` block of the matching providers.yml entry ({} if none)."""
+    phase_key = f"phase{2 if 2 in phases else 1}"
+    id_hint = provider.lower()
+    try:
+        from cloud_client import _load_config
+
+        for p in _load_config().get("providers", []):
+            if (
+                p.get("phase") == phase_key
+                and id_hint in p.get("id", "").lower()
+                and p.get("batch")
+            ):
+                return p["batch"]
+    except Exception:
+        pass
+    return {}
+
+
+def part_caps(
+    batch_cfg: dict, max_part_mb: float | None, max_part_records: int | None
+) -> tuple[int | None, int | None]:
+    """
+    (max_bytes, max_records) per part file: CLI values win, then the
+    provider's batch.max_file_mb / batch.max_requests, else uncapped.
+    """
+    mb = max_part_mb if max_part_mb is not None else batch_cfg.get("max_file_mb")
+    records = (
+        max_part_records
+        if max_part_records is not None
+        else batch_cfg.get("max_requests")
+    )
+    return (int(mb * 1024 * 1024) if mb else None), (records or None)
+
+
 # ── Entry loading ─────────────────────────────────────────────────────────────
 
 
@@ -140,47 +185,16 @@ def load_entries(
     if local:
         local_path = _paths.resolve_local(local)
         print(f"  📂 Loading local: {local_path}")
-        with open(local_path, encoding="utf-8") as f:
-            raw = json.load(f)
+        corpus = open_corpus(local_path)
     else:
         url = _github_url(lang, version, year)
         print(f"  📡 Fetching: {url}")
         with urllib.request.urlopen(url, timeout=30) as resp:
-            raw = json.load(resp)
-
-    # Support {"data": {date: entry}} and nested {"data": {lang: {date: [entry, ...]}}}
-    # Support {"data": {lang: {date: [entry, ...]}}} nested format
-    raw_data = raw.get("data", raw) if isinstance(raw, dict) else raw
-    # Unwrap one more level if keyed by language
-    if isinstance(raw_data, dict) and lang in raw_data:
-        raw_data = raw_data[lang]
-    # raw_data is now {date: entry_or_list}
-    items = []
-    if isinstance(raw_data, dict):
-        for val in raw_data.values():
-            if isinstance(val, list):
-                items.extend(val)
-            else:
-                items.append(val)
-    else:
-        items = raw_data
-    entries = []
-    for item in items:
-        if not isinstance(item, dict):
-            continue
-        entries.append(
-            DevotionalEntry(
-                date=item.get("date", item.get("fecha", "")),
-                id=item.get("id", ""),
-                language=lang,
-                version=version,
-                versiculo=item.get("versiculo", ""),
-                reflexion=item.get("reflexion", ""),
-                oracion=item.get("oracion", ""),
-                para_meditar=item.get("para_meditar", []),
-                tags=item.get("tags", []),
-            )
-        )
+            corpus = Corpus.from_data(json.load(resp))
+
+    # Any source shape (nested by language, flat date map, entry list) — the
+    # language / version of the run label every entry, in file order.
+    entries = corpus.entries(lang, language=lang, version=version)
     print(f"  ✅ {len(entries)} entries loaded")
     return entries
 
@@ -188,7 +202,7 @@ def load_entries(
 # ── JSONL builder ─────────────────────────────────────────────────────────────
 
 
-def build_batch(
+def iter_records(
     lang: str,
     version: str,
     year: int,
@@ -200,9 +214,9 @@ def build_batch(
     skip_reviewed: bool,
     phases: list[int],
     no_genome: bool = False,
-) -> list[dict]:
+) -> Iterator[dict]:
     """
-    Builds one JSONL record per entry.
+    Yields one JSONL record per entry — nothing is held beyond the current record.
     phases controls which phases are included:
       [2]    → Phase 2 only (default, legacy behavior)
       [1]    → Phase 1 only (linguistic scan)
@@ -210,7 +224,6 @@ def build_batch(
     System prompt is built once and reused — Fireworks caches it automatically.
     no_genome: if True, suppress genome injection (baseline / ablation run).
     """
-    records = []
     skipped = 0
     effective_genome = None if no_genome else genome
 
@@ -225,6 +238,7 @@ def build_batch(
         if 2 in phases
         else None
     )
+    enable_thinking = _thinking_for_provider(provider, phases)
 
     for entry in entries:
         if skip_reviewed and entry.date in reviewed:
@@ -246,8 +260,7 @@ def build_batch(
                 messages.append({"role": "system", "content": p2_system})
             messages.append({"role": "user", "content": build_phase2_user(entry, lang)})
 
-        enable_thinking = _thinking_for_provider(provider, phases)
-        record = {
+        yield {
             "custom_id": entry.id,
             "body": {
                 "model": model,
@@ -257,12 +270,22 @@ def build_batch(
                 **({"enable_thinking": True} if enable_thinking else {}),
             },
         }
-        records.append(record)
 
     if skipped:
         print(f"  ⏭️  Skipped {skipped} already-reviewed entries")
 
-    return records
+
+def build_batch(*args, **kwargs) -> list[dict]:
+    """All records of iter_records() as a list (same arguments)."""
+    return list(iter_records(*args, **kwargs))
+
+
+def with_dashscope_fields(records: Iterable[dict]) -> Iterator[dict]:
+    """DashScope requires method + url at record top level (OpenAI-compat batch format)."""
+    for rec in records:
+        rec.setdefault("method", "POST")
+        rec.setdefault("url", "/v1/chat/completions")
+        yield rec
 
 
 # ── Output ────────────────────────────────────────────────────────────────────
@@ -281,50 +304,178 @@ def write_jsonl(records: list[dict], path: Path):
     print(f"  💾 Written: {path}  ({len(records)} records, {size_kb:.1f} KB)")
 
 
+def part_path(path: Path, index: int) -> Path:
+    """batch_input_….jsonl → batch_input_….part003.jsonl"""
+    return path.with_name(f"{path.stem}.part{index:03d}{path.suffix}")
+
+
+def manifest_path(path: Path) -> Path:
+    """batch_input_….jsonl → batch_input_….manifest.json"""
+    return path.with_name(f"{path.stem}.manifest.json")
+
+
+def write_jsonl_parts(
+    records: Iterable[dict],
+    path: Path,
+    max_bytes: int | None = None,
+    max_records: int | None = None,
+) -> dict:
+    """
+    Streams records to disk, starting a new part file whenever the next
+    record would push the current one past max_bytes or max_records.
+    A single part keeps the plain `path` name; otherwise parts are
+    <stem>.part001.jsonl, <stem>.part002.jsonl, …
+    Writes <stem>.manifest.json (parts with record / byte counts and
+    first / last custom_id) and returns it. No records → no files, no parts.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    parts: list[dict] = []
+    part = None
+    f = None
+    try:
+        for rec in records:
+            line = (json.dumps(rec, ensure_ascii=False) + "\n").encode("utf-8")
+            if f is not None and (
+                (max_records and part["records"] >= max_records)
+                or (max_bytes and part["bytes"] + len(line) > max_bytes)
+            ):
+                f.close()
+                f = None
+            if f is None:
+                part = {
+                    "file": part_path(path, len(parts) + 1).name,
+                    "records": 0,
+                    "bytes": 0,
+                    "first_custom_id": rec.get("custom_id"),
+                    "last_custom_id": None,
+                }
+                parts.append(part)
+                f = open(path.parent / part["file"], "wb")
+            if max_bytes and len(line) > max_bytes:
+                print(
+                    f"  ⚠️  Record {rec.get('custom_id')} alone is {len(line):,} bytes "
+                    f"(cap {max_bytes:,}) — written to its own part"
+                )
+            f.write(line)
+            part["records"] += 1
+            part["bytes"] += len(line)
+            part["last_custom_id"] = rec.get("custom_id")
+    finally:
+        if f is not None:
+            f.close()
+
+    if len(parts) == 1:
+        os.replace(path.parent / parts[0]["file"], path)
+        parts[0]["file"] = path.name
+
+    manifest = {
+        "created": datetime.now(timezone.utc).isoformat(),
+        "max_bytes": max_bytes,
+        "max_records": max_records,
+        "records": sum(p["records"] for p in parts),
+        "bytes": sum(p["bytes"] for p in parts),
+        "parts": parts,
+    }
+    if not parts:
+        return manifest
+    manifest_path(path).write_text(
+        json.dumps(manifest, indent=2, ensure_ascii=False), encoding="utf-8"
+    )
+    for p in parts:
+        print(
+            f"  💾 Written: {path.parent / p['file']}  "
+            f"({p['records']} records, {p['bytes'] / 1024:.1f} KB)"
+        )
+    if len(parts) > 1:
+        print(f"  🗂️  Manifest: {manifest_path(path)}  ({len(parts)} parts)")
+    return manifest
+
+
+def load_parts(path: Path) -> list[Path]:
+    """
+    Part files behind a batch input: a .manifest.json lists them, a .jsonl
+    with a sibling manifest expands to its parts, any other .jsonl is itself.
+    """
+    path = Path(path)
+    mf = path if path.name.endswith(".manifest.json") else manifest_path(path)
+    if not mf.exists():
+        return [path]
+    manifest = json.loads(mf.read_text(encoding="utf-8"))
+    return [mf.parent / p["file"] for p in manifest["parts"]]
+
+
 # ── Token estimate ────────────────────────────────────────────────────────────
 
 
-def estimate_cost(records: list[dict], model: str):
+class CostEstimate:
     """
-    Rough token estimate. System prompt tokens counted once (cached after first request).
+    Running token estimate, fed one record at a time while records stream
+    to disk. System prompt tokens counted once (cached after first request).
     Uses char/4 heuristic — good enough for cost planning.
     """
-    if not records:
-        return
-
-    system_chars = len(records[0]["body"]["messages"][0]["content"])
-    user_chars = sum(len(r["body"]["messages"][1]["content"]) for r in records)
-    output_chars = len(records) * 200  # ~200 chars per JSON verdict
-
-    system_tokens = system_chars // 4
-    user_tokens = user_chars // 4
-    output_tokens = output_chars // 4
-
-    # Pricing (batch = 50% off real-time)
-    # Fireworks qwen3-vl-30b: ~$0.90/1M → batch ~$0.45/1M
-    # DashScope qwen-plus: ~$0.80/1M input → batch ~$0.40/1M
-    # DashScope qwen-flash: ~$0.14/1M input → batch ~$0.07/1M
-    # Using Fireworks batch rates as conservative estimate
-    price_input_per_m = 0.45  # batch rate
-    price_cached_per_m = 0.225  # cached system prompt (Fireworks)
-    price_output_per_m = 0.45
-
-    n = len(records)
-    # System prompt: first request full price, rest cached
-    system_cost = (system_tokens / 1_000_000) * price_input_per_m
-    system_cost += ((n - 1) * system_tokens / 1_000_000) * price_cached_per_m
-    user_cost = (user_tokens / 1_000_000) * price_input_per_m
-    output_cost = (output_tokens / 1_000_000) * price_output_per_m
-    total = system_cost + user_cost + output_cost
-
-    print(f"\n  📊 Token estimate ({n} entries):")
-    print(
-        f"     System prompt : ~{system_tokens:,} tokens (cached after first request)"
-    )
-    print(f"     User prompts  : ~{user_tokens:,} tokens total")
-    print(f"     Output        : ~{output_tokens:,} tokens total")
-    print(f"     Est. cost     : ~${total:.3f} USD  (batch + cache rates)")
-    print(f"     Model         : {model}")
+
+    def __init__(self) -> None:
+        self.n = 0
+        self.system_chars = 0
+        self.user_chars = 0
+
+    def add(self, rec: dict) -> None:
+        messages = rec["body"]["messages"]
+        if not self.n:
+            self.system_chars = len(messages[0]["content"])
+        self.user_chars += len(messages[1]["content"])
+        self.n += 1
+
+    def observe(self, records: Iterable[dict]) -> Iterator[dict]:
+        """Pass records through, counting each one."""
+        for rec in records:
+            self.add(rec)
+            yield rec
+
+    def report(self, model: str) -> None:
+        if not self.n:
+            return
+
+        output_chars = self.n * 200  # ~200 chars per JSON verdict
+
+        system_tokens = self.system_chars // 4
+        user_tokens = self.user_chars // 4
+        output_tokens = output_chars // 4
+
+        # Pricing (batch = 50% off real-time)
+        # Fireworks qwen3-vl-30b: ~$0.90/1M → batch ~$0.45/1M
+        # DashScope qwen-plus: ~$0.80/1M input → batch ~$0.40/1M
+        # DashScope qwen-flash: ~$0.14/1M input → batch ~$0.07/1M
+        # Using Fireworks batch rates as conservative estimate
+        price_input_per_m = 0.45  # batch rate
+        price_cached_per_m = 0.225  # cached system prompt (Fireworks)
+        price_output_per_m = 0.45
+
+        n = self.n
+        # System prompt: first request full price, rest cached
+        system_cost = (system_tokens / 1_000_000) * price_input_per_m
+        system_cost += ((n - 1) * system_tokens / 1_000_000) * price_cached_per_m
+        user_cost = (user_tokens / 1_000_000) * price_input_per_m
+        output_cost = (output_tokens / 1_000_000) * price_output_per_m
+        total = system_cost + user_cost + output_cost
+
+        print(f"\n  📊 Token estimate ({n} entries):")
+        print(
+            f"     System prompt : ~{system_tokens:,} tokens (cached after first request)"
+        )
+        print(f"     User prompts  : ~{user_tokens:,} tokens total")
+        print(f"     Output        : ~{output_tokens:,} tokens total")
+        print(f"     Est. cost     : ~${total:.3f} USD  (batch + cache rates)")
+        print(f"     Model         : {model}")
+
+
+def estimate_cost(records: Iterable[dict], model: str):
+    """Token estimate for an already-built record list (see CostEstimate)."""
+    estimate = CostEstimate()
+    for rec in records:
+        estimate.add(rec)
+    estimate.report(model)
 
 
 # ── Main ──────────────────────────────────────────────────────────────────────
@@ -378,6 +529,18 @@ def main():
         action="store_true",
         help="Suppress genome injection (baseline run without prior pattern knowledge)",
     )
+    parser.add_argument(
+        "--max-part-mb",
+        type=float,
+        default=None,
+        help="Start a new part file past this size (default: provider batch.max_file_mb)",
+    )
+    parser.add_argument(
+        "--max-part-records",
+        type=int,
+        default=None,
+        help="Start a new part file past this many records (default: provider batch.max_requests)",
+    )
     args = parser.parse_args()
 
     # Parse --phase into sorted list of ints, validate
@@ -443,8 +606,8 @@ def main():
     else:
         print(f"  🧬 Genome: {frag_count} fragments")
 
-    # Build JSONL records
-    records = build_batch(
+    # Stream JSONL records straight to disk, part by part
+    records = iter_records(
         lang=args.lang,
         version=args.version,
         year=args.year,
@@ -457,21 +620,9 @@ def main():
         phases=phases,
         no_genome=no_genome,
     )
-
-    # DashScope requires method + url fields at record top level
     if args.provider == "dashscope":
-        for rec in records:
-            rec["method"] = "POST"
-            rec["url"] = "/v1/chat/completions"
-
-    if not records:
-        print("  ✅ Nothing to build — all entries already reviewed.")
-        sys.exit(0)
-
-    print(f"  📦 {len(records)} entries → batch")
-
-    # Cost estimate
-    estimate_cost(records, model)
+        records = with_dashscope_fields(records)
+    estimate = CostEstimate()
 
     # Write output — filename reflects phases included
     suffix = phase_suffix(phases)
@@ -487,7 +638,23 @@ def main():
         else _paths.BATCH_INPUT_DIR
         / f"batch_input_{args.lang}_{args.version}_{args.year}{suffix}_{model_slug}_{ts}.jsonl"
     )
-    write_jsonl(records, out_path)
+    max_bytes, max_records = part_caps(
+        _batch_cfg_for_provider(args.provider, phases),
+        args.max_part_mb,
+        args.max_part_records,
+    )
+    manifest = write_jsonl_parts(
+        estimate.observe(records), out_path, max_bytes, max_records
+    )
+
+    if not manifest["parts"]:
+        print("  ✅ Nothing to build — all entries already reviewed.")
+        sys.exit(0)
+
+    print(f"  📦 {manifest['records']} entries → batch")
+
+    # Cost estimate
+    estimate.report(model)
 
     print("\n  Next step:")
     print("    Run the full pipeline (upload → submit → poll → download → collect):")
@@ -495,7 +662,8 @@ def main():
         f"      python3 batch_pipeline.py --lang {args.lang} --version {args.version} --year {args.year} \\"
     )
     print(f"          --phase {args.phase} --provider {args.provider} \\")
-    print(f"          --input {out_path}")
+    next_input = out_path if len(manifest["parts"]) == 1 else manifest_path(out_path)
+    print(f"          --input {next_input}")
     print(f"{'═' * 60}\n")
 
 
@@ -53,6 +53,28 @@ Public API (mirrors ollama_client.py):
   get_model_for_key(key) → str
   MODEL_KEYS
 
+Async API:
+  await acall(system, user, phase, verbose, deadline_s) → same tuple as call_ollama
+
+Both go over per-provider keep-alive connection pools (http_transport.py), so
+calls after the first skip the TCP + TLS handshake. Each HTTP attempt is
+bounded by settings.request_timeout_s (default 90).
+
+Routing: every call books its estimated token cost on rate_scheduler and goes
+to the provider that can serve it soonest (rpm / tpm / rpd buckets); 429s
+still swap to the next provider.
+
+Caching: answers from API providers are kept in response_cache keyed by
+(provider, model, phase, prompt); an unchanged prompt is answered from disk
+without a call. Local providers are cached by ollama_client itself.
+
+Prompt-prefix caching: providers with a `prompt_cache` block in
+providers.yml get a byte-stable system message — the per-entry Phase 1
+context of a compiled Phase 2 prompt (prompts.SystemPrompt) moves to the
+head of the user message, and style "cache_control" marks the system block
+as a cache breakpoint. Cached prompt tokens reported in responses are added
+to the usage ledger (--usage, runner footer).
+
 CLI:
   python cloud_client.py --list
   python cloud_client.py --test --phase 1
@@ -62,12 +84,10 @@ CLI:
 """
 
 import argparse
+import asyncio
 import json
 import os
 import time
-import urllib.request
-import urllib.error
-from datetime import date
 from pathlib import Path
 from typing import Optional
 
@@ -77,6 +97,11 @@ except ImportError:
     yaml = None  # handled at load time
 
 from models import PauseCategory, ReaderReaction, Verdict
+from quota_ledger import QuotaLedger, ledger_for
+from rate_scheduler import estimate_tokens
+import rate_scheduler as _rate
+import http_transport as _transport
+import response_cache
 import ollama_client as _ollama  # local routing
 
 # --- Load .env automatically ---
@@ -126,7 +151,7 @@ def settings() -> dict:
     return _load_config().get("settings", {})
 
 
-# ── Daily usage tracking ──────────────────────────────────────────────────────
+# ── Usage tracking ────────────────────────────────────────────────────────────
 
 
 def _usage_path() -> Path:
@@ -135,73 +160,75 @@ def _usage_path() -> Path:
     )
 
 
-def _load_usage() -> dict:
-    path = _usage_path()
-    today = str(date.today())
-    if path.exists():
-        try:
-            data = json.loads(path.read_text(encoding="utf-8"))
-            if data.get("date") == today:
-                return data
-        except (json.JSONDecodeError, KeyError):
-            pass
-    return {"date": today, "providers": {}}
+def _ledger() -> QuotaLedger:
+    """Process-wide in-memory ledger; persisted only with daily_token_tracking."""
+    return ledger_for(
+        _usage_path(), persist=settings().get("daily_token_tracking", True)
+    )
 
 
-def _save_usage(usage: dict):
-    if settings().get("daily_token_tracking", True):
-        _usage_path().write_text(json.dumps(usage, indent=2), encoding="utf-8")
+def _load_usage() -> dict:
+    return _ledger().snapshot()
 
 
 def _record_tokens(provider_id: str, tokens: int):
     if not settings().get("daily_token_tracking", True):
         return
-    usage = _load_usage()
-    bucket = usage["providers"].setdefault(provider_id, {"tokens": 0, "requests": 0})
-    bucket["tokens"] += tokens
-    bucket["requests"] += 1
-    _save_usage(usage)
+    _ledger().record(provider_id, tokens)
 
 
-def _provider_exhausted(provider: dict) -> bool:
-    """True if provider is at or near its daily limit."""
-    pid = provider["id"]
-    usage = _load_usage()
-    bucket = usage["providers"].get(pid, {"tokens": 0, "requests": 0})
+def _cached_tokens(usage: dict) -> int:
+    """Prompt tokens served from the provider's prefix cache, in any usage dialect."""
+    details = usage.get("prompt_tokens_details") or {}
+    return int(
+        details.get("cached_tokens")
+        or usage.get("prompt_cache_hit_tokens")  # DeepSeek
+        or usage.get("cache_read_input_tokens")  # Anthropic
+        or 0
+    )
 
-    skip_pct = settings().get("skip_at_percent", 95) / 100
 
-    tpd = provider["limits"].get("tpd") or 0
-    if tpd and bucket["tokens"] >= tpd * skip_pct:
-        return True
+def cached_tokens_today() -> int:
+    """Cached prompt tokens recorded today across providers (in-memory ledger)."""
+    return _ledger().cached_total()
 
-    rpd = provider["limits"].get("rpd") or 0
-    if rpd and bucket["requests"] >= rpd * skip_pct:
-        return True
 
-    return False
+def _provider_exhausted(provider: dict) -> bool:
+    """True if provider is at or near its daily limit."""
+    skip_pct = settings().get("skip_at_percent", 95) / 100
+    return _ledger().over_daily(provider, skip_pct)
 
 
 def _provider_warned(provider: dict) -> bool:
     """True if provider is near (but not at) its daily limit."""
-    pid = provider["id"]
-    usage = _load_usage()
-    bucket = usage["providers"].get(pid, {"tokens": 0, "requests": 0})
-
     warn_pct = settings().get("warn_at_percent", 80) / 100
+    return _ledger().over_daily(provider, warn_pct)
 
-    tpd = provider["limits"].get("tpd") or 0
-    if tpd and bucket["tokens"] >= tpd * warn_pct:
-        return True
-
-    rpd = provider["limits"].get("rpd") or 0
-    if rpd and bucket["requests"] >= rpd * warn_pct:
-        return True
 
-    return False
+# ── Request building ──────────────────────────────────────────────────────────
 
 
-# ── Request building ──────────────────────────────────────────────────────────
+def _cache_layout(provider: dict, system: str, user: str) -> tuple[str | list, str]:
+    """
+    Order and mark messages for providers with prompt_cache.supported, so the
+    system message is the same bytes for every entry of a run (until the
+    genome changes). Returns (system_content, user).
+    """
+    cache_cfg = provider.get("prompt_cache") or {}
+    if not cache_cfg.get("supported"):
+        return system, user
+    context = getattr(system, "context", "")
+    if context:
+        system = system.compiled.render()
+        user = f"{context.strip()}\n\n{user}"
+    if cache_cfg.get("style") == "cache_control":
+        block = {
+            "type": "text",
+            "text": str(system),
+            "cache_control": {"type": "ephemeral"},
+        }
+        return [block], user
+    return str(system), user
 
 
 def _build_request(
@@ -214,6 +241,7 @@ def _build_request(
     model = provider["model"]
     thinking_cfg = provider.get("thinking_mode", {})
     style = thinking_cfg.get("style", "none")
+    system, user = _cache_layout(provider, system, user)
 
     # Inject /think tag for SambaNova-style providers
     if style == "think_tag" and phase == 2:
@@ -251,9 +279,8 @@ def _build_request(
     return payload, api_key or "local"
 
 
-def _build_http_request(
-    provider: dict, payload: dict, api_key: str
-) -> urllib.request.Request:
+def _http_parts(provider: dict, payload: dict, api_key: str) -> tuple[str, dict, bytes]:
+    """Returns (url, headers, body) for a chat completion POST."""
     base_url = provider["base_url"].rstrip("/")
     url = f"{base_url}/chat/completions"
 
@@ -266,12 +293,7 @@ def _build_http_request(
     for k, v in provider.get("headers", {}).items():
         headers[k] = v
 
-    return urllib.request.Request(
-        url,
-        data=json.dumps(payload).encode("utf-8"),
-        headers=headers,
-        method="POST",
-    )
+    return url, headers, json.dumps(payload).encode("utf-8")
 
 
 # ── Response parsing ──────────────────────────────────────────────────────────
@@ -332,6 +354,30 @@ def _extract_thinking(content: str) -> str:
     return match.group(1).strip() if match else ""
 
 
+def _read_completion(
+    provider: dict, raw_bytes: bytes, elapsed: float, verbose: bool
+) -> tuple[Optional[ReaderReaction], str, str, int]:
+    """Decode a completion body. Returns (reaction, content, raw_full, tokens)."""
+    data = json.loads(raw_bytes)
+    content, tokens = _parse_response(data)
+    cached = _cached_tokens(data.get("usage") or {})
+    _ledger().record_cached(provider["id"], cached)
+
+    tps = round(tokens / max(elapsed, 0.1))
+    if verbose:
+        hit = f", {cached} cached" if cached else ""
+        print(f"{tps} tok/s  ({tokens} tokens{hit}, {elapsed:.1f}s)")
+
+    thinking = _extract_thinking(content)
+    raw_full = f"<think>{thinking}</think>\n{content}" if thinking else content
+    return _parse_reaction(content), content, raw_full, tokens
+
+
+def _print_call(provider: dict, phase: int) -> None:
+    style = "thinking" if phase == 2 else "fast"
+    print(f"  [{provider['name']} / {style}] ", end="", flush=True)
+
+
 # ── Core call ─────────────────────────────────────────────────────────────────
 
 
@@ -352,7 +398,7 @@ def _call_provider(
         thinking_cfg = provider.get("thinking_mode", {})
         think = thinking_cfg.get("supported", False) and phase == 2
         reaction, raw = _ollama.call_ollama(
-            model, system, user, verbose=verbose, think=think
+            model, system, user, verbose=verbose, think=think, phase=phase
         )
         return reaction, raw, None
     # ── API routing (below) ───────────────────────────────────────────────
@@ -365,30 +411,34 @@ def _call_provider(
     except RuntimeError as e:
         return None, str(e), None
 
-    req = _build_http_request(provider, payload, api_key)
+    url, headers, body = _http_parts(provider, payload, api_key)
+    deadline_s = cfg.get("request_timeout_s", 90)
 
     for attempt in range(1, max_retries + 1):
         try:
             if verbose:
-                style = "thinking" if phase == 2 else "fast"
-                print(f"  [{provider['name']} / {style}] ", end="", flush=True)
+                _print_call(provider, phase)
 
             t0 = time.monotonic()
-            with urllib.request.urlopen(req, timeout=90) as resp:
-                raw_bytes = resp.read()
+            status, raw_bytes = _transport.post(
+                provider, url, headers, body, deadline_s
+            )
             elapsed = time.monotonic() - t0
 
-            data = json.loads(raw_bytes)
-            content, tokens = _parse_response(data)
-
-            tps = round(tokens / max(elapsed, 0.1))
-            if verbose:
-                print(f"{tps} tok/s  ({tokens} tokens, {elapsed:.1f}s)")
-
-            thinking = _extract_thinking(content)
-            raw_full = f"<think>{thinking}</think>\n{content}" if thinking else content
+            if status == 429:
+                if verbose:
+                    print(" 429 rate limit")
+                return None, "429", None  # signal to swap provider
+            if status >= 400:
+                if attempt < max_retries:
+                    time.sleep(retry_delay)
+                    continue
+                text = raw_bytes.decode("utf-8", errors="replace")
+                return None, f"HTTP {status}: {text[:200]}", None
 
-            reaction = _parse_reaction(content)
+            reaction, content, raw_full, tokens = _read_completion(
+                provider, raw_bytes, elapsed, verbose
+            )
             if reaction is None:
                 if attempt < max_retries:
                     if verbose:
@@ -399,31 +449,211 @@ def _call_provider(
 
             return reaction, raw_full, tokens
 
-        except urllib.error.HTTPError as e:
-            body = e.read().decode("utf-8", errors="replace")
-            if e.code == 429:
-                if verbose:
-                    print(" 429 rate limit")
-                return None, "429", None  # signal to swap provider
+        except (TimeoutError, OSError, json.JSONDecodeError) as e:
             if attempt < max_retries:
                 time.sleep(retry_delay)
                 continue
-            return None, f"HTTP {e.code}: {body[:200]}", None
-
-        except (
-            urllib.error.URLError,
-            TimeoutError,
-            OSError,
-            json.JSONDecodeError,
-        ) as e:
+            return None, f"{type(e).__name__}: {e}", None
+
+    return None, "Max retries exceeded", None
+
+
+async def _acall_provider(
+    provider: dict,
+    system: str,
+    user: str,
+    phase: int,
+    verbose: bool,
+    deadline_s: float,
+) -> tuple[Optional[ReaderReaction], Optional[str], Optional[int]]:
+    """Async _call_provider over the pooled transport — same returns and retries."""
+    if provider.get("client_type") == "local":
+        model = provider.get("model")
+        thinking_cfg = provider.get("thinking_mode", {})
+        think = thinking_cfg.get("supported", False) and phase == 2
+        reaction, raw = await asyncio.to_thread(
+            _ollama.call_ollama,
+            model,
+            system,
+            user,
+            verbose=verbose,
+            think=think,
+            phase=phase,
+        )
+        return reaction, raw, None
+
+    cfg = settings()
+    max_retries = cfg.get("max_retries", 2)
+    retry_delay = cfg.get("retry_delay_s", 5)
+
+    try:
+        payload, api_key = _build_request(provider, system, user, phase)
+    except RuntimeError as e:
+        return None, str(e), None
+
+    url, headers, body = _http_parts(provider, payload, api_key)
+
+    for attempt in range(1, max_retries + 1):
+        try:
+            if verbose:
+                _print_call(provider, phase)
+
+            t0 = time.monotonic()
+            status, raw_bytes = await _transport.apost(
+                provider, url, headers, body, deadline_s
+            )
+            elapsed = time.monotonic() - t0
+
+            if status == 429:
+                if verbose:
+                    print(" 429 rate limit")
+                return None, "429", None  # signal to swap provider
+            if status >= 400:
+                if attempt < max_retries:
+                    await asyncio.sleep(retry_delay)
+                    continue
+                text = raw_bytes.decode("utf-8", errors="replace")
+                return None, f"HTTP {status}: {text[:200]}", None
+
+            reaction, content, raw_full, tokens = _read_completion(
+                provider, raw_bytes, elapsed, verbose
+            )
+            if reaction is None:
+                if attempt < max_retries:
+                    if verbose:
+                        print(f"  parse failed, retrying ({attempt}/{max_retries})...")
+                    await asyncio.sleep(retry_delay)
+                    continue
+                return None, f"ParseError: {content[:400]}", None
+
+            return reaction, raw_full, tokens
+
+        except (TimeoutError, OSError, json.JSONDecodeError) as e:
             if attempt < max_retries:
-                time.sleep(retry_delay)
+                await asyncio.sleep(retry_delay)
                 continue
             return None, f"{type(e).__name__}: {e}", None
 
     return None, "Max retries exceeded", None
 
 
+# ── Provider routing (shared by call_ollama and acall) ────────────────────────
+
+
+def _provider_ready(provider: dict, verbose: bool, failures: list[str]) -> bool:
+    """False (and a recorded failure) if the provider hit its daily limit."""
+    if _provider_exhausted(provider):
+        msg = f"[{provider['name']}] daily limit reached — skipped"
+        if verbose:
+            print(f"  {msg}")
+        failures.append(msg)
+        return False
+
+    if _provider_warned(provider) and verbose:
+        print(f"  [{provider['name']}] approaching daily limit — continuing")
+    return True
+
+
+def _cache_keys(
+    candidates: list[dict], phase: int, system: str, user: str
+) -> dict[str, str]:
+    """Response-cache key per API candidate (local ones cache in ollama_client)."""
+    if not response_cache.enabled():
+        return {}
+    return {
+        p["id"]: response_cache.cache_key(p["id"], p["model"], phase, system, user)
+        for p in candidates
+        if p.get("client_type", "api") != "local"
+    }
+
+
+def _cached_result(
+    keys: dict[str, str], verbose: bool
+) -> tuple[ReaderReaction, str] | None:
+    """(reaction, raw) replayed from the response cache, or None on a miss."""
+    if not keys:
+        return None
+    raw = response_cache.lookup(list(keys.values()))
+    reaction = _parse_reaction(raw) if raw else None
+    if reaction is None:
+        return None
+    if verbose:
+        print("  [cache] hit")
+    return reaction, raw
+
+
+def _estimate_cost(system: str, user: str) -> int:
+    completion = settings().get("completion_token_estimate", 1024)
+    return estimate_tokens(system, user, completion=completion)
+
+
+def _schedule(
+    remaining: list[dict], cost: int, verbose: bool, failures: list[str]
+) -> tuple[dict | None, float]:
+    """
+    Book the call on the provider that can serve it soonest.
+    Returns (provider, wait_s), or (None, 0) if every remaining provider is
+    further out than settings.max_schedule_wait_s.
+    """
+    max_wait = settings().get("max_schedule_wait_s", 120)
+    provider, wait = _rate.shared().reserve(remaining, cost, max_wait_s=max_wait)
+    if provider is None:
+        names = ", ".join(p["name"] for p in remaining)
+        msg = f"[{names}] rate limits full — next slot in {wait:.0f}s"
+        if verbose:
+            print(f"  {msg}")
+        failures.append(msg)
+        return None, 0.0
+    if wait and verbose:
+        print(f"  [{provider['name']}] rate limit — waiting {wait:.1f}s")
+    return provider, wait
+
+
+def _settle(
+    provider: dict,
+    cost: int,
+    reaction: Optional[ReaderReaction],
+    raw: Optional[str],
+    tokens: Optional[int],
+    verbose: bool,
+    failures: list[str],
+) -> Optional[tuple[Optional[ReaderReaction], Optional[str]]]:
+    """
+    Book one provider attempt. Returns the final (reaction, raw) to hand back,
+    or None to move on to the next provider.
+    """
+    if raw == "429":
+        _rate.shared().backoff(provider)
+        if settings().get("swap_on_429", True):
+            msg = f"[{provider['name']}] 429 rate-limit → swapped"
+            if verbose:
+                print("  swapping to next provider...")
+            failures.append(msg)
+            return None
+        return None, f"429 rate limit on {provider['name']}"
+
+    if tokens:
+        _rate.shared().settle(provider, cost, tokens)
+    if reaction is not None:
+        if tokens:
+            _record_tokens(provider["id"], tokens)
+        return reaction, raw
+
+    # Non-429 failure — record detail and try next
+    fail_detail = f"[{provider['name']}] {raw}"
+    if verbose:
+        print(f"  [{provider['name']}] failed: {raw}")
+    if tokens:
+        _record_tokens(provider["id"], tokens)
+    failures.append(fail_detail)
+    return None
+
+
+def _all_failed(phase: int, failures: list[str]) -> tuple[None, str]:
+    failures_str = " | ".join(failures) if failures else "no providers available"
+    return None, f"All providers exhausted for phase {phase}: {failures_str}"
+
+
 # ── Public API ────────────────────────────────────────────────────────────────
 
 # Mirror ollama_client MODEL_KEYS
@@ -453,55 +683,84 @@ def call_ollama(
 ) -> tuple[Optional[ReaderReaction], Optional[str]]:
     """
     Drop-in replacement for ollama_client.call_ollama.
-    Reads providers.yml, routes by phase, swaps on 429.
+    Reads providers.yml, routes by phase to the provider with rate budget
+    soonest, swaps on 429.
     Returns (ReaderReaction, raw_full) or (None, error_str).
     """
     candidates = providers_for_phase(phase)
     if not candidates:
         return None, f"No providers configured for phase {phase} in providers.yml"
 
-    swap_on_429 = settings().get("swap_on_429", True)
-    failures: list[str] = []
+    keys = _cache_keys(candidates, phase, system, user)
+    cached = _cached_result(keys, verbose)
+    if cached is not None:
+        return cached
 
-    for provider in candidates:
-        pid = provider["id"]
+    failures: list[str] = []
+    remaining = [p for p in candidates if _provider_ready(p, verbose, failures)]
+    cost = _estimate_cost(system, user)
+    while remaining:
+        provider, wait = _schedule(remaining, cost, verbose, failures)
+        if provider is None:
+            break
+        remaining.remove(provider)
+        if wait:
+            time.sleep(wait)
+        reaction, raw, tokens = _call_provider(provider, system, user, phase, verbose)
+        result = _settle(provider, cost, reaction, raw, tokens, verbose, failures)
+        if result is not None:
+            if result[0] is not None and provider["id"] in keys:
+                response_cache.store(keys[provider["id"]], phase, result[1])
+            return result
 
-        if _provider_exhausted(provider):
-            msg = f"[{provider['name']}] daily limit reached — skipped"
-            if verbose:
-                print(f"  {msg}")
-            failures.append(msg)
-            continue
+    return _all_failed(phase, failures)
 
-        if _provider_warned(provider) and verbose:
-            print(f"  [{provider['name']}] approaching daily limit — continuing")
 
-        reaction, raw, tokens = _call_provider(provider, system, user, phase, verbose)
+async def acall(
+    system: str,
+    user: str,
+    phase: int = 2,
+    verbose: bool = False,
+    deadline_s: float | None = None,
+) -> tuple[Optional[ReaderReaction], Optional[str]]:
+    """
+    Async call_ollama: same providers.yml routing, 429 swap and return shape,
+    over per-provider keep-alive pools (HTTP/2 with httpx + h2). Many calls can
+    be in flight on one event loop. deadline_s bounds each HTTP attempt
+    (default: settings.request_timeout_s, else 90).
+    """
+    candidates = providers_for_phase(phase)
+    if not candidates:
+        return None, f"No providers configured for phase {phase} in providers.yml"
 
-        if raw == "429":
-            if swap_on_429:
-                msg = f"[{provider['name']}] 429 rate-limit → swapped"
-                if verbose:
-                    print("  swapping to next provider...")
-                failures.append(msg)
-                continue
-            return None, f"429 rate limit on {provider['name']}"
+    if deadline_s is None:
+        deadline_s = settings().get("request_timeout_s", 90)
 
-        if reaction is not None:
-            if tokens:
-                _record_tokens(pid, tokens)
-            return reaction, raw
+    keys = _cache_keys(candidates, phase, system, user)
+    cached = _cached_result(keys, verbose)
+    if cached is not None:
+        return cached
 
-        # Non-429 failure — record detail and try next
-        fail_detail = f"[{provider['name']}] {raw}"
-        if verbose:
-            print(f"  [{provider['name']}] failed: {raw}")
-        if tokens:
-            _record_tokens(pid, tokens)
-        failures.append(fail_detail)
+    failures: list[str] = []
+    remaining = [p for p in candidates if _provider_ready(p, verbose, failures)]
+    cost = _estimate_cost(system, user)
+    while remaining:
+        provider, wait = _schedule(remaining, cost, verbose, failures)
+        if provider is None:
+            break
+        remaining.remove(provider)
+        if wait:
+            await asyncio.sleep(wait)
+        reaction, raw, tokens = await _acall_provider(
+            provider, system, user, phase, verbose, deadline_s
+        )
+        result = _settle(provider, cost, reaction, raw, tokens, verbose, failures)
+        if result is not None:
+            if result[0] is not None and provider["id"] in keys:
+                response_cache.store(keys[provider["id"]], phase, result[1])
+            return result
 
-    failures_str = " | ".join(failures) if failures else "no providers available"
-    return None, f"All providers exhausted for phase {phase}: {failures_str}"
+    return _all_failed(phase, failures)
 
 
 # ── CLI ───────────────────────────────────────────────────────────────────────
@@ -554,9 +813,11 @@ def _cmd_usage():
         tok_pct = f"({bucket['tokens'] / tpd * 100:.0f}%)" if tpd else ""
         req_pct = f"({bucket['requests'] / rpd * 100:.0f}%)" if rpd else ""
         name = p.get("name", pid)
+        cached = bucket.get("cached_tokens", 0)
+        cached_str = f"  cached: {cached}" if cached else ""
         print(
             f"  {name:<22} tokens: {bucket['tokens']:>7} {tok_pct:<8} "
-            f"requests: {bucket['requests']:>5} {req_pct}"
+            f"requests: {bucket['requests']:>5} {req_pct}{cached_str}"
         )
     print()
 
@@ -610,7 +871,7 @@ def _cli():
     elif args.usage:
         _cmd_usage()
     elif args.reset_usage:
-        _usage_path().unlink(missing_ok=True)
+        _ledger().reset()
         print("  Usage counters reset.\n")
     elif args.test:
         _cmd_test(args.phase)
@@ -16,13 +16,23 @@ Usage:
 
 Callable from batch_pipeline.py via process_results().
 
+Results lines are decoded and parsed in a process pool (--workers); dedup,
+genome absorption and audit writes stay in one process, in file order,
+through a single buffered audit.AuditWriter (periodic flush + fsync).
+
 Output:
     Appends to critic_audit_{lang}_{version}_{year}.jsonl
 """
 
 import argparse
+import contextlib
+import io
 import json
+import os
 import re
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 # Load .env for local development (optional)
@@ -35,8 +45,15 @@ except ImportError:
     pass
 
 # ── Project imports ───────────────────────────────────────────────────────────
-from audit import audit_path, append_record, build_record, compute_asset_id
+from audit import (
+    AuditWriter,
+    audit_path,
+    build_record,
+    compute_asset_id,
+    load_index,
+)
 from datetime import datetime, timezone
+from corpus import open_corpus
 from cloud_client import _parse_reaction
 from models import PauseCategory, ReaderReaction, Verdict
 from genome import absorb_reaction, ensure_genome, save_genome
@@ -88,25 +105,7 @@ def load_source_index(source_path: Path) -> dict[str, str]:
     """
     if not source_path or not source_path.exists():
         return {}
-    with open(source_path, encoding="utf-8") as f:
-        data = json.load(f)
-    index: dict[str, str] = {}
-    lang_data = data.get("data", {})
-    # data.data is {lang: {date: [entries]}} or {date: [entries]}
-    if lang_data:
-        first_val = next(iter(lang_data.values()))
-        date_map = first_val if isinstance(first_val, dict) else lang_data
-        for date_entries in date_map.values():
-            for entry in date_entries:
-                eid = entry.get("id", "")
-                if eid:
-                    full = (
-                        (entry.get("reflexion") or "")
-                        + " "
-                        + (entry.get("oracion") or "")
-                    )
-                    index[eid] = full
-    return index
+    return open_corpus(source_path).source_index()
 
 
 def extract_content(result_line: dict) -> str | None:
@@ -209,6 +208,216 @@ def _parse_phase1_reaction(raw: str) -> ReaderReaction | None:
     return reaction
 
 
+# ── Result parsing (worker processes) ───────────────────────────────────────
+
+# Results files smaller than this are parsed in-process — pool start-up
+# would cost more than it saves.
+PARALLEL_MIN_BYTES = 1024 * 1024
+CHUNK_LINES = 256  # results lines per worker task
+
+_EMPTY_REACTION = "[collect_batch] Empty response from batch provider."
+_PARSE_REACTION = "[collect_batch] Could not parse JSON from model response."
+
+# Per-process context set by _init_worker: input_index, source_index, lang,
+# version, phase, dry_run
+_ctx: dict = {}
+
+
+def _init_worker(
+    input_index: dict,
+    source_index: dict,
+    lang: str,
+    version: str,
+    phase: int,
+    dry_run: bool,
+) -> None:
+    _ctx.update(
+        input_index=input_index,
+        source_index=source_index,
+        lang=lang,
+        version=version,
+        phase=phase,
+        dry_run=dry_run,
+    )
+
+
+def _error_reaction(message: str) -> ReaderReaction:
+    return ReaderReaction(
+        verdict=Verdict.OK,
+        reaction=message,
+        quoted_pause=None,
+        category=None,
+        confidence=0.0,
+    )
+
+
+def _parse_line(line_num: int, line: str) -> dict | None:
+    """
+    Decode, parse and gate one results line; compute its candidate asset id
+    and (unless dry run) its AuditRecord. Anything the parsers print is
+    captured into "log" so the collector prints it in line order.
+    """
+    line = line.strip()
+    if not line:
+        return None
+    try:
+        result = json.loads(line)
+    except json.JSONDecodeError:
+        return {"skip": f"  ⚠️  Line {line_num}: invalid JSON — skipping"}
+
+    custom_id = result.get("custom_id", "")
+    if not custom_id:
+        return {"skip": f"  ⚠️  Line {line_num}: missing custom_id — skipping"}
+
+    entry_meta = _ctx["input_index"].get(custom_id)
+    if not entry_meta:
+        return {
+            "skip": f"  ⚠️  Line {line_num}: custom_id '{custom_id}' not in input index — skipping"
+        }
+
+    lang, version, phase = _ctx["lang"], _ctx["version"], _ctx["phase"]
+    log = io.StringIO()
+    raw_content = extract_content(result)
+    if not raw_content:
+        kind, reaction, raw_response = "empty", _error_reaction(_EMPTY_REACTION), None
+    else:
+        with contextlib.redirect_stdout(log):
+            if phase == 1:
+                reaction = _parse_phase1_reaction(raw_content)
+            else:
+                reaction = _parse_reaction(raw_content)
+        if reaction is None:
+            kind, reaction = "unparsed", _error_reaction(_PARSE_REACTION)
+        else:
+            kind = "parsed"
+        raw_response = raw_content
+
+    # ── Verbatim gate (Phase 1 only) ─────────────────────────────────────
+    # Discard any flags whose quoted_problem is not found verbatim
+    # in the source entry. These are model hallucinations.
+    source_index = _ctx["source_index"]
+    if (
+        kind == "parsed"
+        and phase == 1
+        and source_index
+        and reaction.verdict == Verdict.PAUSE
+    ):
+        source_text = source_index.get(custom_id, "")
+        if source_text:
+            original_pause = reaction.quoted_pause or ""
+            if original_pause and original_pause not in source_text:
+                print(
+                    f"  🚫  {custom_id}: quoted_problem not in source "
+                    f"(hallucinated) — downgraded to CLEAN",
+                    file=log,
+                )
+                # Downgrade to CLEAN — do not write as flagged
+                reaction = ReaderReaction(
+                    verdict=Verdict.OK,
+                    reaction=f'[gate] Hallucinated flag discarded: "{original_pause[:60]}"',
+                    quoted_pause=None,
+                    category=None,
+                    confidence=0.0,
+                )
+    # ─────────────────────────────────────────────────────────────────────
+
+    if kind == "parsed":
+        action = "flagged" if reaction.verdict.value == "PAUSE" else "reviewed"
+    else:
+        action = "error_parse"
+
+    # Dedup by composite key id:phase:asset_id
+    # build candidate row to compute asset id exactly as audit would
+    candidate_row = {
+        "date": entry_meta["date"],
+        "id": custom_id,
+        "language": lang,
+        "version": version,
+        "reviewed_at": datetime.now(timezone.utc).isoformat(),
+        "action": action,
+        "phase": phase,
+        "verdict": reaction.verdict.value,
+        "reaction": reaction.reaction,
+        "quoted_pause": reaction.quoted_pause,
+        "category": reaction.category.value if reaction.category else None,
+        "confidence": reaction.confidence,
+        "genome_fragment_id": None,
+        "raw_response": raw_response,
+        "phase1_verdict": None,
+        "phase1_issue": None,
+        "phase1_quoted": None,
+        "phase1_confidence": None,
+        "phase1_raw": None,
+    }
+
+    record = None
+    if not _ctx["dry_run"]:
+        record = build_record(
+            entry_date=entry_meta["date"],
+            entry_id=custom_id,
+            lang=lang,
+            version=version,
+            # error rows keep the historical phase=0
+            **({"phase": phase} if kind == "parsed" else {}),
+            action=action,
+            reaction=reaction,
+            raw_response=raw_response,
+        )
+
+    return {
+        "custom_id": custom_id,
+        "date": entry_meta["date"],
+        "kind": kind,
+        "action": action,
+        "reaction": reaction,
+        "asset": compute_asset_id(candidate_row),
+        "record": record,
+        "log": log.getvalue(),
+    }
+
+
+def _parse_chunk(lines: list[tuple[int, str]]) -> list[dict | None]:
+    return [_parse_line(line_num, line) for line_num, line in lines]
+
+
+def _chunks(path: Path) -> Iterator[list[tuple[int, str]]]:
+    with open(path, encoding="utf-8") as f:
+        chunk = []
+        for item in enumerate(f, 1):
+            chunk.append(item)
+            if len(chunk) >= CHUNK_LINES:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+
+def _parsed_lines(
+    results_path: Path, workers: int, initargs: tuple
+) -> Iterator[dict | None]:
+    """
+    Parsed results in file order. Chunks go to a process pool (at most
+    workers * 4 in flight, so memory stays bounded); small files or
+    workers <= 1 parse in-process.
+    """
+    if workers <= 1 or results_path.stat().st_size < PARALLEL_MIN_BYTES:
+        _init_worker(*initargs)
+        for chunk in _chunks(results_path):
+            yield from _parse_chunk(chunk)
+        return
+
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=initargs
+    ) as pool:
+        in_flight: deque = deque()
+        for chunk in _chunks(results_path):
+            in_flight.append(pool.submit(_parse_chunk, chunk))
+            if len(in_flight) >= workers * 4:
+                yield from in_flight.popleft().result()
+        while in_flight:
+            yield from in_flight.popleft().result()
+
+
 # ── Main ──────────────────────────────────────────────────────────────────────
 
 
@@ -222,26 +431,23 @@ def process_results(
     overwrite: bool = False,
     phase: int = 2,
     source_path: Path | None = None,
+    workers: int | None = None,
 ) -> dict:
     """
     Parse batch results and write AuditRecord JSONL.
     Returns summary dict: {"ok": int, "paused": int, "errors": int, "skipped": int}.
     phase=1 → expects CLEAN/FLAG schema; phase=2 → expects OK/PAUSE schema (default).
+    Lines are decoded and parsed in a process pool (workers, default: CPU
+    count); dedup, genome absorption and audit writes stay in this process,
+    in file order, through one buffered AuditWriter.
     Callable from batch_pipeline.py or standalone via main().
     """
     log_path = audit_path(lang, version, year)
 
-    # Load existing audit into memory for dedup (id:phase)
+    # Load existing audit keys for dedup (id:phase) from the sidecar index
     existing: set[str] = set()  # "id:phase"
-    if log_path.exists() and not overwrite:
-        with open(log_path, encoding="utf-8") as f:
-            for line in f:
-                if line.strip():
-                    try:
-                        r = json.loads(line)
-                        existing.add(f"{r['id']}:{r.get('phase', 0)}")
-                    except Exception:
-                        pass
+    if not overwrite:
+        existing = set(load_index(log_path))
 
     # Load genome for PAUSE absorption
     genome = ensure_genome(lang, version, year)
@@ -271,244 +477,59 @@ def process_results(
     print(f"  ✅ {len(input_index)} entries indexed")
 
     total = ok = paused = errors = skipped = 0
+    workers = workers if workers is not None else (os.cpu_count() or 1)
+    initargs = (input_index, source_index, lang, version, phase, dry_run)
+    writer = None if dry_run else AuditWriter(log_path)
 
-    with open(results_path, encoding="utf-8") as f:
-        for line_num, line in enumerate(f, 1):
-            line = line.strip()
-            if not line:
+    try:
+        for parsed in _parsed_lines(Path(results_path), workers, initargs):
+            if parsed is None:
                 continue
-
-            try:
-                result = json.loads(line)
-            except json.JSONDecodeError:
-                print(f"  ⚠️  Line {line_num}: invalid JSON — skipping")
+            if "skip" in parsed:
+                print(parsed["skip"])
                 skipped += 1
                 continue
+            if parsed["log"]:
+                print(parsed["log"], end="")
 
-            custom_id = result.get("custom_id", "")
-            if not custom_id:
-                print(f"  ⚠️  Line {line_num}: missing custom_id — skipping")
+            custom_id = parsed["custom_id"]
+            if f"{custom_id}:{phase}:{parsed['asset']}" in existing:
                 skipped += 1
                 continue
 
-            entry_meta = input_index.get(custom_id)
-            if not entry_meta:
-                print(
-                    f"  ⚠️  Line {line_num}: custom_id '{custom_id}' not in input index — skipping"
-                )
-                skipped += 1
-                continue
-
-            raw_content = extract_content(result)
-            if not raw_content:
-                # compute candidate asset id for this (empty) response
-                action_tmp = "error_parse"
-                err_reaction_tmp = ReaderReaction(
-                    verdict=Verdict.OK,
-                    reaction="[collect_batch] Empty response from batch provider.",
-                    quoted_pause=None,
-                    category=None,
-                    confidence=0.0,
-                )
-                candidate_row_tmp = {
-                    "date": entry_meta["date"],
-                    "id": custom_id,
-                    "language": lang,
-                    "version": version,
-                    "reviewed_at": datetime.now(timezone.utc).isoformat(),
-                    "action": action_tmp,
-                    "phase": phase,
-                    "verdict": err_reaction_tmp.verdict.value,
-                    "reaction": err_reaction_tmp.reaction,
-                    "quoted_pause": err_reaction_tmp.quoted_pause,
-                    "category": None,
-                    "confidence": err_reaction_tmp.confidence,
-                    "genome_fragment_id": None,
-                    "raw_response": None,
-                    "phase1_verdict": None,
-                    "phase1_issue": None,
-                    "phase1_quoted": None,
-                    "phase1_confidence": None,
-                    "phase1_raw": None,
-                }
-                candidate_asset_tmp = compute_asset_id(candidate_row_tmp)
-                if f"{custom_id}:{phase}:{candidate_asset_tmp}" in existing:
-                    skipped += 1
-                    continue
-                print(
-                    f"  ❌  {custom_id}: empty/missing content — logging as error_parse"
-                )
-                if not dry_run:
-                    err_reaction = ReaderReaction(
-                        verdict=Verdict.OK,
-                        reaction="[collect_batch] Empty response from batch provider.",
-                        quoted_pause=None,
-                        category=None,
-                        confidence=0.0,
-                    )
-                    record = build_record(
-                        entry_date=entry_meta["date"],
-                        entry_id=custom_id,
-                        lang=lang,
-                        version=version,
-                        action="error_parse",
-                        reaction=err_reaction,
-                        raw_response=None,
-                    )
-                    append_record(log_path, record)
-                errors += 1
-                continue
-
-            if phase == 1:
-                reaction = _parse_phase1_reaction(raw_content)
-            else:
-                reaction = _parse_reaction(raw_content)
-
-            if reaction is None:
-                # compute candidate asset id for this parse-failure case
-                action_tmp = "error_parse"
-                err_reaction_tmp = ReaderReaction(
-                    verdict=Verdict.OK,
-                    reaction="[collect_batch] Could not parse JSON from model response.",
-                    quoted_pause=None,
-                    category=None,
-                    confidence=0.0,
-                )
-                candidate_row_tmp = {
-                    "date": entry_meta["date"],
-                    "id": custom_id,
-                    "language": lang,
-                    "version": version,
-                    "reviewed_at": datetime.now(timezone.utc).isoformat(),
-                    "action": "error_parse",
-                    "phase": phase,
-                    "verdict": err_reaction_tmp.verdict.value,
-                    "reaction": err_reaction_tmp.reaction,
-                    "quoted_pause": err_reaction_tmp.quoted_pause,
-                    "category": None,
-                    "confidence": err_reaction_tmp.confidence,
-                    "genome_fragment_id": None,
-                    "raw_response": raw_content,
-                    "phase1_verdict": None,
-                    "phase1_issue": None,
-                    "phase1_quoted": None,
-                    "phase1_confidence": None,
-                    "phase1_raw": None,
-                }
-                candidate_asset_tmp = compute_asset_id(candidate_row_tmp)
-                if f"{custom_id}:{phase}:{candidate_asset_tmp}" in existing:
-                    skipped += 1
-                    continue
-                print(
-                    f"  ❌  {custom_id}: failed to parse JSON verdict — logging as error_parse"
+            if parsed["kind"] != "parsed":
+                reason = (
+                    "empty/missing content"
+                    if parsed["kind"] == "empty"
+                    else "failed to parse JSON verdict"
                 )
-                if not dry_run:
-                    err_reaction = ReaderReaction(
-                        verdict=Verdict.OK,
-                        reaction="[collect_batch] Could not parse JSON from model response.",
-                        quoted_pause=None,
-                        category=None,
-                        confidence=0.0,
-                    )
-                    record = build_record(
-                        entry_date=entry_meta["date"],
-                        entry_id=custom_id,
-                        lang=lang,
-                        version=version,
-                        action="error_parse",
-                        reaction=err_reaction,
-                        raw_response=raw_content,
-                    )
-                    append_record(log_path, record)
+                print(f"  ❌  {custom_id}: {reason} — logging as error_parse")
+                if writer:
+                    writer.append(parsed["record"])
                 errors += 1
                 continue
 
-            # ── Verbatim gate (Phase 1 only) ─────────────────────────────
-            # Discard any flags whose quoted_problem is not found verbatim
-            # in the source entry. These are model hallucinations.
-            if (
-                phase == 1
-                and source_index
-                and reaction
-                and reaction.verdict == Verdict.PAUSE
-            ):
-                source_text = source_index.get(custom_id, "")
-                if source_text:
-                    original_pause = reaction.quoted_pause or ""
-                    if original_pause and original_pause not in source_text:
-                        print(
-                            f"  🚫  {custom_id}: quoted_problem not in source "
-                            f"(hallucinated) — downgraded to CLEAN"
-                        )
-                        # Downgrade to CLEAN — do not write as flagged
-                        reaction = ReaderReaction(
-                            verdict=Verdict.OK,
-                            reaction=f'[gate] Hallucinated flag discarded: "{original_pause[:60]}"',
-                            quoted_pause=None,
-                            category=None,
-                            confidence=0.0,
-                        )
-            # ─────────────────────────────────────────────────────────────
-
-            action = "flagged" if reaction.verdict.value == "PAUSE" else "reviewed"
-
-            # Dedup by composite key id:phase:asset_id
-            # build candidate row to compute asset id exactly as audit would
-            candidate_row = {
-                "date": entry_meta["date"],
-                "id": custom_id,
-                "language": lang,
-                "version": version,
-                "reviewed_at": datetime.now(timezone.utc).isoformat(),
-                "action": action,
-                "phase": phase,
-                "verdict": reaction.verdict.value,
-                "reaction": reaction.reaction,
-                "quoted_pause": reaction.quoted_pause,
-                "category": reaction.category.value if reaction.category else None,
-                "confidence": reaction.confidence,
-                "genome_fragment_id": None,
-                "raw_response": raw_content,
-                "phase1_verdict": None,
-                "phase1_issue": None,
-                "phase1_quoted": None,
-                "phase1_confidence": None,
-                "phase1_raw": None,
-            }
-            candidate_asset = compute_asset_id(candidate_row)
-            if f"{custom_id}:{phase}:{candidate_asset}" in existing:
-                skipped += 1
-                continue
-
-            if not dry_run:
-                record = build_record(
-                    entry_date=entry_meta["date"],
-                    entry_id=custom_id,
-                    lang=lang,
-                    version=version,
-                    phase=phase,
-                    action=action,
-                    reaction=reaction,
-                    raw_response=raw_content,
-                )
-                append_record(log_path, record)
+            action, reaction = parsed["action"], parsed["reaction"]
+            if writer:
+                writer.append(parsed["record"])
                 # mark as seen for this phase
                 existing.add(f"{custom_id}:{phase}")
                 if action == "flagged" and reaction.category and reaction.quoted_pause:
-                    genome, _ = absorb_reaction(
-                        genome, reaction, entry_meta["date"], year
-                    )
+                    genome, _ = absorb_reaction(genome, reaction, parsed["date"], year)
                     genome_dirty = True
 
             total += 1
             if action == "flagged":
                 paused += 1
                 print(
-                    f"  🔶  {entry_meta['date']} [{reaction.category.value if reaction.category else '?'}] "
+                    f"  🔶  {parsed['date']} [{reaction.category.value if reaction.category else '?'}] "
                     f'conf={reaction.confidence:.2f}  "{(reaction.quoted_pause or "")[:60]}"'
                 )
             else:
                 ok += 1
+    finally:
+        if writer:
+            writer.close()
 
     if genome_dirty and not dry_run:
         save_genome(genome, year)
@@ -569,6 +590,12 @@ def main():
         default=None,
         help="Source devotional JSON (required for Phase 1 verbatim gate).",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Parser processes (default: CPU count; 1 = parse in-process)",
+    )
     args = parser.parse_args()
 
     process_results(
@@ -581,6 +608,7 @@ def main():
         overwrite=args.overwrite,
         phase=args.phase,
         source_path=Path(args.source) if args.source else None,
+        workers=args.workers,
     )
 
 
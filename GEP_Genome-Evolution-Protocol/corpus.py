@@ -0,0 +1,318 @@
+"""
+corpus.py — GEP Critic v3
+Single responsibility: parse devotional source files once and serve entries.
+
+Design:
+    - One schema walk for every source shape in use: {"data": {lang: {date:
+      [entry, ...]}}}, {"data": {date: entry_or_list}}, a bare date map and a
+      plain entry list. A date value may be one entry or a list of entries.
+    - Columnar form: per-row dates, ids, languages and versions, plus one text
+      buffer holding versiculo / reflexion / oracion / para_meditar / tags for
+      every row back to back. offsets[row * 5 + k] is where field k starts.
+    - Rows of one language are contiguous; spans maps language → (start, end).
+      A flat file has a single "" span.
+    - DevotionalEntry objects are built on demand from buffer slices; scans
+      read field text without building entries at all.
+    - Disk cache: data/cache/corpus/<stem>_<path hash>.pickle, keyed by the
+      source's size + mtime_ns and, when those change, its SHA-256 — a touched
+      but unchanged file is re-stamped, not re-parsed. Written atomically.
+    - In-process memo: repeated open_corpus() calls on an unchanged file
+      return the same Corpus.
+    - GEP_CORPUS_CACHE=0 disables the disk cache (the memo stays).
+
+Usage:
+    from corpus import open_corpus
+
+    corpus = open_corpus("data/source/Devocional_year_2025_es_NVI.json")
+    entries = corpus.entries("es")                 # list[DevotionalEntry]
+    for row in corpus.rows():
+        text = corpus.field(row, "reflexion")
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+import threading
+from array import array
+from pathlib import Path
+from typing import Iterator
+
+import paths as _paths
+from atomic_file import replace_file
+from models import DevotionalEntry
+
+FORMAT = 1
+
+FIELDS = ("versiculo", "reflexion", "oracion", "para_meditar", "tags")
+_LIST_FIELDS = {"para_meditar", "tags"}
+_FIELD_INDEX = {name: k for k, name in enumerate(FIELDS)}
+_ENTRY_KEYS = {"id", "date", "fecha", *FIELDS}
+
+
+def enabled() -> bool:
+    return os.environ.get("GEP_CORPUS_CACHE", "1") != "0"
+
+
+def _is_entry(value) -> bool:
+    return isinstance(value, dict) and not _ENTRY_KEYS.isdisjoint(value)
+
+
+def _text(value) -> str:
+    if isinstance(value, str):
+        return value
+    return "" if value is None else str(value)
+
+
+def _sections(data) -> list[tuple[str, list[tuple[str, dict]]]]:
+    """
+    Normalise any source shape to [(lang, [(date_key, item), ...])].
+    lang is "" for files not keyed by language; date_key is "" for list files.
+    """
+    root = data.get("data", data) if isinstance(data, dict) else data
+    if isinstance(root, list):
+        return [("", [("", item) for item in root])]
+    if not isinstance(root, dict):
+        return [("", [])]
+
+    def dated(date_map: dict) -> list[tuple[str, dict]]:
+        items = []
+        for date_key, value in date_map.items():
+            for item in value if isinstance(value, list) else [value]:
+                items.append((date_key, item))
+        return items
+
+    nested = any(isinstance(v, dict) and not _is_entry(v) for v in root.values())
+    if not nested:
+        return [("", dated(root))]
+    return [(lang, dated(m)) for lang, m in root.items() if isinstance(m, dict)]
+
+
+class Corpus:
+    """Columnar, read-only view of one devotional source file."""
+
+    def __init__(
+        self,
+        spans: dict[str, tuple[int, int]],
+        dates: list[str],
+        ids: list[str],
+        languages: list[str],
+        versions: list[str],
+        text: str,
+        offsets: array,
+    ):
+        self.spans = spans
+        self.dates = dates
+        self.ids = ids
+        self.languages = languages
+        self.versions = versions
+        self.text = text
+        self.offsets = offsets
+
+    @classmethod
+    def from_data(cls, data) -> "Corpus":
+        """Build the columns from parsed source JSON (any supported shape)."""
+        spans: dict[str, tuple[int, int]] = {}
+        dates, ids, languages, versions = [], [], [], []
+        parts: list[str] = []
+        offsets = array("I", [0])
+        pos = 0
+        for lang, items in _sections(data):
+            start = len(ids)
+            for date_key, item in items:
+                if not isinstance(item, dict):
+                    continue
+                dates.append(date_key or _text(item.get("date", item.get("fecha"))))
+                ids.append(_text(item.get("id")))
+                languages.append(_text(item.get("language")) or lang)
+                versions.append(_text(item.get("version")))
+                for name in FIELDS:
+                    value = item.get(name)
+                    if name in _LIST_FIELDS:
+                        value = json.dumps(value, ensure_ascii=False) if value else ""
+                    else:
+                        value = _text(value)
+                    parts.append(value)
+                    pos += len(value)
+                    offsets.append(pos)
+            spans[lang] = (start, len(ids))
+        return cls(spans, dates, ids, languages, versions, "".join(parts), offsets)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @property
+    def nested(self) -> bool:
+        """True when the file is keyed by language."""
+        return "" not in self.spans
+
+    def has_language(self, lang: str) -> bool:
+        return self.nested and lang in self.spans
+
+    def rows(self, lang: str | None = None) -> range:
+        """
+        Row numbers for one language. lang=None picks the first language of a
+        nested file; a flat file returns all rows whatever lang is.
+        """
+        if not self.nested:
+            return range(len(self))
+        if lang is None:
+            lang = next(iter(self.spans), None)
+        start, end = self.spans.get(lang, (0, 0))
+        return range(start, end)
+
+    def field(self, row: int, name: str) -> str:
+        """Raw text of one field (list fields come back JSON-encoded)."""
+        k = row * len(FIELDS) + _FIELD_INDEX[name]
+        return self.text[self.offsets[k] : self.offsets[k + 1]]
+
+    def _list(self, row: int, name: str) -> list:
+        raw = self.field(row, name)
+        return json.loads(raw) if raw else []
+
+    def entry(
+        self,
+        row: int,
+        language: str | None = None,
+        version: str | None = None,
+    ) -> DevotionalEntry:
+        """Materialise one row; language / version override the stored values."""
+        return DevotionalEntry(
+            date=self.dates[row],
+            id=self.ids[row],
+            language=self.languages[row] if language is None else language,
+            version=self.versions[row] if version is None else version,
+            versiculo=self.field(row, "versiculo"),
+            reflexion=self.field(row, "reflexion"),
+            oracion=self.field(row, "oracion"),
+            para_meditar=self._list(row, "para_meditar"),
+            tags=self._list(row, "tags"),
+        )
+
+    def entries(
+        self,
+        lang: str | None = None,
+        language: str | None = None,
+        version: str | None = None,
+    ) -> list[DevotionalEntry]:
+        """Entries of one language in file order (see rows())."""
+        entries = [self.entry(row, language, version) for row in self.rows(lang)]
+        if lang and language is None:
+            for e in entries:
+                e.language = e.language or lang
+        return entries
+
+    def texts(
+        self, lang: str | None = None, fields=("reflexion", "oracion")
+    ) -> Iterator[tuple[int, str, str]]:
+        """(row, field, text) for every row of one language, without entries."""
+        for row in self.rows(lang):
+            for name in fields:
+                yield row, name, self.field(row, name)
+
+    def source_index(self, lang: str | None = None) -> dict[str, str]:
+        """entry_id → "reflexion oracion" for rows with an id."""
+        return {
+            self.ids[row]: self.field(row, "reflexion")
+            + " "
+            + self.field(row, "oracion")
+            for row in self.rows(lang)
+            if self.ids[row]
+        }
+
+    def _columns(self) -> dict:
+        return {
+            "spans": self.spans,
+            "dates": self.dates,
+            "ids": self.ids,
+            "languages": self.languages,
+            "versions": self.versions,
+            "text": self.text,
+            "offsets": self.offsets,
+        }
+
+
+# ── Disk cache ────────────────────────────────────────────────────────────────
+
+
+def cache_path(source: Path) -> Path:
+    """Cache file for one source path (the directory hash keeps stems apart)."""
+    source = Path(source).resolve()
+    tag = hashlib.sha1(str(source).encode("utf-8")).hexdigest()[:12]
+    return _paths.CACHE_DIR / "corpus" / f"{source.stem}_{tag}.pickle"
+
+
+def _read_cache(path: Path) -> dict | None:
+    try:
+        with open(path, "rb") as f:
+            cached = pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        print(f"  ⚠️  Corpus cache unreadable ({path.name}): {e} — rebuilding")
+        return None
+    if not isinstance(cached, dict) or cached.get("format") != FORMAT:
+        return None
+    return cached
+
+
+def _write_cache(path: Path, cached: dict) -> None:
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(cached, f, protocol=pickle.HIGHEST_PROTOCOL)
+            replace_file(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+    except OSError as e:
+        print(f"  ⚠️  Corpus cache write failed: {e}")
+
+
+def _load(source: Path, stamp: tuple[int, int]) -> Corpus:
+    cpath = cache_path(source) if enabled() else None
+    cached = _read_cache(cpath) if cpath else None
+    if cached and cached["stamp"] == stamp:
+        return Corpus(**cached["columns"])
+
+    raw = source.read_bytes()
+    digest = hashlib.sha256(raw).hexdigest()
+    if cached and cached["sha256"] == digest:
+        corpus = Corpus(**cached["columns"])
+    else:
+        corpus = Corpus.from_data(json.loads(raw.decode("utf-8")))
+    if cpath:
+        _write_cache(
+            cpath,
+            {
+                "format": FORMAT,
+                "stamp": stamp,
+                "sha256": digest,
+                "columns": corpus._columns(),
+            },
+        )
+    return corpus
+
+
+_memo: dict[Path, tuple[tuple[int, int], Corpus]] = {}
+_memo_lock = threading.Lock()
+
+
+def open_corpus(source) -> Corpus:
+    """
+    Corpus for a source JSON file: memo, then disk cache, then a fresh parse.
+    Raises FileNotFoundError / json.JSONDecodeError like json.load would.
+    """
+    source = Path(source).resolve()
+    st = source.stat()
+    stamp = (st.st_size, st.st_mtime_ns)
+    with _memo_lock:
+        hit = _memo.get(source)
+        if hit and hit[0] == stamp:
+            return hit[1]
+        corpus = _load(source, stamp)
+        _memo[source] = (stamp, corpus)
+        return corpus
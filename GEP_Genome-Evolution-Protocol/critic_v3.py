@@ -9,6 +9,7 @@ Every PAUSE reaction grows the genome for future runs.
 
 Usage:
   python critic_v3.py --lang pt --version ARC --year 2025 --mode overnight
+  python critic_v3.py --lang pt --version ARC --year 2025 --mode overnight --workers 8
   python critic_v3.py --lang pt --version ARC --year 2025 --role elder --mode overnight
   python critic_v3.py --lang pt --version ARC --year 2025 --role charismatic
   python critic_v3.py --lang es --version NVI --year 2025 --mode interactive
@@ -89,6 +90,8 @@ def main():
         epilog=(
             "Examples:\n"
             "  python critic_v3.py --lang pt --version ARC --year 2025 --mode overnight\n"
+            "  python critic_v3.py --lang pt --version ARC --year 2025 --workers 8\n"
+            "  python critic_v3.py --lang pt --version ARC --year 2025 --p1-workers 16 --p2-workers 4\n"
             "  python critic_v3.py --lang pt --version ARC --year 2025 --role elder\n"
             "  python critic_v3.py --lang pt --version ARC --year 2025 --role charismatic\n"
             "  python critic_v3.py --lang pt --version ARC --year 2025 --role new_believer\n"
@@ -122,6 +125,26 @@ def main():
     parser.add_argument(
         "--start-date", dest="start_date", help="Skip entries before YYYY-MM-DD"
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Overnight mode: entries reviewed concurrently (default 1 = sequential)",
+    )
+    parser.add_argument(
+        "--p1-workers",
+        dest="p1_workers",
+        type=int,
+        default=0,
+        help="Overnight mode: pipeline Phase 1 with its own pool size (0 = --workers)",
+    )
+    parser.add_argument(
+        "--p2-workers",
+        dest="p2_workers",
+        type=int,
+        default=0,
+        help="Overnight mode: pipeline Phase 2 with its own pool size (0 = --workers)",
+    )
     parser.add_argument(
         "--local", metavar="FILE", help="Use local JSON file instead of GitHub fetch"
     )
@@ -260,7 +283,12 @@ def main():
         run_interactive(**kwargs)
     else:
         overnight_kwargs = {k: v for k, v in kwargs.items() if k != "role"}
-        run_overnight(**overnight_kwargs)
+        run_overnight(
+            **overnight_kwargs,
+            workers=args.workers,
+            p1_workers=args.p1_workers,
+            p2_workers=args.p2_workers,
+        )
 
 
 if __name__ == "__main__":
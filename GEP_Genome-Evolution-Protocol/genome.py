@@ -1,13 +1,34 @@
 """
 genome.py — GEP Critic v3
 Single responsibility: load, update, and persist the GEP genome.
+
+Absorption looks up similar fragments through FragmentWordIndex, an inverted
+index (category → word → fragment positions) kept on the genome and grown as
+fragments are appended, so a PAUSE only scores fragments sharing a word
+with its quote. Fragment category and example_quote are treated as
+immutable; replacing or shrinking genome.fragments triggers a rebuild.
+
+Persistence: genome_{lang}_{version}_{year}.json is a snapshot, and
+absorb_reaction appends one add / update / promote event per PAUSE to
+genome_{lang}_{version}_{year}.journal.jsonl — O(1) I/O instead of a
+full rewrite. load_genome replays the journal over the snapshot; events
+carry absolute values, so replaying one already in the snapshot is
+harmless. A line torn by a crash is skipped, and the next event starts on
+a fresh line after it. save_genome compacts: the
+snapshot is written to a temp file, fsynced and renamed over the old one,
+then the journal is removed. Absorption compacts on its own once the
+journal passes JOURNAL_COMPACT_BYTES.
 """
 
 import json
+import os
+import tempfile
 import uuid
 from datetime import datetime, timezone
 from pathlib import Path
 
+from atomic_file import replace_file
+from corpus import Corpus, open_corpus
 from models import (
     Genome,
     GenomeFragment,
@@ -16,12 +37,16 @@ from models import (
     ReaderReaction,
     Verdict,
 )
+from quote_matcher import automaton_for
 
 # Minimum confidence a fragment needs to appear in prompts
 CONFIDENCE_SEED = 0.4  # first time a pattern is seen
 CONFIDENCE_BOOST = 0.15  # each additional evidence date
 CONFIDENCE_MAX = 0.95
 
+# Journal size at which absorb_reaction compacts into the snapshot
+JOURNAL_COMPACT_BYTES = 256 * 1024
+
 
 import paths as _paths
 
@@ -31,28 +56,77 @@ def genome_path(lang: str, version: str, year: int) -> Path:
     return _paths.GENOMES_DIR / f"genome_{lang}_{version}_{year}.json"
 
 
+def journal_path(lang: str, version: str, year: int) -> Path:
+    return genome_path(lang, version, year).with_suffix(".journal.jsonl")
+
+
+def _fragment_to_dict(f: GenomeFragment) -> dict:
+    return {
+        "id": f.id,
+        "language": f.language,
+        "version": f.version,
+        "category": f.category.value,
+        "pattern": f.pattern,
+        "example_quote": f.example_quote,
+        "evidence_dates": f.evidence_dates,
+        "confidence": f.confidence,
+        "state": f.state.value,
+        "created_at": f.created_at,
+        "updated_at": f.updated_at,
+    }
+
+
+def _fragment_from_dict(fr: dict) -> GenomeFragment:
+    return GenomeFragment(
+        id=fr["id"],
+        language=fr["language"],
+        version=fr["version"],
+        category=PauseCategory(fr["category"]),
+        pattern=fr["pattern"],
+        example_quote=fr["example_quote"],
+        evidence_dates=fr["evidence_dates"],
+        confidence=fr["confidence"],
+        created_at=fr["created_at"],
+        updated_at=fr["updated_at"],
+    )
+
+
+def _genome_header(genome: Genome) -> dict:
+    return {
+        "language": genome.language,
+        "version": genome.version,
+        "genome_version": genome.genome_version,
+        "total_entries_reviewed": genome.total_entries_reviewed,
+        "total_pauses": genome.total_pauses,
+        "updated_at": genome.updated_at,
+    }
+
+
+def _read_journal(path: Path) -> list[dict]:
+    if not path.exists():
+        return []
+    events = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                events.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue  # torn write from a crash — the events after it stand
+    return events
+
+
 def load_genome(lang: str, version: str, year: int) -> Genome | None:
     path = genome_path(lang, version, year)
-    if not path.exists():
+    events = _read_journal(journal_path(lang, version, year))
+    if path.exists():
+        with open(path, encoding="utf-8") as f:
+            raw = json.load(f)
+    elif events:
+        raw = dict(events[0]["genome"])  # never compacted yet
+    else:
         return None
-    with open(path, encoding="utf-8") as f:
-        raw = json.load(f)
-    fragments = [
-        GenomeFragment(
-            id=fr["id"],
-            language=fr["language"],
-            version=fr["version"],
-            category=PauseCategory(fr["category"]),
-            pattern=fr["pattern"],
-            example_quote=fr["example_quote"],
-            evidence_dates=fr["evidence_dates"],
-            confidence=fr["confidence"],
-            created_at=fr["created_at"],
-            updated_at=fr["updated_at"],
-        )
-        for fr in raw.get("fragments", [])
-    ]
-    return Genome(
+    fragments = [_fragment_from_dict(fr) for fr in raw.get("fragments", [])]
+    genome = Genome(
         language=raw["language"],
         version=raw["version"],
         genome_version=raw["genome_version"],
@@ -61,37 +135,71 @@ def load_genome(lang: str, version: str, year: int) -> Genome | None:
         total_pauses=raw.get("total_pauses", 0),
         updated_at=raw.get("updated_at", ""),
     )
+    _replay(genome, events)
+    return genome
+
+
+def _replay(genome: Genome, events: list[dict]) -> None:
+    """Apply journal events in order. State is left to ensure_genome, as on load."""
+    by_id = {f.id: f for f in genome.fragments}
+    for event in events:
+        header = event["genome"]
+        genome.total_entries_reviewed = header["total_entries_reviewed"]
+        genome.total_pauses = header["total_pauses"]
+        genome.updated_at = header["updated_at"]
+        fr = event["fragment"]
+        frag = by_id.get(fr["id"])
+        if frag is None:
+            frag = by_id[fr["id"]] = _fragment_from_dict(fr)
+            genome.fragments.append(frag)
+        else:
+            frag.evidence_dates = fr["evidence_dates"]
+            frag.confidence = fr["confidence"]
+            frag.updated_at = fr["updated_at"]
+
+
+def _journal(genome: Genome, year: int, op: str, fragment: GenomeFragment) -> None:
+    """Append one event; compact into the snapshot once the journal is large."""
+    path = journal_path(genome.language, genome.version, year)
+    genome.updated_at = datetime.now(timezone.utc).isoformat()
+    event = {
+        "op": op,
+        "genome": _genome_header(genome),
+        "fragment": _fragment_to_dict(fragment),
+    }
+    torn = False
+    if path.is_file() and path.stat().st_size:
+        with open(path, "rb") as f:
+            f.seek(-1, os.SEEK_END)
+            torn = f.read(1) != b"\n"
+    with open(path, "a", encoding="utf-8") as f:
+        if torn:  # keep this event off the partial line
+            f.write("\n")
+        f.write(json.dumps(event, ensure_ascii=False) + "\n")
+        size = f.tell()
+    if size >= JOURNAL_COMPACT_BYTES:
+        save_genome(genome, year)
 
 
 def save_genome(genome: Genome, year: int):
+    """Write a full snapshot atomically and truncate the journal it absorbs."""
     path = genome_path(genome.language, genome.version, year)
     genome.updated_at = datetime.now(timezone.utc).isoformat()
     data = {
-        "language": genome.language,
-        "version": genome.version,
-        "genome_version": genome.genome_version,
-        "total_entries_reviewed": genome.total_entries_reviewed,
-        "total_pauses": genome.total_pauses,
-        "updated_at": genome.updated_at,
-        "fragments": [
-            {
-                "id": f.id,
-                "language": f.language,
-                "version": f.version,
-                "category": f.category.value,
-                "pattern": f.pattern,
-                "example_quote": f.example_quote,
-                "evidence_dates": f.evidence_dates,
-                "confidence": f.confidence,
-                "state": f.state.value,
-                "created_at": f.created_at,
-                "updated_at": f.updated_at,
-            }
-            for f in genome.fragments
-        ],
+        **_genome_header(genome),
+        "fragments": [_fragment_to_dict(f) for f in genome.fragments],
     }
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=path.stem, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        replace_file(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+    journal_path(genome.language, genome.version, year).unlink(missing_ok=True)
 
 
 def _promote_pending(genome: Genome):
@@ -151,10 +259,14 @@ def absorb_reaction(
         existing.confidence = min(
             existing.confidence + CONFIDENCE_BOOST, CONFIDENCE_MAX
         )
+        op = "update"
         if existing.confidence >= 0.7:
+            if existing.state != GeneState.CONFIRMED:
+                op = "promote"
             existing.state = GeneState.CONFIRMED
         existing.updated_at = now
-        save_genome(genome, year)
+        genome.touch()
+        _journal(genome, year, op, existing)
         return genome, existing.id
 
     # New fragment
@@ -172,10 +284,64 @@ def absorb_reaction(
         updated_at=now,
     )
     genome.fragments.append(fragment)
-    save_genome(genome, year)
+    _word_index(genome)  # indexes the new fragment
+    genome.touch()
+    _journal(genome, year, "add", fragment)
     return genome, frag_id
 
 
+class FragmentWordIndex:
+    """
+    Inverted index over fragment example_quotes for _find_similar_fragment.
+    Words are normalised exactly as the overlap check does (lower().split()).
+    Positions refer to genome.fragments, so candidates come back in list order.
+    """
+
+    def __init__(self, fragments: list[GenomeFragment] = ()):
+        self.fragments: list[GenomeFragment] = []
+        self.sizes: list[int] = []  # distinct words per fragment
+        self.postings: dict[PauseCategory, dict[str, list[int]]] = {}
+        for frag in fragments:
+            self.add(frag)
+
+    def add(self, frag: GenomeFragment) -> None:
+        pos = len(self.fragments)
+        words = set(frag.example_quote.lower().split())
+        self.fragments.append(frag)
+        self.sizes.append(len(words))
+        by_word = self.postings.setdefault(frag.category, {})
+        for word in words:
+            by_word.setdefault(word, []).append(pos)
+
+    def shared_words(self, category: PauseCategory, words: set[str]) -> dict[int, int]:
+        """{fragment position: number of words shared} for one category."""
+        by_word = self.postings.get(category)
+        shared: dict[int, int] = {}
+        if not by_word:
+            return shared
+        for word in words:
+            for pos in by_word.get(word, ()):
+                shared[pos] = shared.get(pos, 0) + 1
+        return shared
+
+
+def _word_index(genome: Genome) -> FragmentWordIndex:
+    """The genome's word index, caught up with fragments appended since."""
+    index = genome.word_index
+    fragments = genome.fragments
+    n = len(index.fragments) if index else 0
+    if (
+        index is None
+        or len(fragments) < n
+        or (n and fragments[n - 1] is not index.fragments[n - 1])
+    ):
+        index = genome.word_index = FragmentWordIndex(fragments)
+    else:
+        for frag in fragments[n:]:
+            index.add(frag)
+    return index
+
+
 def _find_similar_fragment(
     genome: Genome,
     category: PauseCategory,
@@ -188,19 +354,16 @@ def _find_similar_fragment(
     distinct quotes create new fragments so the genome keeps learning.
     Returns the best-matching fragment (highest overlap), or None.
     """
+    index = _word_index(genome)
     quote_words = set(quote.lower().split())
     best: GenomeFragment | None = None
     best_overlap = 0.0
-    for frag in genome.fragments:
-        if frag.category != category:
-            continue
-        frag_words = set(frag.example_quote.lower().split())
-        if not quote_words or not frag_words:
-            continue
-        overlap = len(quote_words & frag_words) / min(len(quote_words), len(frag_words))
+    shared = index.shared_words(category, quote_words)
+    for pos in sorted(shared):
+        overlap = shared[pos] / min(len(quote_words), index.sizes[pos])
         if overlap >= 0.4 and overlap > best_overlap:
             best_overlap = overlap
-            best = frag
+            best = index.fragments[pos]
     return best
 
 
@@ -231,60 +394,42 @@ def corpus_scan(
         fragments = [f for f in fragments if f.category.value in categories]
 
     results: dict[str, list[dict]] = {f.id: [] for f in fragments}
+    quotes = {f.id: f.example_quote for f in fragments}
+    automaton = automaton_for(fragments)
 
     for source_path in source_paths:
-        with open(source_path, encoding="utf-8") as fp:
-            data = json.load(fp)
-
-        lang_data = data.get("data", {})
-        first_val = next(iter(lang_data.values()), {})
-        date_map = first_val if isinstance(first_val, dict) else lang_data
-
-        for date_key, entries in date_map.items():
-            for entry in entries:
-                eid = entry.get("id", "")
-                date = entry.get("date", date_key)
-                for field in ("reflexion", "oracion"):
-                    text = entry.get(field, "") or ""
-                    for fragment in fragments:
-                        pattern = fragment.example_quote
-                        if pattern in text:
-                            idx = text.find(pattern)
-                            context = text[max(0, idx - 40) : idx + len(pattern) + 60]
-                            results[fragment.id].append(
-                                {
-                                    "entry_id": eid,
-                                    "date": date,
-                                    "field": field,
-                                    "context": f"...{context}...",
-                                }
-                            )
+        corpus = open_corpus(source_path)
+        for row, field, text in corpus.texts():
+            for frag_id, idx in automaton.first_matches(text).items():
+                pattern = quotes[frag_id]
+                context = text[max(0, idx - 40) : idx + len(pattern) + 60]
+                results[frag_id].append(
+                    {
+                        "entry_id": corpus.ids[row],
+                        "date": corpus.dates[row],
+                        "field": field,
+                        "context": f"...{context}...",
+                    }
+                )
 
     return results
 
 
 def _scan_data_for_quotes(
-    data: dict,
+    data: dict | Corpus,
     confirmed: list[GenomeFragment],
     found_ids: set[str],
 ) -> None:
     """
-    Scan a parsed source JSON dict for confirmed fragment quotes.
-    Mutates found_ids in place. Shared by local and remote paths.
+    Scan a source corpus (or parsed source JSON dict) for confirmed fragment
+    quotes. Mutates found_ids in place. Shared by local and remote paths.
     """
-    lang_data = data.get("data", {})
-    first_val = next(iter(lang_data.values()), {})
-    date_map = first_val if isinstance(first_val, dict) else lang_data
-
-    for _date_key, entries in date_map.items():
-        if isinstance(entries, dict):
-            entries = [entries]
-        for entry in entries:
-            for field in ("reflexion", "oracion"):
-                text = entry.get(field, "") or ""
-                for frag in confirmed:
-                    if frag.id not in found_ids and frag.example_quote in text:
-                        found_ids.add(frag.id)
+    automaton = automaton_for(confirmed)
+    corpus = data if isinstance(data, Corpus) else Corpus.from_data(data)
+    for _row, _field, text in corpus.texts():
+        found_ids |= automaton.keys_in(text)
+        if len(found_ids) >= len(confirmed):
+            return  # early exit: all accounted for
 
 
 def verify_fragments_against_source(
@@ -343,9 +488,7 @@ def verify_fragments_against_source(
             if not Path(source_path).exists():
                 print(f"  ⚠️  Source file not found: {source_path} — skipped")
                 continue
-            with open(source_path, encoding="utf-8") as fp:
-                data = json.load(fp)
-            _scan_data_for_quotes(data, confirmed, found_ids)
+            _scan_data_for_quotes(open_corpus(source_path), confirmed, found_ids)
             if len(found_ids) == len(confirmed):
                 break  # early exit: all accounted for
 
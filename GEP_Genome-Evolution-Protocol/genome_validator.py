@@ -16,6 +16,10 @@ Usage:
 
     # Validate JSON file directly
     report = validate_file("path/to/file.json", genome, lang)
+
+    # Compile once, reuse across files / years
+    compiled = compile_genome(genome, confidence_threshold=0.6)
+    report = validate_file("path/to/file.json", compiled, lang)
 """
 
 import json
@@ -25,6 +29,7 @@ from pathlib import Path
 from typing import List, Dict
 
 from models import DevotionalEntry, Genome, GenomeFragment
+from quote_matcher import automaton_for
 
 
 @dataclass
@@ -82,107 +87,159 @@ class ValidationReport:
         return "\n".join(lines)
 
 
-def _search_pattern_in_text(
-    text: str, fragment: GenomeFragment, entry_id: str, entry_date: str, field: str
-) -> List[PatternMatch]:
-    """Search for a genome pattern in text. Returns list of matches."""
-    matches = []
+def _quote_match(
+    fragment: GenomeFragment, entry_id: str, entry_date: str, field: str
+) -> PatternMatch:
+    """Exact example_quote hit — one match per fragment per field."""
+    return PatternMatch(
+        entry_id=entry_id,
+        entry_date=entry_date,
+        field=field,
+        fragment_id=fragment.id,
+        category=fragment.category.value,
+        pattern=fragment.pattern,
+        matched_text=fragment.example_quote,
+        confidence=fragment.confidence,
+    )
+
+
+_REGEX_FLAGS = re.IGNORECASE | re.MULTILINE
+
+
+def _pattern_regex(fragment: GenomeFragment) -> str:
+    """Pattern format: "word1 word2" or "word1.*word2" or similar."""
+    return fragment.pattern.replace(" ", r"\s+")
+
+
+class CompiledGenome:
+    """
+    High-confidence genome fragments compiled once for validation.
+
+    - example_quotes share one lower-cased automaton (quote_matcher), so each
+      field is lowered and quote-scanned once for all fragments.
+    - Each pattern is compiled once; invalid regexes are dropped here with a
+      single warning instead of failing to compile per entry × field × fragment.
 
-    # Try exact quote match first
-    if fragment.example_quote.lower() in text.lower():
-        matches.append(
-            PatternMatch(
-                entry_id=entry_id,
-                entry_date=entry_date,
-                field=field,
-                fragment_id=fragment.id,
-                category=fragment.category.value,
-                pattern=fragment.pattern,
-                matched_text=fragment.example_quote,
-                confidence=fragment.confidence,
-            )
+    Matches are identical to searching fragment by fragment: the exact quote
+    if present, otherwise every non-overlapping regex match (re.finditer).
+    """
+
+    def __init__(self, genome: Genome | None, confidence_threshold: float = 0.6):
+        self.confidence_threshold = confidence_threshold
+        self.fragments: List[GenomeFragment] = (
+            genome.high_confidence_fragments(threshold=confidence_threshold)
+            if genome
+            else []
         )
+        self.automaton = automaton_for(self.fragments, ignore_case=True)
+        self.dropped: List[GenomeFragment] = []
+        self._regexes: Dict[str, re.Pattern] = {}  # fragment id → regex
+        for fragment in self.fragments:
+            try:
+                self._regexes[fragment.id] = re.compile(
+                    _pattern_regex(fragment), _REGEX_FLAGS
+                )
+            except re.error as e:
+                self.dropped.append(fragment)
+                print(f"  ⚠️  Invalid pattern regex in {fragment.id} — skipped ({e})")
+
+    def __bool__(self) -> bool:
+        return bool(self.fragments)
+
+    def search_field(
+        self, text: str, entry_id: str, entry_date: str, field: str
+    ) -> List[PatternMatch]:
+        """Every fragment match in one field, in fragment order."""
+        quoted = self.automaton.keys_in(text.lower())
+        matches = []
+        for fragment in self.fragments:
+            if fragment.id in quoted:
+                matches.append(_quote_match(fragment, entry_id, entry_date, field))
+                continue
+            regex = self._regexes.get(fragment.id)
+            if regex is None:
+                continue
+            for m in regex.finditer(text):
+                matches.append(
+                    PatternMatch(
+                        entry_id=entry_id,
+                        entry_date=entry_date,
+                        field=field,
+                        fragment_id=fragment.id,
+                        category=fragment.category.value,
+                        pattern=fragment.pattern,
+                        matched_text=m.group(0),
+                        confidence=fragment.confidence,
+                    )
+                )
         return matches
 
-    # Try pattern-based search (convert pattern to regex)
-    # Pattern format: "word1 word2" or "word1.*word2" or similar
-    pattern_regex = fragment.pattern.replace(" ", r"\s+")
 
-    try:
-        regex = re.compile(pattern_regex, re.IGNORECASE | re.MULTILINE)
-        for match in regex.finditer(text):
-            matched_text = match.group(0)
-            matches.append(
-                PatternMatch(
-                    entry_id=entry_id,
-                    entry_date=entry_date,
-                    field=field,
-                    fragment_id=fragment.id,
-                    category=fragment.category.value,
-                    pattern=fragment.pattern,
-                    matched_text=matched_text,
-                    confidence=fragment.confidence,
-                )
-            )
-    except re.error:
-        # If pattern is not valid regex, skip
-        pass
+_COMPILED_CACHE_SIZE = 8
+_compiled_cache: Dict[tuple, CompiledGenome] = {}
 
-    return matches
+
+def compile_genome(genome: Genome, confidence_threshold: float = 0.6) -> CompiledGenome:
+    """
+    CompiledGenome for this genome, reused until a fragment's quote, pattern
+    or confidence changes (or the threshold does).
+    """
+    key = (
+        tuple(
+            (f.id, f.example_quote, f.pattern, f.confidence) for f in genome.fragments
+        ),
+        confidence_threshold,
+    )
+    compiled = _compiled_cache.pop(key, None)
+    if compiled is None:
+        compiled = CompiledGenome(genome, confidence_threshold)
+        if len(_compiled_cache) >= _COMPILED_CACHE_SIZE:
+            del _compiled_cache[next(iter(_compiled_cache))]  # least recently used
+    _compiled_cache[key] = compiled
+    return compiled
+
+
+def _as_compiled(
+    genome: "Genome | CompiledGenome | None", confidence_threshold: float
+) -> CompiledGenome | None:
+    if genome is None or isinstance(genome, CompiledGenome):
+        return genome
+    return compile_genome(genome, confidence_threshold)
 
 
 def validate_entry(
-    entry: DevotionalEntry, genome: Genome, confidence_threshold: float = 0.6
+    entry: DevotionalEntry,
+    genome: "Genome | CompiledGenome",
+    confidence_threshold: float = 0.6,
 ) -> List[PatternMatch]:
     """
     Validate a single entry against genome patterns.
 
     Args:
         entry: DevotionalEntry to validate
-        genome: Genome with patterns to check
+        genome: Genome with patterns to check, or a CompiledGenome
+                (its own threshold then applies)
         confidence_threshold: Minimum confidence for patterns to check
 
     Returns:
         List of PatternMatch objects for patterns found
     """
-    if not genome:
+    compiled = _as_compiled(genome, confidence_threshold)
+    if not compiled:
         return []
 
     matches = []
-    high_conf_fragments = genome.high_confidence_fragments(
-        threshold=confidence_threshold
-    )
-
-    # Check reflexion field
-    for fragment in high_conf_fragments:
-        matches.extend(
-            _search_pattern_in_text(
-                entry.reflexion, fragment, entry.id, entry.date, "reflexion"
-            )
-        )
-
-    # Check oracion field
-    for fragment in high_conf_fragments:
-        matches.extend(
-            _search_pattern_in_text(
-                entry.oracion, fragment, entry.id, entry.date, "oracion"
-            )
-        )
-
-    # Check versiculo field (less common, but possible)
-    for fragment in high_conf_fragments:
+    # versiculo last — less common, but possible
+    for field in ("reflexion", "oracion", "versiculo"):
         matches.extend(
-            _search_pattern_in_text(
-                entry.versiculo, fragment, entry.id, entry.date, "versiculo"
-            )
+            compiled.search_field(getattr(entry, field), entry.id, entry.date, field)
         )
-
     return matches
 
 
 def validate_entries(
     entries: List[DevotionalEntry],
-    genome: Genome,
+    genome: "Genome | CompiledGenome",
     lang: str,
     version: str,
     year: int,
@@ -193,11 +250,12 @@ def validate_entries(
 
     Args:
         entries: List of DevotionalEntry objects
-        genome: Genome with patterns
+        genome: Genome with patterns, or a CompiledGenome to reuse across calls
         lang: Language code
         version: Bible version
         year: Year
         confidence_threshold: Minimum confidence for patterns
+                              (ignored when a CompiledGenome is passed)
 
     Returns:
         ValidationReport with all matches found
@@ -208,12 +266,12 @@ def validate_entries(
 
     print(f"\n  🔍 Validating {len(entries)} entries against genome patterns...")
     print(f"     Language: {lang} | Version: {version} | Year: {year}")
-    print(f"     Confidence threshold: {confidence_threshold}")
-
-    if genome:
-        fragments = genome.high_confidence_fragments(threshold=confidence_threshold)
-        print(f"     Genome fragments: {len(fragments)}")
+    compiled = _as_compiled(genome, confidence_threshold) if genome else None
+    if compiled is not None:
+        print(f"     Confidence threshold: {compiled.confidence_threshold}")
+        print(f"     Genome fragments: {len(compiled.fragments)}")
     else:
+        print(f"     Confidence threshold: {confidence_threshold}")
         print("     ⚠️  No genome available — skipping validation")
         return ValidationReport(
             total_entries=len(entries),
@@ -224,7 +282,7 @@ def validate_entries(
         )
 
     for entry in entries:
-        entry_matches = validate_entry(entry, genome, confidence_threshold)
+        entry_matches = validate_entry(entry, compiled)
         if entry_matches:
             entries_with_matches += 1
             all_matches.extend(entry_matches)
@@ -248,30 +306,31 @@ def validate_entries(
 
 
 def validate_file(
-    file_path: str, genome: Genome, lang: str, confidence_threshold: float = 0.6
+    file_path: str,
+    genome: "Genome | CompiledGenome",
+    lang: str,
+    confidence_threshold: float = 0.6,
 ) -> ValidationReport:
     """
     Validate a devotional JSON file against genome patterns.
 
     Args:
         file_path: Path to devotional JSON file
-        genome: Genome with patterns
+        genome: Genome with patterns, or a CompiledGenome
         lang: Language code
         confidence_threshold: Minimum confidence
 
     Returns:
         ValidationReport with matches found
     """
+    from corpus import open_corpus
     from source import extract_entries
 
     path = Path(file_path)
     if not path.exists():
         raise FileNotFoundError(f"File not found: {file_path}")
 
-    with open(path, encoding="utf-8") as f:
-        data = json.load(f)
-
-    entries = extract_entries(data, lang)
+    entries = extract_entries(open_corpus(path), lang)
 
     # Extract version and year from entries
     version = entries[0].version if entries else "unknown"
@@ -0,0 +1,263 @@
+"""
+http_transport.py — GEP Critic v3
+Single responsibility: pooled HTTP POST for cloud provider calls.
+
+Design:
+    - One keep-alive connection pool per provider, shared by every request,
+      so entries stop paying a TCP + TLS handshake each.
+    - httpx.AsyncClient when installed (pip install "httpx[http2]"): HTTP/2
+      when the h2 package is present and the provider doesn't set
+      `http2: false` in providers.yml; one client per event loop.
+    - Fallback: stdlib http.client keep-alive connections driven through
+      asyncio.to_thread — handshakes amortised, HTTP/1.1 only.
+    - Proxies: httpx reads HTTP(S)_PROXY / NO_PROXY itself. On the stdlib
+      path, a URL the environment sends through a proxy goes through
+      urllib.request instead of the pool: one connection per request, as
+      before pooling, but still reachable.
+    - Every request has a deadline covering connect + send + read. Deadline
+      expiry raises TimeoutError and connection failures raise OSError, the
+      same exceptions cloud_client already retries on.
+    - post() is the blocking twin for threaded callers (call_ollama from
+      runner workers): the same stdlib pool, with deadline_s as the socket
+      timeout of connect and every send / read, like urlopen's timeout.
+
+Usage:
+    from http_transport import apost, aclose, post
+
+    status, body = await apost(provider, url, headers, body, deadline_s=90)
+    status, body = post(provider, url, headers, body, deadline_s=90)
+    await aclose()   # optional — release pooled connections
+"""
+
+import asyncio
+import http.client
+import ssl
+import threading
+import urllib.error
+import urllib.request
+import weakref
+from urllib.parse import urlsplit
+
+try:
+    import httpx
+except ImportError:
+    httpx = None  # stdlib fallback below
+
+try:
+    import h2  # only probed; httpx imports it itself for HTTP/2
+except ImportError:
+    h2 = None
+
+DEFAULT_POOL_SIZE = 8
+
+
+# ── stdlib keep-alive pool ────────────────────────────────────────────────────
+
+
+class _ConnectionPool:
+    """Idle http.client connections for one scheme://host:port, thread-safe."""
+
+    def __init__(self, url: str, size: int):
+        parts = urlsplit(url)
+        self.https = parts.scheme == "https"
+        self.host = parts.hostname
+        self.port = parts.port
+        self.size = size
+        self._idle: list[http.client.HTTPConnection] = []
+        self._lock = threading.Lock()
+        self._ssl = ssl.create_default_context() if self.https else None
+
+    def _connect(self, timeout: float) -> http.client.HTTPConnection:
+        if self.https:
+            return http.client.HTTPSConnection(
+                self.host, self.port, timeout=timeout, context=self._ssl
+            )
+        return http.client.HTTPConnection(self.host, self.port, timeout=timeout)
+
+    def _checkout(self, timeout: float) -> tuple[http.client.HTTPConnection, bool]:
+        with self._lock:
+            if self._idle:
+                conn = self._idle.pop()
+                conn.timeout = timeout
+                if conn.sock is not None:
+                    conn.sock.settimeout(timeout)
+                return conn, True
+        return self._connect(timeout), False
+
+    def _checkin(self, conn: http.client.HTTPConnection) -> None:
+        with self._lock:
+            if len(self._idle) < self.size:
+                self._idle.append(conn)
+                return
+        conn.close()
+
+    def post(
+        self, url: str, headers: dict, body: bytes, timeout: float
+    ) -> tuple[int, bytes]:
+        parts = urlsplit(url)
+        target = parts.path + (f"?{parts.query}" if parts.query else "")
+        conn, reused = self._checkout(timeout)
+        try:
+            try:
+                conn.request("POST", target, body=body, headers=headers)
+                resp = conn.getresponse()
+            except (
+                http.client.RemoteDisconnected,
+                ConnectionResetError,
+                BrokenPipeError,
+            ):
+                if not reused:
+                    raise
+                # Server dropped an idle keep-alive connection — one fresh retry
+                conn.close()
+                conn = self._connect(timeout)
+                conn.request("POST", target, body=body, headers=headers)
+                resp = conn.getresponse()
+            data = resp.read()
+        except BaseException:
+            conn.close()
+            raise
+        if resp.will_close:
+            conn.close()
+        else:
+            self._checkin(conn)
+        return resp.status, data
+
+    def close(self) -> None:
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close()
+
+
+_pools: dict[str, _ConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+
+def _origin(url: str) -> str:
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}"
+
+
+def _stdlib_pool(url: str, size: int) -> _ConnectionPool:
+    origin = _origin(url)
+    with _pools_lock:
+        pool = _pools.get(origin)
+        if pool is None:
+            pool = _pools[origin] = _ConnectionPool(url, size)
+        return pool
+
+
+def _proxied(url: str) -> bool:
+    """True if HTTP(S)_PROXY covers url and NO_PROXY doesn't exempt its host."""
+    parts = urlsplit(url)
+    return parts.scheme in urllib.request.getproxies() and not (
+        urllib.request.proxy_bypass(parts.hostname or "")
+    )
+
+
+def _urllib_post(
+    url: str, headers: dict, body: bytes, timeout: float
+) -> tuple[int, bytes]:
+    """One unpooled POST through urllib's ProxyHandler (reads the environment now)."""
+    req = urllib.request.Request(url, data=body, headers=headers, method="POST")
+    try:
+        with urllib.request.build_opener().open(req, timeout=timeout) as resp:
+            return resp.status, resp.read()
+    except urllib.error.HTTPError as e:
+        return e.code, e.read()
+
+
+def _stdlib_post(
+    provider: dict, url: str, headers: dict, body: bytes, timeout: float
+) -> tuple[int, bytes]:
+    if _proxied(url):
+        return _urllib_post(url, headers, body, timeout)
+    pool = _stdlib_pool(url, provider.get("pool_size", DEFAULT_POOL_SIZE))
+    return pool.post(url, headers, body, timeout)
+
+
+# ── httpx clients (one set per event loop) ────────────────────────────────────
+
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _httpx_client(provider: dict, url: str, size: int) -> "httpx.AsyncClient":
+    loop_clients = _clients.setdefault(asyncio.get_running_loop(), {})
+    http2 = h2 is not None and provider.get("http2", True)
+    key = (_origin(url), http2)
+    client = loop_clients.get(key)
+    if client is None:
+        client = loop_clients[key] = httpx.AsyncClient(
+            http2=http2,
+            limits=httpx.Limits(max_connections=size, max_keepalive_connections=size),
+        )
+    return client
+
+
+# ── Public API ────────────────────────────────────────────────────────────────
+
+
+async def apost(
+    provider: dict,
+    url: str,
+    headers: dict,
+    body: bytes,
+    deadline_s: float = 90,
+) -> tuple[int, bytes]:
+    """
+    POST body to url on the provider's pooled connections.
+    Returns (status, response_bytes) for any HTTP status — callers decide what
+    an error is. Raises TimeoutError past the deadline, OSError on transport
+    failures.
+    """
+    size = provider.get("pool_size", DEFAULT_POOL_SIZE)
+    if httpx is not None:
+        client = _httpx_client(provider, url, size)
+        try:
+            resp = await asyncio.wait_for(
+                client.post(url, content=body, headers=headers, timeout=deadline_s),
+                deadline_s,
+            )
+        except httpx.TimeoutException as e:
+            raise TimeoutError(str(e) or "request deadline exceeded") from e
+        except httpx.TransportError as e:
+            raise OSError(str(e)) from e
+        return resp.status_code, resp.content
+
+    try:
+        return await asyncio.wait_for(
+            asyncio.to_thread(_stdlib_post, provider, url, headers, body, deadline_s),
+            deadline_s,
+        )
+    except asyncio.TimeoutError as e:
+        raise TimeoutError("request deadline exceeded") from e
+
+
+def post(
+    provider: dict,
+    url: str,
+    headers: dict,
+    body: bytes,
+    deadline_s: float = 90,
+) -> tuple[int, bytes]:
+    """
+    Blocking apost over the provider's stdlib keep-alive pool (urllib behind
+    a proxy), safe to call from many threads. Same returns; a socket timeout
+    raises TimeoutError.
+    """
+    return _stdlib_post(provider, url, headers, body, deadline_s)
+
+
+async def aclose() -> None:
+    """Close pooled connections (httpx clients of the running loop + stdlib pools)."""
+    loop_clients = _clients.pop(asyncio.get_running_loop(), {})
+    for client in loop_clients.values():
+        await client.aclose()
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.close()
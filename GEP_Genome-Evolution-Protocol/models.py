@@ -3,6 +3,7 @@ models.py — GEP Critic v3
 Data structures. Single source of truth.
 """
 
+import itertools
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Optional
@@ -145,6 +146,9 @@ class GenomeFragment:
     updated_at: str = ""
 
 
+_GENOME_REVISIONS = itertools.count(1)
+
+
 @dataclass
 class Genome:
     """
@@ -159,6 +163,21 @@ class Genome:
     total_entries_reviewed: int = 0
     total_pauses: int = 0
     updated_at: str = ""
+    # genome.FragmentWordIndex, built lazily by absorption — never persisted
+    word_index: Optional[object] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # Process-unique revision; touch() on every fragment change. Compiled
+    # prompts (prompts.compile_phase2_system) are cached per revision.
+    revision: int = field(
+        default_factory=lambda: next(_GENOME_REVISIONS),
+        init=False,
+        repr=False,
+        compare=False,
+    )
+
+    def touch(self) -> None:
+        self.revision = next(_GENOME_REVISIONS)
 
     def fragment_by_category(self, cat: PauseCategory) -> list[GenomeFragment]:
         return [f for f in self.fragments if f.category == cat]
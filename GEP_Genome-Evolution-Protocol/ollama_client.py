@@ -1,6 +1,7 @@
 """
 ollama_client.py — GEP Critic v3
 Single responsibility: call Ollama, parse JSON, retry on failure.
+Parsed answers go to response_cache, so an unchanged prompt is not re-run.
 """
 
 import json
@@ -9,6 +10,7 @@ import time
 import urllib.request
 import urllib.error
 
+import response_cache
 from models import PauseCategory, ReaderReaction, Verdict
 
 OLLAMA_URL = "http://localhost:11434/api/generate"
@@ -30,17 +32,28 @@ def call_ollama(
     user: str,
     verbose: bool = True,
     think: bool = True,
+    phase: int = 2,
 ) -> tuple[ReaderReaction | None, str | None]:
     """
     Streams response from Ollama.
     Returns (ReaderReaction, raw_full) on success — raw_full includes <think> blocks.
     Returns (None, error_str) on failure.
     When verbose=True, prints live thinking progress and verdict to stdout.
+    phase only selects the response-cache TTL.
     """
     # Validate model parameter (catches common typos/missing models early)
     if not model or model.isspace():
         return None, f"Error: invalid model parameter '{model}'"
 
+    cache_key = response_cache.cache_key("ollama", model, phase, system, user)
+    cached = response_cache.lookup([cache_key])
+    if cached is not None:
+        parsed = _parse_reaction(cached)
+        if parsed is not None:
+            if verbose:
+                print("  [cache] hit")
+            return parsed, cached
+
     payload = json.dumps(
         {
             "model": model,
@@ -79,6 +92,7 @@ def call_ollama(
                 # Return the full raw (incl. <think> blocks) so the caller can store
                 # thinking tokens and the prose response for debugging/audit.
                 return None, raw
+            response_cache.store(cache_key, phase, raw)
             return parsed, raw
 
         except urllib.error.URLError as e:
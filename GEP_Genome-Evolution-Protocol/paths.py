@@ -23,6 +23,8 @@ PROVIDERS_YML = CONFIG_DIR / "providers.yml"
 # ── Data ──────────────────────────────────────────────────────────────────────
 DATA_DIR = ROOT / os.environ.get("GEP_DATA_DIR", "data")
 AUDIT_DIR = DATA_DIR / "audit"
+BLOBS_DIR = DATA_DIR / "blobs"
+CACHE_DIR = DATA_DIR / "cache"
 BATCH_INPUT_DIR = DATA_DIR / "batch_input"
 BATCH_OUTPUT_DIR = DATA_DIR / "batch_output"
 GENOMES_DIR = DATA_DIR / "genomes"
@@ -36,6 +38,8 @@ def ensure_dirs() -> None:
     for d in (
         CONFIG_DIR,
         AUDIT_DIR,
+        BLOBS_DIR,
+        CACHE_DIR,
         BATCH_INPUT_DIR,
         BATCH_OUTPUT_DIR,
         GENOMES_DIR,
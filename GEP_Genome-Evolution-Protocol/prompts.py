@@ -16,8 +16,23 @@ Two-phase validation:
     Phase 2 — Content coherence (qwen3:14b, thinking mode, ~100s/entry)
         Carlos reader check: reflection connected to verse, prayer drift, register,
         hallucination. Phase 1 result injected to skip linguistics.
+
+Compiled system prompts:
+    The static parts of a system prompt (persona, rules, few-shots, genome
+    block) are rendered once into a CompiledPrompt — per lang for Phase 1,
+    per (lang, version, genome.revision) for Phase 2 — and only the small
+    per-entry Phase 1 context is spliced in. CompiledPrompt.template_hash
+    identifies the static text for prompt-prefix and response caches.
+    build_phase1_system / build_phase2_system return the same strings as
+    before, from the compiled templates — as SystemPrompt, a str that also
+    carries its template and context, so cloud_client can lay the request
+    out for provider prefix caching.
 """
 
+import hashlib
+from dataclasses import dataclass, field
+from functools import lru_cache
+
 from models import DevotionalEntry, Genome, PauseCategory
 from lang_registry import get_native_speaker_info
 
@@ -491,8 +506,16 @@ def build_phase1_system(lang: str, genome: "Genome | None" = None) -> str:
     genome param kept for signature compatibility but intentionally ignored.
     Phase 1 reads text fresh — genome search is a separate Python pass.
     """
+    return compile_phase1_system(lang).render()
+
+
+@lru_cache(maxsize=None)
+def compile_phase1_system(lang: str) -> "CompiledPrompt":
+    """Phase 1 system prompt, rendered once per language."""
     language, country = get_native_speaker_info(lang)
-    return PHASE1_SYSTEM_TEMPLATE.format(language=language, country=country)
+    return CompiledPrompt(
+        PHASE1_SYSTEM_TEMPLATE.format(language=language, country=country)
+    )
 
 
 def build_phase1_user(entry: DevotionalEntry, lang: str = "es") -> str:
@@ -572,25 +595,95 @@ def build_phase2_system(
       - verse_mismatch removed
       - Always responds in English
     """
-    language_name, country = get_native_speaker_info(lang)
-    genome_block = build_genome_block(genome)
-    few_shot = FEW_SHOT_EXAMPLES.get(lang, FEW_SHOT_EXAMPLES.get("en", ""))
+    compiled = compile_phase2_system(lang, version, genome)
+    return compiled.render(phase1_context(phase1_result))
 
+
+def phase1_context(phase1_result: dict | None) -> str:
+    """The per-entry Phase 1 block spliced into the compiled Phase 2 prompt."""
     if phase1_result and phase1_result.get("verdict") == "FLAG":
-        phase1_block = (
+        return (
             f"\n### Phase 1 linguistic check already flagged this entry:\n"
             f"  Issue   : {phase1_result.get('issue')}\n"
             f'  Phrase  : "{phase1_result.get("quoted_problem")}"\n'
             f"Focus only on CONTENT coherence. Do not re-flag the linguistic issue.\n"
         )
-    elif phase1_result:
-        phase1_block = (
+    if phase1_result:
+        return (
             "\n### Phase 1 linguistic check: CLEAN. Focus only on content coherence.\n"
         )
-    else:
-        phase1_block = ""
+    return ""
 
-    return f"""\
+
+# ── Compiled templates ────────────────────────────────────────────────────────
+
+
+@dataclass(frozen=True)
+class CompiledPrompt:
+    """
+    A system prompt with its static text pre-rendered: head + context + tail.
+    template_hash is stable for identical static text across processes.
+    """
+
+    head: str
+    tail: str = ""
+    template_hash: str = field(init=False)
+
+    def __post_init__(self):
+        digest = hashlib.sha256(f"{self.head}\0{self.tail}".encode("utf-8"))
+        object.__setattr__(self, "template_hash", digest.hexdigest()[:16])
+
+    def render(self, context: str = "") -> "SystemPrompt":
+        return SystemPrompt(self, context)
+
+
+class SystemPrompt(str):
+    """
+    A rendered system prompt: an ordinary str (head + context + tail) that
+    remembers its CompiledPrompt and per-entry context. Pickles as plain str.
+    """
+
+    compiled: CompiledPrompt
+    context: str
+
+    def __new__(cls, compiled: CompiledPrompt, context: str = ""):
+        self = super().__new__(cls, f"{compiled.head}{context}{compiled.tail}")
+        self.compiled = compiled
+        self.context = context
+        return self
+
+    def __reduce__(self):
+        return str, (str(self),)
+
+
+# (lang, version, genome.revision or None) → CompiledPrompt; oldest dropped first
+_PHASE2_COMPILED: dict[tuple, CompiledPrompt] = {}
+_PHASE2_COMPILED_MAX = 64
+
+
+def compile_phase2_system(
+    lang: str, version: str, genome: Genome | None = None
+) -> CompiledPrompt:
+    """
+    Phase 2 system prompt without the Phase 1 context, rendered once per
+    (lang, version, genome revision). The genome must be touch()ed after
+    any fragment change — absorb_reaction does.
+    """
+    key = (lang, version, genome.revision if genome else None)
+    compiled = _PHASE2_COMPILED.get(key)
+    if compiled is None:
+        compiled = _render_phase2(lang, version, build_genome_block(genome))
+        if len(_PHASE2_COMPILED) >= _PHASE2_COMPILED_MAX:
+            _PHASE2_COMPILED.pop(next(iter(_PHASE2_COMPILED)), None)
+        _PHASE2_COMPILED[key] = compiled
+    return compiled
+
+
+def _render_phase2(lang: str, version: str, genome_block: str) -> CompiledPrompt:
+    language_name, country = get_native_speaker_info(lang)
+    few_shot = FEW_SHOT_EXAMPLES.get(lang, FEW_SHOT_EXAMPLES.get("en", ""))
+
+    head = f"""\
 You are a native {language_name} speaker from {country}.
 
 You just finished reading today's devotional from the {version} Bible.
@@ -599,7 +692,8 @@ Linguistic issues are already handled. Focus on meaning, coherence, and flow.
 
 {PHASE2_THINKING_PREAMBLE}
 {PHASE2_SUSPICION_STEP}
-{phase1_block}
+"""
+    tail = f"""
 ### How to react:
 - If content felt natural, coherent, and spiritually connected → verdict OK.
 - If ANYTHING in the content made you pause → verdict PAUSE.
@@ -645,8 +739,9 @@ Do NOT write "Final answer:" before the JSON.
 Do NOT use \\boxed{{}} or any other wrapper.
 Do NOT add prose before or after the JSON.
 The very first character of your visible output must be {{ and the last must be }}."""
+    return CompiledPrompt(head, tail)
 
 
 def build_phase2_user(entry: DevotionalEntry, lang: str = "es") -> str:
     """Phase 2 uses the same entry format."""
-    return build_user_prompt(entry, lang)
\ No newline at end of file
+    return build_user_prompt(entry, lang)
@@ -0,0 +1,179 @@
+"""
+quota_ledger.py — GEP Critic v3
+Single responsibility: track provider token / request usage in memory.
+
+Design:
+    - One process-wide ledger per counter file, guarded by a lock — safe for
+      runner worker threads and asyncio tasks alike.
+    - Daily totals (tokens, requests) keep the .gep_daily_tokens.json format
+      and reset when the date changes. Prompt tokens a provider served from
+      its prefix cache are added as "cached_tokens" (record_cached).
+    - Per-minute `tpm` / `rpm` limits are rate_scheduler's job; the ledger
+      only counts what was spent.
+    - Write-behind: the file is rewritten atomically (tmp + os.replace) at most
+      every flush_interval_s seconds, and once more at interpreter exit.
+
+Usage:
+    from quota_ledger import ledger_for
+
+    ledger = ledger_for(path)
+    ledger.record("groq_phase1", tokens=812)
+    ledger.record_cached("fireworks_batch_phase2", 2048)
+    ledger.daily("groq_phase1")          # {"tokens": …, "requests": …}
+"""
+
+import atexit
+import json
+import os
+import tempfile
+import threading
+import time
+from datetime import date
+from pathlib import Path
+
+from atomic_file import replace_file
+
+
+class QuotaLedger:
+    """In-memory usage counters with periodic atomic persistence."""
+
+    def __init__(self, path: Path, flush_interval_s: float = 5.0, persist: bool = True):
+        self.path = Path(path)
+        self.flush_interval_s = flush_interval_s
+        self.persist = persist
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()  # keeps file writes in snapshot order
+        self._usage = self._load()
+        self._dirty = False
+        self._last_flush = time.monotonic()
+
+    # ── Persistence ──────────────────────────────────────────────────────────
+
+    def _load(self) -> dict:
+        today = str(date.today())
+        if self.path.exists():
+            try:
+                data = json.loads(self.path.read_text(encoding="utf-8"))
+                if data.get("date") == today:
+                    data.setdefault("providers", {})
+                    return data
+            except (json.JSONDecodeError, OSError, AttributeError):
+                pass
+        return {"date": today, "providers": {}}
+
+    def _roll_day(self) -> None:
+        """Start a fresh day (caller holds the lock)."""
+        today = str(date.today())
+        if self._usage["date"] != today:
+            self._usage = {"date": today, "providers": {}}
+            self._dirty = True
+
+    def flush(self) -> None:
+        """Write the daily counters now if anything changed."""
+        with self._flush_lock:
+            with self._lock:
+                if not (self.persist and self._dirty):
+                    return
+                text = json.dumps(self._usage, indent=2)
+                self._dirty = False
+                self._last_flush = time.monotonic()
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    f.write(text)
+                replace_file(tmp, self.path)
+            except BaseException:
+                Path(tmp).unlink(missing_ok=True)
+                raise
+
+    def reset(self) -> None:
+        """Forget today's counters and remove the counter file."""
+        with self._lock:
+            self._usage = {"date": str(date.today()), "providers": {}}
+            self._dirty = False
+        self.path.unlink(missing_ok=True)
+
+    # ── Counters ─────────────────────────────────────────────────────────────
+
+    def record(self, provider_id: str, tokens: int, requests: int = 1) -> None:
+        now = time.monotonic()
+        with self._lock:
+            self._roll_day()
+            bucket = self._usage["providers"].setdefault(
+                provider_id, {"tokens": 0, "requests": 0}
+            )
+            bucket["tokens"] += tokens
+            bucket["requests"] += requests
+            self._dirty = True
+            due = now - self._last_flush >= self.flush_interval_s
+        if due:
+            self.flush()
+
+    def record_cached(self, provider_id: str, cached_tokens: int) -> None:
+        """Count prompt tokens the provider reported as served from its cache."""
+        if not cached_tokens:
+            return
+        with self._lock:
+            self._roll_day()
+            bucket = self._usage["providers"].setdefault(
+                provider_id, {"tokens": 0, "requests": 0}
+            )
+            bucket["cached_tokens"] = bucket.get("cached_tokens", 0) + cached_tokens
+            self._dirty = True
+
+    def cached_total(self) -> int:
+        """Cached prompt tokens recorded today, across providers."""
+        with self._lock:
+            self._roll_day()
+            return sum(
+                b.get("cached_tokens", 0) for b in self._usage["providers"].values()
+            )
+
+    def daily(self, provider_id: str) -> dict:
+        with self._lock:
+            self._roll_day()
+            bucket = self._usage["providers"].get(provider_id)
+            return dict(bucket) if bucket else {"tokens": 0, "requests": 0}
+
+    def snapshot(self) -> dict:
+        """Copy of the daily usage in .gep_daily_tokens.json format."""
+        with self._lock:
+            self._roll_day()
+            return json.loads(json.dumps(self._usage))
+
+    # ── Limits ───────────────────────────────────────────────────────────────
+
+    def over_daily(self, provider: dict, fraction: float) -> bool:
+        """True if today's usage reached `fraction` of the provider's tpd / rpd."""
+        limits = provider.get("limits") or {}
+        bucket = self.daily(provider["id"])
+        tpd = limits.get("tpd") or 0
+        if tpd and bucket["tokens"] >= tpd * fraction:
+            return True
+        rpd = limits.get("rpd") or 0
+        return bool(rpd and bucket["requests"] >= rpd * fraction)
+
+
+_ledgers: dict[Path, QuotaLedger] = {}
+_ledgers_lock = threading.Lock()
+
+
+def ledger_for(path: Path, persist: bool = True) -> QuotaLedger:
+    """The process-wide ledger for a counter file (created on first use)."""
+    path = Path(path).resolve()
+    with _ledgers_lock:
+        ledger = _ledgers.get(path)
+        if ledger is None:
+            ledger = _ledgers[path] = QuotaLedger(path, persist=persist)
+        ledger.persist = persist
+        return ledger
+
+
+@atexit.register
+def _flush_all() -> None:
+    for ledger in list(_ledgers.values()):
+        try:
+            ledger.flush()
+        except OSError:
+            pass
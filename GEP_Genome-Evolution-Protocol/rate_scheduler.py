@@ -0,0 +1,210 @@
+"""
+rate_scheduler.py — GEP Critic v3
+Single responsibility: pace outbound LLM calls against provider rate limits.
+
+Design:
+    - One token bucket per limit and provider: `rpm` and `rpd` count requests,
+      `tpm` counts tokens. Buckets start full and refill continuously
+      (rpm and tpm over 60 s, rpd over 24 h). Null / missing limits are unlimited.
+    - A request's token cost is estimated up front from prompt length
+      (estimate_tokens) and corrected with the real usage afterwards (settle).
+    - reserve() picks, among the candidates, the provider that can serve the
+      request soonest — ties go to the earlier (higher-priority) candidate —
+      and books it at once, letting buckets go into debt. The caller sleeps
+      the returned wait; concurrent callers see the booking and spread to other
+      providers instead of all hitting one until it answers 429.
+    - backoff() parks a provider after a 429 the buckets did not predict.
+    - Providers are plain dicts with "id" and "limits" — the providers.yml
+      entries as loaded by cloud_client, or the per-model dict built by
+      seed_generation/gemini_rate_limiter.py.
+    - shared() is the process-wide scheduler every outbound call books on.
+
+Usage:
+    from rate_scheduler import estimate_tokens, shared
+
+    cost = estimate_tokens(system, user, completion=1024)
+    provider, wait = shared().reserve(candidates, cost)
+    time.sleep(wait)
+    ...  # call provider
+    shared().settle(provider, cost, usage["total_tokens"])
+"""
+
+import math
+import threading
+import time
+
+# Rough UTF-8 bytes per token — close for Latin scripts, low for CJK /
+# Devanagari (3 bytes per char); settle() corrects the booking either way.
+BYTES_PER_TOKEN = 4
+
+MINUTE_S = 60.0
+DAY_S = 86400.0
+
+DEFAULT_BACKOFF_S = 60.0
+
+
+def estimate_tokens(*texts: str, completion: int = 0) -> int:
+    """Estimated token cost of a request: prompt texts plus expected completion."""
+    size = sum(len(t.encode("utf-8")) for t in texts if t)
+    return math.ceil(size / BYTES_PER_TOKEN) + completion
+
+
+class TokenBucket:
+    """Continuous-refill bucket; the level may go negative (booked-ahead debt)."""
+
+    __slots__ = ("capacity", "rate", "level", "updated")
+
+    def __init__(self, capacity: float, period_s: float, now: float):
+        self.capacity = float(capacity)
+        self.rate = self.capacity / period_s
+        self.level = self.capacity
+        self.updated = now
+
+    def _refill(self, now: float) -> None:
+        if now > self.updated:
+            self.level = min(
+                self.capacity, self.level + (now - self.updated) * self.rate
+            )
+            self.updated = now
+
+    def wait(self, amount: float, now: float) -> float:
+        """Seconds until `amount` is available (a cost above capacity waits for a full bucket)."""
+        self._refill(now)
+        missing = min(amount, self.capacity) - self.level
+        return max(0.0, missing / self.rate)
+
+    def take(self, amount: float, now: float) -> None:
+        self._refill(now)
+        self.level -= amount
+
+    def give(self, amount: float, now: float) -> None:
+        self._refill(now)
+        self.level = min(self.capacity, self.level + amount)
+
+
+def _limits(provider: dict) -> tuple:
+    limits = provider.get("limits") or {}
+    return tuple(limits.get(k) or 0 for k in ("rpm", "tpm", "rpd"))
+
+
+class _ProviderState:
+    """Buckets for one provider: (bucket, counts_tokens) pairs."""
+
+    def __init__(self, limits: tuple, now: float):
+        rpm, tpm, rpd = limits
+        self.limits = limits
+        self.blocked_until = 0.0
+        self.buckets: dict[str, tuple[TokenBucket, bool]] = {}
+        if rpm:
+            self.buckets["rpm"] = (TokenBucket(rpm, MINUTE_S, now), False)
+        if tpm:
+            self.buckets["tpm"] = (TokenBucket(tpm, MINUTE_S, now), True)
+        if rpd:
+            self.buckets["rpd"] = (TokenBucket(rpd, DAY_S, now), False)
+
+    def wait(self, tokens: int, now: float) -> float:
+        wait = max(0.0, self.blocked_until - now)
+        for bucket, counts_tokens in self.buckets.values():
+            wait = max(wait, bucket.wait(tokens if counts_tokens else 1, now))
+        return wait
+
+    def take(self, tokens: int, now: float) -> None:
+        for bucket, counts_tokens in self.buckets.values():
+            bucket.take(tokens if counts_tokens else 1, now)
+
+
+class RateScheduler:
+    """Thread-safe token-bucket scheduler over any number of providers."""
+
+    def __init__(self, clock=time.monotonic):
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._states: dict[str, _ProviderState] = {}
+
+    def _state(self, provider: dict, now: float) -> _ProviderState:
+        """Provider buckets, rebuilt if its limits changed (caller holds the lock)."""
+        limits = _limits(provider)
+        state = self._states.get(provider["id"])
+        if state is None or state.limits != limits:
+            state = self._states[provider["id"]] = _ProviderState(limits, now)
+        return state
+
+    def wait_time(self, provider: dict, tokens: int = 0) -> float:
+        """Seconds until the provider could take a request of `tokens`."""
+        with self._lock:
+            now = self._clock()
+            return self._state(provider, now).wait(tokens, now)
+
+    def reserve(
+        self,
+        candidates: list[dict],
+        tokens: int = 0,
+        max_wait_s: float | None = None,
+    ) -> tuple[dict | None, float]:
+        """
+        Book a request on the candidate that can serve it soonest.
+        Returns (provider, wait_s) — sleep wait_s before calling — or
+        (None, soonest_wait_s) without booking if every candidate is further
+        out than max_wait_s.
+        """
+        if not candidates:
+            return None, math.inf
+        with self._lock:
+            now = self._clock()
+            best, best_wait = None, math.inf
+            for provider in candidates:
+                wait = self._state(provider, now).wait(tokens, now)
+                if wait < best_wait:
+                    best, best_wait = provider, wait
+                if wait == 0.0:
+                    break
+            if max_wait_s is not None and best_wait > max_wait_s:
+                return None, best_wait
+            self._state(best, now).take(tokens, now)
+            return best, best_wait
+
+    def settle(self, provider: dict, estimated: int, actual: int) -> None:
+        """Correct a booking of `estimated` tokens to the `actual` usage."""
+        if not actual or actual == estimated:
+            return
+        with self._lock:
+            now = self._clock()
+            entry = self._state(provider, now).buckets.get("tpm")
+            if entry is None:
+                return
+            bucket = entry[0]
+            if actual > estimated:
+                bucket.take(actual - estimated, now)
+            else:
+                bucket.give(estimated - actual, now)
+
+    def backoff(self, provider: dict, seconds: float = DEFAULT_BACKOFF_S) -> None:
+        """Keep the provider out of reserve() results for `seconds`."""
+        with self._lock:
+            now = self._clock()
+            state = self._state(provider, now)
+            state.blocked_until = max(state.blocked_until, now + seconds)
+
+    def status(self, provider: dict) -> dict:
+        """Booked usage per limit, e.g. {"rpm": 3, "tpm": 4100} (0 = idle)."""
+        with self._lock:
+            now = self._clock()
+            state = self._state(provider, now)
+            out = {}
+            for name, (bucket, _) in state.buckets.items():
+                bucket._refill(now)
+                out[name] = round(bucket.capacity - bucket.level)
+            return out
+
+
+_shared: RateScheduler | None = None
+_shared_lock = threading.Lock()
+
+
+def shared() -> RateScheduler:
+    """The process-wide scheduler (created on first use)."""
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            _shared = RateScheduler()
+        return _shared
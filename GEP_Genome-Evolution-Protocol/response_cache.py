@@ -0,0 +1,187 @@
+"""
+response_cache.py — GEP Critic v3
+Single responsibility: on-disk cache of model responses keyed by prompt hash.
+
+Design:
+    - Key: SHA-256 of (provider, model, phase, system, user). A restarted run
+      or an error_tech requeue replays the already-paid answer for any prompt
+      that has not changed; a new genome or prompt template is a new key.
+    - SQLite file data/cache/responses.sqlite, one row per key with the raw
+      response, its size and created / expires / last-used times.
+    - Callers store only responses that parsed — errors are never cached.
+    - Per-phase TTL (TTL_S): Phase 1 answers depend only on the entry text,
+      Phase 2 prompts embed the genome and age out sooner.
+    - Size-bounded LRU: past max_bytes, least recently used rows are deleted
+      down to 90% of the cap.
+    - Hit / miss counters per process (stats()) for the overnight footer.
+    - GEP_RESPONSE_CACHE=0 disables lookups and stores.
+
+Usage:
+    import response_cache
+
+    key = response_cache.cache_key(provider_id, model, phase, system, user)
+    raw = response_cache.lookup([key])             # None on miss
+    if raw is None:
+        ...  # call the model
+        response_cache.store(key, phase, raw)
+    response_cache.stats()                          # {"hits": …, "misses": …}
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+import paths as _paths
+
+CACHE_FILE = "responses.sqlite"
+
+# Seconds a cached answer stays valid, by phase
+TTL_S = {1: 30 * 86400, 2: 7 * 86400}
+
+MAX_BYTES = 256 * 1024 * 1024
+
+
+def enabled() -> bool:
+    return os.environ.get("GEP_RESPONSE_CACHE", "1") != "0"
+
+
+def cache_key(provider: str, model: str, phase: int, system: str, user: str) -> str:
+    material = json.dumps([provider, model, phase, system, user], ensure_ascii=False)
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """SQLite-backed LRU + TTL store, shared by every thread of the process."""
+
+    def __init__(self, path: Path, max_bytes: int = MAX_BYTES):
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(
+            self.path, check_same_thread=False, isolation_level=None, timeout=30
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            " key TEXT PRIMARY KEY, phase INTEGER, raw TEXT, size INTEGER,"
+            " created REAL, expires REAL, used REAL)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS responses_used ON responses(used)"
+        )
+        self._total = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()[0]
+
+    def get(self, keys: list[str]) -> str | None:
+        """Raw response for the first key (in order) with a live entry."""
+        if not keys:
+            return None
+        now = time.time()
+        marks = ",".join("?" * len(keys))
+        with self._lock:
+            rows = dict(
+                self._conn.execute(
+                    f"SELECT key, raw FROM responses WHERE key IN ({marks}) AND expires > ?",
+                    (*keys, now),
+                ).fetchall()
+            )
+            for key in keys:
+                if key in rows:
+                    self._conn.execute(
+                        "UPDATE responses SET used = ? WHERE key = ?", (now, key)
+                    )
+                    return rows[key]
+        return None
+
+    def put(self, key: str, phase: int, raw: str) -> None:
+        now = time.time()
+        size = len(raw.encode("utf-8"))
+        ttl = TTL_S.get(phase, TTL_S[2])
+        with self._lock:
+            old = self._conn.execute(
+                "SELECT size FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, phase, raw, size, now, now + ttl, now),
+            )
+            self._total += size - (old[0] if old else 0)
+            if self._total > self.max_bytes:
+                self._evict(now)
+
+    def _evict(self, now: float) -> None:
+        """Drop expired rows, then LRU rows down to 90% of max_bytes (caller holds the lock)."""
+        self._conn.execute("DELETE FROM responses WHERE expires <= ?", (now,))
+        total = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()[0]
+        target = self.max_bytes * 0.9
+        if total > target:
+            cursor = self._conn.execute("SELECT key, size FROM responses ORDER BY used")
+            drop = []
+            for key, size in cursor:
+                if total <= target:
+                    break
+                drop.append((key,))
+                total -= size
+            cursor.close()
+            self._conn.executemany("DELETE FROM responses WHERE key = ?", drop)
+        self._total = total
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+_caches: dict[Path, ResponseCache] = {}
+_caches_lock = threading.Lock()
+_stats = {"hits": 0, "misses": 0}
+_stats_lock = threading.Lock()
+
+
+def _cache() -> ResponseCache:
+    path = (_paths.CACHE_DIR / CACHE_FILE).resolve()
+    with _caches_lock:
+        cache = _caches.get(path)
+        if cache is None:
+            cache = _caches[path] = ResponseCache(path)
+        return cache
+
+
+def _count(outcome: str) -> None:
+    with _stats_lock:
+        _stats[outcome] += 1
+
+
+def lookup(keys: list[str]) -> str | None:
+    """Cached raw response for the first matching key; counts one hit or miss."""
+    if not enabled():
+        return None
+    try:
+        raw = _cache().get(keys)
+    except sqlite3.Error as e:
+        print(f"  ⚠️  Response cache unavailable: {e}")
+        raw = None
+    _count("misses" if raw is None else "hits")
+    return raw
+
+
+def store(key: str, phase: int, raw: str | None) -> None:
+    if not (enabled() and raw):
+        return
+    try:
+        _cache().put(key, phase, raw)
+    except sqlite3.Error as e:
+        print(f"  ⚠️  Response cache write failed: {e}")
+
+
+def stats() -> dict:
+    """Process-wide hit / miss counts since start."""
+    with _stats_lock:
+        return dict(_stats)
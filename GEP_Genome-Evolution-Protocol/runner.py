@@ -11,7 +11,11 @@ Two-phase flow per entry:
 
 import json
 import re
+import threading
 import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextlib import nullcontext
 from datetime import datetime, timezone
 from pathlib import Path
 
@@ -24,7 +28,12 @@ from audit import (
 )
 from genome import absorb_reaction, ensure_genome, save_genome
 from models import DevotionalEntry, ReaderReaction, Verdict
-from cloud_client import call_ollama, get_model_for_key, _unwrap_text
+from cloud_client import (
+    _unwrap_text,
+    cached_tokens_today,
+    call_ollama,
+    get_model_for_key,
+)
 from prompts import (
     build_phase1_system,
     build_phase1_user,
@@ -32,6 +41,7 @@ from prompts import (
     build_phase2_user,
 )
 import paths as _paths
+import response_cache
 
 
 def _safe_parse_json(raw: str) -> dict | None:
@@ -208,25 +218,10 @@ def _parse_phase1(raw: str) -> dict | None:
     return {"verdict": "CLEAN", "issue": issue_text, "quoted": None, "confidence": 0.4}
 
 
-def _process_entry(
-    entry: DevotionalEntry,
-    model: str,
-    lang: str,
-    version: str,
-    year: int,
-    genome,
-    verbose: bool = True,
-    phase: int = 0,
-) -> tuple[
-    ReaderReaction | None, str | None, str | None, float, dict | None, str | None
-]:
-    """
-    Two-phase processing per entry.
-    Returns (reaction, fragment_id, phase2_raw, elapsed_total, phase1_result, phase1_raw).
-    """
-    total_t0 = time.monotonic()
-
-    # ── Phase 1 — Linguistic ───────────────────────────────────────────────
+def _run_phase1(
+    entry: DevotionalEntry, lang: str, verbose: bool = True
+) -> tuple[dict | None, str | None, float]:
+    """Phase 1 linguistic call. Returns (phase1_result, phase1_raw, elapsed)."""
     p1_system = build_phase1_system(lang)
     p1_user = build_phase1_user(entry, lang)
 
@@ -235,7 +230,7 @@ def _process_entry(
 
     p1_t0 = time.monotonic()
     _p1_rxn, p1_raw = call_ollama(
-        PHASE1_MODEL, p1_system, p1_user, verbose=True, think=True, phase=1
+        PHASE1_MODEL, p1_system, p1_user, verbose=verbose, think=True, phase=1
     )
     p1_elapsed = time.monotonic() - p1_t0
     # Only parse the raw string when the provider actually returned a response;
@@ -252,19 +247,29 @@ def _process_entry(
     elif verbose:
         print(f"⚠️  parse error ({p1_elapsed:.0f}s)")
 
-    # ── Phase 2 — Content coherence ────────────────────────────────────────
-    if phase == 1:
-        elapsed_total = time.monotonic() - total_t0
-        return None, None, None, elapsed_total, phase1_result, p1_raw
-    p2_system = build_phase2_system(lang, version, genome, phase1_result)
+    return phase1_result, p1_raw, p1_elapsed
+
+
+def _run_phase2(
+    entry: DevotionalEntry,
+    model: str,
+    lang: str,
+    version: str,
+    genome,
+    phase1_result: dict | None,
+    verbose: bool = True,
+    genome_lock: "threading.Lock | None" = None,
+) -> tuple[ReaderReaction | None, str | None, float]:
+    """Phase 2 content call. Returns (reaction, phase2_raw, elapsed)."""
+    p2_t0 = time.monotonic()
+    with genome_lock or nullcontext():
+        p2_system = build_phase2_system(lang, version, genome, phase1_result)
     p2_user = build_phase2_user(entry, lang)
 
     if verbose:
         print("  [P2] content...", end=" ", flush=True)
 
-    p2_t0 = time.monotonic()
     reaction, p2_raw = call_ollama(model, p2_system, p2_user, verbose=verbose)
-    p2_elapsed = time.monotonic() - p2_t0
 
     if reaction and isinstance(p2_raw, str):
         parsed_p2 = _safe_parse_json(p2_raw)
@@ -272,8 +277,61 @@ def _process_entry(
         reaction.suggested_reflexion = (parsed_p2 or {}).get("suggested_reflexion")
         reaction.suggested_oracion = (parsed_p2 or {}).get("suggested_oracion")
 
-    elapsed_total = time.monotonic() - total_t0
+    return reaction, p2_raw, time.monotonic() - p2_t0
+
+
+def _review_entry(
+    entry: DevotionalEntry,
+    model: str,
+    lang: str,
+    genome,
+    version: str,
+    verbose: bool = True,
+    phase: int = 0,
+    genome_lock: "threading.Lock | None" = None,
+) -> tuple[ReaderReaction | None, str | None, float, dict | None, str | None]:
+    """
+    Two-phase model calls for one entry — no genome mutation, no file I/O.
+    Safe to run from worker threads: the genome is only read while building the
+    Phase 2 prompt, under genome_lock when one is given.
+    Returns (reaction, phase2_raw, elapsed_total, phase1_result, phase1_raw).
+    """
+    phase1_result, p1_raw, p1_elapsed = _run_phase1(entry, lang, verbose=verbose)
+    if phase == 1:
+        return None, None, p1_elapsed, phase1_result, p1_raw
+
+    reaction, p2_raw, p2_elapsed = _run_phase2(
+        entry,
+        model,
+        lang,
+        version,
+        genome,
+        phase1_result,
+        verbose=verbose,
+        genome_lock=genome_lock,
+    )
+    return reaction, p2_raw, p1_elapsed + p2_elapsed, phase1_result, p1_raw
+
 
+def _process_entry(
+    entry: DevotionalEntry,
+    model: str,
+    lang: str,
+    version: str,
+    year: int,
+    genome,
+    verbose: bool = True,
+    phase: int = 0,
+) -> tuple[
+    ReaderReaction | None, str | None, str | None, float, dict | None, str | None
+]:
+    """
+    Two-phase processing per entry, then genome absorption.
+    Returns (reaction, fragment_id, phase2_raw, elapsed_total, phase1_result, phase1_raw).
+    """
+    reaction, p2_raw, elapsed_total, phase1_result, p1_raw = _review_entry(
+        entry, model, lang, genome, version, verbose=verbose, phase=phase
+    )
     if reaction is None:
         return None, None, p2_raw, elapsed_total, phase1_result, p1_raw
 
@@ -281,6 +339,136 @@ def _process_entry(
     return reaction, fragment_id, p2_raw, elapsed_total, phase1_result, p1_raw
 
 
+def _review_stream(
+    pending: list[DevotionalEntry],
+    review: Callable[[DevotionalEntry], tuple],
+    workers: int = 1,
+    on_start: Callable[[int, DevotionalEntry], None] | None = None,
+) -> Iterator[tuple[DevotionalEntry, tuple]]:
+    """
+    Yield (entry, review_result) for every pending entry.
+
+    workers == 1 → sequential, in input order; on_start(i, entry) fires before
+                   each review so the run log reads top-to-bottom as today.
+    workers  > 1 → at most `workers` reviews in flight on a thread pool, yielded
+                   in completion order. on_start is not called — the consumer
+                   (main thread) is the single writer for logs, audit and genome.
+
+    On KeyboardInterrupt (or any exception in the consumer) queued reviews are
+    cancelled; in-flight ones finish in the background and their results are
+    dropped — they are not in the audit log, so the next run picks them up.
+    """
+    if workers <= 1:
+        for i, entry in enumerate(pending, 1):
+            if on_start:
+                on_start(i, entry)
+            yield entry, review(entry)
+        return
+
+    pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="gep-review")
+    queue = iter(pending)
+    in_flight = {}
+    try:
+        for entry in queue:
+            in_flight[pool.submit(review, entry)] = entry
+            if len(in_flight) >= workers:
+                break
+        while in_flight:
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for fut in done:
+                entry = in_flight.pop(fut)
+                nxt = next(queue, None)
+                if nxt is not None:
+                    in_flight[pool.submit(review, nxt)] = nxt
+                yield entry, fut.result()
+        pool.shutdown(wait=True)
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _pipeline_stream(
+    pending: list[DevotionalEntry],
+    phase1: Callable[[DevotionalEntry], tuple],
+    phase2: Callable[[DevotionalEntry, dict | None], tuple],
+    p1_workers: int,
+    p2_workers: int,
+) -> Iterator[tuple[DevotionalEntry, tuple]]:
+    """
+    Two-stage pipeline: Phase 1 results feed a Phase 2 queue.
+
+    Each stage has its own thread pool, so P1 and P2 providers get independent
+    concurrency limits, and entry k+1's linguistic scan overlaps entry k's
+    content review. Phase 1 only runs ahead while the Phase 2 backlog is below
+    2 × p2_workers, so a fast P1 provider cannot queue up the whole year.
+
+    phase1(entry)                → (phase1_result, phase1_raw, elapsed)
+    phase2(entry, phase1_result) → (reaction, phase2_raw, elapsed)
+
+    Yields (entry, (reaction, phase2_raw, elapsed_total, phase1_result,
+    phase1_raw)) in Phase 2 completion order — the same shape as _review_entry.
+    elapsed_total is P1 + P2 service time; time spent waiting in the queue is
+    excluded.
+    """
+    p1_pool = ThreadPoolExecutor(max_workers=p1_workers, thread_name_prefix="gep-p1")
+    p2_pool = ThreadPoolExecutor(max_workers=p2_workers, thread_name_prefix="gep-p2")
+    queue = iter(pending)
+    backlog_cap = 2 * p2_workers
+    p1_futs: dict = {}  # future → entry
+    p2_futs: dict = {}  # future → (entry, phase1 output)
+
+    def _feed() -> None:
+        while len(p1_futs) < p1_workers and len(p2_futs) < backlog_cap:
+            entry = next(queue, None)
+            if entry is None:
+                return
+            p1_futs[p1_pool.submit(phase1, entry)] = entry
+
+    try:
+        _feed()
+        while p1_futs or p2_futs:
+            done, _ = wait([*p1_futs, *p2_futs], return_when=FIRST_COMPLETED)
+            for fut in done:
+                if fut in p1_futs:
+                    entry = p1_futs.pop(fut)
+                    p1_out = fut.result()
+                    p2_futs[p2_pool.submit(phase2, entry, p1_out[0])] = (entry, p1_out)
+                    continue
+                entry, (phase1_result, p1_raw, p1_elapsed) = p2_futs.pop(fut)
+                reaction, p2_raw, p2_elapsed = fut.result()
+                yield (
+                    entry,
+                    (reaction, p2_raw, p1_elapsed + p2_elapsed, phase1_result, p1_raw),
+                )
+            _feed()
+    finally:
+        p1_pool.shutdown(wait=False, cancel_futures=True)
+        p2_pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _eta_line(
+    completion_times: list[float], run_t0: float, remaining: int, workers: int
+) -> str:
+    """
+    ETA from wall-clock throughput over the most recent completions.
+    With N workers, entries finish ~N times faster than their individual
+    elapsed time, so per-entry elapsed cannot be used as the rate.
+    """
+    window = completion_times[-(5 * workers) :]
+    if len(window) >= 2:
+        per_entry = (window[-1] - window[0]) / (len(window) - 1)
+    else:
+        per_entry = (completion_times[-1] - run_t0) / len(completion_times)
+    eta_s = int(per_entry * remaining)
+    hh, rem = divmod(eta_s, 3600)
+    mm, ss = divmod(rem, 60)
+    per_hour = 3600 / per_entry if per_entry > 0 else 0.0
+    return (
+        f"  ETA: ~{hh:02d}:{mm:02d}:{ss:02d} for {remaining} remaining  "
+        f"(avg {per_entry:.0f}s/entry wall, {per_hour:.0f} entries/h, "
+        f"{workers} worker{'s' if workers != 1 else ''})"
+    )
+
+
 def _print_reaction(
     entry: DevotionalEntry,
     reaction: ReaderReaction,
@@ -420,7 +608,29 @@ def run_overnight(
     model_key: str,
     start_date: str | None,
     phase: int = 0,
+    workers: int = 1,
+    p1_workers: int = 0,
+    p2_workers: int = 0,
 ):
+    """
+    Unattended review of every pending entry.
+
+    workers > 1 runs that many entries' model calls concurrently. The calling
+    thread stays the single writer: it absorbs reactions into the genome and
+    appends audit / run-log rows as results complete, so critic_audit_*.jsonl
+    and the genome file are never written from two threads at once.
+
+    p1_workers / p2_workers switch to a pipelined run: Phase 1 and Phase 2 get
+    separate pools (0 = fall back to workers), so entry k+1's linguistic scan
+    overlaps entry k's content review. Ignored when phase == 1.
+    """
+    workers = max(1, workers)
+    pipelined = phase != 1 and bool(p1_workers or p2_workers)
+    p1_n = max(1, p1_workers or workers)
+    p2_n = max(1, p2_workers or workers)
+    concurrent = pipelined or workers > 1
+    pool_size = p2_n if pipelined else workers
+    workers_desc = f"P1 x{p1_n} → P2 x{p2_n} (pipelined)" if pipelined else str(workers)
     model = _resolve_p2_model(model_key)
     _log_model_debug(model)
     log_path = audit_path(lang, version, year)
@@ -451,6 +661,7 @@ def run_overnight(
         f"  P1 model : {PHASE1_MODEL}\n"
         f"  P2 model : {model}\n"
         f"  Pending  : {len(pending)} entries\n"
+        f"  Workers  : {workers_desc}\n"
         f"  Genome   : {len(genome.fragments)} fragments\n"
         f"  Audit log: {log_path}\n"
         f"  Run log  : {run_log}\n"
@@ -464,23 +675,71 @@ def run_overnight(
     p1_flag_count = 0
     error_count = 0
     run_t0 = time.monotonic()
-    entry_times: list[float] = []
+    completion_times: list[float] = []
+    genome_lock = threading.Lock()
+    cache_at_start = response_cache.stats()
+    prefix_cached_at_start = cached_tokens_today()
+
+    def _on_start(i: int, entry: DevotionalEntry) -> None:
+        entry_start = datetime.now(timezone.utc).strftime("%H:%M:%S UTC")
+        _log(
+            run_log,
+            f"\n{'─' * 60}\n"
+            f"  [{i}/{len(pending)}] {entry.date} | {entry.id}\n"
+            f"  Started: {entry_start}",
+        )
 
-    try:
-        for i, entry in enumerate(pending, 1):
-            entry_start = datetime.now(timezone.utc).strftime("%H:%M:%S UTC")
-            entry_header = (
-                f"\n{'─' * 60}\n"
-                f"  [{i}/{len(pending)}] {entry.date} | {entry.id}\n"
-                f"  Started: {entry_start}"
-            )
-            _log(run_log, entry_header)
+    def _review(entry: DevotionalEntry) -> tuple:
+        # Worker output would interleave on stdout — only the sequential path
+        # streams live P1/P2 progress.
+        return _review_entry(
+            entry,
+            model,
+            lang,
+            genome,
+            version,
+            verbose=not concurrent,
+            phase=phase,
+            genome_lock=genome_lock,
+        )
 
-            reaction, fragment_id, p2_raw, elapsed, phase1_result, p1_raw = (
-                _process_entry(
-                    entry, model, lang, version, year, genome, verbose=True, phase=phase
+    if pipelined:
+        stream = _pipeline_stream(
+            pending,
+            lambda entry: _run_phase1(entry, lang, verbose=False),
+            lambda entry, phase1_result: _run_phase2(
+                entry,
+                model,
+                lang,
+                version,
+                genome,
+                phase1_result,
+                verbose=False,
+                genome_lock=genome_lock,
+            ),
+            p1_workers=p1_n,
+            p2_workers=p2_n,
+        )
+    else:
+        stream = _review_stream(pending, _review, workers=workers, on_start=_on_start)
+
+    try:
+        for i, (entry, result) in enumerate(stream, 1):
+            reaction, p2_raw, elapsed, phase1_result, p1_raw = result
+            if concurrent:
+                entry_done = datetime.now(timezone.utc).strftime("%H:%M:%S UTC")
+                _log(
+                    run_log,
+                    f"\n{'─' * 60}\n"
+                    f"  [{i}/{len(pending)}] {entry.date} | {entry.id}\n"
+                    f"  Finished: {entry_done}",
                 )
-            )
+            fragment_id = None
+            if reaction is not None:
+                with genome_lock:
+                    genome, fragment_id = absorb_reaction(
+                        genome, reaction, entry.date, year
+                    )
 
             # Phase 1 summary
             p1_verdict = (phase1_result or {}).get("verdict", "error")
@@ -601,34 +860,39 @@ def run_overnight(
                 suggested_oracion=reaction.suggested_oracion if reaction else None,
             )
             append_record(log_path, record)
-            entry_times.append(elapsed)
-
-            if entry_times:
-                avg = sum(entry_times[-5:]) / len(entry_times[-5:])
-                remaining = len(pending) - i
-                eta_s = int(avg * remaining)
-                hh2, rem = divmod(eta_s, 3600)
-                mm2, ss2 = divmod(rem, 60)
-                _log(
-                    run_log,
-                    f"  ETA: ~{hh2:02d}:{mm2:02d}:{ss2:02d} for {remaining} remaining  (avg {avg:.0f}s/entry)",
-                )
+            completion_times.append(time.monotonic())
+            _log(
+                run_log,
+                _eta_line(completion_times, run_t0, len(pending) - i, pool_size),
+            )
 
     except KeyboardInterrupt:
         _log(run_log, "\n\n  🛑 Interrupted. Progress saved.")
+    finally:
+        stream.close()
 
     total_elapsed = time.monotonic() - run_t0
     mm, ss = divmod(int(total_elapsed), 60)
     hh, mm = divmod(mm, 60)
+    processed = ok_count + pause_count + error_count
+    throughput = processed / total_elapsed * 3600 if total_elapsed > 0 else 0.0
+    cache_now = response_cache.stats()
+    cache_hits = cache_now["hits"] - cache_at_start["hits"]
+    cache_misses = cache_now["misses"] - cache_at_start["misses"]
+    prefix_cached = cached_tokens_today() - prefix_cached_at_start
     footer = (
         f"\n{'═' * 60}\n"
         f"  Run finished : {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')}\n"
         f"  Total time   : {hh:02d}:{mm:02d}:{ss:02d}\n"
-        f"  Processed    : {ok_count + pause_count + error_count} entries\n"
+        f"  Processed    : {processed} entries\n"
+        f"  Workers      : {workers_desc}\n"
+        f"  Throughput   : {throughput:.0f} entries/h\n"
         f"  ✅ OK        : {ok_count}\n"
         f"  🔶 PAUSE (P2): {pause_count}\n"
         f"  🔤 FLAG  (P1): {p1_flag_count}\n"
         f"  ⚠️  Errors   : {error_count}\n"
+        f"  💾 Cache     : {cache_hits} hits / {cache_misses} misses\n"
+        f"  🧠 Prefix    : {prefix_cached} prompt tokens served from provider cache\n"
         f"  Run log      : {run_log}\n"
         f"{'═' * 60}"
     )
@@ -9,6 +9,7 @@ import sys
 import urllib.request
 import urllib.error
 
+from corpus import Corpus, open_corpus
 from models import DevotionalEntry
 from lang_registry import get as get_lang
 
@@ -63,38 +64,18 @@ def fetch_remote(lang: str, version: str, year: int) -> dict:
         sys.exit(1)
 
 
-def load_local(path: str) -> dict:
-    with open(path, encoding="utf-8") as f:
-        return json.load(f)
+def load_local(path: str) -> Corpus:
+    """Open a local source file through the shared corpus cache."""
+    return open_corpus(path)
 
 
-def extract_entries(data: dict, lang: str) -> list[DevotionalEntry]:
-    try:
-        date_map = data["data"][lang]
-    except KeyError:
+def extract_entries(data: dict | Corpus, lang: str) -> list[DevotionalEntry]:
+    corpus = data if isinstance(data, Corpus) else Corpus.from_data(data)
+    if not corpus.has_language(lang):
         print(f"  ❌ Could not find data.{lang} in source JSON")
         sys.exit(1)
 
-    entries = []
-    for date_key, date_value in date_map.items():
-        items = date_value if isinstance(date_value, list) else [date_value]
-        for item in items:
-            if not isinstance(item, dict):
-                continue
-            entries.append(
-                DevotionalEntry(
-                    date=date_key,
-                    id=item.get("id", ""),
-                    language=item.get("language", lang),
-                    version=item.get("version", ""),
-                    versiculo=item.get("versiculo", ""),
-                    reflexion=item.get("reflexion", ""),
-                    oracion=item.get("oracion", ""),
-                    para_meditar=item.get("para_meditar", []),
-                    tags=item.get("tags", []),
-                )
-            )
-
+    entries = corpus.entries(lang)
     entries.sort(key=lambda e: e.date)
     return entries
 
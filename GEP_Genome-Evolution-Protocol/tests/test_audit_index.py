@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+test_audit_index.py — Tests for the audit log sidecar index
+
+Tests cover:
+1. append_record keeps the index in step with the JSONL log
+2. load_reviewed_dates / load_index read the index, read_record the log
+3. Catch-up on lines appended without the index
+4. Rebuild when the index is missing, corrupt or stale
+5. Blob mode: raw responses in blob_store, hash in the row
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add parent directory to path to import audit
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import blob_store
+import paths
+from audit import (
+    append_record,
+    build_record,
+    index_path,
+    load_index,
+    load_raw,
+    load_reviewed_dates,
+    read_record,
+)
+from models import ReaderReaction, Verdict
+
+
+def _record(date: str, action: str = "reviewed", phase: int = 0, raw: str = "ok"):
+    verdict = Verdict.PAUSE if action == "flagged" else Verdict.OK
+    return build_record(
+        entry_date=date,
+        entry_id=f"id-{date}",
+        lang="es",
+        version="NVI",
+        action=action,
+        reaction=ReaderReaction(verdict=verdict, reaction="r"),
+        phase=phase,
+        raw_response=raw,
+    )
+
+
+def _raw_line(date: str, action: str) -> str:
+    row = {"id": f"id-{date}", "date": date, "phase": 0, "action": action}
+    return json.dumps(row) + "\n"
+
+
+@pytest.fixture
+def log_path(tmp_path):
+    return tmp_path / "critic_audit_es_NVI_2025.jsonl"
+
+
+class TestAppendAndLoad:
+    """Test index contents after append_record."""
+
+    def test_append_creates_index(self, log_path):
+        append_record(log_path, _record("2025-01-01"))
+        assert index_path(log_path).exists()
+        assert set(load_index(log_path)) == {"id-2025-01-01:0"}
+
+    def test_reviewed_dates_skip_errors(self, log_path):
+        append_record(log_path, _record("2025-01-01"))
+        append_record(log_path, _record("2025-01-02", action="flagged"))
+        append_record(log_path, _record("2025-01-03", action="error_tech"))
+        assert load_reviewed_dates(log_path) == {"2025-01-01", "2025-01-02"}
+
+    def test_earlier_review_survives_later_error(self, log_path):
+        append_record(log_path, _record("2025-01-01"))
+        append_record(log_path, _record("2025-01-01", action="error_tech"))
+        assert load_reviewed_dates(log_path) == {"2025-01-01"}
+        assert load_index(log_path)["id-2025-01-01:0"]["action"] == "error_tech"
+
+    def test_index_entry_points_at_full_row(self, log_path):
+        append_record(log_path, _record("2025-01-01", raw="x" * 5000))
+        append_record(log_path, _record("2025-01-02", action="flagged", phase=2))
+        entry = load_index(log_path)["id-2025-01-02:2"]
+        row = read_record(log_path, entry["offset"])
+        assert row["date"] == "2025-01-02"
+        assert row["asset_id"] == entry["asset_id"]
+        assert entry["verdict"] == "PAUSE"
+
+    def test_missing_log(self, log_path):
+        assert load_reviewed_dates(log_path) == set()
+        assert load_index(log_path) == {}
+
+
+class TestResync:
+    """Test catch-up and rebuild against the log."""
+
+    def test_lines_appended_without_index_are_picked_up(self, log_path):
+        append_record(log_path, _record("2025-01-01"))
+        with open(log_path, "a", encoding="utf-8") as f:
+            f.write(_raw_line("2025-01-02", "flagged"))
+        assert load_reviewed_dates(log_path) == {"2025-01-01", "2025-01-02"}
+        append_record(log_path, _record("2025-01-03"))
+        assert len(load_index(log_path)) == 3
+
+    def test_partial_trailing_line_waits(self, log_path):
+        append_record(log_path, _record("2025-01-01"))
+        line = _raw_line("2025-01-02", "reviewed")
+        with open(log_path, "a", encoding="utf-8") as f:
+            f.write(line[:10])
+        assert load_reviewed_dates(log_path) == {"2025-01-01"}
+        with open(log_path, "a", encoding="utf-8") as f:
+            f.write(line[10:])
+        assert load_reviewed_dates(log_path) == {"2025-01-01", "2025-01-02"}
+
+    def test_missing_index_rebuilt(self, log_path):
+        append_record(log_path, _record("2025-01-01"))
+        index_path(log_path).unlink()
+        assert load_reviewed_dates(log_path) == {"2025-01-01"}
+
+    def test_corrupt_index_rebuilt(self, log_path):
+        append_record(log_path, _record("2025-01-01"))
+        index_path(log_path).write_bytes(b"not a database" * 100)
+        assert load_reviewed_dates(log_path) == {"2025-01-01"}
+
+    def test_rewritten_log_rebuilds(self, log_path):
+        append_record(log_path, _record("2025-01-01"))
+        append_record(log_path, _record("2025-01-02"))
+        log_path.write_text(_raw_line("2025-02-01", "reviewed"), encoding="utf-8")
+        assert load_reviewed_dates(log_path) == {"2025-02-01"}
+
+    def test_same_size_rewrite_rebuilds(self, log_path):
+        log_path.write_text(_raw_line("2025-01-01", "reviewed"), encoding="utf-8")
+        assert load_reviewed_dates(log_path) == {"2025-01-01"}
+        log_path.write_text(_raw_line("2025-01-09", "reviewed"), encoding="utf-8")
+        assert load_reviewed_dates(log_path) == {"2025-01-09"}
+
+    def test_malformed_lines_skipped(self, log_path):
+        log_path.write_text(
+            "not json\n" + _raw_line("2025-01-01", "reviewed"), encoding="utf-8"
+        )
+        assert load_reviewed_dates(log_path) == {"2025-01-01"}
+
+
+@pytest.fixture
+def blobs_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(paths, "BLOBS_DIR", tmp_path / "blobs")
+    return tmp_path / "blobs"
+
+
+class TestBlobMode:
+    """Test raw responses stored out of line in blob_store."""
+
+    def test_row_keeps_only_hash(self, log_path, blobs_dir):
+        append_record(log_path, _record("2025-01-01", raw="<think>x</think>{}"), True)
+        row = json.loads(log_path.read_text(encoding="utf-8"))
+        assert row["raw_response"] is None
+        assert row["raw_response_blob"].startswith("sha256:")
+        assert "phase1_raw_blob" not in row  # nothing to store
+        assert load_raw(row) == "<think>x</think>{}"
+        assert load_raw(row, "phase1_raw") is None
+
+    def test_asset_id_matches_inline_mode(self, tmp_path, blobs_dir):
+        record = _record("2025-01-01", raw="long raw response")
+        inline, blobbed = tmp_path / "a.jsonl", tmp_path / "b.jsonl"
+        append_record(inline, record, blobs=False)
+        append_record(blobbed, record, blobs=True)
+        a = json.loads(inline.read_text(encoding="utf-8"))
+        b = json.loads(blobbed.read_text(encoding="utf-8"))
+        assert a["asset_id"] == b["asset_id"]
+        assert load_raw(a) == load_raw(b) == "long raw response"
+
+    def test_identical_blobs_stored_once(self, log_path, blobs_dir):
+        append_record(log_path, _record("2025-01-01", raw="same"), blobs=True)
+        append_record(log_path, _record("2025-01-02", raw="same"), blobs=True)
+        assert len([p for p in blobs_dir.rglob("*") if p.is_file()]) == 1
+        assert load_reviewed_dates(log_path) == {"2025-01-01", "2025-01-02"}
+
+    def test_gzip_fallback_roundtrip(self, blobs_dir, monkeypatch):
+        monkeypatch.setattr(blob_store, "zstandard", None)
+        key = blob_store.put_blob("ñandú " * 1000)
+        assert next(blobs_dir.rglob("*.gz"))
+        assert blob_store.get_blob(key) == "ñandú " * 1000
+        assert key == blob_store.blob_key("ñandú " * 1000)
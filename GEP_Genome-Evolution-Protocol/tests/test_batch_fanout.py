@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+test_batch_fanout.py — Tests for multi-target batch fan-out
+
+Tests cover:
+1. --targets matrix expansion from lang_registry
+2. All batches submitted before polling, collected as each finishes
+3. Exponential poll backoff, reset on progress
+4. Resume from the state file without resubmitting
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add parent directory to path to import batch_pipeline
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import batch_pipeline
+from batch_client import BatchAPIError
+from batch_pipeline import parse_targets, run_fanout
+from batch_state import FanoutState
+
+
+class TestParseTargets:
+    """Test --targets expansion."""
+
+    def test_versions_languages_and_years(self):
+        assert parse_targets("es:RVR1960,pt,en:KJV:2026", 2025) == [
+            ("es", "RVR1960", 2025),
+            ("pt", "NVI", 2025),
+            ("pt", "ARC", 2025),
+            ("en", "KJV", 2026),
+        ]
+
+    def test_duplicates_dropped(self):
+        assert parse_targets("es,es:NVI", 2025) == [
+            ("es", "RVR1960", 2025),
+            ("es", "NVI", 2025),
+        ]
+
+    def test_all_covers_registry(self):
+        targets = parse_targets("all", 2025)
+        assert ("fil", "MBB05", 2025) in targets
+        assert len(targets) == 20
+
+    @pytest.mark.parametrize("spec", ["xx", "es:KJV", "es:NVI:soon", "a:b:c:d", ","])
+    def test_bad_specs(self, spec):
+        with pytest.raises(ValueError):
+            parse_targets(spec, 2025)
+
+
+class FakeClient:
+    """Batch i completes on its `ready[i]`-th status check."""
+
+    def __init__(self, ready: dict[str, int], fail: set[str] = frozenset()):
+        self.ready = ready
+        self.fail = fail
+        self.calls = []
+        self.checks: dict[str, int] = {}
+
+    def upload(self, path):
+        self.calls.append(("upload", path.name))
+        return f"file-{path.stem}"
+
+    def submit(self, file_id):
+        self.calls.append(("submit", file_id))
+        return file_id.replace("file-", "batch-")
+
+    def check(self, batch_id):
+        self.calls.append(("check", batch_id))
+        if batch_id in self.fail:
+            raise BatchAPIError("Batch ended with status='expired'")
+        self.checks[batch_id] = self.checks.get(batch_id, 0) + 1
+        if self.checks[batch_id] >= self.ready[batch_id]:
+            return f"out-{batch_id}"
+        return None
+
+    def download(self, file_id, dest):
+        self.calls.append(("download", file_id))
+        dest.write_text("")
+        return dest
+
+
+@pytest.fixture
+def fanout(tmp_path, monkeypatch):
+    monkeypatch.setattr(batch_pipeline._paths, "BATCH_OUTPUT_DIR", tmp_path / "out")
+    (tmp_path / "out").mkdir()
+    sleeps, collected = [], []
+
+    def fake_build(lang, version, year, **kwargs):
+        path = tmp_path / f"batch_input_{lang}_{version}_{year}.jsonl"
+        path.write_text("{}\n")
+        return [path]
+
+    def fake_collect(input_path, results_path, lang, version, year, dry_run):
+        collected.append(f"{lang}/{version}")
+        return {}
+
+    monkeypatch.setattr(batch_pipeline, "_build_jsonl", fake_build)
+    monkeypatch.setattr(batch_pipeline, "process_results", fake_collect)
+    monkeypatch.setattr(batch_pipeline.time, "sleep", sleeps.append)
+
+    def run(client, targets, **overrides):
+        monkeypatch.setattr(batch_pipeline, "BatchClient", lambda pid: client)
+        args = argparse.Namespace(
+            dry_run=False,
+            skip_reviewed=False,
+            no_genome=False,
+            poll_interval=30,
+            max_poll_interval=200,
+            upload_workers=4,
+            state=tmp_path / "fanout.state.json",
+            **overrides,
+        )
+        return run_fanout(args, targets, "p", {}, "m", [1])
+
+    return run, sleeps, collected
+
+
+TARGETS = [("es", "RVR1960", 2025), ("es", "NVI", 2025), ("pt", "ARC", 2025)]
+IDS = [
+    "batch-batch_input_es_RVR1960_2025",
+    "batch-batch_input_es_NVI_2025",
+    "batch-batch_input_pt_ARC_2025",
+]
+
+
+class TestFanout:
+    """Test submit-all, poll-together, collect-when-done."""
+
+    def test_submits_everything_before_polling(self, fanout):
+        run, _, _ = fanout
+        client = FakeClient(dict.fromkeys(IDS, 1))
+        run(client, TARGETS)
+        kinds = [kind for kind, _ in client.calls]
+        assert kinds.index("check") > max(
+            i for i, k in enumerate(kinds) if k == "submit"
+        )
+        assert kinds.count("submit") == 3
+
+    def test_collects_each_as_it_finishes(self, fanout):
+        run, _, collected = fanout
+        client = FakeClient(dict(zip(IDS, [3, 1, 2])))
+        state = run(client, TARGETS)
+        assert collected == ["es/NVI", "pt/ARC", "es/RVR1960"]
+        assert [t["status"] for t in state.targets] == ["done"] * 3
+
+    def test_backoff_doubles_until_progress(self, fanout):
+        run, sleeps, _ = fanout
+        client = FakeClient(dict(zip(IDS, [1, 3, 7])))
+        run(client, TARGETS)
+        # round 1: one done → 30; 2: none → 60; 3: one done → 30;
+        # then nothing until round 7: 60, 120, 200 (cap)
+        assert sleeps == [30, 60, 30, 60, 120, 200]
+
+    def test_failed_batch_marks_target(self, fanout):
+        run, _, collected = fanout
+        client = FakeClient(dict.fromkeys(IDS, 1), fail={IDS[1]})
+        state = run(client, TARGETS)
+        assert [t["status"] for t in state.targets] == ["done", "failed", "done"]
+        assert "es/NVI" not in collected
+
+
+class TestResume:
+    """Test resuming from the state file after a crash."""
+
+    def test_resume_polls_without_resubmitting(self, fanout, monkeypatch):
+        run, sleeps, collected = fanout
+        first = FakeClient(dict(zip(IDS, [1, 99, 99])))
+
+        def crash(_):
+            raise KeyboardInterrupt
+
+        monkeypatch.setattr(batch_pipeline.time, "sleep", crash)
+        with pytest.raises(KeyboardInterrupt):
+            run(first, TARGETS)
+        assert collected == ["es/RVR1960"]
+
+        monkeypatch.setattr(batch_pipeline.time, "sleep", sleeps.append)
+        second = FakeClient(dict.fromkeys(IDS, 1))
+        state = run(second, TARGETS)
+        kinds = {kind for kind, _ in second.calls}
+        assert "upload" not in kinds and "submit" not in kinds
+        assert ("check", IDS[0]) not in second.calls
+        assert collected == ["es/RVR1960", "es/NVI", "pt/ARC"]
+        assert [t["status"] for t in state.targets] == ["done"] * 3
+
+    def test_downloaded_part_collected_without_provider(self, fanout, tmp_path):
+        run, _, collected = fanout
+        state = FanoutState.open("p", [1], TARGETS[:1], tmp_path / "fanout.state.json")
+        inp = tmp_path / "batch_input_es_RVR1960_2025.jsonl"
+        state.set_parts(state.targets[0], [inp])
+        results = tmp_path / "out" / "r.jsonl"
+        results.write_text("")
+        state.update(
+            state.targets[0]["parts"][0],
+            batch_id="b1",
+            status="downloaded",
+            results=str(results),
+        )
+        client = FakeClient({})
+        run(client, TARGETS[:1])
+        assert client.calls == []
+        assert collected == ["es/RVR1960"]
+
+    def test_upload_failure_retried_on_reopen(self, fanout):
+        run, _, _ = fanout
+
+        class Flaky(FakeClient):
+            def upload(self, path):
+                raise OSError("connection reset")
+
+        state = run(Flaky({}), TARGETS[:1])
+        assert state.targets[0]["status"] == "failed"
+
+        client = FakeClient(dict.fromkeys(IDS, 1))
+        state = run(client, TARGETS[:1])
+        assert ("upload", "batch_input_es_RVR1960_2025.jsonl") in client.calls
+        assert state.targets[0]["status"] == "done"
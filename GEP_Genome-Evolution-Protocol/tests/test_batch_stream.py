@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+"""
+test_batch_stream.py — Tests for the streaming batch JSONL builder
+
+Tests cover:
+1. Lazy record generation (iter_records)
+2. Part rollover at record / byte caps, manifest custom_id ranges
+3. Manifest / part resolution for --input, part caps from providers.yml
+4. Concurrent part upload in batch_pipeline
+"""
+
+import json
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+# Add parent directory to path to import build_batch
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import batch_pipeline
+import build_batch
+from build_batch import (
+    CostEstimate,
+    estimate_cost,
+    iter_records,
+    load_parts,
+    manifest_path,
+    part_caps,
+    with_dashscope_fields,
+    write_jsonl_parts,
+)
+from models import DevotionalEntry
+
+
+def _rec(i: int, size: int = 10) -> dict:
+    return {
+        "custom_id": f"id{i:03d}",
+        "body": {
+            "messages": [
+                {"role": "system", "content": "S" * 40},
+                {"role": "user", "content": "u" * size},
+            ]
+        },
+    }
+
+
+def _lines(path: Path) -> list[dict]:
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+@pytest.fixture
+def entries():
+    return [
+        DevotionalEntry(
+            date=f"2025-01-{i:02d}",
+            id=f"e{i}",
+            language="es",
+            version="RVR1960",
+            versiculo="v",
+            reflexion="r",
+            oracion="o",
+        )
+        for i in range(1, 6)
+    ]
+
+
+@pytest.fixture
+def prompts(monkeypatch):
+    monkeypatch.setattr(build_batch, "build_phase2_system", lambda **kw: "SYS")
+    monkeypatch.setattr(build_batch, "build_phase2_user", lambda e, lang: f"U {e.id}")
+    monkeypatch.setattr(build_batch, "_thinking_for_provider", lambda p, ph: False)
+
+
+class TestIterRecords:
+    """Test the record generator."""
+
+    def test_lazy_generation(self, entries, prompts, monkeypatch):
+        rendered = []
+        monkeypatch.setattr(
+            build_batch,
+            "build_phase2_user",
+            lambda e, lang: rendered.append(e.id) or f"U {e.id}",
+        )
+        records = iter_records(
+            "es", "RVR1960", 2025, entries, set(), None, "m", "dashscope", False, [2]
+        )
+        assert rendered == []
+        first = next(records)
+        assert first["custom_id"] == "e1"
+        assert rendered == ["e1"]
+
+    def test_build_batch_matches_generator(self, entries, prompts):
+        args = (
+            "es",
+            "RVR1960",
+            2025,
+            entries,
+            {"2025-01-02"},
+            None,
+            "m",
+            "x",
+            True,
+            [2],
+        )
+        assert build_batch.build_batch(*args) == list(iter_records(*args))
+        assert len(build_batch.build_batch(*args)) == 4
+
+    def test_dashscope_fields(self):
+        rec = next(with_dashscope_fields([_rec(1)]))
+        assert rec["method"] == "POST"
+        assert rec["url"] == "/v1/chat/completions"
+
+
+class TestParts:
+    """Test rollover and the manifest."""
+
+    def test_single_part_keeps_plain_name(self, tmp_path):
+        out = tmp_path / "batch_input_x.jsonl"
+        manifest = write_jsonl_parts((_rec(i) for i in range(3)), out)
+        assert [p["file"] for p in manifest["parts"]] == [out.name]
+        assert len(_lines(out)) == 3
+        assert json.loads(manifest_path(out).read_text())["records"] == 3
+
+    def test_rolls_over_at_record_cap(self, tmp_path):
+        out = tmp_path / "batch_input_x.jsonl"
+        manifest = write_jsonl_parts((_rec(i) for i in range(7)), out, max_records=3)
+        parts = manifest["parts"]
+        assert [p["file"] for p in parts] == [
+            "batch_input_x.part001.jsonl",
+            "batch_input_x.part002.jsonl",
+            "batch_input_x.part003.jsonl",
+        ]
+        assert [p["records"] for p in parts] == [3, 3, 1]
+        assert [(p["first_custom_id"], p["last_custom_id"]) for p in parts] == [
+            ("id000", "id002"),
+            ("id003", "id005"),
+            ("id006", "id006"),
+        ]
+        assert not out.exists()
+        ids = [r["custom_id"] for p in parts for r in _lines(tmp_path / p["file"])]
+        assert ids == [f"id{i:03d}" for i in range(7)]
+
+    def test_rolls_over_at_byte_cap(self, tmp_path):
+        out = tmp_path / "batch_input_x.jsonl"
+        line = len(json.dumps(_rec(0)).encode("utf-8")) + 1
+        manifest = write_jsonl_parts(
+            (_rec(i) for i in range(5)), out, max_bytes=line * 2
+        )
+        assert [p["records"] for p in manifest["parts"]] == [2, 2, 1]
+        for p in manifest["parts"]:
+            size = (tmp_path / p["file"]).stat().st_size
+            assert size == p["bytes"] <= line * 2
+
+    def test_oversize_record_gets_own_part(self, tmp_path, capsys):
+        out = tmp_path / "batch_input_x.jsonl"
+        records = [_rec(0), _rec(1, size=500), _rec(2)]
+        manifest = write_jsonl_parts(records, out, max_bytes=200)
+        assert [p["records"] for p in manifest["parts"]] == [1, 1, 1]
+        assert "id001" in capsys.readouterr().out
+
+    def test_empty_writes_nothing(self, tmp_path):
+        out = tmp_path / "batch_input_x.jsonl"
+        manifest = write_jsonl_parts(iter(()), out, max_records=2)
+        assert manifest["parts"] == []
+        assert list(tmp_path.iterdir()) == []
+
+    def test_load_parts(self, tmp_path):
+        out = tmp_path / "batch_input_x.jsonl"
+        write_jsonl_parts((_rec(i) for i in range(4)), out, max_records=2)
+        expected = [
+            tmp_path / "batch_input_x.part001.jsonl",
+            tmp_path / "batch_input_x.part002.jsonl",
+        ]
+        assert load_parts(manifest_path(out)) == expected
+        assert load_parts(out) == expected
+        plain = tmp_path / "other.jsonl"
+        assert load_parts(plain) == [plain]
+
+    def test_part_caps(self):
+        cfg = {"max_file_mb": 500, "max_requests": 50000}
+        assert part_caps(cfg, None, None) == (500 * 1024 * 1024, 50000)
+        assert part_caps(cfg, 1, 10) == (1024 * 1024, 10)
+        assert part_caps({}, None, None) == (None, None)
+
+
+class TestCostEstimate:
+    """Test the streaming token estimate."""
+
+    def test_observe_matches_list_estimate(self, capsys):
+        records = [_rec(i, size=400) for i in range(3)]
+        estimate_cost(records, "m")
+        expected = capsys.readouterr().out
+        estimate = CostEstimate()
+        assert list(estimate.observe(iter(records))) == records
+        estimate.report("m")
+        assert capsys.readouterr().out == expected
+        assert "~300 tokens total" in expected
+
+
+class FakeClient:
+    def __init__(self, uploads: int):
+        self.barrier = threading.Barrier(uploads, timeout=5)
+        self.downloads = []
+
+    def upload(self, path):
+        self.barrier.wait()  # every part uploading at once, or BrokenBarrierError
+        return f"file-{path.name}"
+
+    def submit(self, file_id):
+        return f"batch-{file_id}"
+
+    def poll(self, batch_id, interval):
+        return f"out-{batch_id}"
+
+    def download(self, file_id, dest):
+        self.downloads.append(file_id)
+        dest.write_text("")
+        return dest
+
+
+class TestPipelineParts:
+    """Test batch_pipeline uploads parts concurrently."""
+
+    def test_parts_uploaded_concurrently(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(batch_pipeline._paths, "BATCH_OUTPUT_DIR", tmp_path)
+        out = tmp_path / "batch_input_x.jsonl"
+        write_jsonl_parts((_rec(i) for i in range(6)), out, max_records=2)
+        parts = load_parts(out)
+        client = FakeClient(uploads=3)
+
+        done = batch_pipeline._run_batches(client, parts, poll_interval=0)
+
+        assert [p for p, _ in done] == parts
+        assert [r.name for _, r in done] == [
+            "BIJOutputSet_x.part001_results.jsonl",
+            "BIJOutputSet_x.part002_results.jsonl",
+            "BIJOutputSet_x.part003_results.jsonl",
+        ]
+        assert client.downloads == [
+            f"out-batch-file-batch_input_x.part00{i}.jsonl" for i in (1, 2, 3)
+        ]
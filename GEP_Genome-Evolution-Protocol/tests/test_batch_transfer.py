@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+test_batch_transfer.py — Tests for streaming BatchClient upload / download
+
+Tests cover:
+1. Upload streams the multipart body from disk
+2. Download resumes with HTTP Range after a dropped connection / from a .part
+3. Size and digest verification, server ignoring Range
+"""
+
+import base64
+import hashlib
+import json
+import re
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+# Add parent directory to path to import batch_client
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import batch_client
+from batch_client import BatchAPIError, BatchClient
+
+CONTENT = b"".join(b'{"custom_id": "id%04d", "ok": true}\n' % i for i in range(2000))
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        self.server.uploads.append(body)
+        self._json({"id": "file-up"})
+
+    def do_GET(self):
+        srv = self.server
+        srv.ranges.append(self.headers.get("Range"))
+        if not self.path.endswith("/content"):
+            self._json({"id": "file-1", "bytes": srv.reported_size})
+            return
+        start = 0
+        match = re.fullmatch(r"bytes=(\d+)-", self.headers.get("Range") or "")
+        if match and srv.honour_range:
+            start = int(match.group(1))
+            if start >= len(srv.content):
+                self.send_response(416)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            self.send_response(206)
+            self.send_header(
+                "Content-Range",
+                f"bytes {start}-{len(srv.content) - 1}/{len(srv.content)}",
+            )
+        else:
+            self.send_response(200)
+        body = srv.content[start:]
+        self.send_header("Content-Length", str(len(body)))
+        if srv.digest:
+            self.send_header("Repr-Digest", f"sha-256=:{srv.digest}:")
+        self.end_headers()
+        if srv.drops:
+            srv.drops -= 1
+            self.wfile.write(body[: len(body) // 3])
+            self.wfile.flush()
+            self.close_connection = True
+            return
+        self.wfile.write(body)
+
+    def _json(self, data):
+        payload = json.dumps(data).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    srv = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    srv.content = CONTENT
+    srv.reported_size = len(CONTENT)
+    srv.digest = base64.b64encode(hashlib.sha256(CONTENT).digest()).decode()
+    srv.honour_range = True
+    srv.drops = 0
+    srv.uploads = []
+    srv.ranges = []
+    thread = threading.Thread(target=srv.serve_forever, daemon=True)
+    thread.start()
+    yield srv
+    srv.shutdown()
+    srv.server_close()
+
+
+@pytest.fixture
+def client(server, monkeypatch):
+    host, port = server.server_address
+    provider = {
+        "id": "test_batch",
+        "base_url": f"http://{host}:{port}/v1",
+        "model": "m",
+        "env_var": "GEP_TEST_KEY",
+        "batch": {"supported": True},
+    }
+    monkeypatch.setenv("GEP_TEST_KEY", "k")
+    monkeypatch.setattr(batch_client, "_load_config", lambda: {"providers": [provider]})
+    monkeypatch.setattr(batch_client.time, "sleep", lambda s: None)
+    monkeypatch.setattr(batch_client, "CHUNK_BYTES", 4096)
+    return BatchClient("test_batch")
+
+
+class TestUpload:
+    """Test the streamed multipart upload."""
+
+    def test_streams_from_disk(self, client, server, tmp_path, monkeypatch):
+        src = tmp_path / "batch_input_x.jsonl"
+        src.write_bytes(CONTENT)
+
+        def no_read_bytes(self):
+            raise AssertionError("upload must not read the whole file")
+
+        monkeypatch.setattr(Path, "read_bytes", no_read_bytes)
+        assert client.upload(src) == "file-up"
+        body = server.uploads[0]
+        assert CONTENT in body
+        assert b'name="purpose"\r\n\r\nbatch' in body
+        assert body.endswith(b"\r\n--GEPBatch01--\r\n")
+
+
+class TestDownload:
+    """Test resumable, verified downloads."""
+
+    def test_plain_download(self, client, server, tmp_path):
+        dest = tmp_path / "results.jsonl"
+        assert client.download("file-1", dest) == dest
+        assert dest.read_bytes() == CONTENT
+        assert not (tmp_path / "results.jsonl.part").exists()
+
+    def test_resumes_after_dropped_connection(self, client, server, tmp_path):
+        server.drops = 2
+        dest = tmp_path / "results.jsonl"
+        client.download("file-1", dest)
+        assert dest.read_bytes() == CONTENT
+        content_ranges = server.ranges[1:]  # first GET is the file object
+        assert content_ranges[0] is None
+        assert all(r and r.startswith("bytes=") for r in content_ranges[1:])
+        assert len(content_ranges) == 3
+
+    def test_resumes_existing_part_file(self, client, server, tmp_path):
+        dest = tmp_path / "results.jsonl"
+        (tmp_path / "results.jsonl.part").write_bytes(CONTENT[:1000])
+        client.download("file-1", dest)
+        assert dest.read_bytes() == CONTENT
+        assert server.ranges[-1] == "bytes=1000-"
+
+    def test_complete_part_file_not_refetched(self, client, server, tmp_path):
+        dest = tmp_path / "results.jsonl"
+        (tmp_path / "results.jsonl.part").write_bytes(CONTENT)
+        client.download("file-1", dest)
+        assert dest.read_bytes() == CONTENT
+        assert len(server.ranges) == 1  # file object only
+
+    def test_server_ignoring_range_restarts(self, client, server, tmp_path):
+        server.honour_range = False
+        dest = tmp_path / "results.jsonl"
+        (tmp_path / "results.jsonl.part").write_bytes(b"stale bytes")
+        client.download("file-1", dest)
+        assert dest.read_bytes() == CONTENT
+
+    def test_digest_mismatch_discarded(self, client, server, tmp_path):
+        server.digest = base64.b64encode(hashlib.sha256(b"other").digest()).decode()
+        dest = tmp_path / "results.jsonl"
+        with pytest.raises(BatchAPIError, match="checksum"):
+            client.download("file-1", dest)
+        assert not dest.exists()
+        assert not (tmp_path / "results.jsonl.part").exists()
+
+    def test_size_mismatch_discarded(self, client, server, tmp_path):
+        server.reported_size = len(CONTENT) + 10
+        server.digest = None
+        with pytest.raises(BatchAPIError, match="expected"):
+            client.download("file-1", tmp_path / "results.jsonl")
+
+    def test_gives_up_keeping_part(self, client, server, tmp_path):
+        server.drops = 99
+        with pytest.raises(BatchAPIError, match="attempts"):
+            client.download("file-1", tmp_path / "results.jsonl")
+        assert (tmp_path / "results.jsonl.part").stat().st_size > 0
@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+"""
+test_cloud_async.py — Tests for cloud_client.acall / call_ollama over http_transport
+
+Tests cover:
+1. acall returns the same (reaction, raw) shape as call_ollama
+2. Keep-alive: many requests reuse a few pooled connections
+3. Concurrent calls on one event loop
+4. 429 swap to the next provider, per-request deadline
+5. call_ollama (runner's threaded path) on the same keep-alive pool,
+   and through HTTP_PROXY when one is set
+"""
+
+import asyncio
+import json
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+# Add parent directory to path to import cloud_client
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import cloud_client
+import http_transport
+import rate_scheduler
+from models import Verdict
+
+COMPLETION = {
+    "choices": [
+        {
+            "message": {
+                "content": '{"verdict": "PAUSE", "reaction": "repeated", '
+                '"quoted_pause": "amor amor", "category": "repetition", '
+                '"confidence": 0.9}'
+            }
+        }
+    ],
+    "usage": {"total_tokens": 42},
+}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        with self.server.lock:
+            self.server.requests.append((self.path, json.loads(body)))
+        if self.path.startswith("/limited"):
+            self._reply(429, {"error": {"message": "slow down"}})
+            return
+        if self.path.startswith("/slow"):
+            time.sleep(0.5)
+        time.sleep(self.server.delay)
+        self._reply(200, COMPLETION)
+
+    def _reply(self, status, data):
+        payload = json.dumps(data).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    srv = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    srv.lock = threading.Lock()
+    srv.connections = 0
+    srv.requests = []
+    srv.delay = 0.0
+    srv.handle_error = lambda request, address: None  # client hung up (deadline)
+    thread = threading.Thread(target=srv.serve_forever, daemon=True)
+    thread.start()
+    yield srv
+    srv.shutdown()
+    srv.server_close()
+
+
+def _provider(server, pid: str, path: str = "/v1", priority: int = 1) -> dict:
+    host, port = server.server_address
+    return {
+        "id": pid,
+        "name": pid,
+        "phase": "both",
+        "priority": priority,
+        "client_type": "api",
+        "base_url": f"http://{host}:{port}{path}",
+        "model": "test-model",
+        "env_var": "GEP_TEST_KEY",
+        "limits": {},
+    }
+
+
+@pytest.fixture
+def providers(server, monkeypatch):
+    """Point cloud_client at the local server through the stdlib pool."""
+    monkeypatch.setenv("GEP_TEST_KEY", "k")
+    monkeypatch.setenv("GEP_RESPONSE_CACHE", "0")
+    for var in ("http_proxy", "https_proxy", "HTTP_PROXY", "HTTPS_PROXY"):
+        monkeypatch.delenv(var, raising=False)
+    monkeypatch.setattr(http_transport, "httpx", None)
+    monkeypatch.setattr(rate_scheduler, "_shared", rate_scheduler.RateScheduler())
+    config = {
+        "settings": {
+            "default_backend": "api",
+            "daily_token_tracking": False,
+            "max_retries": 1,
+            "retry_delay_s": 0,
+        },
+        "providers": [_provider(server, "main")],
+    }
+    monkeypatch.setattr(cloud_client, "_config", config)
+    yield config
+    asyncio.run(http_transport.aclose())
+
+
+class TestAcall:
+    """Test the async call path end to end."""
+
+    def test_same_result_as_call_ollama(self, providers):
+        reaction, raw = asyncio.run(cloud_client.acall("sys", "user", phase=2))
+        sync_reaction, sync_raw = cloud_client.call_ollama(
+            "auto", "sys", "user", verbose=False, phase=2
+        )
+        assert reaction == sync_reaction
+        assert raw == sync_raw
+        assert reaction.verdict == Verdict.PAUSE
+        assert reaction.quoted_pause == "amor amor"
+
+    def test_connections_are_reused(self, providers, server):
+        async def run():
+            for _ in range(10):
+                await cloud_client.acall("sys", "user", phase=1)
+
+        asyncio.run(run())
+        assert len(server.requests) == 10
+        assert server.connections == 1
+
+    def test_concurrent_calls_in_flight(self, providers, server):
+        server.delay = 0.2
+
+        async def run():
+            return await asyncio.gather(
+                *(cloud_client.acall("sys", f"user {i}", phase=2) for i in range(6))
+            )
+
+        t0 = time.monotonic()
+        results = asyncio.run(run())
+        assert time.monotonic() - t0 < 6 * 0.2
+        assert all(r.verdict == Verdict.PAUSE for r, _ in results)
+        assert server.connections <= 6
+
+    def test_429_swaps_to_next_provider(self, providers, server):
+        providers["providers"] = [
+            _provider(server, "limited", path="/limited", priority=1),
+            _provider(server, "backup", priority=2),
+        ]
+        reaction, raw = asyncio.run(cloud_client.acall("sys", "user", phase=2))
+        assert reaction is not None
+        assert [path for path, _ in server.requests] == [
+            "/limited/chat/completions",
+            "/v1/chat/completions",
+        ]
+
+    def test_deadline_exceeded_reports_timeout(self, providers, server):
+        providers["providers"] = [_provider(server, "slow", path="/slow")]
+        reaction, raw = asyncio.run(
+            cloud_client.acall("sys", "user", phase=2, deadline_s=0.1)
+        )
+        assert reaction is None
+        assert "TimeoutError" in raw
+
+    def test_payload_matches_sync_request(self, providers, server):
+        asyncio.run(cloud_client.acall("SYS", "USER", phase=1))
+        _, payload = server.requests[0]
+        assert payload["model"] == "test-model"
+        assert payload["messages"] == [
+            {"role": "system", "content": "SYS"},
+            {"role": "user", "content": "USER"},
+        ]
+
+
+class TestSyncPool:
+    """Test the blocking call_ollama path shares the keep-alive pool."""
+
+    def test_connections_are_reused(self, providers, server):
+        for _ in range(10):
+            reaction, _ = cloud_client.call_ollama(
+                "auto", "sys", "user", verbose=False, phase=1
+            )
+            assert reaction.verdict == Verdict.PAUSE
+        assert len(server.requests) == 10
+        assert server.connections == 1
+
+    def test_worker_threads_share_pool(self, providers, server):
+        server.delay = 0.05
+        results = []
+
+        def worker():
+            for i in range(5):
+                results.append(
+                    cloud_client.call_ollama(
+                        "auto", "sys", f"user {i}", verbose=False, phase=2
+                    )
+                )
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert all(r is not None for r, _ in results)
+        assert len(server.requests) == 20
+        assert server.connections <= 4
+
+    def test_request_timeout_reports_timeout(self, providers, server):
+        providers["settings"]["request_timeout_s"] = 0.1
+        providers["providers"] = [_provider(server, "slow", path="/slow")]
+        reaction, raw = cloud_client.call_ollama(
+            "auto", "sys", "user", verbose=False, phase=2
+        )
+        assert reaction is None
+        assert "TimeoutError" in raw
+
+    def test_http_proxy_honoured(self, providers, server, monkeypatch):
+        host, port = server.server_address
+        monkeypatch.setenv("HTTP_PROXY", f"http://{host}:{port}")
+        monkeypatch.setenv("NO_PROXY", "")
+        monkeypatch.delenv("no_proxy", raising=False)
+        provider = _provider(server, "proxied")
+        provider["base_url"] = "http://provider.invalid/v1"
+        providers["providers"] = [provider]
+        reaction, _ = cloud_client.call_ollama(
+            "auto", "sys", "user", verbose=False, phase=2
+        )
+        assert reaction.verdict == Verdict.PAUSE
+        assert [path for path, _ in server.requests] == [
+            "http://provider.invalid/v1/chat/completions"
+        ]
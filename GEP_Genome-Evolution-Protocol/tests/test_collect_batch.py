@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""
+test_collect_batch.py — Tests for parallel batch result collection
+
+Tests cover:
+1. Process-pool parsing writes the same audit rows, in order, as in-process
+2. Counters, skips, dry run, Phase 1 verbatim gate
+3. Genome absorption in file order
+4. AuditWriter: rows and sidecar index match append_record, flush thresholds
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add parent directory to path to import collect_batch
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import audit
+import collect_batch
+import genome as genome_mod
+import paths
+from audit import AuditWriter, append_record, build_record, index_path, load_index
+from collect_batch import process_results
+from models import ReaderReaction, Verdict
+
+N = 60
+
+
+def _reply(i: int) -> str | None:
+    if i % 10 == 3:
+        return None  # empty response
+    if i % 10 == 7:
+        return "not json at all"
+    if i % 5 == 0:
+        return json.dumps(
+            {
+                "verdict": "PAUSE",
+                "reaction": f"stumbled {i}",
+                "quoted_pause": f"quote {i}",
+                "category": "grammar",
+                "confidence": 0.8,
+            }
+        )
+    return json.dumps({"verdict": "OK", "reaction": f"fine {i}"})
+
+
+@pytest.fixture
+def batch(tmp_path, monkeypatch):
+    monkeypatch.setattr(paths, "AUDIT_DIR", tmp_path / "audit")
+    monkeypatch.setattr(paths, "GENOMES_DIR", tmp_path / "genomes")
+    monkeypatch.setattr(paths, "CACHE_DIR", tmp_path / "cache")
+    (tmp_path / "audit").mkdir()
+    (tmp_path / "genomes").mkdir()
+
+    inp = tmp_path / "batch_input.jsonl"
+    res = tmp_path / "results.jsonl"
+    with open(inp, "w", encoding="utf-8") as f:
+        for i in range(N):
+            body = {
+                "messages": [
+                    {"role": "user", "content": f"Date: 2025-01-{i % 28 + 1:02d}"}
+                ]
+            }
+            f.write(json.dumps({"custom_id": f"e{i:03d}", "body": body}) + "\n")
+    with open(res, "w", encoding="utf-8") as f:
+        for i in range(N):
+            content = _reply(i)
+            choice = {"message": {"content": content}} if content else {}
+            f.write(
+                json.dumps(
+                    {
+                        "custom_id": f"e{i:03d}",
+                        "response": {"body": {"choices": [choice] if choice else []}},
+                    }
+                )
+                + "\n"
+            )
+        f.write("{broken\n")
+        f.write(json.dumps({"custom_id": "unknown"}) + "\n")
+    return inp, res
+
+
+def _run(batch, **kwargs):
+    inp, res = batch
+    return process_results(inp, res, "es", "RVR1960", 2025, **kwargs)
+
+
+def _rows(drop=("reviewed_at", "asset_id")) -> list[dict]:
+    log = audit.audit_path("es", "RVR1960", 2025)
+    rows = [json.loads(line) for line in log.read_text(encoding="utf-8").splitlines()]
+    return [{k: v for k, v in r.items() if k not in drop} for r in rows]
+
+
+class TestProcessResults:
+    """Test the collector end to end."""
+
+    def test_counts(self, batch, capsys):
+        summary = _run(batch, workers=1)
+        assert summary == {"ok": 36, "paused": 12, "errors": 12, "skipped": 2}
+        out = capsys.readouterr().out
+        assert "invalid JSON" in out and "not in input index" in out
+
+    def test_pool_matches_inline(self, batch, monkeypatch):
+        _run(batch, workers=1)
+        inline = _rows()
+        audit.audit_path("es", "RVR1960", 2025).unlink()
+        index_path(audit.audit_path("es", "RVR1960", 2025)).unlink()
+
+        monkeypatch.setattr(collect_batch, "PARALLEL_MIN_BYTES", 0)
+        monkeypatch.setattr(collect_batch, "CHUNK_LINES", 7)
+        _run(batch, workers=2)
+        assert _rows() == inline
+        assert [r["id"] for r in inline] == [f"e{i:03d}" for i in range(N)]
+
+    def test_error_rows_keep_phase_zero(self, batch):
+        _run(batch, workers=1)
+        rows = {r["id"]: r for r in _rows()}
+        assert rows["e003"]["action"] == "error_parse"
+        assert rows["e003"]["phase"] == 0
+        assert rows["e007"]["raw_response"] == "not json at all"
+        assert rows["e001"]["phase"] == 2
+
+    def test_index_matches_log(self, batch):
+        _run(batch, workers=1)
+        index = load_index(audit.audit_path("es", "RVR1960", 2025))
+        assert len(index) == N
+        assert index["e005:2"]["action"] == "flagged"
+
+    def test_dry_run_writes_nothing(self, batch, tmp_path):
+        summary = _run(batch, workers=1, dry_run=True)
+        assert summary["ok"] == 36
+        assert list((tmp_path / "audit").iterdir()) == []
+        assert list((tmp_path / "genomes").iterdir()) == []
+
+    def test_genome_absorbs_in_file_order(self, batch, monkeypatch):
+        seen = []
+        real = collect_batch.absorb_reaction
+
+        def spy(genome, reaction, date, year):
+            seen.append(reaction.quoted_pause)
+            return real(genome, reaction, date, year)
+
+        monkeypatch.setattr(collect_batch, "PARALLEL_MIN_BYTES", 0)
+        monkeypatch.setattr(collect_batch, "CHUNK_LINES", 4)
+        monkeypatch.setattr(collect_batch, "absorb_reaction", spy)
+        _run(batch, workers=2)
+        assert seen == [f"quote {i}" for i in range(0, N, 5)]
+        assert genome_mod.genome_path("es", "RVR1960", 2025).exists()
+
+    def test_phase1_gate_downgrades(self, batch, tmp_path):
+        inp, res = batch
+        flag = json.dumps(
+            {"verdict": "FLAG", "category": "typo", "quoted_problem": "nowhere"}
+        )
+        res.write_text(
+            json.dumps(
+                {
+                    "custom_id": "e001",
+                    "response": {"choices": [{"message": {"content": flag}}]},
+                }
+            )
+            + "\n"
+        )
+        source = tmp_path / "source.json"
+        source.write_text(
+            json.dumps({"data": {"2025-01-02": [{"id": "e001", "reflexion": "text"}]}})
+        )
+        summary = process_results(
+            inp, res, "es", "RVR1960", 2025, phase=1, source_path=source, workers=1
+        )
+        assert summary["ok"] == 1 and summary["paused"] == 0
+        assert _rows()[0]["reaction"].startswith("[gate] Hallucinated flag discarded")
+
+
+def _record(i: int):
+    return build_record(
+        entry_date=f"2025-01-{i % 28 + 1:02d}",
+        entry_id=f"id{i}",
+        lang="es",
+        version="NVI",
+        action="reviewed",
+        reaction=ReaderReaction(verdict=Verdict.OK, reaction=f"r{i}"),
+        phase=2,
+        raw_response="raw",
+    )
+
+
+class TestAuditWriter:
+    """Test the buffered audit writer."""
+
+    def test_same_log_and_index_as_append_record(self, tmp_path):
+        a, b = tmp_path / "a.jsonl", tmp_path / "b.jsonl"
+        records = [_record(i) for i in range(25)]
+        for rec in records:
+            append_record(a, rec)
+        with AuditWriter(b, flush_every=10) as writer:
+            for rec in records:
+                writer.append(rec)
+        assert a.read_bytes() == b.read_bytes()
+        assert load_index(a) == load_index(b)
+
+    def test_appends_after_existing_rows(self, tmp_path):
+        log = tmp_path / "a.jsonl"
+        append_record(log, _record(0))
+        with AuditWriter(log) as writer:
+            writer.append(_record(1))
+        append_record(log, _record(2))
+        assert set(load_index(log)) == {"id0:2", "id1:2", "id2:2"}
+
+    def test_flushes_every_n_rows(self, tmp_path, monkeypatch):
+        syncs = []
+        monkeypatch.setattr(audit.os, "fsync", syncs.append)
+        log = tmp_path / "a.jsonl"
+        writer = AuditWriter(log, flush_every=3, flush_interval_s=3600)
+        for i in range(7):
+            writer.append(_record(i))
+        assert len(syncs) == 2
+        assert len(log.read_text().splitlines()) == 6
+        writer.close()
+        assert len(syncs) == 3
+        assert len(load_index(log)) == 7
+
+    def test_flushes_on_interval(self, tmp_path, monkeypatch):
+        clock = [0.0]
+        monkeypatch.setattr(audit.time, "monotonic", lambda: clock[0])
+        log = tmp_path / "a.jsonl"
+        writer = AuditWriter(log, flush_every=1000, flush_interval_s=2.0)
+        writer.append(_record(0))
+        assert log.read_text() == ""
+        clock[0] = 2.5
+        writer.append(_record(1))
+        assert len(log.read_text().splitlines()) == 2
+        writer.close()
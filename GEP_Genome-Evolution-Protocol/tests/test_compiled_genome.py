@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+test_compiled_genome.py — Tests for genome_validator.CompiledGenome
+
+Tests cover:
+1. Precompiled matches equal per-pattern re.finditer
+2. Invalid regexes dropped once with a warning
+3. compile_genome cache and validate_entries with a CompiledGenome
+"""
+
+import re
+import sys
+from pathlib import Path
+
+# Add parent directory to path to import genome_validator
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import genome_validator
+from genome_validator import CompiledGenome, compile_genome, validate_entries
+from models import DevotionalEntry, Genome, GenomeFragment, PauseCategory
+
+
+def _frag(fid: str, pattern: str, quote: str = "~no quote~", confidence=0.8):
+    return GenomeFragment(
+        id=fid,
+        language="es",
+        version="NVI",
+        category=PauseCategory.GRAMMAR,
+        pattern=pattern,
+        example_quote=quote,
+        evidence_dates=["2025-01-01"],
+        confidence=confidence,
+    )
+
+
+def _genome(*frags: GenomeFragment) -> Genome:
+    return Genome(
+        language="es", version="NVI", genome_version="1", fragments=list(frags)
+    )
+
+
+def _entry(reflexion: str, oracion: str = "", versiculo: str = "") -> DevotionalEntry:
+    return DevotionalEntry(
+        id="d1",
+        date="2025-01-01",
+        language="es",
+        version="NVI",
+        versiculo=versiculo,
+        reflexion=reflexion,
+        oracion=oracion,
+    )
+
+
+def _finditer(text: str, fragments) -> list:
+    """Reference: one finditer per fragment, in fragment order."""
+    out = []
+    for f in fragments:
+        regex = re.compile(f.pattern.replace(" ", r"\s+"), re.I | re.M)
+        out.extend((f.id, m.group(0)) for m in regex.finditer(text))
+    return out
+
+
+TEXT = (
+    "La la gracia de Dios. El Señor es es mi pastor;\n"
+    "nada me faltará. Amor amor amor, gracia sobre gracia."
+)
+
+
+class TestSearchField:
+    """Test precompiled search against per-pattern finditer."""
+
+    def test_matches_equal_per_pattern_finditer(self):
+        frags = [
+            _frag("art", r"\bla la\b"),
+            _frag("es", r"es es"),
+            _frag("amor", r"amor amor"),  # overlapping repeats
+            _frag("gr", r"gracia"),
+            _frag("line", r"^nada"),
+            _frag("dup", r"(\w+) \1"),
+            _frag("opt", r"x*"),
+            _frag("none", r"inexistente"),
+        ]
+        compiled = CompiledGenome(_genome(*frags))
+        got = [
+            (m.fragment_id, m.matched_text)
+            for m in compiled.search_field(TEXT, "d1", "2025-01-01", "reflexion")
+        ]
+        assert got == _finditer(TEXT, frags)
+
+    def test_quote_hit_replaces_regex_hits(self):
+        frag = _frag("gr", r"gracia", quote="GRACIA SOBRE")
+        matches = CompiledGenome(_genome(frag)).search_field(TEXT, "d1", "d", "oracion")
+        assert [m.matched_text for m in matches] == ["GRACIA SOBRE"]
+
+    def test_confidence_threshold_applies(self):
+        genome = _genome(_frag("hi", "gracia"), _frag("lo", "Dios", confidence=0.2))
+        assert [f.id for f in CompiledGenome(genome, 0.6).fragments] == ["hi"]
+
+
+class TestInvalidPatterns:
+    """Test invalid regexes are handled once, at compile time."""
+
+    def test_invalid_regex_dropped_with_one_warning(self, capsys):
+        compiled = CompiledGenome(_genome(_frag("bad", "(la"), _frag("ok", "gracia")))
+        assert [f.id for f in compiled.dropped] == ["bad"]
+        assert capsys.readouterr().out.count("Invalid pattern regex in bad") == 1
+        for _ in range(3):
+            matches = compiled.search_field(TEXT, "d1", "d", "reflexion")
+        assert {m.fragment_id for m in matches} == {"ok"}
+        assert capsys.readouterr().out == ""
+
+    def test_invalid_regex_still_matches_by_quote(self):
+        frag = _frag("bad", "(la", quote="la gracia")
+        matches = CompiledGenome(_genome(frag)).search_field(TEXT, "d1", "d", "f")
+        assert [m.fragment_id for m in matches] == ["bad"]
+
+
+class TestCompileGenomeCache:
+    """Test reuse of compiled genomes until the fragments change."""
+
+    def test_same_genome_reuses_compilation(self):
+        genome = _genome(_frag("gr", "gracia"))
+        assert compile_genome(genome) is compile_genome(genome)
+
+    def test_changed_pattern_recompiles(self):
+        genome = _genome(_frag("gr", "gracia"))
+        before = compile_genome(genome)
+        genome.fragments[0].pattern = "amor"
+        assert compile_genome(genome) is not before
+
+    def test_threshold_is_part_of_key(self):
+        genome = _genome(_frag("gr", "gracia"))
+        assert compile_genome(genome, 0.6) is not compile_genome(genome, 0.9)
+
+    def test_cache_is_bounded(self):
+        for i in range(genome_validator._COMPILED_CACHE_SIZE + 3):
+            compile_genome(_genome(_frag(f"f{i}", "gracia")))
+        assert (
+            len(genome_validator._compiled_cache)
+            <= genome_validator._COMPILED_CACHE_SIZE
+        )
+
+
+class TestValidateWithCompiled:
+    """Test validate_entries / validate_entry accept a CompiledGenome."""
+
+    def test_compiled_and_raw_genome_agree(self):
+        genome = _genome(_frag("amor", "amor amor"), _frag("gr", "gracia"))
+        entries = [_entry(TEXT, oracion="Gracias por tu gracia.")]
+        raw = validate_entries(entries, genome, "es", "NVI", 2025)
+        compiled = validate_entries(entries, CompiledGenome(genome), "es", "NVI", 2025)
+        assert raw.matches == compiled.matches
+        assert compiled.categories_found == {"grammar": compiled.total_matches}
+
+    def test_empty_compiled_genome_skips(self, capsys):
+        report = validate_entries(
+            [_entry(TEXT)], CompiledGenome(None), "es", "NVI", 2025
+        )
+        assert report.total_matches == 0
+        assert "skipping validation" in capsys.readouterr().out
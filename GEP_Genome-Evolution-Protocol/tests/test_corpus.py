@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+test_corpus.py — Tests for the shared devotional corpus loader
+
+Tests cover:
+1. Every source shape normalised to the same rows (nested, flat, list)
+2. DevotionalEntry views match the old per-tool loaders
+3. Disk cache keyed by size + mtime, then SHA-256; memo per process
+4. source / build_batch / collect_batch loaders on top of it
+"""
+
+import json
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add parent directory to path to import corpus
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import corpus as corpus_mod
+import paths
+from build_batch import load_entries
+from collect_batch import load_source_index
+from corpus import Corpus, cache_path, open_corpus
+from source import extract_entries, load_local
+
+
+def _item(day: int, **extra) -> dict:
+    item = {
+        "id": f"id{day}",
+        "date": f"2025-01-0{day}",
+        "language": "es",
+        "version": "NVI",
+        "versiculo": f"Juan 3:{day}",
+        "reflexion": f"reflexión {day} — ñandú",
+        "oracion": f"oración {day}",
+        "para_meditar": [{"cita": f"Salmo {day}", "texto": "t"}],
+        "tags": ["fe", "amor"],
+    }
+    item.update(extra)
+    return item
+
+
+NESTED = {
+    "data": {
+        "es": {
+            "2025-01-02": [_item(2)],
+            "2025-01-01": [_item(1), _item(3, oracion=None)],
+        },
+        "en": {"2025-01-01": _item(4, language="en", version="KJV")},
+    }
+}
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(paths, "CACHE_DIR", tmp_path / "cache")
+    monkeypatch.setattr(corpus_mod, "_memo", {})
+    return tmp_path / "cache"
+
+
+@pytest.fixture
+def source_file(tmp_path):
+    path = tmp_path / "Devocional_year_2025_es_NVI.json"
+    path.write_text(json.dumps(NESTED, ensure_ascii=False), encoding="utf-8")
+    return path
+
+
+class TestShapes:
+    """Test schema normalisation."""
+
+    def test_nested_by_language(self):
+        corpus = Corpus.from_data(NESTED)
+        assert corpus.nested and corpus.has_language("en")
+        assert [corpus.ids[r] for r in corpus.rows("es")] == ["id2", "id1", "id3"]
+        assert [corpus.ids[r] for r in corpus.rows()] == ["id2", "id1", "id3"]
+        assert [corpus.ids[r] for r in corpus.rows("en")] == ["id4"]
+        assert list(corpus.rows("fr")) == []
+
+    def test_flat_date_map_and_list(self):
+        flat = Corpus.from_data({"data": {"2025-01-01": _item(1), "2025-01-02": []}})
+        assert not flat.nested and not flat.has_language("es")
+        assert [flat.ids[r] for r in flat.rows("es")] == ["id1"]
+        undated = _item(1, fecha="2025-02-01")
+        del undated["date"]
+        listed = Corpus.from_data([undated, "junk"])
+        assert listed.dates == ["2025-02-01"]
+
+    def test_entry_view_round_trip(self):
+        corpus = Corpus.from_data(NESTED)
+        entry = corpus.entry(corpus.rows("es")[1])
+        assert entry.reflexion == "reflexión 1 — ñandú"
+        assert entry.para_meditar == [{"cita": "Salmo 1", "texto": "t"}]
+        assert entry.tags == ["fe", "amor"]
+        blank = corpus.entry(corpus.rows("es")[2])
+        assert blank.oracion == "" and blank.versiculo == "Juan 3:3"
+        assert corpus.source_index("es")["id3"] == "reflexión 3 — ñandú "
+
+
+class TestCache:
+    """Test the on-disk columnar cache."""
+
+    def test_written_and_reused(self, source_file, monkeypatch):
+        first = open_corpus(source_file)
+        assert cache_path(source_file).exists()
+        monkeypatch.setattr(corpus_mod, "_memo", {})
+        monkeypatch.setattr(
+            corpus_mod.json, "loads", lambda *a: pytest.fail("re-parsed")
+        )
+        again = open_corpus(source_file)
+        assert again is not first
+        assert again.text == first.text and list(again.offsets) == list(first.offsets)
+
+    def test_memo_returns_same_object(self, source_file):
+        assert open_corpus(source_file) is open_corpus(str(source_file))
+
+    def test_touched_file_restamped_not_reparsed(self, source_file, monkeypatch):
+        open_corpus(source_file)
+        st = source_file.stat()
+        os.utime(source_file, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+        monkeypatch.setattr(corpus_mod, "_memo", {})
+        monkeypatch.setattr(
+            corpus_mod.json, "loads", lambda *a: pytest.fail("re-parsed")
+        )
+        open_corpus(source_file)
+
+    def test_changed_file_rebuilt(self, source_file):
+        assert len(open_corpus(source_file)) == 4
+        data = json.loads(json.dumps(NESTED))
+        data["data"]["es"]["2025-01-05"] = [_item(5)]
+        source_file.write_text(json.dumps(data), encoding="utf-8")
+        assert "id5" in open_corpus(source_file).ids
+
+    def test_corrupt_cache_rebuilt(self, source_file, monkeypatch, capsys):
+        open_corpus(source_file)
+        cache_path(source_file).write_bytes(b"not a pickle")
+        monkeypatch.setattr(corpus_mod, "_memo", {})
+        assert len(open_corpus(source_file)) == 4
+        assert "rebuilding" in capsys.readouterr().out
+
+    def test_disabled(self, source_file, cache_dir, monkeypatch):
+        monkeypatch.setenv("GEP_CORPUS_CACHE", "0")
+        assert len(open_corpus(source_file)) == 4
+        assert not cache_dir.exists()
+
+
+class TestLoaders:
+    """Test the per-tool loaders routed through the corpus."""
+
+    def test_extract_entries_sorted_by_date(self, source_file):
+        for data in (NESTED, load_local(str(source_file))):
+            entries = extract_entries(data, "es")
+            assert [e.id for e in entries] == ["id1", "id3", "id2"]
+            assert entries[0].language == "es" and entries[0].version == "NVI"
+
+    def test_extract_entries_missing_language_exits(self):
+        with pytest.raises(SystemExit):
+            extract_entries({"data": {"2025-01-01": _item(1)}}, "es")
+
+    def test_load_entries_file_order_run_labels(self, source_file, capsys):
+        entries = load_entries("en", "WEB", 2025, str(source_file))
+        assert [(e.id, e.language, e.version) for e in entries] == [
+            ("id4", "en", "WEB")
+        ]
+
+    def test_load_source_index(self, source_file, tmp_path):
+        index = load_source_index(source_file)
+        assert index["id1"] == "reflexión 1 — ñandú oración 1"
+        assert "id4" not in index  # first language only
+        assert load_source_index(tmp_path / "missing.json") == {}
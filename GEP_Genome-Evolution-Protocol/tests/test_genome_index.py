@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+test_genome_index.py — Tests for the genome absorption word index
+
+Tests cover:
+1. _find_similar_fragment picks the same fragment as a full linear scan
+2. The index grows with absorb_reaction and with fragments appended elsewhere
+3. Rebuild when genome.fragments is replaced or shrinks
+4. Only fragments sharing a word are scored
+"""
+
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add parent directory to path to import genome
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import genome as genome_mod
+import paths
+from genome import FragmentWordIndex, _find_similar_fragment, absorb_reaction
+from models import Genome, GenomeFragment, PauseCategory, ReaderReaction, Verdict
+
+WORDS = "el la de amor gracia fe señor dios camino luz paz vida".split()
+
+
+def _frag(i: int, quote: str, category=PauseCategory.GRAMMAR) -> GenomeFragment:
+    return GenomeFragment(
+        id=f"f{i}",
+        language="es",
+        version="RVR1960",
+        category=category,
+        pattern="p",
+        example_quote=quote,
+        evidence_dates=["2025-01-01"],
+        confidence=0.4,
+    )
+
+
+def _genome(fragments=()) -> Genome:
+    return Genome("es", "RVR1960", "es-RVR1960-2025-v1", fragments=list(fragments))
+
+
+def _linear(genome, category, quote):
+    """The pre-index scan, kept as the reference."""
+    quote_words = set(quote.lower().split())
+    best, best_overlap = None, 0.0
+    for frag in genome.fragments:
+        if frag.category != category:
+            continue
+        frag_words = set(frag.example_quote.lower().split())
+        if not quote_words or not frag_words:
+            continue
+        overlap = len(quote_words & frag_words) / min(len(quote_words), len(frag_words))
+        if overlap >= 0.4 and overlap > best_overlap:
+            best_overlap, best = overlap, frag
+    return best
+
+
+def _quote(rng) -> str:
+    return " ".join(
+        rng.choice(WORDS).title() if rng.random() < 0.2 else rng.choice(WORDS)
+        for _ in range(rng.randint(0, 5))
+    )
+
+
+@pytest.fixture
+def genomes_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(paths, "GENOMES_DIR", tmp_path)
+
+
+class TestSimilarFragment:
+    """Test lookups against the linear reference."""
+
+    def test_matches_linear_scan(self):
+        rng = random.Random(7)
+        categories = [PauseCategory.GRAMMAR, PauseCategory.TYPO]
+        genome = _genome(
+            _frag(i, _quote(rng), rng.choice(categories)) for i in range(300)
+        )
+        for _ in range(500):
+            category, quote = rng.choice(categories), _quote(rng)
+            assert _find_similar_fragment(genome, category, quote) is _linear(
+                genome, category, quote
+            )
+
+    def test_ties_go_to_earliest_fragment(self):
+        genome = _genome([_frag(0, "gracia paz"), _frag(1, "paz gracia")])
+        assert _find_similar_fragment(genome, PauseCategory.GRAMMAR, "paz").id == "f0"
+
+    def test_empty_quote_matches_nothing(self):
+        genome = _genome([_frag(0, "gracia"), _frag(1, "")])
+        assert _find_similar_fragment(genome, PauseCategory.GRAMMAR, "  ") is None
+
+    def test_only_sharing_fragments_scored(self):
+        genome = _genome(_frag(i, f"palabra{i} otra{i}") for i in range(1000))
+        index = genome_mod._word_index(genome)
+        shared = index.shared_words(PauseCategory.GRAMMAR, {"palabra5", "nada"})
+        assert shared == {5: 1}
+
+
+class TestIndexMaintenance:
+    """Test the index follows genome.fragments."""
+
+    def test_absorb_adds_to_index(self, genomes_dir):
+        genome = _genome()
+        reaction = ReaderReaction(
+            verdict=Verdict.PAUSE,
+            reaction="r",
+            quoted_pause="la gracia de Dios",
+            category=PauseCategory.GRAMMAR,
+        )
+        genome, first = absorb_reaction(genome, reaction, "2025-01-01", 2025)
+        assert isinstance(genome.word_index, FragmentWordIndex)
+        assert len(genome.word_index.fragments) == 1
+        reaction.quoted_pause = "gracia de dios"
+        genome, second = absorb_reaction(genome, reaction, "2025-01-02", 2025)
+        assert second == first
+        assert genome.fragments[0].evidence_dates == ["2025-01-01", "2025-01-02"]
+
+    def test_catches_up_with_external_append(self):
+        genome = _genome([_frag(0, "luz")])
+        assert _find_similar_fragment(genome, PauseCategory.GRAMMAR, "camino") is None
+        genome.fragments.append(_frag(1, "camino"))
+        assert (
+            _find_similar_fragment(genome, PauseCategory.GRAMMAR, "camino").id == "f1"
+        )
+
+    def test_rebuilds_when_fragments_replaced(self):
+        genome = _genome([_frag(0, "luz"), _frag(1, "camino")])
+        _find_similar_fragment(genome, PauseCategory.GRAMMAR, "luz")
+        genome.fragments = [_frag(2, "camino")]
+        assert _find_similar_fragment(genome, PauseCategory.GRAMMAR, "luz") is None
+        genome.fragments.pop()
+        genome.fragments.append(_frag(3, "luz"))
+        assert _find_similar_fragment(genome, PauseCategory.GRAMMAR, "luz").id == "f3"
+
+    def test_not_persisted(self, genomes_dir):
+        genome = _genome([_frag(0, "luz")])
+        _find_similar_fragment(genome, PauseCategory.GRAMMAR, "luz")
+        genome_mod.save_genome(genome, 2025)
+        loaded = genome_mod.load_genome("es", "RVR1960", 2025)
+        assert loaded.word_index is None
+        assert loaded == genome
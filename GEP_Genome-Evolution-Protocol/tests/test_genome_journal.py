@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+test_genome_journal.py — Tests for the append-only genome journal
+
+Tests cover:
+1. absorb_reaction appends add / update / promote events, no snapshot rewrite
+2. load_genome replays the journal over the snapshot (or alone)
+3. save_genome compacts atomically, keeping the file mode; replay is
+   idempotent, torn tails ignored (also when absorbing resumes after one)
+4. Automatic compaction past JOURNAL_COMPACT_BYTES
+"""
+
+import json
+import os
+import stat
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add parent directory to path to import genome
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import genome as genome_mod
+import paths
+from genome import (
+    absorb_reaction,
+    ensure_genome,
+    genome_path,
+    journal_path,
+    load_genome,
+    save_genome,
+)
+from models import GeneState, PauseCategory, ReaderReaction, Verdict
+
+
+def _pause(quote: str) -> ReaderReaction:
+    return ReaderReaction(
+        verdict=Verdict.PAUSE,
+        reaction="stumbled",
+        quoted_pause=quote,
+        category=PauseCategory.GRAMMAR,
+        confidence=0.8,
+    )
+
+
+def _events() -> list[dict]:
+    text = journal_path("es", "RVR1960", 2025).read_text(encoding="utf-8")
+    return [json.loads(line) for line in text.splitlines()]
+
+
+def _state(genome) -> tuple:
+    return (
+        genome.total_entries_reviewed,
+        genome.total_pauses,
+        [(f.id, f.evidence_dates, f.confidence) for f in genome.fragments],
+    )
+
+
+@pytest.fixture(autouse=True)
+def genomes_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(paths, "GENOMES_DIR", tmp_path)
+    return tmp_path
+
+
+@pytest.fixture
+def absorbed():
+    genome = ensure_genome("es", "RVR1960", 2025)
+    for day in range(1, 4):
+        genome, _ = absorb_reaction(
+            genome, _pause("la gracia"), f"2025-01-0{day}", 2025
+        )
+    genome, _ = absorb_reaction(genome, _pause("otro camino"), "2025-01-04", 2025)
+    return genome
+
+
+class TestJournal:
+    """Test events written by absorb_reaction."""
+
+    def test_events_instead_of_snapshot(self, absorbed):
+        assert not genome_path("es", "RVR1960", 2025).exists()
+        assert [e["op"] for e in _events()] == ["add", "update", "promote", "add"]
+        assert _events()[2]["fragment"]["evidence_dates"] == [
+            "2025-01-01",
+            "2025-01-02",
+            "2025-01-03",
+        ]
+
+    def test_replay_without_snapshot(self, absorbed):
+        loaded = load_genome("es", "RVR1960", 2025)
+        assert _state(loaded) == _state(absorbed)
+        assert loaded.genome_version == "es-RVR1960-2025-v1"
+
+    def test_replay_over_snapshot(self, absorbed):
+        save_genome(absorbed, 2025)
+        genome, _ = absorb_reaction(absorbed, _pause("otro camino"), "2025-02-01", 2025)
+        assert len(_events()) == 1
+        assert _state(load_genome("es", "RVR1960", 2025)) == _state(genome)
+
+    def test_ensure_genome_promotes_replayed(self, absorbed):
+        loaded = ensure_genome("es", "RVR1960", 2025)
+        assert loaded.fragments[0].state == GeneState.CONFIRMED
+        assert loaded.fragments[1].state == GeneState.CANDIDATE
+
+
+class TestCompaction:
+    """Test snapshot writes and journal truncation."""
+
+    def test_save_truncates_journal(self, absorbed, genomes_dir):
+        save_genome(absorbed, 2025)
+        assert not journal_path("es", "RVR1960", 2025).exists()
+        assert [p.name for p in genomes_dir.iterdir()] == [
+            "genome_es_RVR1960_2025.json"
+        ]
+        assert _state(load_genome("es", "RVR1960", 2025)) == _state(absorbed)
+
+    def test_replay_idempotent_after_crash_before_truncate(self, absorbed):
+        journal = journal_path("es", "RVR1960", 2025).read_bytes()
+        save_genome(absorbed, 2025)
+        journal_path("es", "RVR1960", 2025).write_bytes(journal)
+        assert _state(load_genome("es", "RVR1960", 2025)) == _state(absorbed)
+
+    def test_failed_snapshot_keeps_old_file(self, absorbed, monkeypatch):
+        save_genome(absorbed, 2025)
+        before = genome_path("es", "RVR1960", 2025).read_bytes()
+
+        def boom(*args, **kwargs):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(genome_mod.json, "dump", boom)
+        with pytest.raises(OSError):
+            save_genome(absorbed, 2025)
+        assert genome_path("es", "RVR1960", 2025).read_bytes() == before
+        assert not list(genome_path("es", "RVR1960", 2025).parent.glob("*.tmp"))
+
+    def test_snapshot_keeps_file_mode(self, absorbed):
+        path = genome_path("es", "RVR1960", 2025)
+        save_genome(absorbed, 2025)
+        umask = os.umask(0)
+        os.umask(umask)
+        assert stat.S_IMODE(path.stat().st_mode) == 0o666 & ~umask
+        os.chmod(path, 0o640)
+        save_genome(absorbed, 2025)
+        assert stat.S_IMODE(path.stat().st_mode) == 0o640
+
+    def test_torn_tail_ignored(self, absorbed):
+        with open(journal_path("es", "RVR1960", 2025), "a", encoding="utf-8") as f:
+            f.write('{"op": "add", "genome": {')
+        assert _state(load_genome("es", "RVR1960", 2025)) == _state(absorbed)
+
+    def test_absorb_after_torn_tail(self, absorbed):
+        with open(journal_path("es", "RVR1960", 2025), "a", encoding="utf-8") as f:
+            f.write('{"op": "add", "genome": {')
+        genome = load_genome("es", "RVR1960", 2025)
+        genome, _ = absorb_reaction(genome, _pause("nuevo paso"), "2025-01-05", 2025)
+        genome, _ = absorb_reaction(genome, _pause("otra voz"), "2025-01-06", 2025)
+        reloaded = load_genome("es", "RVR1960", 2025)
+        assert len(reloaded.fragments) == len(absorbed.fragments) + 2
+        assert _state(reloaded) == _state(genome)
+
+    def test_compacts_past_threshold(self, monkeypatch):
+        monkeypatch.setattr(genome_mod, "JOURNAL_COMPACT_BYTES", 2000)
+        genome = ensure_genome("es", "RVR1960", 2025)
+        for i in range(10):
+            genome, _ = absorb_reaction(
+                genome, _pause(f"frase {i}"), "2025-01-01", 2025
+            )
+        assert genome_path("es", "RVR1960", 2025).exists()
+        assert len(_events()) < 10
+        assert _state(load_genome("es", "RVR1960", 2025)) == _state(genome)
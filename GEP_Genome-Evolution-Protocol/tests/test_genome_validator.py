@@ -8,6 +8,7 @@ Validates:
     - Edge cases and error handling
 """
 
+import os
 import sys
 import tempfile
 import json
@@ -154,11 +155,17 @@ with tempfile.NamedTemporaryFile(
     json.dump(temp_data, f)
     temp_path = f.name
 
+corpus_cache = os.environ.get("GEP_CORPUS_CACHE")
+os.environ["GEP_CORPUS_CACHE"] = "0"  # keep the temp file out of data/cache
 try:
     file_report = validate_file(temp_path, genome, "es", confidence_threshold=0.6)
     check("File validation succeeds", file_report is not None)
     check("  File report has matches", file_report.total_matches > 0)
 finally:
+    if corpus_cache is None:
+        os.environ.pop("GEP_CORPUS_CACHE", None)
+    else:
+        os.environ["GEP_CORPUS_CACHE"] = corpus_cache
     Path(temp_path).unlink()
 
 # ── Test 6: Edge cases ─────────────────────────────────────────────────────────
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+test_prompt_cache.py — Tests for provider prompt-cache-aware requests
+
+Tests cover:
+1. Byte-stable system message across entries on caching providers
+2. cache_control marking, untouched layout for other providers
+3. Cached-token counts from each usage dialect into the ledger
+"""
+
+import json
+import pickle
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add parent directory to path to import cloud_client
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import cloud_client
+from models import Genome
+from prompts import SystemPrompt, build_phase1_system, build_phase2_system
+from quota_ledger import QuotaLedger
+
+
+def _provider(style=None) -> dict:
+    provider = {
+        "id": "p",
+        "name": "P",
+        "model": "m",
+        "base_url": "http://localhost/v1",
+        "env_var": "GEP_TEST_KEY",
+    }
+    if style:
+        provider["prompt_cache"] = {"supported": True, "style": style}
+    return provider
+
+
+GENOME = Genome("es", "RVR1960", "es-RVR1960-2025-v1")
+FLAG = {"verdict": "FLAG", "issue": "typo", "quoted_problem": "Abrahan"}
+
+
+@pytest.fixture(autouse=True)
+def api_key(monkeypatch):
+    monkeypatch.setenv("GEP_TEST_KEY", "k")
+
+
+def _messages(provider, phase1_result, user="ENTRY"):
+    system = build_phase2_system("es", "RVR1960", GENOME, phase1_result)
+    payload, _ = cloud_client._build_request(provider, system, user, phase=2)
+    return payload["messages"]
+
+
+class TestLayout:
+    """Test message order and markers."""
+
+    def test_system_message_stable_across_entries(self):
+        provider = _provider("auto")
+        runs = [_messages(provider, r) for r in (None, {"verdict": "CLEAN"}, FLAG)]
+        assert len({json.dumps(m[0]) for m in runs}) == 1
+        assert "Phase 1" not in runs[0][0]["content"]
+        assert runs[2][1]["content"].startswith(
+            "### Phase 1 linguistic check already flagged"
+        )
+        assert runs[2][1]["content"].endswith("\n\nENTRY")
+        assert runs[0][1]["content"] == "ENTRY"
+
+    def test_cache_control_marks_system_block(self):
+        system, user = _messages(_provider("cache_control"), FLAG)
+        assert system["content"] == [
+            {
+                "type": "text",
+                "text": build_phase2_system("es", "RVR1960", GENOME),
+                "cache_control": {"type": "ephemeral"},
+            }
+        ]
+        assert "Abrahan" in user["content"]
+
+    def test_non_caching_provider_unchanged(self):
+        system, user = _messages(_provider(), FLAG)
+        assert system["content"] == build_phase2_system("es", "RVR1960", GENOME, FLAG)
+        assert user["content"] == "ENTRY"
+
+    def test_plain_string_prompts_pass_through(self):
+        payload, _ = cloud_client._build_request(_provider("auto"), "SYS", "U", phase=1)
+        assert payload["messages"][0]["content"] == "SYS"
+        phase1 = build_phase1_system("es")
+        payload, _ = cloud_client._build_request(
+            _provider("auto"), phase1, "U", phase=1
+        )
+        assert payload["messages"][0]["content"] == phase1
+
+    def test_think_tag_stays_first(self):
+        provider = _provider("auto")
+        provider["thinking_mode"] = {"style": "think_tag", "inject_tag": "/think"}
+        system = build_phase2_system("es", "RVR1960", GENOME, FLAG)
+        payload, _ = cloud_client._build_request(provider, system, "ENTRY", phase=2)
+        assert payload["messages"][1]["content"].startswith("/think\n### Phase 1")
+
+    def test_system_prompt_is_a_str(self):
+        system = build_phase2_system("es", "RVR1960", GENOME, FLAG)
+        assert isinstance(system, SystemPrompt) and isinstance(system, str)
+        restored = pickle.loads(pickle.dumps(system))
+        assert restored == system and type(restored) is str
+
+
+class TestCachedTokens:
+    """Test cached-token accounting."""
+
+    @pytest.mark.parametrize(
+        "usage, expected",
+        [
+            ({"prompt_tokens_details": {"cached_tokens": 1536}}, 1536),
+            ({"prompt_cache_hit_tokens": 640}, 640),
+            ({"cache_read_input_tokens": 2048}, 2048),
+            ({"prompt_tokens_details": None, "total_tokens": 9}, 0),
+            ({}, 0),
+        ],
+    )
+    def test_usage_dialects(self, usage, expected):
+        assert cloud_client._cached_tokens(usage) == expected
+
+    def test_recorded_in_ledger(self, tmp_path, monkeypatch):
+        ledger = QuotaLedger(tmp_path / "usage.json", persist=False)
+        monkeypatch.setattr(cloud_client, "_ledger", lambda: ledger)
+        body = {
+            "choices": [
+                {"message": {"content": '{"verdict": "OK", "reaction": "ok"}'}}
+            ],
+            "usage": {
+                "total_tokens": 3000,
+                "prompt_tokens_details": {"cached_tokens": 2048},
+            },
+        }
+        for _ in range(2):
+            cloud_client._read_completion(
+                _provider("auto"), json.dumps(body).encode(), 1.0, verbose=False
+            )
+        assert ledger.daily("p")["cached_tokens"] == 4096
+        assert cloud_client.cached_tokens_today() == 4096
+
+    def test_ledger_format_without_cache_hits(self, tmp_path):
+        ledger = QuotaLedger(tmp_path / "usage.json")
+        ledger.record("p", 10)
+        ledger.record_cached("p", 0)
+        assert ledger.daily("p") == {"tokens": 10, "requests": 1}
+        ledger.record_cached("q", 5)
+        ledger.flush()
+        saved = json.loads((tmp_path / "usage.json").read_text())
+        assert saved["providers"]["q"] == {
+            "tokens": 0,
+            "requests": 0,
+            "cached_tokens": 5,
+        }
+        assert ledger.cached_total() == 5
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+test_prompt_compiler.py — Tests for compiled, memoized system prompts
+
+Tests cover:
+1. build_phase1_system / build_phase2_system render from cached templates
+2. Recompile when the genome revision changes (absorb_reaction touches it)
+3. Phase 1 context spliced between the static head and tail
+4. template_hash stable for identical static text
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add parent directory to path to import prompts
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import paths
+import prompts
+from genome import absorb_reaction
+from models import Genome, GenomeFragment, PauseCategory, ReaderReaction, Verdict
+from prompts import (
+    CompiledPrompt,
+    build_phase1_system,
+    build_phase2_system,
+    compile_phase1_system,
+    compile_phase2_system,
+    phase1_context,
+)
+
+
+def _genome() -> Genome:
+    frag = GenomeFragment(
+        id="f1",
+        language="es",
+        version="RVR1960",
+        category=PauseCategory.TYPO,
+        pattern="misspelled name",
+        example_quote="Abrahan",
+        evidence_dates=["2025-01-01", "2025-01-02"],
+        confidence=0.8,
+    )
+    return Genome("es", "RVR1960", "es-RVR1960-2025-v1", fragments=[frag])
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache(monkeypatch):
+    monkeypatch.setattr(prompts, "_PHASE2_COMPILED", {})
+
+
+class TestPhase1:
+    """Test the per-language Phase 1 template."""
+
+    def test_compiled_once(self, monkeypatch):
+        compile_phase1_system.cache_clear()
+        calls = []
+        real = prompts.get_native_speaker_info
+        monkeypatch.setattr(
+            prompts,
+            "get_native_speaker_info",
+            lambda lang: calls.append(lang) or real(lang),
+        )
+        assert build_phase1_system("es") == build_phase1_system("es", genome=_genome())
+        assert calls == ["es"]
+        compile_phase1_system.cache_clear()
+
+    def test_matches_template(self):
+        language, country = prompts.get_native_speaker_info("en")
+        assert build_phase1_system("en") == prompts.PHASE1_SYSTEM_TEMPLATE.format(
+            language=language, country=country
+        )
+
+
+class TestPhase2:
+    """Test the per-(lang, version, genome revision) Phase 2 template."""
+
+    def test_same_revision_reuses_template(self, monkeypatch):
+        genome = _genome()
+        blocks = []
+        real = prompts.build_genome_block
+        monkeypatch.setattr(
+            prompts, "build_genome_block", lambda g: blocks.append(g) or real(g)
+        )
+        first = compile_phase2_system("es", "RVR1960", genome)
+        for result in (None, {"verdict": "CLEAN"}):
+            build_phase2_system("es", "RVR1960", genome, result)
+        assert compile_phase2_system("es", "RVR1960", genome) is first
+        assert len(blocks) == 1
+
+    def test_touch_recompiles(self):
+        genome = _genome()
+        before = build_phase2_system("es", "RVR1960", genome)
+        genome.fragments[0].evidence_dates.append("2025-01-03")
+        assert build_phase2_system("es", "RVR1960", genome) == before  # not touched
+        genome.touch()
+        after = build_phase2_system("es", "RVR1960", genome)
+        assert "Seen 3 time(s)" in after and "Seen 2 time(s)" in before
+
+    def test_absorb_touches_genome(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(paths, "GENOMES_DIR", tmp_path)
+        genome = _genome()
+        revision = genome.revision
+        reaction = ReaderReaction(
+            verdict=Verdict.PAUSE,
+            reaction="r",
+            quoted_pause="Abrahan",
+            category=PauseCategory.TYPO,
+        )
+        absorb_reaction(genome, reaction, "2025-01-05", 2025)
+        assert genome.revision != revision
+        assert "Seen 3 time(s)" in build_phase2_system("es", "RVR1960", genome)
+
+    def test_context_spliced_in_place(self):
+        genome = _genome()
+        flag = {"verdict": "FLAG", "issue": "typo", "quoted_problem": "Abrahan"}
+        compiled = compile_phase2_system("es", "RVR1960", genome)
+        text = build_phase2_system("es", "RVR1960", genome, flag)
+        assert text == compiled.head + phase1_context(flag) + compiled.tail
+        assert 'Phrase  : "Abrahan"' in text
+        assert build_phase2_system("es", "RVR1960", genome) == compiled.render()
+
+    def test_distinct_genomes_distinct_templates(self):
+        a, b = _genome(), _genome()
+        b.fragments[0].example_quote = "Moises"
+        assert "Moises" in build_phase2_system("es", "RVR1960", b)
+        assert "Moises" not in build_phase2_system("es", "RVR1960", a)
+
+
+class TestTemplateHash:
+    """Test template hashes."""
+
+    def test_hash_ignores_context(self):
+        genome = _genome()
+        h1 = compile_phase2_system("es", "RVR1960", genome).template_hash
+        prompts._PHASE2_COMPILED.clear()
+        h2 = compile_phase2_system("es", "RVR1960", genome).template_hash
+        assert h1 == h2 and len(h1) == 16
+        assert compile_phase2_system("es", "NVI", genome).template_hash != h1
+
+    def test_head_tail_boundary_matters(self):
+        assert (
+            CompiledPrompt("ab", "c").template_hash
+            != CompiledPrompt("a", "bc").template_hash
+        )
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+test_quota_ledger.py — Tests for the in-memory provider quota ledger
+
+Tests cover:
+1. Daily counters, day rollover and .gep_daily_tokens.json compatibility
+2. Write-behind flush (interval, atomic file, flush on demand)
+3. Daily tpd / rpd limit checks
+4. Thread safety and cloud_client daily checks on top of the ledger
+"""
+
+import json
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+# Add parent directory to path to import quota_ledger
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import cloud_client
+import quota_ledger
+from quota_ledger import QuotaLedger, ledger_for
+
+
+@pytest.fixture
+def counter(tmp_path):
+    return tmp_path / ".gep_daily_tokens.json"
+
+
+class TestDailyCounters:
+    """Test daily totals and persistence format."""
+
+    def test_record_and_read(self, counter):
+        ledger = QuotaLedger(counter)
+        ledger.record("groq", 100)
+        ledger.record("groq", 50)
+        assert ledger.daily("groq") == {"tokens": 150, "requests": 2}
+        assert ledger.daily("other") == {"tokens": 0, "requests": 0}
+
+    def test_loads_todays_file_ignores_old(self, counter):
+        today = quota_ledger.date.today().isoformat()
+        counter.write_text(
+            json.dumps(
+                {"date": today, "providers": {"p": {"tokens": 7, "requests": 1}}}
+            )
+        )
+        assert QuotaLedger(counter).daily("p") == {"tokens": 7, "requests": 1}
+        counter.write_text(
+            json.dumps(
+                {"date": "2000-01-01", "providers": {"p": {"tokens": 7, "requests": 1}}}
+            )
+        )
+        assert QuotaLedger(counter).daily("p") == {"tokens": 0, "requests": 0}
+
+    def test_day_rollover_resets(self, counter):
+        ledger = QuotaLedger(counter)
+        ledger.record("p", 10)
+        ledger._usage["date"] = "2000-01-01"
+        assert ledger.daily("p") == {"tokens": 0, "requests": 0}
+
+
+class TestWriteBehind:
+    """Test deferred, atomic persistence."""
+
+    def test_no_write_until_interval(self, counter):
+        ledger = QuotaLedger(counter, flush_interval_s=3600)
+        ledger.record("p", 10)
+        assert not counter.exists()
+        ledger.flush()
+        assert json.loads(counter.read_text())["providers"]["p"]["tokens"] == 10
+
+    def test_interval_elapsed_writes(self, counter):
+        ledger = QuotaLedger(counter, flush_interval_s=0)
+        ledger.record("p", 10)
+        assert json.loads(counter.read_text())["providers"]["p"]["requests"] == 1
+        assert not list(counter.parent.glob("*.tmp"))
+
+    def test_persist_false_never_writes(self, counter):
+        ledger = QuotaLedger(counter, flush_interval_s=0, persist=False)
+        ledger.record("p", 10)
+        ledger.flush()
+        assert not counter.exists()
+
+    def test_reset_clears_memory_and_file(self, counter):
+        ledger = QuotaLedger(counter, flush_interval_s=0)
+        ledger.record("p", 10)
+        ledger.reset()
+        assert not counter.exists()
+        assert ledger.daily("p")["tokens"] == 0
+
+
+class TestLimits:
+    """Test daily limit checks."""
+
+    def test_over_daily_fraction(self, counter):
+        ledger = QuotaLedger(counter, flush_interval_s=3600)
+        provider = {"id": "p", "limits": {"tpd": 1000, "rpd": None}}
+        ledger.record("p", 800)
+        assert ledger.over_daily(provider, 0.8)
+        assert not ledger.over_daily(provider, 0.95)
+
+
+class TestConcurrency:
+    """Test counters under concurrent workers."""
+
+    def test_parallel_records_are_not_lost(self, counter):
+        ledger = QuotaLedger(counter, flush_interval_s=0)
+
+        def work():
+            for _ in range(200):
+                ledger.record("p", 3)
+
+        threads = [threading.Thread(target=work) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        ledger.flush()
+        assert ledger.daily("p") == {"tokens": 4800, "requests": 1600}
+        saved = json.loads(counter.read_text())
+        assert saved["providers"]["p"] == {"tokens": 4800, "requests": 1600}
+
+    def test_ledger_for_is_shared(self, counter):
+        assert ledger_for(counter) is ledger_for(Path(str(counter)))
+
+
+class TestCloudClientLimits:
+    """Test cloud_client provider checks backed by the ledger."""
+
+    @pytest.fixture
+    def config(self, counter, monkeypatch):
+        cfg = {
+            "settings": {
+                "daily_token_tracking": True,
+                "daily_counter_path": str(counter),
+                "skip_at_percent": 95,
+                "warn_at_percent": 80,
+            },
+            "providers": [],
+        }
+        monkeypatch.setattr(cloud_client, "_config", cfg)
+        yield cfg
+        cloud_client._ledger().reset()
+
+    def test_no_file_reads_per_check(self, config, counter, monkeypatch):
+        provider = {"id": "p", "name": "P", "limits": {"tpd": 1000}}
+        cloud_client._record_tokens("p", 850)
+        monkeypatch.setattr(
+            Path, "read_text", lambda *a, **k: pytest.fail("file re-read")
+        )
+        assert cloud_client._provider_warned(provider)
+        assert not cloud_client._provider_exhausted(provider)
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+test_quote_matcher.py — Tests for the shared genome quote matcher
+
+Tests cover:
+1. QuoteAutomaton offsets vs str.find (automaton and direct-scan paths)
+2. Overlapping, duplicate and empty quotes
+3. automaton_for caching keyed by the genome's fragments
+4. genome.corpus_scan / verify_fragments_against_source on top of it
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add parent directory to path to import quote_matcher
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import paths
+import quote_matcher
+from genome import corpus_scan, verify_fragments_against_source
+from models import GeneState, Genome, GenomeFragment, PauseCategory
+from quote_matcher import QuoteAutomaton, automaton_for
+
+
+def _frag(fid: str, quote: str, state=GeneState.CONFIRMED) -> GenomeFragment:
+    return GenomeFragment(
+        id=fid,
+        language="es",
+        version="NVI",
+        category=PauseCategory.REPETITION,
+        pattern=quote,
+        example_quote=quote,
+        evidence_dates=["2025-01-01"],
+        confidence=0.8,
+        state=state,
+    )
+
+
+@pytest.fixture(params=["automaton", "direct"])
+def scan_mode(request, monkeypatch):
+    """Run each matcher test on both the pure-Python automaton and direct scan."""
+    threshold = 0 if request.param == "automaton" else 10_000
+    monkeypatch.setattr(quote_matcher, "PY_AUTOMATON_MIN_QUOTES", threshold)
+    monkeypatch.setattr(quote_matcher, "ahocorasick", None)
+    quote_matcher._cached_automaton.cache_clear()
+    return request.param
+
+
+class TestQuoteAutomaton:
+    """Test single-pass multi-quote matching."""
+
+    def test_first_matches_equal_str_find(self, scan_mode):
+        text = "amor de Dios, amor eterno; Dios es amor"
+        quotes = ["amor", "Dios", "amor eterno", "gracia"]
+        automaton = QuoteAutomaton([(q, q) for q in quotes])
+        first = automaton.first_matches(text)
+        assert first == {q: text.find(q) for q in quotes if q in text}
+
+    def test_overlapping_quotes_all_reported(self, scan_mode):
+        automaton = QuoteAutomaton([("a", "he"), ("b", "she"), ("c", "hers")])
+        assert sorted(automaton.iter_matches("ushers")) == [
+            (1, "b"),
+            (2, "a"),
+            (2, "c"),
+        ]
+
+    def test_duplicate_quotes_map_to_every_key(self, scan_mode):
+        automaton = QuoteAutomaton([("f1", "gracia"), ("f2", "gracia")])
+        assert automaton.keys_in("por gracia sois salvos") == {"f1", "f2"}
+
+    def test_empty_quote_matches_like_in(self, scan_mode):
+        automaton = QuoteAutomaton([("empty", ""), ("x", "zzz")])
+        assert automaton.first_matches("texto") == {"empty": 0}
+
+    def test_ignore_case_expects_lowered_text(self, scan_mode):
+        automaton = QuoteAutomaton([("f", "Señor Jesús")], ignore_case=True)
+        assert automaton.keys_in("gracias SEÑOR JESÚS".lower()) == {"f"}
+
+
+class TestAutomatonCache:
+    """Test automaton reuse until the genome changes."""
+
+    def test_same_fragments_reuse_automaton(self):
+        frags = [_frag("f1", "amor"), _frag("f2", "paz")]
+        assert automaton_for(frags) is automaton_for(list(frags))
+
+    def test_new_fragment_rebuilds(self):
+        frags = [_frag("f1", "amor")]
+        before = automaton_for(frags)
+        frags.append(_frag("f2", "paz"))
+        assert automaton_for(frags) is not before
+
+    def test_case_mode_is_part_of_key(self):
+        frags = [_frag("f1", "Amor")]
+        assert automaton_for(frags) is not automaton_for(frags, ignore_case=True)
+
+
+@pytest.fixture
+def source_file(tmp_path, monkeypatch):
+    monkeypatch.setattr(paths, "CACHE_DIR", tmp_path / "cache")
+    data = {
+        "data": {
+            "es": {
+                "2025-01-01": [
+                    {
+                        "id": "d1",
+                        "date": "2025-01-01",
+                        "reflexion": "Dios nos ama profundamente profundamente.",
+                        "oracion": "Señor, gracias gracias por tu amor.",
+                    }
+                ],
+                "2025-01-02": [
+                    {
+                        "id": "d2",
+                        "date": "2025-01-02",
+                        "reflexion": "El Señor es mi pastor.",
+                        "oracion": "Amén. gracias gracias",
+                    }
+                ],
+            }
+        }
+    }
+    path = tmp_path / "Devocional_year_2025_es_NVI.json"
+    path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+    return path
+
+
+def _genome(*frags: GenomeFragment) -> Genome:
+    return Genome(
+        language="es", version="NVI", genome_version="1", fragments=list(frags)
+    )
+
+
+class TestGenomeScans:
+    """Test genome scans that share the automaton."""
+
+    def test_corpus_scan_hits_and_context(self, scan_mode, source_file):
+        genome = _genome(
+            _frag("rep", "profundamente profundamente"),
+            _frag("dup", "gracias gracias"),
+            _frag("none", "no existe"),
+        )
+        results = corpus_scan(genome, [source_file])
+        assert [h["entry_id"] for h in results["rep"]] == ["d1"]
+        assert [(h["date"], h["field"]) for h in results["dup"]] == [
+            ("2025-01-01", "oracion"),
+            ("2025-01-02", "oracion"),
+        ]
+        assert results["none"] == []
+        assert "profundamente profundamente" in results["rep"][0]["context"]
+
+    def test_verify_fragments_local(self, scan_mode, source_file):
+        genome = _genome(
+            _frag("ok", "mi pastor"),
+            _frag("stale", "frase inventada"),
+            _frag("cand", "mi pastor", state=GeneState.CANDIDATE),
+        )
+        verified, unverified = verify_fragments_against_source(
+            genome, [source_file], local=True
+        )
+        assert [f.id for f in verified] == ["ok"]
+        assert [f.id for f in unverified] == ["stale"]
@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+test_rate_scheduler.py — Tests for the token-bucket provider scheduler
+
+Tests cover:
+1. Token estimate from prompt length
+2. rpm / tpm / rpd buckets: bursts, exact waits, settle corrections
+3. Soonest-provider choice, priority ties, max wait, 429 backoff
+4. cloud_client routing through the scheduler
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add parent directory to path to import rate_scheduler
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import cloud_client
+import rate_scheduler
+from models import ReaderReaction, Verdict
+from rate_scheduler import RateScheduler, estimate_tokens
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def scheduler(clock):
+    return RateScheduler(clock=clock)
+
+
+def _p(pid: str, **limits) -> dict:
+    return {"id": pid, "name": pid, "limits": limits}
+
+
+class TestEstimate:
+    """Test request cost estimates."""
+
+    def test_prompt_bytes_plus_completion(self):
+        assert estimate_tokens("a" * 400) == 100
+        assert estimate_tokens("a" * 401, "", completion=50) == 151
+
+    def test_non_latin_counts_bytes(self):
+        assert estimate_tokens("神" * 100) == 75
+
+
+class TestBuckets:
+    """Test waits computed from each limit."""
+
+    def test_rpm_burst_then_exact_wait(self, scheduler, clock):
+        p = _p("a", rpm=6)
+        for _ in range(6):
+            assert scheduler.reserve([p])[1] == 0.0
+        assert scheduler.wait_time(p) == pytest.approx(10.0)
+        clock.now += 10
+        assert scheduler.wait_time(p) == pytest.approx(0.0)
+
+    def test_booked_waits_queue_up(self, scheduler):
+        p = _p("a", rpm=60)
+        for _ in range(60):
+            scheduler.reserve([p])
+        waits = [scheduler.reserve([p])[1] for _ in range(3)]
+        assert waits == pytest.approx([1.0, 2.0, 3.0])
+
+    def test_tpm_uses_token_cost(self, scheduler, clock):
+        p = _p("a", tpm=6000)
+        assert scheduler.reserve([p], 5000)[1] == 0.0
+        assert scheduler.wait_time(p, 2000) == pytest.approx(10.0)
+        assert scheduler.wait_time(p, 1000) == 0.0
+
+    def test_settle_refunds_and_charges(self, scheduler):
+        p = _p("a", tpm=6000)
+        scheduler.reserve([p], 5000)
+        scheduler.settle(p, 5000, 1000)
+        assert scheduler.status(p) == {"tpm": 1000}
+        scheduler.settle(p, 1000, 3000)
+        assert scheduler.status(p) == {"tpm": 3000}
+
+    def test_rpd_refills_over_a_day(self, scheduler, clock):
+        p = _p("a", rpd=2)
+        scheduler.reserve([p])
+        scheduler.reserve([p])
+        assert scheduler.wait_time(p) == pytest.approx(43200.0)
+
+    def test_unlimited_provider_never_waits(self, scheduler):
+        p = _p("a", rpm=None, tpm=None)
+        for _ in range(1000):
+            assert scheduler.reserve([p], 10**6)[1] == 0.0
+        assert scheduler.status(p) == {}
+
+    def test_changed_limits_rebuild(self, scheduler):
+        scheduler.reserve([_p("a", rpm=1)])
+        assert scheduler.wait_time(_p("a", rpm=1)) > 0
+        assert scheduler.wait_time(_p("a", rpm=100)) == 0.0
+
+
+class TestChoice:
+    """Test provider selection across candidates."""
+
+    def test_priority_order_wins_ties(self, scheduler):
+        first, second = _p("a", rpm=10), _p("b", rpm=10)
+        assert scheduler.reserve([first, second])[0] is first
+
+    def test_moves_on_before_a_429(self, scheduler):
+        first, second = _p("a", rpm=2), _p("b", rpm=60)
+        picked = [scheduler.reserve([first, second])[0]["id"] for _ in range(4)]
+        assert picked == ["a", "a", "b", "b"]
+
+    def test_soonest_when_all_must_wait(self, scheduler):
+        slow, fast = _p("slow", rpm=1), _p("fast", rpm=12)
+        scheduler.reserve([slow])
+        for _ in range(12):
+            scheduler.reserve([fast])
+        provider, wait = scheduler.reserve([slow, fast])
+        assert provider is fast
+        assert wait == pytest.approx(5.0)
+
+    def test_max_wait_books_nothing(self, scheduler):
+        p = _p("a", rpm=1)
+        scheduler.reserve([p])
+        assert scheduler.reserve([p], max_wait_s=30) == (None, pytest.approx(60.0))
+        assert scheduler.wait_time(p) == pytest.approx(60.0)
+
+    def test_backoff_parks_provider(self, scheduler, clock):
+        first, second = _p("a"), _p("b")
+        scheduler.backoff(first, 30)
+        assert scheduler.reserve([first, second])[0] is second
+        clock.now += 30
+        assert scheduler.reserve([first, second])[0] is first
+
+
+class TestCloudClientRouting:
+    """Test call_ollama books on the shared scheduler."""
+
+    @pytest.fixture
+    def routed(self, monkeypatch):
+        monkeypatch.setenv("GEP_RESPONSE_CACHE", "0")
+        calls, sleeps = [], []
+        config = {
+            "settings": {
+                "default_backend": "api",
+                "daily_token_tracking": False,
+                "completion_token_estimate": 0,
+            },
+            "providers": [
+                {**_p("main", rpm=1), "phase": "both", "priority": 1},
+                {**_p("spare", rpm=1), "phase": "both", "priority": 2},
+            ],
+        }
+        monkeypatch.setattr(cloud_client, "_config", config)
+        monkeypatch.setattr(rate_scheduler, "_shared", RateScheduler())
+        monkeypatch.setattr(cloud_client.time, "sleep", sleeps.append)
+
+        def fake_call(provider, system, user, phase, verbose):
+            calls.append(provider["id"])
+            reaction = ReaderReaction(verdict=Verdict.OK, reaction="ok")
+            return reaction, "raw", 40
+
+        monkeypatch.setattr(cloud_client, "_call_provider", fake_call)
+        return config, calls, sleeps
+
+    def test_spreads_without_waiting_for_429(self, routed):
+        _, calls, sleeps = routed
+        for _ in range(2):
+            cloud_client.call_ollama("auto", "s", "u", verbose=False)
+        assert calls == ["main", "spare"]
+        assert sleeps == []
+
+    def test_waits_for_budget_then_calls(self, routed):
+        config, calls, sleeps = routed
+        config["providers"].pop()
+        for _ in range(2):
+            reaction, _ = cloud_client.call_ollama("auto", "s", "u", verbose=False)
+        assert calls == ["main", "main"]
+        assert sleeps == [pytest.approx(60.0, abs=1)]
+        assert reaction.verdict == Verdict.OK
+
+    def test_over_max_wait_fails_fast(self, routed):
+        config, calls, _ = routed
+        config["providers"].pop()
+        config["settings"]["max_schedule_wait_s"] = 5
+        cloud_client.call_ollama("auto", "s", "u", verbose=False)
+        reaction, err = cloud_client.call_ollama("auto", "s", "u", verbose=False)
+        assert reaction is None
+        assert "rate limits full" in err
+        assert calls == ["main"]
+
+    def test_tokens_settled(self, routed):
+        config, _, _ = routed
+        main = config["providers"][0]
+        main["limits"] = {"tpm": 10000}
+        cloud_client.call_ollama("auto", "s" * 4000, "", verbose=False)
+        assert rate_scheduler.shared().status(main) == {"tpm": 40}
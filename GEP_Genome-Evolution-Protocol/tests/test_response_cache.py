@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+test_response_cache.py — Tests for the on-disk model response cache
+
+Tests cover:
+1. Keys per (provider, model, phase, prompt), round trip, key order
+2. Per-phase TTL and size-bounded LRU eviction
+3. Hit / miss counters and GEP_RESPONSE_CACHE=0
+4. cloud_client / ollama_client answering repeated prompts from the cache
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add parent directory to path to import response_cache
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import cloud_client
+import ollama_client
+import paths
+import rate_scheduler
+import response_cache
+from models import ReaderReaction, Verdict
+from response_cache import ResponseCache, cache_key
+
+RAW = '{"verdict": "PAUSE", "reaction": "repeated", "category": "repetition"}'
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(paths, "CACHE_DIR", tmp_path / "cache")
+    monkeypatch.setenv("GEP_RESPONSE_CACHE", "1")
+    return tmp_path / "cache"
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1_000_000.0]
+    monkeypatch.setattr(response_cache.time, "time", lambda: now[0])
+    return now
+
+
+class TestStore:
+    """Test keys and the SQLite store."""
+
+    def test_key_covers_every_part(self):
+        base = cache_key("groq", "qwen", 1, "sys", "user")
+        assert base == cache_key("groq", "qwen", 1, "sys", "user")
+        variants = [
+            cache_key("cerebras", "qwen", 1, "sys", "user"),
+            cache_key("groq", "llama", 1, "sys", "user"),
+            cache_key("groq", "qwen", 2, "sys", "user"),
+            cache_key("groq", "qwen", 1, "sys2", "user"),
+            cache_key("groq", "qwen", 1, "sys", "user2"),
+            cache_key("groq", "qwen", 1, "sysu", "ser"),
+        ]
+        assert base not in variants
+        assert len(set(variants)) == len(variants)
+
+    def test_round_trip_and_first_key_wins(self, tmp_path):
+        cache = ResponseCache(tmp_path / "c.sqlite")
+        cache.put("b", 1, "from b")
+        cache.put("c", 1, "from c")
+        assert cache.get(["a", "c", "b"]) == "from c"
+        assert cache.get(["a"]) is None
+        cache.close()
+        assert ResponseCache(tmp_path / "c.sqlite").get(["b"]) == "from b"
+
+    def test_ttl_per_phase(self, tmp_path, clock):
+        cache = ResponseCache(tmp_path / "c.sqlite")
+        cache.put("p1", 1, "one")
+        cache.put("p2", 2, "two")
+        clock[0] += response_cache.TTL_S[2] + 1
+        assert cache.get(["p2"]) is None
+        assert cache.get(["p1"]) == "one"
+        clock[0] += response_cache.TTL_S[1]
+        assert cache.get(["p1"]) is None
+
+    def test_lru_eviction_keeps_recently_used(self, tmp_path, clock):
+        cache = ResponseCache(tmp_path / "c.sqlite", max_bytes=1000)
+        for i in range(4):
+            clock[0] += 1
+            cache.put(f"k{i}", 1, "x" * 240)
+        clock[0] += 1
+        assert cache.get(["k0"])  # k0 now most recently used
+        clock[0] += 1
+        cache.put("k4", 1, "x" * 240)
+        assert cache.get(["k1"]) is None
+        assert cache.get(["k0"]) and cache.get(["k4"])
+        assert cache._total <= 1000
+
+
+class TestModuleApi:
+    """Test lookup / store counters and the kill switch."""
+
+    def test_hits_and_misses_counted(self, cache_dir):
+        before = response_cache.stats()
+        assert response_cache.lookup(["k"]) is None
+        response_cache.store("k", 1, "raw")
+        assert response_cache.lookup(["k"]) == "raw"
+        after = response_cache.stats()
+        assert after["hits"] - before["hits"] == 1
+        assert after["misses"] - before["misses"] == 1
+        assert (cache_dir / response_cache.CACHE_FILE).exists()
+
+    def test_disabled_is_a_no_op(self, cache_dir, monkeypatch):
+        monkeypatch.setenv("GEP_RESPONSE_CACHE", "0")
+        before = response_cache.stats()
+        response_cache.store("k", 1, "raw")
+        assert response_cache.lookup(["k"]) is None
+        assert response_cache.stats() == before
+        assert not cache_dir.exists()
+
+
+class TestClients:
+    """Test both clients replay unchanged prompts."""
+
+    @pytest.fixture
+    def cloud(self, cache_dir, monkeypatch):
+        calls = []
+        config = {
+            "settings": {"default_backend": "api", "daily_token_tracking": False},
+            "providers": [
+                {
+                    "id": "main",
+                    "name": "main",
+                    "model": "m",
+                    "phase": "both",
+                    "limits": {},
+                }
+            ],
+        }
+        monkeypatch.setattr(cloud_client, "_config", config)
+        monkeypatch.setattr(rate_scheduler, "_shared", rate_scheduler.RateScheduler())
+        replies = {"raw": RAW, "ok": True}
+
+        def fake_call(provider, system, user, phase, verbose):
+            calls.append((phase, user))
+            if not replies["ok"]:
+                return None, "HTTP 500: boom", None
+            return cloud_client._parse_reaction(replies["raw"]), replies["raw"], 10
+
+        monkeypatch.setattr(cloud_client, "_call_provider", fake_call)
+        return calls, replies
+
+    def test_cloud_repeat_prompt_served_from_cache(self, cloud):
+        calls, _ = cloud
+        first = cloud_client.call_ollama("auto", "s", "u", verbose=False, phase=1)
+        second = cloud_client.call_ollama("auto", "s", "u", verbose=False, phase=1)
+        assert calls == [(1, "u")]
+        assert second[1] == first[1] == RAW
+        assert second[0].verdict == Verdict.PAUSE
+
+    def test_cloud_changed_prompt_or_phase_misses(self, cloud):
+        calls, _ = cloud
+        cloud_client.call_ollama("auto", "s", "u", verbose=False, phase=1)
+        cloud_client.call_ollama("auto", "s", "u", verbose=False, phase=2)
+        cloud_client.call_ollama("auto", "s", "u2", verbose=False, phase=1)
+        assert len(calls) == 3
+
+    def test_cloud_errors_not_cached(self, cloud):
+        calls, replies = cloud
+        replies["ok"] = False
+        reaction, _ = cloud_client.call_ollama("auto", "s", "u", verbose=False)
+        assert reaction is None
+        replies["ok"] = True
+        reaction, _ = cloud_client.call_ollama("auto", "s", "u", verbose=False)
+        assert reaction is not None
+        assert len(calls) == 2
+
+    def test_ollama_repeat_prompt_skips_stream(self, cache_dir, monkeypatch):
+        streams = []
+
+        def fake_stream(req, verbose):
+            streams.append(req)
+            return "<think>hmm</think>\n" + RAW
+
+        monkeypatch.setattr(ollama_client, "_collect_stream", fake_stream)
+        first = ollama_client.call_ollama("qwen3:4b", "s", "u", verbose=False, phase=1)
+        second = ollama_client.call_ollama("qwen3:4b", "s", "u", verbose=False, phase=1)
+        assert len(streams) == 1
+        assert second[1] == first[1]
+        assert isinstance(second[0], ReaderReaction)
+        assert second[0].verdict == Verdict.PAUSE
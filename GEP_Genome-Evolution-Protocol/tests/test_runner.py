@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""
+test_runner.py — Tests for runner.py overnight orchestration
+
+Tests cover:
+1. _review_stream ordering and bounded concurrency
+2. _pipeline_stream Phase 1 → Phase 2 overlap and per-stage limits
+3. run_overnight with --workers N (audit log, genome, run log)
+4. ETA / throughput line
+"""
+
+import json
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+# Add parent directory to path to import runner
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import paths
+import runner
+from models import PauseCategory, ReaderReaction, Verdict
+from source import get_sample_entries
+
+
+@pytest.fixture
+def gep_dirs(tmp_path, monkeypatch):
+    """Redirect every data dir into tmp_path so runs don't touch data/."""
+    for name in (
+        "AUDIT_DIR",
+        "BLOBS_DIR",
+        "CACHE_DIR",
+        "BATCH_INPUT_DIR",
+        "BATCH_OUTPUT_DIR",
+        "GENOMES_DIR",
+        "LOGS_DIR",
+        "SOURCE_DIR",
+        "REPORTS_DIR",
+    ):
+        monkeypatch.setattr(paths, name, tmp_path / name.lower())
+    return tmp_path
+
+
+@pytest.fixture
+def stub_llm(monkeypatch):
+    """Fake call_ollama: P1 CLEAN, P2 PAUSE on the first entry, OK elsewhere."""
+    state = {"active": 0, "peak": 0}
+    lock = threading.Lock()
+
+    def fake_call(model, system, user, verbose=True, phase=2, think=True):
+        with lock:
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+        time.sleep(0.02)
+        with lock:
+            state["active"] -= 1
+        if phase == 1:
+            raw = '{"verdict": "CLEAN", "issue": null, "quoted": null}'
+            return ReaderReaction(verdict=Verdict.OK, reaction="clean"), raw
+        if "2025-01-01" in user:
+            rxn = ReaderReaction(
+                verdict=Verdict.PAUSE,
+                reaction="repeated phrase",
+                quoted_pause="amor amor",
+                category=PauseCategory.REPETITION,
+                confidence=0.9,
+            )
+            return rxn, '{"verdict": "PAUSE"}'
+        return ReaderReaction(verdict=Verdict.OK, reaction="fine"), '{"verdict": "OK"}'
+
+    monkeypatch.setattr(runner, "call_ollama", fake_call)
+    monkeypatch.setattr(runner, "_resolve_p2_model", lambda key: "stub-model")
+    monkeypatch.setattr(runner, "_log_model_debug", lambda model: None)
+    return state
+
+
+class TestReviewStream:
+    """Test the bounded review pool."""
+
+    def test_sequential_preserves_order_and_calls_on_start(self):
+        started = []
+        out = list(
+            runner._review_stream(
+                [1, 2, 3],
+                lambda e: e * 10,
+                workers=1,
+                on_start=lambda i, e: started.append((i, e)),
+            )
+        )
+        assert out == [(1, 10), (2, 20), (3, 30)]
+        assert started == [(1, 1), (2, 2), (3, 3)]
+
+    def test_concurrent_yields_every_entry_once(self):
+        out = list(runner._review_stream(list(range(20)), lambda e: e, workers=4))
+        assert sorted(e for e, _ in out) == list(range(20))
+
+    def test_concurrency_is_bounded(self):
+        state = {"active": 0, "peak": 0}
+        lock = threading.Lock()
+
+        def review(e):
+            with lock:
+                state["active"] += 1
+                state["peak"] = max(state["peak"], state["active"])
+            time.sleep(0.01)
+            with lock:
+                state["active"] -= 1
+            return e
+
+        list(runner._review_stream(list(range(16)), review, workers=3))
+        assert 1 < state["peak"] <= 3
+
+
+class TestPipelineStream:
+    """Test the two-stage Phase 1 → Phase 2 pipeline."""
+
+    @staticmethod
+    def _stage(state, key, lock, result):
+        def run(*args):
+            with lock:
+                state[key] += 1
+                state[key + "_peak"] = max(state[key + "_peak"], state[key])
+                state["overlap"] |= state["p1"] > 0 and state["p2"] > 0
+            time.sleep(0.01)
+            with lock:
+                state[key] -= 1
+            return result(*args)
+
+        return run
+
+    def _run(self, n, p1_workers, p2_workers):
+        state = {"p1": 0, "p2": 0, "p1_peak": 0, "p2_peak": 0, "overlap": False}
+        lock = threading.Lock()
+        phase1 = self._stage(state, "p1", lock, lambda e: ({"e": e}, f"raw{e}", 1.0))
+        phase2 = self._stage(state, "p2", lock, lambda e, r: (r["e"], "p2", 2.0))
+        out = list(
+            runner._pipeline_stream(
+                list(range(n)), phase1, phase2, p1_workers, p2_workers
+            )
+        )
+        return out, state
+
+    def test_every_entry_flows_through_both_stages(self):
+        out, _ = self._run(12, 3, 2)
+        assert sorted(e for e, _ in out) == list(range(12))
+        for entry, (reaction, p2_raw, elapsed, p1_result, p1_raw) in out:
+            assert reaction == entry
+            assert p1_result == {"e": entry}
+            assert p1_raw == f"raw{entry}"
+            assert elapsed == 3.0
+
+    def test_stage_limits_are_independent(self):
+        _, state = self._run(20, 4, 1)
+        assert state["p1_peak"] <= 4
+        assert state["p2_peak"] == 1
+
+    def test_phase1_overlaps_phase2(self):
+        _, state = self._run(10, 2, 2)
+        assert state["overlap"]
+
+
+class TestRunOvernightWorkers:
+    """Test run_overnight with a worker pool."""
+
+    def test_workers_log_every_entry_once(self, gep_dirs, stub_llm):
+        entries = get_sample_entries()
+        runner.run_overnight(entries, "es", "NVI", 2025, "auto", None, workers=4)
+
+        log_path = paths.AUDIT_DIR / "critic_audit_es_NVI_2025.jsonl"
+        rows = [json.loads(l) for l in log_path.read_text().splitlines() if l]
+        assert sorted(r["date"] for r in rows) == sorted(e.date for e in entries)
+        assert stub_llm["peak"] > 1
+
+    def test_workers_absorb_into_genome(self, gep_dirs, stub_llm):
+        runner.run_overnight(
+            get_sample_entries(), "es", "NVI", 2025, "auto", None, workers=3
+        )
+        genome_file = paths.GENOMES_DIR / "genome_es_NVI_2025.json"
+        genome = json.loads(genome_file.read_text())
+        assert genome["total_entries_reviewed"] == 5
+        assert genome["total_pauses"] == 1
+        assert len(genome["fragments"]) == 1
+
+    def test_run_log_reports_workers_and_throughput(self, gep_dirs, stub_llm):
+        runner.run_overnight(
+            get_sample_entries(), "es", "NVI", 2025, "auto", None, workers=2
+        )
+        text = (paths.LOGS_DIR / "run_log_es_NVI_2025.log").read_text()
+        assert "Workers      : 2" in text
+        assert "entries/h" in text
+        assert "Cache     : 0 hits / 0 misses" in text
+        assert text.count("Finished:") == 5
+
+    def test_pipelined_run_logs_every_entry(self, gep_dirs, stub_llm):
+        entries = get_sample_entries()
+        runner.run_overnight(
+            entries, "es", "NVI", 2025, "auto", None, p1_workers=3, p2_workers=2
+        )
+        log_path = paths.AUDIT_DIR / "critic_audit_es_NVI_2025.jsonl"
+        rows = [json.loads(l) for l in log_path.read_text().splitlines() if l]
+        assert sorted(r["date"] for r in rows) == sorted(e.date for e in entries)
+        assert all(r["phase1_verdict"] == "CLEAN" for r in rows)
+        text = (paths.LOGS_DIR / "run_log_es_NVI_2025.log").read_text()
+        assert "P1 x3 → P2 x2 (pipelined)" in text
+
+    def test_sequential_default_unchanged(self, gep_dirs, stub_llm):
+        runner.run_overnight(get_sample_entries(), "es", "NVI", 2025, "auto", None)
+        text = (paths.LOGS_DIR / "run_log_es_NVI_2025.log").read_text()
+        assert text.count("Started:") == 5
+        assert stub_llm["peak"] == 1
+
+
+class TestEtaLine:
+    """Test ETA computed from wall-clock throughput."""
+
+    def test_eta_uses_completion_spacing(self):
+        line = runner._eta_line([10.0, 12.0, 14.0], 0.0, remaining=10, workers=1)
+        assert "~00:00:20" in line
+        assert "1800 entries/h" in line
+
+    def test_eta_single_completion_uses_run_start(self):
+        line = runner._eta_line([5.0], 0.0, remaining=2, workers=4)
+        assert "~00:00:10" in line
+        assert "4 workers" in line
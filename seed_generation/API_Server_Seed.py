@@ -34,7 +34,11 @@ from tenacity import (
     wait_exponential,
 )
 
-from gemini_rate_limiter import GeminiRateLimiter, GeminiRateLimiterError
+from gemini_rate_limiter import (
+    GeminiRateLimiter,
+    GeminiRateLimiterError,
+    estimate_tokens,
+)
 from seed_content_validator import validate_and_fix
 
 # =============================================================================
@@ -70,6 +74,9 @@ GENERATION_MODEL = "gemini-2.0-flash"
 # How many full Gemini regeneration attempts before giving up
 MAX_CONTENT_RETRIES = 3
 
+# Expected output tokens per call — booked against TPM until usage is known
+EXPECTED_OUTPUT_TOKENS = 2048
+
 # =============================================================================
 # RATE LIMITER
 # =============================================================================
@@ -132,6 +139,12 @@ class SeedGenerateResponse(BaseModel):
 # =============================================================================
 
 
+def _settle_usage(cost: int, response) -> None:
+    """Replace the estimated TPM booking with the tokens Gemini reports."""
+    usage = getattr(response, "usage_metadata", None)
+    _rate_limiter.settle(cost, getattr(usage, "total_token_count", None))
+
+
 @retry(
     wait=wait_exponential(multiplier=1, min=4, max=10),
     stop=stop_after_attempt(3),
@@ -141,8 +154,6 @@ async def _call_gemini_raw(
     verse_cita: str, lang: str, topic: Optional[str] = None
 ) -> CreativeContent:
     """Raw Gemini generation — returns reflexion + oracion. No validation."""
-    _rate_limiter.acquire()
-
     prompt_parts = "\n\n".join(
         [
             f"You are a devoted biblical devotional writer. "
@@ -172,12 +183,16 @@ async def _call_gemini_raw(
         ]
     )
 
+    cost = estimate_tokens(prompt_parts, completion=EXPECTED_OUTPUT_TOKENS)
+    await _rate_limiter.aacquire(cost)
+
     print(f"DEBUG: Gemini call — verse: {verse_cita}, lang: {lang}")
     response = await _client.aio.models.generate_content(
         model=GENERATION_MODEL,
         contents=prompt_parts,
         config=_GENERATION_CONFIG,
     )
+    _settle_usage(cost, response)
     raw = response.text.strip().replace("```json", "").replace("```", "").strip()
     # Extract JSON object robustly — handles preamble from thinking models
     match = re.search(r"\{.*\}", raw, re.DOTALL)
@@ -203,8 +218,6 @@ async def _call_gemini_fix_script(
     bad_oracion: str,
 ) -> CreativeContent:
     """Script-fix retry — rewrites content into the correct language script."""
-    _rate_limiter.acquire()
-
     prompt = (
         f"The following devotional text is NOT written in {lang.upper()} script. "
         f"Rewrite it completely in {lang.upper()}. Keep the same devotional meaning.\n\n"
@@ -218,12 +231,16 @@ async def _call_gemini_fix_script(
         f"Do NOT include transliterations, romanizations, or text in parentheses."
     )
 
+    cost = estimate_tokens(prompt, completion=EXPECTED_OUTPUT_TOKENS)
+    await _rate_limiter.aacquire(cost)
+
     print(f"WARNING: Script fix retry — verse: {verse_cita}, lang: {lang}")
     response = await _client.aio.models.generate_content(
         model=GENERATION_MODEL,
         contents=prompt,
         config=_GENERATION_CONFIG,
     )
+    _settle_usage(cost, response)
     raw = response.text.strip().replace("```json", "").replace("```", "").strip()
     # Extract JSON object robustly — handles preamble from thinking models
     match = re.search(r"\{.*\}", raw, re.DOTALL)
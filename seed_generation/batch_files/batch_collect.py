@@ -5,13 +5,21 @@ STEP 2 — Collect results from any provider and build devotional records.
 
 Replaces batch_claude_collect.py with a provider-agnostic version.
 Reads the state file from batch_submit.py, fires the adapter's collect(),
-parses JSON, validates Phase 1, builds devotional records, saves output.
+and handles each result as the adapter yields it: parse JSON, validate
+Phase 1, build the devotional record, append it to the job's journal.
+Once the adapter is done the journal is compacted into the raw output file.
+
+Restart-safe: the journal (<state stem>.collect.jsonl in output_dir) is
+flushed line by line, so a run that dies late keeps everything built so far.
+Running collect again on the same state skips the journaled dates and only
+processes the rest. The journal is removed after a successful compaction.
 
 CLI:
   python batch_collect.py --state batch_state_tl_ADB_gemini_20260421_120000.json
   python batch_collect.py          # auto-finds latest batch_state_*.json
 
 Outputs (in output_dir):
+  <state stem>.collect.jsonl                      journal while collecting
   raw_<lang>_<version>_<provider>_<ts>.json       all built devotionals
   batch_errors_<lang>_<version>_<provider>_<ts>.json   failed dates
   batch_val_warnings_<lang>_<version>_<provider>_<ts>.json  Phase1 warnings
@@ -24,7 +32,7 @@ import re
 import sys
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
 try:
     from dotenv import load_dotenv
@@ -33,9 +41,11 @@ try:
 except ImportError:
     pass
 
-from pipeline_shared import repair_json, build_prompt
+from pipeline_shared import build_prompt
 from pipeline_shared import _check_prayer_ending, _load_prayer_endings
-from provider_adapter import load_adapter, BatchRequest, RawResult
+from provider_adapter import load_adapter, BatchRequest
+
+import tolerant_json  # importable once pipeline_shared has added seed_generation/
 
 _SCRIPT_DIR = Path(__file__).parent
 
@@ -194,6 +204,77 @@ def save_output(
     return str(path)
 
 
+# ─────────────────────────────────────────────────────────────────────────────
+# Collect journal  (append-only JSONL, one built devotional per line)
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+def journal_path(state_path: str, output_dir: str) -> Path:
+    return Path(output_dir) / f"{Path(state_path).stem}.collect.jsonl"
+
+
+def read_journal(path: Path) -> Iterator[dict]:
+    """Records in write order. A torn last line (run killed mid-write) is skipped."""
+    if not path.is_file():
+        return
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if isinstance(record, dict) and record.get("date"):
+                yield record
+
+
+class CollectJournal:
+    """
+    {"date", "devotional", "warnings"} per line, flushed as each date is
+    built. done holds the dates already journaled by earlier runs.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.done = {record["date"] for record in read_journal(path)}
+        self._file = None
+
+    def append(self, date_key: str, devo: dict, warnings: list[str]) -> None:
+        if self._file is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            torn = False
+            if self.path.is_file() and self.path.stat().st_size:
+                with open(self.path, "rb") as f:
+                    f.seek(-1, os.SEEK_END)
+                    torn = f.read(1) != b"\n"
+            self._file = open(self.path, "a", encoding="utf-8")
+            if torn:  # keep the next record off the partial line
+                self._file.write("\n")
+        record = {"date": date_key, "devotional": devo, "warnings": warnings}
+        self._file.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self._file.flush()
+        self.done.add(date_key)
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def compact_journal(path: Path) -> tuple[dict[str, dict], list[dict]]:
+    """(date → devotional, Phase 1 warnings) from the journal; last record per date wins."""
+    completed: dict[str, dict] = {}
+    warnings: dict[str, list[str]] = {}
+    for record in read_journal(path):
+        completed[record["date"]] = record["devotional"]
+        warnings[record["date"]] = record.get("warnings") or []
+    val_warnings = [
+        {"date": d, "issue": "phase1", "detail": w}
+        for d, w in sorted(warnings.items())
+        if w
+    ]
+    return completed, val_warnings
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # State loader
 # ─────────────────────────────────────────────────────────────────────────────
@@ -423,43 +504,19 @@ def load_state(path: str) -> dict:
 # ─────────────────────────────────────────────────────────────────────────────
 
 
-def collect(state_path: str, results_file: Optional[str] = None) -> None:
-    SEP = "=" * 60
-    state = load_state(state_path)
-
+def _collect_pending(
+    state: dict,
+    requests: list[BatchRequest],
+    seed: dict,
+    journal: CollectJournal,
+    model_alias: Optional[str],
+    results_file: Optional[str],
+) -> list[dict]:
+    """Stream adapter results into the journal; returns this run's error records."""
     provider = state["provider"]
-    model_alias = state.get("model_alias") or None
-    job_id = state["job_id"]
-    seed_path = state["seed_path"]
     master_lang = state["master_lang"]
     master_version = state["master_version"]
-    output_dir = state["output_dir"]
 
-    _print_banner()
-    _print_state_header(state, state_path)
-    print(_c(_box_top("PROCESSING"), _CYAN, _BOLD))
-
-    # ── Load seed ──────────────────────────────────────────────────────────
-    with open(seed_path, encoding="utf-8") as f:
-        seed = json.load(f)
-
-    # Rebuild BatchRequest list from state (needed by adapters)
-    requests: list[BatchRequest] = []
-    for date_key in state.get("dates", []):
-        seed_entry = seed.get(date_key, {})
-        cita = seed_entry.get("versiculo", {}).get("cita", "")
-        texto = seed_entry.get("versiculo", {}).get("texto", "")
-        topic = seed_entry.get("topic")
-        requests.append(
-            BatchRequest(
-                date_key=date_key,
-                custom_id=_safe_custom_id(date_key),
-                prompt=build_prompt(cita, master_lang, topic, texto),
-                model_id=state.get("model_id", ""),
-            )
-        )
-
-    # ── Load adapter + collect ─────────────────────────────────────────────
     if model_alias == "default":
         model_alias = None
     adapter = load_adapter(provider, model_alias)
@@ -478,21 +535,20 @@ def collect(state_path: str, results_file: Optional[str] = None) -> None:
             sys.exit(1)
         collect_job_id = results_file
     else:
-        collect_job_id = job_id
+        collect_job_id = state["job_id"]
 
     print(
         _c(_box_row(f"  Collecting {len(requests)} results from {provider}..."), _DIM)
     )
     print(_c(_box_row(""), _CYAN))
-    raw_results: list[RawResult] = adapter.collect(collect_job_id, requests)
 
-    # ── Process results ────────────────────────────────────────────────────
-    completed: dict[str, dict] = {}
+    # ── Process results as the adapter yields them ─────────────────────────
     error_records: list[dict] = []
-    val_warnings: list[dict] = []
 
-    for result in raw_results:
+    for result in adapter.collect(collect_job_id, requests):
         date_key = result.date_key
+        if date_key in journal.done:
+            continue  # built by an earlier run (result files hold every date)
 
         if not result.succeeded:
             _print_result_row(date_key, "ERROR", result.error or "")
@@ -502,11 +558,9 @@ def collect(state_path: str, results_file: Optional[str] = None) -> None:
             continue
 
         # Parse JSON
-        data = repair_json(result.raw_text)
+        data, repairs = tolerant_json.parse(result.raw_text)
         if data is None:
-            _print_result_row(
-                date_key, "PARSE_ERROR", "all JSON repair strategies failed"
-            )
+            _print_result_row(date_key, "PARSE_ERROR", "no JSON object recovered")
             error_records.append(
                 {
                     "date": date_key,
@@ -535,11 +589,7 @@ def collect(state_path: str, results_file: Optional[str] = None) -> None:
             continue
 
         # Phase 1 validation
-        p1_passed, p1_issues = run_phase1(reflexion, oracion, master_lang)
-        if not p1_passed:
-            val_warnings.append(
-                {"date": date_key, "issue": "phase1", "detail": p1_issues}
-            )
+        _, p1_issues = run_phase1(reflexion, oracion, master_lang)
 
         # Build devotional record
         seed_entry = seed.get(date_key, {})
@@ -552,27 +602,100 @@ def collect(state_path: str, results_file: Optional[str] = None) -> None:
             devo = build_devotional(
                 date_key, seed_entry, master_lang, master_version, reflexion, oracion
             )
-            completed[date_key] = devo
-            if p1_issues:
-                _print_result_row(
-                    date_key,
-                    "WARN",
-                    f"r:{len(reflexion)} o:{len(oracion)}  {len(p1_issues)} issue(s)",
-                )
-            else:
-                _print_result_row(
-                    date_key, "OK", f"r:{len(reflexion)} o:{len(oracion)}"
-                )
         except Exception as e:
             _print_result_row(date_key, "BUILD_ERROR", str(e))
             error_records.append(
                 {"date": date_key, "reason": "build_error", "detail": str(e)}
             )
+            continue
+
+        journal.append(date_key, devo, p1_issues)
+        repaired = f"  repaired: {', '.join(repairs)}" if repairs else ""
+        if p1_issues:
+            _print_result_row(
+                date_key,
+                "WARN",
+                f"r:{len(reflexion)} o:{len(oracion)}  {len(p1_issues)} issue(s)"
+                + repaired,
+            )
+        else:
+            _print_result_row(
+                date_key, "OK", f"r:{len(reflexion)} o:{len(oracion)}" + repaired
+            )
+
+    return error_records
+
+
+def collect(state_path: str, results_file: Optional[str] = None) -> None:
+    SEP = "=" * 60
+    state = load_state(state_path)
+
+    provider = state["provider"]
+    model_alias = state.get("model_alias") or None
+    seed_path = state["seed_path"]
+    master_lang = state["master_lang"]
+    master_version = state["master_version"]
+    output_dir = state["output_dir"]
+
+    _print_banner()
+    _print_state_header(state, state_path)
+    print(_c(_box_top("PROCESSING"), _CYAN, _BOLD))
+
+    # ── Load seed ──────────────────────────────────────────────────────────
+    with open(seed_path, encoding="utf-8") as f:
+        seed = json.load(f)
+
+    # ── Journal: dates built by an earlier, interrupted run are skipped ─────
+    journal = CollectJournal(journal_path(state_path, output_dir))
+    dates = state.get("dates", [])
+    pending = [d for d in dates if d not in journal.done]
+    if journal.done:
+        print(
+            _c(
+                _box_row(
+                    f"  Resuming — {len(dates) - len(pending)} date(s) already in "
+                    f"{journal.path.name}"
+                ),
+                _DIM,
+            )
+        )
+
+    # Rebuild BatchRequest list from state (needed by adapters)
+    requests: list[BatchRequest] = []
+    for date_key in pending:
+        seed_entry = seed.get(date_key, {})
+        cita = seed_entry.get("versiculo", {}).get("cita", "")
+        texto = seed_entry.get("versiculo", {}).get("texto", "")
+        topic = seed_entry.get("topic")
+        requests.append(
+            BatchRequest(
+                date_key=date_key,
+                custom_id=_safe_custom_id(date_key),
+                prompt=build_prompt(cita, master_lang, topic, texto),
+                model_id=state.get("model_id", ""),
+            )
+        )
+
+    # ── Load adapter + collect ─────────────────────────────────────────────
+    error_records: list[dict] = []
+    if requests:
+        error_records = _collect_pending(
+            state,
+            requests,
+            seed,
+            journal,
+            model_alias,
+            results_file,
+        )
+    else:
+        print(_c(_box_row("  All dates already collected — compacting journal."), _DIM))
+    journal.close()
 
     print(_c(_box_bot(), _CYAN, _BOLD))
 
-    # ── Save outputs ───────────────────────────────────────────────────────
-    _print_summary(len(requests), len(completed), len(error_records), len(val_warnings))
+    # ── Compact journal → raw output ───────────────────────────────────────
+    completed, val_warnings = compact_journal(journal.path)
+    _print_summary(len(dates), len(completed), len(error_records), len(val_warnings))
 
     ts = datetime.now().strftime("%Y%m%d_%H%M%S")
 
@@ -581,6 +704,7 @@ def collect(state_path: str, results_file: Optional[str] = None) -> None:
         out_path = save_output(
             completed, master_lang, master_version, provider, output_dir
         )
+        journal.path.unlink()
         print(
             _c(_box_row(f"  {_c('raw output', _CAMO, _BOLD)}   →  {out_path}"), _WHITE)
         )
@@ -1,10 +1,18 @@
 # pipeline_shared.py
 # Shared utilities for batch pipeline scripts
 import json
-import re
+import sys
 import unicodedata
+from pathlib import Path
 from typing import Optional
 
+# tolerant_json lives one level up, shared with the seed_generation scripts
+_SEED_DIR = str(Path(__file__).resolve().parent.parent)
+if _SEED_DIR not in sys.path:
+    sys.path.append(_SEED_DIR)
+
+import tolerant_json  # noqa: E402
+
 # --- Constants ---
 LITURGICAL_WHITELIST = frozenset(
     {
@@ -52,54 +60,9 @@ def _extract_first_balanced_object(text: str) -> Optional[str]:
 
 
 def repair_json(raw_text: str) -> Optional[dict]:
-    # Strip chain-of-thought <think>...</think> blocks (Qwen3, DeepSeek-R1, etc.)
-    text = re.sub(r"<think>[\s\S]*?</think>", "", raw_text, flags=re.IGNORECASE).strip()
-    text = re.sub(r"```(?:json)?\s*", "", text)
-    text = re.sub(r"```\s*$", "", text, flags=re.MULTILINE).strip()
-    try:
-        return json.loads(text)
-    except json.JSONDecodeError:
-        pass
-    candidate = _extract_first_balanced_object(text)
-    if candidate:
-        try:
-            return json.loads(candidate)
-        except json.JSONDecodeError:
-            pass
-        fixed = re.sub(r",(\s*[}\]])", r"\1", candidate)
-        try:
-            return json.loads(fixed)
-        except json.JSONDecodeError:
-            pass
-        fixed2 = re.sub(r"[\x00-\x08\x0b\x0c\x0e-\x1f]", "", fixed)
-        try:
-            return json.loads(fixed2)
-        except json.JSONDecodeError:
-            pass
-        fixed3 = re.sub(r",([\s]*[}\]])", r"\1", candidate)
-        fixed3 = re.sub(r'(?<=: ")([^"]*?)\n([^"]*?)(?=")', r"\1\\n\2", fixed3)
-        try:
-            return json.loads(fixed3)
-        except json.JSONDecodeError:
-            pass
-    reflexion_m = re.search(r'"reflexion"\s*:\s*"((?:[^"\\]|\\.)*)"', text, re.DOTALL)
-    oracion_m = re.search(r'"oracion"\s*:\s*"((?:[^"\\]|\\.)*)"', text, re.DOTALL)
-    if reflexion_m and oracion_m:
-        try:
-            return {
-                "reflexion": reflexion_m.group(1)
-                .encode("raw_unicode_escape")
-                .decode("unicode_escape"),
-                "oracion": oracion_m.group(1)
-                .encode("raw_unicode_escape")
-                .decode("unicode_escape"),
-            }
-        except Exception:
-            return {
-                "reflexion": reflexion_m.group(1),
-                "oracion": oracion_m.group(1),
-            }
-    return None
+    # Single-pass tolerant parse (see tolerant_json.py); repairs are dropped
+    # here — callers that report them use tolerant_json.parse directly.
+    return tolerant_json.parse(raw_text)[0]
 
 
 # --- Prompt Builder ---
@@ -5,7 +5,7 @@ Provider-agnostic adapter layer for devotional batch generation.
 
 Each adapter exposes the same interface:
   submit(requests)  → job_id (str)
-  collect(job_id)   → list[RawResult]
+  collect(job_id)   → Iterator[RawResult], yielded as results are read
 
 RawResult is a simple dataclass: date_key, raw_text, error
 
@@ -13,7 +13,8 @@ Usage:
   from provider_adapter import load_adapter
   adapter = load_adapter(provider="gemini", model_alias="gemini-2.0-flash")
   job_id  = adapter.submit(requests)          # returns immediately
-  results = adapter.collect(job_id)           # blocks until done
+  for result in adapter.collect(job_id, requests):  # waits for the job,
+      ...                                           # then yields results
 """
 
 from __future__ import annotations
@@ -22,12 +23,14 @@ import asyncio
 import datetime
 import json
 import os
+import queue
 import re
+import threading
 import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
 import yaml
 
@@ -95,8 +98,8 @@ class BaseAdapter(ABC):
         """Submit all requests. Returns a job_id string."""
 
     @abstractmethod
-    def collect(self, job_id: str, requests: list[BatchRequest]) -> list[RawResult]:
-        """Block until done. Returns one RawResult per request."""
+    def collect(self, job_id: str, requests: list[BatchRequest]) -> Iterator[RawResult]:
+        """Wait for the job, then yield one RawResult per request as it is read."""
 
     @property
     def model_id(self) -> str:
@@ -154,7 +157,7 @@ class AnthropicAdapter(BaseAdapter):
         print(f"INFO: Expires: {batch.expires_at}")
         return batch.id
 
-    def collect(self, job_id: str, requests: list[BatchRequest]) -> list[RawResult]:
+    def collect(self, job_id: str, requests: list[BatchRequest]) -> Iterator[RawResult]:
         # Build lookup: custom_id → date_key
         cid_map = {r.custom_id: r.date_key for r in requests}
 
@@ -177,20 +180,16 @@ class AnthropicAdapter(BaseAdapter):
             time.sleep(self._poll_interval)
 
         # Stream results
-        results: list[RawResult] = []
         for item in self._client.messages.batches.results(job_id):
             date_key = cid_map.get(item.custom_id, item.custom_id)
             if item.result.type == "succeeded":
                 text = item.result.message.content[0].text.strip()
-                results.append(RawResult(date_key=date_key, raw_text=text))
+                yield RawResult(date_key=date_key, raw_text=text)
             else:
-                results.append(
-                    RawResult(
-                        date_key=date_key,
-                        error=f"batch_result_{item.result.type}: {str(item.result)[:120]}",
-                    )
+                yield RawResult(
+                    date_key=date_key,
+                    error=f"batch_result_{item.result.type}: {str(item.result)[:120]}",
                 )
-        return results
 
     def generate_one(self, request: BatchRequest) -> RawResult:
         """Direct API call for repair/fallback — not a batch."""
@@ -219,7 +218,7 @@ class GeminiBatchAdapter(BaseAdapter):
     submit()  → uploads JSONL via File API, calls client.batches.create(),
                 returns real batch job name as job_id
     collect() → polls client.batches.get() until COMPLETED/FAILED,
-                downloads and parses output JSONL, returns list[RawResult]
+                streams the output JSONL, yields one RawResult per request
     generate_one() → direct generate_content() call for repair
     """
 
@@ -302,7 +301,7 @@ class GeminiBatchAdapter(BaseAdapter):
 
     # ── collect ───────────────────────────────────────────────────────────
 
-    def collect(self, job_id: str, requests: list[BatchRequest]) -> list[RawResult]:
+    def collect(self, job_id: str, requests: list[BatchRequest]) -> Iterator[RawResult]:
         # Build lookup: custom_id → date_key
         cid_map = {r.custom_id: r.date_key for r in requests}
 
@@ -342,17 +341,16 @@ class GeminiBatchAdapter(BaseAdapter):
         dest = getattr(job, "dest", None)
         if dest is None:
             print("ERROR: No dest field on completed job — cannot retrieve results")
-            return [
-                RawResult(date_key=r.date_key, error="no_output_dest") for r in requests
-            ]
+            for r in requests:
+                yield RawResult(date_key=r.date_key, error="no_output_dest")
+            return
 
         result_file_name = getattr(dest, "file_name", None)
         if not result_file_name:
             print(f"ERROR: dest.file_name is empty — dest={dest!r}")
-            return [
-                RawResult(date_key=r.date_key, error="no_output_file_name")
-                for r in requests
-            ]
+            for r in requests:
+                yield RawResult(date_key=r.date_key, error="no_output_file_name")
+            return
 
         print(f"INFO: Downloading output from {result_file_name}...")
 
@@ -369,7 +367,7 @@ class GeminiBatchAdapter(BaseAdapter):
         print(f"INFO: Output downloaded → {out_path}")
 
         # Parse output JSONL
-        results: list[RawResult] = []
+        parsed = 0
         missing_keys = set(cid_map.keys())
 
         with open(out_path, encoding="utf-8") as f:
@@ -390,12 +388,11 @@ class GeminiBatchAdapter(BaseAdapter):
                 # Check for API-level error in this line
                 response_obj = obj.get("response", {})
                 error_obj = obj.get("error")
+                parsed += 1
                 if error_obj:
-                    results.append(
-                        RawResult(
-                            date_key=date_key,
-                            error=f"gemini_error: {error_obj}",
-                        )
+                    yield RawResult(
+                        date_key=date_key,
+                        error=f"gemini_error: {error_obj}",
                     )
                     continue
 
@@ -404,26 +401,24 @@ class GeminiBatchAdapter(BaseAdapter):
                     text = response_obj["candidates"][0]["content"]["parts"][0][
                         "text"
                     ].strip()
-                    if not text:
-                        results.append(RawResult(date_key=date_key, error="empty_text"))
-                    else:
-                        results.append(RawResult(date_key=date_key, raw_text=text))
                 except (KeyError, IndexError, TypeError) as e:
-                    results.append(
-                        RawResult(
-                            date_key=date_key,
-                            error=f"parse_response_error: {e} | raw: {str(obj)[:120]}",
-                        )
+                    yield RawResult(
+                        date_key=date_key,
+                        error=f"parse_response_error: {e} | raw: {str(obj)[:120]}",
                     )
+                    continue
+                if not text:
+                    yield RawResult(date_key=date_key, error="empty_text")
+                else:
+                    yield RawResult(date_key=date_key, raw_text=text)
 
         # Any keys not present in output file
         for missing_key in missing_keys:
             date_key = cid_map.get(missing_key, missing_key)
             print(f"WARNING: No output for key {missing_key!r} ({date_key})")
-            results.append(RawResult(date_key=date_key, error="missing_from_output"))
+            yield RawResult(date_key=date_key, error="missing_from_output")
 
-        print(f"INFO: Parsed {len(results)} results from output JSONL")
-        return results
+        print(f"INFO: Parsed {parsed} results from output JSONL")
 
     # ── generate_one (repair) ─────────────────────────────────────────────
 
@@ -503,10 +498,29 @@ class FireworksAdapter(BaseAdapter):
         )
         return tmp.name
 
-    def collect(self, job_id: str, requests: list[BatchRequest]) -> list[RawResult]:
-        return asyncio.run(self._collect_async(requests))
-
-    async def _collect_async(self, requests: list[BatchRequest]) -> list[RawResult]:
+    def collect(self, job_id: str, requests: list[BatchRequest]) -> Iterator[RawResult]:
+        # The event loop runs on a worker thread and hands each result over
+        # as it completes; None marks the end of the run.
+        done: queue.Queue = queue.Queue()
+        failure: list[BaseException] = []
+
+        def _run() -> None:
+            try:
+                asyncio.run(self._collect_async(requests, done.put))
+            except BaseException as e:
+                failure.append(e)
+            finally:
+                done.put(None)
+
+        worker = threading.Thread(target=_run, name="fireworks-collect", daemon=True)
+        worker.start()
+        while (result := done.get()) is not None:
+            yield result
+        worker.join()
+        if failure:
+            raise failure[0]
+
+    async def _collect_async(self, requests: list[BatchRequest], emit) -> None:
         sem = asyncio.Semaphore(self._max_parallel)
 
         async def _one(req: BatchRequest) -> RawResult:
@@ -525,7 +539,6 @@ class FireworksAdapter(BaseAdapter):
                     return RawResult(date_key=req.date_key, error=str(e))
 
         tasks = [_one(r) for r in requests]
-        results = []
         done = 0
         total = len(tasks)
         for coro in asyncio.as_completed(tasks):
@@ -534,8 +547,7 @@ class FireworksAdapter(BaseAdapter):
             if done % 25 == 0 or done == total:
                 status = "✅" if result.succeeded else "❌"
                 print(f"  {status} {done}/{total} — {result.date_key}")
-            results.append(result)
-        return results
+            emit(result)
 
     def generate_one(self, request: BatchRequest) -> RawResult:
         """Sync fallback for repair."""
@@ -571,7 +583,7 @@ class FireworksBatchFileAdapter(BaseAdapter):
       2. Upload the file manually to Fireworks AI.
       3. Download results from Fireworks AI.
       4. collect(results_path, requests) → parses OpenAI results JSONL,
-                                           returns list[RawResult].
+                                           yields one RawResult per request.
 
     OpenAI batch line format produced by submit():
       {"custom_id": "...", "method": "POST", "url": "/v1/chat/completions",
@@ -645,7 +657,7 @@ class FireworksBatchFileAdapter(BaseAdapter):
         )
         return str(out_path)
 
-    def collect(self, job_id: str, requests: list[BatchRequest]) -> list[RawResult]:
+    def collect(self, job_id: str, requests: list[BatchRequest]) -> Iterator[RawResult]:
         """
         Parse an OpenAI-format results JSONL file downloaded from Fireworks AI.
         job_id must be the path to the results file (passed via --results in CLI).
@@ -663,7 +675,7 @@ class FireworksBatchFileAdapter(BaseAdapter):
             )
 
         cid_map = {r.custom_id: r.date_key for r in requests}
-        results: list[RawResult] = []
+        parsed = 0
         missing = set(cid_map.keys())
 
         with open(results_path, encoding="utf-8") as f:
@@ -680,15 +692,14 @@ class FireworksBatchFileAdapter(BaseAdapter):
                 custom_id = obj.get("custom_id", "")
                 date_key = cid_map.get(custom_id, custom_id)
                 missing.discard(custom_id)
+                parsed += 1
 
                 # API-level error
                 error_obj = obj.get("error")
                 if error_obj:
-                    results.append(
-                        RawResult(
-                            date_key=date_key,
-                            error=f"fireworks_batch_error: {error_obj}",
-                        )
+                    yield RawResult(
+                        date_key=date_key,
+                        error=f"fireworks_batch_error: {error_obj}",
                     )
                     continue
 
@@ -700,38 +711,32 @@ class FireworksBatchFileAdapter(BaseAdapter):
                 #   Fireworks direct     : response = {id, object, choices, ...}
                 has_choices = "choices" in response or "body" in response
                 if not has_choices and status != 200:
-                    results.append(
-                        RawResult(
-                            date_key=date_key,
-                            error=f"http_error: status_code={status}",
-                        )
+                    yield RawResult(
+                        date_key=date_key,
+                        error=f"http_error: status_code={status}",
                     )
                     continue
 
                 try:
                     body = response.get("body", response)
                     text = body["choices"][0]["message"]["content"].strip()
-                    if not text:
-                        results.append(
-                            RawResult(date_key=date_key, error="empty_content")
-                        )
-                    else:
-                        results.append(RawResult(date_key=date_key, raw_text=text))
                 except (KeyError, IndexError, TypeError) as e:
-                    results.append(
-                        RawResult(
-                            date_key=date_key,
-                            error=f"parse_error: {e} | raw: {str(obj)[:120]}",
-                        )
+                    yield RawResult(
+                        date_key=date_key,
+                        error=f"parse_error: {e} | raw: {str(obj)[:120]}",
                     )
+                    continue
+                if not text:
+                    yield RawResult(date_key=date_key, error="empty_content")
+                else:
+                    yield RawResult(date_key=date_key, raw_text=text)
 
         for missing_cid in missing:
             date_key = cid_map.get(missing_cid, missing_cid)
             print(f"WARNING: No result line for custom_id={missing_cid!r} ({date_key})")
-            results.append(RawResult(date_key=date_key, error="missing_from_results"))
+            yield RawResult(date_key=date_key, error="missing_from_results")
 
-        print(f"INFO: Parsed {len(results)} results from {results_path}")
-        return results
+        print(f"INFO: Parsed {parsed} results from {results_path}")
 
     def generate_one(self, request: BatchRequest) -> RawResult:
         raise NotImplementedError(
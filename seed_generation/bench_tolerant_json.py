@@ -0,0 +1,287 @@
+"""
+bench_tolerant_json.py
+──────────────────────
+Benchmark tolerant_json.parse against the old repair_json cascade.
+
+Corpus:
+  --corpus FILE   recorded raw responses — JSONL, or a JSON list, of records
+                  with "raw_text" (or "detail", as in batch_errors_*.json), or
+                  plain strings.
+  (default)       built from committed yearly devotionals: every entry is
+                  rendered in the shapes models actually return — clean,
+                  fenced, behind a long <think> block, with trailing commas,
+                  raw newlines, control characters, surrounding prose, and
+                  truncated.
+
+For every shape it reports mean time per response for each parser, how many
+responses each recovered, and how many recovered reflexion/oracion pairs
+differ between the two.
+
+CLI:
+  python bench_tolerant_json.py
+  python bench_tolerant_json.py --limit 100 --repeat 5
+  python bench_tolerant_json.py --corpus recorded_responses.jsonl
+"""
+
+import argparse
+import glob
+import json
+import os
+import re
+import sys
+import time
+from typing import Optional
+
+from tolerant_json import parse
+
+_SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+# ─── 1. OLD CASCADE (batch_files/pipeline_shared.py before tolerant_json) ────
+
+
+def _extract_first_balanced_object(text: str) -> Optional[str]:
+    start = text.find("{")
+    if start == -1:
+        return None
+    depth = 0
+    in_string = False
+    escape = False
+    for i, c in enumerate(text[start:], start):
+        if escape:
+            escape = False
+            continue
+        if c == "\\" and in_string:
+            escape = True
+            continue
+        if c == '"':
+            in_string = not in_string
+            continue
+        if in_string:
+            continue
+        if c == "{":
+            depth += 1
+        elif c == "}":
+            depth -= 1
+            if depth == 0:
+                return text[start : i + 1]
+    return None
+
+
+def legacy_repair_json(raw_text: str) -> Optional[dict]:
+    text = re.sub(r"<think>[\s\S]*?</think>", "", raw_text, flags=re.IGNORECASE).strip()
+    text = re.sub(r"```(?:json)?\s*", "", text)
+    text = re.sub(r"```\s*$", "", text, flags=re.MULTILINE).strip()
+    try:
+        return json.loads(text)
+    except json.JSONDecodeError:
+        pass
+    candidate = _extract_first_balanced_object(text)
+    if candidate:
+        try:
+            return json.loads(candidate)
+        except json.JSONDecodeError:
+            pass
+        fixed = re.sub(r",(\s*[}\]])", r"\1", candidate)
+        try:
+            return json.loads(fixed)
+        except json.JSONDecodeError:
+            pass
+        fixed2 = re.sub(r"[\x00-\x08\x0b\x0c\x0e-\x1f]", "", fixed)
+        try:
+            return json.loads(fixed2)
+        except json.JSONDecodeError:
+            pass
+        fixed3 = re.sub(r",([\s]*[}\]])", r"\1", candidate)
+        fixed3 = re.sub(r'(?<=: ")([^"]*?)\n([^"]*?)(?=")', r"\1\\n\2", fixed3)
+        try:
+            return json.loads(fixed3)
+        except json.JSONDecodeError:
+            pass
+    reflexion_m = re.search(r'"reflexion"\s*:\s*"((?:[^"\\]|\\.)*)"', text, re.DOTALL)
+    oracion_m = re.search(r'"oracion"\s*:\s*"((?:[^"\\]|\\.)*)"', text, re.DOTALL)
+    if reflexion_m and oracion_m:
+        try:
+            return {
+                "reflexion": reflexion_m.group(1)
+                .encode("raw_unicode_escape")
+                .decode("unicode_escape"),
+                "oracion": oracion_m.group(1)
+                .encode("raw_unicode_escape")
+                .decode("unicode_escape"),
+            }
+        except Exception:
+            return {
+                "reflexion": reflexion_m.group(1),
+                "oracion": oracion_m.group(1),
+            }
+    return None
+
+
+# ─── 2. CORPUS ───────────────────────────────────────────────────────────────
+
+
+def load_recorded(path: str) -> dict[str, list[str]]:
+    """{"recorded": [raw_text, ...]} from a JSONL / JSON list file."""
+    with open(path, encoding="utf-8") as f:
+        text = f.read()
+    try:
+        records = json.loads(text)
+    except json.JSONDecodeError:
+        records = [json.loads(line) for line in text.splitlines() if line.strip()]
+    raws = []
+    for rec in records if isinstance(records, list) else [records]:
+        if isinstance(rec, str):
+            raws.append(rec)
+        elif isinstance(rec, dict):
+            raw = rec.get("raw_text") or rec.get("detail")
+            if isinstance(raw, str):
+                raws.append(raw)
+    return {"recorded": raws}
+
+
+def _sample_entries(limit: int) -> list[dict]:
+    pattern = os.path.join(
+        _SCRIPT_DIR, "20*", "yearly_devotionals", "*", "Devocional_year_*.json"
+    )
+    entries = []
+    for path in sorted(glob.glob(pattern)):
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f).get("data", {})
+        for by_date in data.values():
+            for items in by_date.values():
+                for item in items if isinstance(items, list) else [items]:
+                    if item.get("reflexion") and item.get("oracion"):
+                        entries.append(
+                            {"reflexion": item["reflexion"], "oracion": item["oracion"]}
+                        )
+                        if len(entries) >= limit:
+                            return entries
+    return entries
+
+
+def _think(entry: dict, kb: int) -> str:
+    line = f"Let me plan the reflexion. The key idea is {{faith}}: {entry['oracion'][:120]}\n"
+    return "<think>\n" + line * max(1, kb * 1024 // len(line)) + "</think>\n\n"
+
+
+def build_corpus(limit: int, think_kb: int) -> dict[str, list[str]]:
+    """Responses per shape, rendered from real devotional text."""
+    shapes: dict[str, list[str]] = {}
+    for entry in _sample_entries(limit):
+        clean = json.dumps(entry, ensure_ascii=False, indent=2)
+        raw_nl = '{\n  "reflexion": "%s",\n  "oracion": "%s"\n}' % (
+            entry["reflexion"].replace("\\", "\\\\").replace('"', '\\"'),
+            entry["oracion"].replace("\\", "\\\\").replace('"', '\\"'),
+        )
+        variants = {
+            "clean": clean,
+            "fenced": f"```json\n{clean}\n```",
+            "think": _think(entry, think_kb) + f"```json\n{clean}\n```",
+            "trailing_comma": clean[:-2] + ",\n}",
+            "raw_newline": raw_nl,
+            "control_char": clean.replace(". ", ".\x0b ", 1),
+            "think_and_broken": _think(entry, think_kb) + raw_nl[:-2] + ",\n}",
+            "prose_around": f"Here is the devotional:\n{clean}\nLet me know if you need changes.",
+            "truncated": clean[: len(clean) * 2 // 3],
+        }
+        for name, raw in variants.items():
+            shapes.setdefault(name, []).append(raw)
+    return shapes
+
+
+# ─── 3. BENCHMARK ────────────────────────────────────────────────────────────
+
+
+def _time(fn, raws: list[str], repeat: int) -> tuple[float, list]:
+    best, results = float("inf"), []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        results = [fn(raw) for raw in raws]
+        best = min(best, time.perf_counter() - t0)
+    return best, results
+
+
+def _fields(data) -> Optional[tuple]:
+    if not isinstance(data, dict):
+        return None
+    return data.get("reflexion"), data.get("oracion")
+
+
+def run(shapes: dict[str, list[str]], repeat: int) -> None:
+    SEP = "=" * 78
+    print(f"\n{SEP}")
+    print(
+        f"  {'shape':<18}{'n':>5}  {'old µs':>9}{'new µs':>9}{'speedup':>9}  {'old ok':>7}{'new ok':>7}{'differ':>7}"
+    )
+    print(SEP)
+    totals = [0.0, 0.0, 0, 0, 0, 0]
+    for name, raws in shapes.items():
+        if not raws:
+            continue
+        t_old, old = _time(legacy_repair_json, raws, repeat)
+        t_new, new = _time(lambda raw: parse(raw)[0], raws, repeat)
+        old_ok = sum(r is not None for r in old)
+        new_ok = sum(r is not None for r in new)
+        differ = sum(
+            1
+            for a, b in zip(old, new)
+            if a is not None and b is not None and _fields(a) != _fields(b)
+        )
+        n = len(raws)
+        print(
+            f"  {name:<18}{n:>5}  {t_old / n * 1e6:>9.1f}{t_new / n * 1e6:>9.1f}"
+            f"{t_old / t_new if t_new else 0:>8.1f}x  {old_ok:>7}{new_ok:>7}{differ:>7}"
+        )
+        for k, v in enumerate((t_old, t_new, n, old_ok, new_ok, differ)):
+            totals[k] += v
+    t_old, t_new, n, old_ok, new_ok, differ = totals
+    print(SEP)
+    if n:
+        print(
+            f"  {'total':<18}{n:>5}  {t_old / n * 1e6:>9.1f}{t_new / n * 1e6:>9.1f}"
+            f"{t_old / t_new if t_new else 0:>8.1f}x  {old_ok:>7}{new_ok:>7}{differ:>7}"
+        )
+    print(f"{SEP}\n")
+
+
+# ─── 4. ENTRY POINT ──────────────────────────────────────────────────────────
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark tolerant_json against the old repair_json cascade."
+    )
+    parser.add_argument("--corpus", help="Recorded raw responses (JSONL or JSON list)")
+    parser.add_argument(
+        "--limit",
+        type=int,
+        default=200,
+        help="Devotionals sampled for the built corpus (default 200)",
+    )
+    parser.add_argument(
+        "--think-kb",
+        type=int,
+        default=24,
+        help="Size of generated <think> blocks in KB (default 24)",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=3,
+        help="Timing runs per shape, best kept (default 3)",
+    )
+    args = parser.parse_args()
+
+    if args.corpus:
+        shapes = load_recorded(args.corpus)
+    else:
+        shapes = build_corpus(args.limit, args.think_kb)
+    if not any(shapes.values()):
+        print("⚠️  Empty corpus — nothing to benchmark.")
+        sys.exit(1)
+    run(shapes, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+"""
+bible_db.py
+───────────
+Single responsibility: open SQLite Bible DBs for the seed tools, read-only,
+decompressing each .gz once.
+
+Every seed tool (extract_seed, seed_extractor_fetch, main, VerseResolver)
+gets its Bible connection from here:
+  - A *.SQLite3.gz is decompressed once into Bibles/.cache/, the file named
+    after the SHA-256 of the .gz content — a re-downloaded or edited .gz is a
+    new cache entry, an unchanged one is reused by every later run. Stale
+    entries for the same Bible are removed when a new one is written.
+  - Plain .db / .sqlite / .SQLite3 files are used in place.
+  - Connections are read-only (mode=ro) with SQLite mmap enabled. Cached
+    copies never change after they are written, so they are also opened
+    with immutable=1 (no locking, no change detection).
+  - connection_factory() resolves the file once and returns a picklable
+    zero-argument callable; worker processes each call it for their own
+    connection.
+
+Cache location: Bibles/.cache/ next to this script, or SEED_BIBLE_CACHE_DIR.
+
+Usage:
+    import bible_db
+
+    conn = bible_db.open_bible("Bibles/ES/RVR1960_es.SQLite3.gz")
+
+    connect = bible_db.connection_factory("Bibles/ES/RVR1960_es.SQLite3.gz")
+    with VerseResolver(connect, preload=True) as r:
+        ...
+"""
+
+import functools
+import gzip
+import hashlib
+import os
+import re
+import shutil
+import sqlite3
+import tempfile
+from pathlib import Path
+
+_SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+CACHE_DIR = os.environ.get("SEED_BIBLE_CACHE_DIR") or os.path.join(
+    _SCRIPT_DIR, "Bibles", ".cache"
+)
+
+# Bytes of each DB SQLite may memory-map (a full Bible is ~5-15 MB)
+MMAP_BYTES = 256 * 1024 * 1024
+
+# mkstemp files are 0600; cache entries get what open(path, "w") would give.
+# The umask is read once — reading it means setting it, unsafe with threads.
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+# (abs path, size, mtime_ns) → SHA-256, so a process hashes each .gz once
+_hash_memo: dict[tuple[str, int, int], str] = {}
+
+
+def content_hash(path: str) -> str:
+    """SHA-256 hex digest of a file's bytes."""
+    path = os.path.abspath(path)
+    st = os.stat(path)
+    key = (path, st.st_size, st.st_mtime_ns)
+    digest = _hash_memo.get(key)
+    if digest is None:
+        h = hashlib.sha256()
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                h.update(block)
+        digest = _hash_memo[key] = h.hexdigest()
+    return digest
+
+
+def _split_gz(gz_path: str) -> tuple[str, str]:
+    """Bibles/ES/RVR1960_es.SQLite3.gz → (RVR1960_es, .SQLite3)"""
+    return os.path.splitext(os.path.basename(gz_path)[: -len(".gz")])
+
+
+def cached_path(gz_path: str) -> str:
+    """Cache file for a .gz: <name>.<hash16><ext>, e.g. RVR1960_es.3fa2….SQLite3"""
+    base, ext = _split_gz(gz_path)
+    return os.path.join(CACHE_DIR, f"{base}.{content_hash(gz_path)[:16]}{ext}")
+
+
+def ensure_db(path: str) -> str:
+    """
+    Path of a ready-to-open SQLite file for path.
+    A .gz is decompressed into the cache on first use; plain files pass through.
+    """
+    if not path.lower().endswith(".gz"):
+        return path
+    target = cached_path(path)
+    if os.path.exists(target):
+        return target
+
+    print(f"      🗜️  Decompressing {os.path.basename(path)} (cached for later runs)...")
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=CACHE_DIR, suffix=".tmp")
+    try:
+        with gzip.open(path, "rb") as gz_in, os.fdopen(fd, "wb") as db_out:
+            shutil.copyfileobj(gz_in, db_out)
+        os.chmod(tmp, 0o666 & ~_UMASK)
+        os.replace(tmp, target)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+        raise
+
+    # Older decompressions of the same Bible (different .gz content)
+    base, ext = _split_gz(path)
+    stale = re.compile(rf"{re.escape(base)}\.[0-9a-f]{{16}}{re.escape(ext)}")
+    for name in os.listdir(CACHE_DIR):
+        if stale.fullmatch(name) and name != os.path.basename(target):
+            try:
+                os.unlink(os.path.join(CACHE_DIR, name))
+            except OSError:
+                pass
+    return target
+
+
+def _is_cached(db_path: str) -> bool:
+    return os.path.dirname(os.path.abspath(db_path)) == os.path.abspath(CACHE_DIR)
+
+
+def connect(db_path: str, immutable: bool = False) -> sqlite3.Connection:
+    """Read-only connection with mmap; immutable=True only for files that never change."""
+    uri = Path(db_path).resolve().as_uri() + "?mode=ro"
+    if immutable:
+        uri += "&immutable=1"
+    conn = sqlite3.connect(uri, uri=True)
+    conn.execute(f"PRAGMA mmap_size={MMAP_BYTES}")
+    return conn
+
+
+def connection_factory(path: str):
+    """Zero-argument, picklable callable returning a new read-only connection."""
+    db_path = ensure_db(path)
+    return functools.partial(connect, db_path, _is_cached(db_path))
+
+
+def open_bible(path: str) -> sqlite3.Connection:
+    """Read-only connection to a Bible DB (.gz or plain)."""
+    return connection_factory(path)()
@@ -20,18 +20,17 @@ Usage:
                seed_tag_misses_<lang>_<version>_<ts>.json  (if any)
 """
 
-import gzip
 import json
 import re
-import shutil
 import sqlite3
 import sys
 import os
-import tempfile
 import urllib.request
 from datetime import datetime
 from tkinter import Tk, filedialog, messagebox, simpledialog
 
+import bible_db
+
 # =============================================================================
 # 1. CONSTANTS & CONFIG
 # =============================================================================
@@ -486,35 +485,14 @@ def resolve_reference(
 # =============================================================================
 
 
-def open_sqlite(path: str) -> tuple[sqlite3.Connection, object]:
+def open_sqlite(path: str) -> sqlite3.Connection:
     """
-    Open a SQLite database from a plain file or a .gz-compressed file.
-
-    If path ends with .gz:
-      - Decompresses into a NamedTemporaryFile (delete=False so SQLite can open it).
-      - Returns (conn, tmp) — caller MUST call tmp.close() + os.unlink(tmp.name)
-        when done, or use the context pattern in extract_seed().
-    Otherwise:
-      - Opens directly.
-      - Returns (conn, None) — no cleanup needed.
+    Open a SQLite Bible database from a plain file or a .gz-compressed file.
 
-    Never leaves a decompressed file on disk after the caller finishes.
+    Read-only, through the shared bible_db cache: a .gz is decompressed once
+    into Bibles/.cache/ (keyed by its content hash) and reused by later runs.
     """
-    if path.lower().endswith(".gz"):
-        tmp = tempfile.NamedTemporaryFile(suffix=".db", delete=False)
-        try:
-            with gzip.open(path, "rb") as gz_in:
-                shutil.copyfileobj(gz_in, tmp)
-            tmp.flush()
-            tmp.close()  # close write handle; SQLite opens its own
-            conn = sqlite3.connect(tmp.name)
-            return conn, tmp
-        except Exception:
-            tmp.close()
-            os.unlink(tmp.name)
-            raise
-    else:
-        return sqlite3.connect(path), None
+    return bible_db.open_bible(path)
 
 
 # =============================================================================
@@ -583,25 +561,14 @@ def extract_seed(
     print(f"      ✅ {len(dates)} dates\n")
 
     print("[4/7] Connecting to SQLite...")
-    is_gz = sqlite_path.lower().endswith(".gz")
-    if is_gz:
-        print(
-            "      🗜️  Detected .gz — decompressing to temp file (will be deleted on exit)..."
-        )
-    tmp_db = None
     try:
-        conn, tmp_db = open_sqlite(sqlite_path)
+        conn = open_sqlite(sqlite_path)
         cursor = conn.cursor()
         cursor.execute("SELECT COUNT(*) FROM verses")
         verse_count = cursor.fetchone()[0]
         print(f"      ✅ {verse_count:,} verses available\n")
     except Exception as e:
         print(f"      ❌ FATAL: Cannot open SQLite — {e}")
-        if tmp_db is not None:
-            try:
-                os.unlink(tmp_db.name)
-            except OSError:
-                pass
         sys.exit(1)
 
     # ── Preflight tag coverage ────────────────────────────────────────────────
@@ -690,12 +657,6 @@ def extract_seed(
 
     finally:
         conn.close()
-        if tmp_db is not None:
-            try:
-                os.unlink(tmp_db.name)
-                print(f"      🗑️  Temp file deleted: {tmp_db.name}")
-            except OSError as e:
-                print(f"      ⚠️  Could not delete temp file {tmp_db.name}: {e}")
 
     # ── Reverse validation ────────────────────────────────────────────────────
     violations = reverse_validate_seed(seed, tags_map, effective_merge, target_lang)
@@ -7,39 +7,66 @@ All model limits and safety margins are defined here.
 Callers (API_Server_Seed.py, API_Server_V9.py, etc.) call acquire()
 before every Gemini request — they know nothing about the limits.
 
+Every call is also booked on the shared token-bucket scheduler
+(GEP_Genome-Evolution-Protocol/rate_scheduler.py) — the same RPM / TPM model
+that paces GEP cloud_client calls. TPM is charged from a prompt-length
+estimate and corrected with the real usage via settle().
+
 Supported models:
-  - gemini-2.0-flash       RPM:15  RPD:200
-  - gemini-2.5-flash-lite  RPM:15  RPD:20
-  - gemini-1.5-flash       RPM:15  RPD:1500
+  - gemini-2.0-flash       RPM:15  TPM:1M    RPD:200
+  - gemini-2.5-flash-lite  RPM:15  TPM:250k  RPD:20
+  - gemini-1.5-flash       RPM:15  TPM:1M    RPD:1500
 
 Usage:
-    from gemini_rate_limiter import GeminiRateLimiter
+    from gemini_rate_limiter import GeminiRateLimiter, estimate_tokens
 
     limiter = GeminiRateLimiter(model="gemini-2.0-flash")
-    limiter.acquire()   # blocks until safe to call
+    cost = estimate_tokens(prompt, completion=EXPECTED_OUTPUT_TOKENS)
+    limiter.acquire(cost)          # blocks the thread until safe to call
+    await limiter.aacquire(cost)   # same, from async code (event loop stays free)
+    limiter.try_acquire(cost)      # True if booked now, False → route elsewhere
+    ...
+    limiter.settle(cost, response.usage_metadata.total_token_count)
 """
 
+import asyncio
+import sys
 import threading
 import time
+from collections import deque
+from pathlib import Path
+
+# Shared scheduler lives with the GEP cloud client; appended (not prepended)
+# so seed_generation modules keep precedence over same-named GEP ones.
+_GEP_DIR = Path(__file__).resolve().parent.parent / "GEP_Genome-Evolution-Protocol"
+if str(_GEP_DIR) not in sys.path:
+    sys.path.append(str(_GEP_DIR))
+
+import rate_scheduler  # noqa: E402
+from rate_scheduler import estimate_tokens  # noqa: E402,F401  (re-exported)
 
 
 # ── Model registry ────────────────────────────────────────────────────────────
 # Source: https://ai.google.dev/gemini-api/docs/rate-limits (free tier)
 # RPM  = requests per minute
+# TPM  = tokens per minute (input + output)
 # RPD  = requests per day  (None = no enforced daily limit)
 MODEL_LIMITS = {
     "gemini-2.0-flash": {
         "RPM": 15,
+        "TPM": 1_000_000,
         "RPD": 200,
         "display": "Gemini 2.0 Flash (free tier)",
     },
     "gemini-2.5-flash": {
         "RPM": 15,
+        "TPM": 250_000,
         "RPD": 2000,
         "display": "Gemini 2.5 Flash Lite (free tier)",
     },
     "gemini-1.5-flash": {
         "RPM": 15,
+        "TPM": 1_000_000,
         "RPD": 1500,
         "display": "Gemini 1.5 Flash (free tier)",
     },
@@ -51,9 +78,6 @@ SAFETY_MARGIN = 0.8
 # Rolling window for RPM tracking (seconds)
 RPM_WINDOW_SECS = 60
 
-# How long to wait when RPM limit is hit (slightly over window to ensure reset)
-RPM_WAIT_SECS = 65
-
 # How long to wait when RPD limit is hit (in seconds — 1 hour, then recheck)
 RPD_WAIT_SECS = 3600
 
@@ -66,8 +90,14 @@ class GeminiRateLimiter:
     """
     Thread-safe Gemini API rate limiter.
 
-    Tracks RPM via in-memory rolling window (no DB needed).
+    Tracks RPM via in-memory rolling window (no DB needed): a deque of call
+    times, oldest first, so purging and the wait for the next free slot are
+    O(1) per expired call.
     Tracks RPD via in-memory daily counter (resets at UTC midnight).
+    Books RPM / TPM on the shared rate_scheduler buckets.
+
+    The lock only guards bookkeeping — waiting happens outside it, so
+    status() and other callers are never blocked behind a sleeping acquire().
 
     All limit values come from MODEL_LIMITS — callers define nothing.
     """
@@ -83,6 +113,7 @@ class GeminiRateLimiter:
         self._model = model
         self._limits = MODEL_LIMITS[model]
         self._safe_rpm = int(self._limits["RPM"] * safety_margin)
+        self._safe_tpm = int(self._limits["TPM"] * safety_margin)
         self._safe_rpd = (
             int(self._limits["RPD"] * safety_margin)
             if self._limits.get("RPD")
@@ -90,64 +121,66 @@ class GeminiRateLimiter:
         )
 
         self._lock = threading.Lock()
-        self._recent_calls = []  # UTC timestamps of calls in last RPM_WINDOW_SECS
+        self._recent_calls: deque[float] = deque()  # monotonic call times, oldest first
         self._daily_calls = 0
         self._day_start_utc = self._utc_midnight()
 
+        # Scheduler entry — rpd stays with the UTC-midnight counter above
+        self._provider = {
+            "id": f"gemini:{model}",
+            "name": self._limits["display"],
+            "limits": {"rpm": self._safe_rpm, "tpm": self._safe_tpm},
+        }
+
         print(
             f"INFO: GeminiRateLimiter initialized — "
             f"model: {model} | "
             f"RPM safe: {self._safe_rpm}/{self._limits['RPM']} | "
+            f"TPM safe: {self._safe_tpm}/{self._limits['TPM']} | "
             f"RPD safe: {self._safe_rpd}/{self._limits['RPD']}"
         )
 
     # ── Public API ────────────────────────────────────────────────────────────
 
-    def acquire(self) -> None:
+    def acquire(self, tokens: int = 0) -> None:
         """
-        Block until it is safe to make a Gemini API call.
-        Raises GeminiRateLimiterError if daily quota is exhausted.
+        Block until it is safe to make a Gemini API call of ~`tokens` tokens
+        (see estimate_tokens). Raises GeminiRateLimiterError if daily quota
+        is exhausted.
         """
-        with self._lock:
-            while True:
-                now = time.time()
-                self._reset_daily_if_needed(now)
-                self._purge_old_calls(now)
+        while (wait := self._try_book(tokens)) > 0:
+            print(f"INFO: Rate limit reached — waiting {wait:.1f}s...")
+            time.sleep(wait)
 
-                rpm = len(self._recent_calls)
-                rpd = self._daily_calls
+    async def aacquire(self, tokens: int = 0) -> None:
+        """acquire() for async callers — waits with asyncio.sleep, never blocking the loop."""
+        while (wait := self._try_book(tokens)) > 0:
+            print(f"INFO: Rate limit reached — waiting {wait:.1f}s...")
+            await asyncio.sleep(wait)
 
-                print(
-                    f"INFO: Rate — RPM:{rpm}/{self._safe_rpm} "
-                    + (f"RPD:{rpd}/{self._safe_rpd}" if self._safe_rpd else "")
-                )
-
-                # ── RPD check ─────────────────────────────────────────────────
-                if self._safe_rpd and rpd >= self._safe_rpd:
-                    raise GeminiRateLimiterError(
-                        f"Daily quota reached ({rpd} calls today, safe limit: {self._safe_rpd}). "
-                        f"Resets at UTC midnight."
-                    )
-
-                # ── RPM check ─────────────────────────────────────────────────
-                if rpm >= self._safe_rpm:
-                    print(f"INFO: RPM limit reached — waiting {RPM_WAIT_SECS}s...")
-                    time.sleep(RPM_WAIT_SECS)
-                    continue
+    def try_acquire(self, tokens: int = 0) -> bool:
+        """
+        Book a call only if one is allowed right now — never waits.
+        Returns False when RPM / TPM is full so the caller can use another
+        model. Raises GeminiRateLimiterError if daily quota is exhausted.
+        """
+        return self._try_book(tokens) == 0
 
-                # ── Safe to proceed ───────────────────────────────────────────
-                self._recent_calls.append(now)
-                self._daily_calls += 1
-                break
+    def settle(self, estimated: int, actual: int | None) -> None:
+        """Correct the TPM booking of acquire(estimated) to the real usage."""
+        if actual:
+            rate_scheduler.shared().settle(self._provider, estimated, actual)
 
     def status(self) -> dict:
         """Returns current rate status snapshot — useful for logging."""
         with self._lock:
-            now = time.time()
+            now = time.monotonic()
             self._reset_daily_if_needed(now)
             self._purge_old_calls(now)
             return {
                 "model": self._model,
+                "tpm": rate_scheduler.shared().status(self._provider).get("tpm", 0),
+                "tpm_safe": self._safe_tpm,
                 "rpm": len(self._recent_calls),
                 "rpm_safe": self._safe_rpm,
                 "rpm_limit": self._limits["RPM"],
@@ -158,10 +191,53 @@ class GeminiRateLimiter:
 
     # ── Internal helpers ──────────────────────────────────────────────────────
 
+    def _try_book(self, tokens: int) -> float:
+        """
+        Book a call if every limit allows it now and return 0, else return
+        the exact seconds until the next slot without booking anything.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._reset_daily_if_needed(now)
+            self._purge_old_calls(now)
+
+            rpm = len(self._recent_calls)
+            rpd = self._daily_calls
+
+            print(
+                f"INFO: Rate — RPM:{rpm}/{self._safe_rpm} "
+                + (f"RPD:{rpd}/{self._safe_rpd}" if self._safe_rpd else "")
+            )
+
+            # ── RPD check ─────────────────────────────────────────────────────
+            if self._safe_rpd and rpd >= self._safe_rpd:
+                raise GeminiRateLimiterError(
+                    f"Daily quota reached ({rpd} calls today, safe limit: {self._safe_rpd}). "
+                    f"Resets at UTC midnight."
+                )
+
+            # ── RPM check — next slot opens when the oldest call leaves ──────
+            if rpm >= self._safe_rpm:
+                return self._recent_calls[0] + RPM_WINDOW_SECS - now
+
+            # ── TPM (and bucket RPM) on the shared scheduler ─────────────────
+            booked, wait = rate_scheduler.shared().reserve(
+                [self._provider], tokens, max_wait_s=0
+            )
+            if booked is None:
+                return wait
+
+            # ── Safe to proceed ───────────────────────────────────────────────
+            self._recent_calls.append(now)
+            self._daily_calls += 1
+            return 0.0
+
     def _purge_old_calls(self, now: float) -> None:
         """Remove calls outside the rolling RPM window."""
         cutoff = now - RPM_WINDOW_SECS
-        self._recent_calls = [t for t in self._recent_calls if t >= cutoff]
+        calls = self._recent_calls
+        while calls and calls[0] <= cutoff:
+            calls.popleft()
 
     def _reset_daily_if_needed(self, now: float) -> None:
         """Reset daily counter at UTC midnight."""
@@ -30,7 +30,6 @@ import json
 import os
 import re
 import signal
-import sqlite3
 import subprocess
 import sys
 import time
@@ -265,7 +264,10 @@ def phase_seed(
 
     # Validate DB connection
     try:
-        conn = sqlite3.connect(sqlite_path)
+        sys.path.insert(0, _SCRIPT_DIR)
+        import bible_db
+
+        conn = bible_db.open_bible(sqlite_path)
         cursor = conn.cursor()
         cursor.execute("SELECT COUNT(*) FROM verses")
         verse_count = cursor.fetchone()[0]
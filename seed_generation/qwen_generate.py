@@ -133,7 +133,7 @@ def _parse_response(raw: str) -> dict[str, Any]:
     Parse model output → dict with at least {reflexion, oracion}.
     Falls back to pipeline_shared.repair_json() on decode failure.
     """
-    data = repair_json(raw)  # handles markdown fences + 6-strategy recovery
+    data = repair_json(raw)  # think blocks, fences, single-pass tolerant parse
     if data is None:
         raise QwenGenerationError(
             f"repair_json() could not recover output. "
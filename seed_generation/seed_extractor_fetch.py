@@ -9,12 +9,19 @@ Sources (in priority order):
   • bible_books.json SOT  — github.com/develop4God/bible_versions  (cached in memory)
   • Bible versions index  — github.com/develop4God/bible_versions  (cached in memory)
   • Target SQLite DB      — Bibles/ folder if already present, else downloaded
-                           from the remote index URL and decompressed in place
+                           from the remote index URL; .gz files are decompressed
+                           once into the shared bible_db cache
   • tags_master.json      — local file next to this script (required)
 
 Interaction:
   Terminal prompts → select year  →  select language  →  select version
   Single tkinter dialog           →  choose output folder
+  Or CLI flags: --year --lang --version --output
+
+Matrix mode (--targets ar:ALAB,de:LU17 | de | all, --workers N):
+  One worker process per target, each with its own read-only Bible
+  connection; the KJV JSON, tags_master.json and bible_books SOT are loaded
+  once and shared read-only. Per-target output files are the same as below.
 
 Output files (in chosen folder):
   seed_<lang>_<version>_<year>_<ts>.json
@@ -24,14 +31,15 @@ Output files (in chosen folder):
 """
 
 import argparse
-import gzip
+import contextlib
+import io
 import json
 import os
 import re
-import shutil
 import sqlite3
 import sys
 import urllib.request
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime
 
 try:
@@ -41,6 +49,8 @@ try:
 except ImportError:
     _HAS_TKINTER = False
 
+import bible_db
+
 # ─────────────────────────────────────────────────────────────────────────────
 # 1.  CONSTANTS & PATHS
 # ─────────────────────────────────────────────────────────────────────────────
@@ -105,6 +115,8 @@ SEP = "=" * 62
 # Module-level caches — fetched once per run
 _books_sot_cache: dict | None = None
 _versions_index_cache: dict | None = None
+_kjv_cache: dict[int, tuple[str, dict]] = {}
+_tags_master_cache: tuple[dict, dict] | None = None
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -164,8 +176,10 @@ def fetch_kjv(year: int) -> tuple[str, dict]:
     """
     Load the KJV devotional JSON for *year*.
     Checks the local BASE file first; falls back to the remote GitHub URL.
-    Returns (lang_code, {date: [entry]}).
+    Returns (lang_code, {date: [entry]}). Cached per year for the process.
     """
+    if year in _kjv_cache:
+        return _kjv_cache[year]
     local = _LOCAL_KJV.get(year, "")
     if local and os.path.exists(local):
         print(f"  Loading KJV {year} from local file...")
@@ -182,6 +196,7 @@ def fetch_kjv(year: int) -> tuple[str, dict]:
     lang = list(data["data"].keys())[0]
     dates = data["data"][lang]
     print(f"      ✅ {len(dates)} dates  ({src})\n")
+    _kjv_cache[year] = lang, dates
     return lang, dates
 
 
@@ -216,46 +231,47 @@ def _make_progress_hook():
 
 def find_or_download_db(version_entry: dict, lang_code: str) -> str:
     """
-    Ensure the SQLite DB for *version_entry* is present locally.
+    Ensure the SQLite DB for *version_entry* is available locally.
 
     Search order:
-      1. Bibles/<VERSION>_<LANG>.SQLite3         (flat cache — preferred)
+      1. Bibles/<VERSION>_<LANG>.SQLite3               (legacy flat copy)
       2. Bibles/<LANG_UPPER>/<VERSION>_<LANG>.SQLite3  (legacy subfolder)
+      3. Bibles/<LANG_UPPER>/<VERSION>_<LANG>.SQLite3.gz, then Bibles/<…>.gz
 
-    If not found, download the .gz from the remote URL, decompress to (1),
-    then delete the .gz.
+    If none is found, download the .gz into Bibles/<LANG_UPPER>/ and keep it.
+    A .gz is decompressed once into the shared bible_db cache (keyed by its
+    content hash), so later runs — of this or any other seed tool — reuse it.
 
-    Returns the path to the ready-to-use .SQLite3 file.
+    Returns the path to the ready-to-use SQLite file.
     """
     remote_file = version_entry["file"]  # e.g. "LU17_de.SQLite3.gz"
     db_filename = remote_file.replace(".gz", "")  # e.g. "LU17_de.SQLite3"
-
-    flat_path = os.path.join(DB_DIR, db_filename)
-    sub_path = os.path.join(DB_DIR, lang_code.upper(), db_filename)
-
-    if os.path.exists(flat_path):
-        print(f"      ✅ Using cached  {flat_path}")
-        return flat_path
-    if os.path.exists(sub_path):
-        print(f"      ✅ Using cached  {sub_path}")
-        return sub_path
+    lang_dir = os.path.join(DB_DIR, lang_code.upper())
+
+    for path in (
+        os.path.join(DB_DIR, db_filename),
+        os.path.join(lang_dir, db_filename),
+    ):
+        if os.path.exists(path):
+            print(f"      ✅ Using cached  {path}")
+            return path
+
+    gz_path = os.path.join(lang_dir, remote_file)
+    for path in (gz_path, os.path.join(DB_DIR, remote_file)):
+        if os.path.exists(path):
+            db_path = bible_db.ensure_db(path)
+            print(f"      ✅ Using cached  {db_path}")
+            return db_path
 
     # ── Download ──────────────────────────────────────────────────────────────
-    os.makedirs(DB_DIR, exist_ok=True)
-    gz_path = os.path.join(DB_DIR, remote_file)
-
-    if not os.path.exists(gz_path):
-        print(f"      ⬇  Downloading {remote_file}...")
-        urllib.request.urlretrieve(version_entry["url"], gz_path, _make_progress_hook())
-        print()  # newline after progress bar
-
-    # ── Decompress ────────────────────────────────────────────────────────────
-    print(f"      🗜  Decompressing {remote_file}...")
-    with gzip.open(gz_path, "rb") as gz_in, open(flat_path, "wb") as db_out:
-        shutil.copyfileobj(gz_in, db_out)
-    os.unlink(gz_path)
+    os.makedirs(lang_dir, exist_ok=True)
+    print(f"      ⬇  Downloading {remote_file}...")
+    urllib.request.urlretrieve(version_entry["url"], gz_path, _make_progress_hook())
+    print()  # newline after progress bar
+
+    db_path = bible_db.ensure_db(gz_path)
     print(f"      ✅ {db_filename}\n")
-    return flat_path
+    return db_path
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -386,6 +402,9 @@ def normalize_tag(tag: str) -> str:
 
 def load_tags_master() -> tuple[dict, dict]:
     """Load tags_master.json. Returns (tags_map, effective_merge_map)."""
+    global _tags_master_cache
+    if _tags_master_cache is not None:
+        return _tags_master_cache
     if not os.path.exists(TAGS_MASTER_PATH):
         raise FileNotFoundError(
             f"tags_master.json not found at: {TAGS_MASTER_PATH}\n"
@@ -395,7 +414,8 @@ def load_tags_master() -> tuple[dict, dict]:
         data = json.load(f)
     file_merge = data.get("merge_map", {})
     merged_map = {**MERGE_MAP, **file_merge}
-    return data["tags"], merged_map
+    _tags_master_cache = data["tags"], merged_map
+    return _tags_master_cache
 
 
 def preflight_coverage(
@@ -686,7 +706,11 @@ def run(
     version_entry: dict,
     output_dir: str,
     lang_entry: dict | None = None,
-) -> None:
+) -> dict:
+    """
+    Extract one (lang_code, version_code) seed for *year* into *output_dir*.
+    Returns a summary: seed path, seed entries, skipped dates, violations.
+    """
     display_name = version_entry["name"]
 
     print(f"\n{SEP}")
@@ -715,7 +739,7 @@ def run(
     print("[4/7] Bible SQLite DB...")
     local_db = find_or_download_db(version_entry, lang_code)
 
-    conn = sqlite3.connect(local_db)
+    conn = bible_db.open_bible(local_db)
     cursor = conn.cursor()
     cursor.execute("SELECT COUNT(*) FROM verses")
     verse_count = cursor.fetchone()[0]
@@ -733,7 +757,7 @@ def run(
                 try:
                     print(f"      ℹ️  Fallback DB: {fallback_code} ({fb_entry['name']})")
                     fb_local = find_or_download_db(fb_entry, lang_code)
-                    fallback_conn = sqlite3.connect(fb_local)
+                    fallback_conn = bible_db.open_bible(fb_local)
                     fallback_cursor = fallback_conn.cursor()
                     fallback_cursor.execute("SELECT COUNT(*) FROM verses")
                     fb_count = fallback_cursor.fetchone()[0]
@@ -893,10 +917,168 @@ def run(
     else:
         print("  ✅ Seed is clean — ready for generate_from_seed.py")
     print(SEP + "\n")
+    return {
+        "seed_path": seed_path,
+        "ok": ok_count,
+        "skipped": skip_count,
+        "violations": len(violations),
+    }
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# 10.  MATRIX MODE  (many targets, one worker process each)
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+def parse_targets(spec: str, index: dict) -> list[tuple[str, str]]:
+    """
+    "ar:ALAB,de:LU17" → [("ar", "ALAB"), ("de", "LU17")]
+    "de"              → every version of de
+    "all"             → every version of every language in the versions index
+    """
+    languages = index["languages"]
+    targets: list[tuple[str, str]] = []
+    for item in spec.split(","):
+        item = item.strip()
+        if not item:
+            continue
+        if item.lower() == "all":
+            targets += [
+                (lc, vc) for lc, le in languages.items() for vc in le["versions"]
+            ]
+            continue
+        lang_code, _, version_code = item.partition(":")
+        lang_code = lang_code.lower()
+        lang_entry = languages.get(lang_code)
+        if lang_entry is None:
+            raise ValueError(f"language '{lang_code}' not found in versions index")
+        if not version_code:
+            targets += [(lang_code, vc) for vc in lang_entry["versions"]]
+        elif version_code.upper() in lang_entry["versions"]:
+            targets.append((lang_code, version_code.upper()))
+        else:
+            raise ValueError(
+                f"version '{version_code}' not found for language '{lang_code}' "
+                f"(available: {list(lang_entry['versions'])})"
+            )
+    return list(dict.fromkeys(targets))
+
+
+def _init_matrix_worker(
+    books_sot: dict, tags_master: tuple[dict, dict], kjv: dict[int, tuple[str, dict]]
+) -> None:
+    """Seed the module caches once per worker — shared inputs are read-only."""
+    global _books_sot_cache, _tags_master_cache
+    _books_sot_cache = books_sot
+    _tags_master_cache = tags_master
+    _kjv_cache.update(kjv)
+
+
+def _run_target(
+    year: int,
+    lang_code: str,
+    version_code: str,
+    version_entry: dict,
+    output_dir: str,
+    lang_entry: dict,
+) -> tuple[dict | None, str]:
+    """Worker: one run() with its output captured. Returns (summary, log)."""
+    out = io.StringIO()
+    summary = None
+    with contextlib.redirect_stdout(out):
+        try:
+            summary = run(
+                year, lang_code, version_code, version_entry, output_dir, lang_entry
+            )
+        except BaseException as e:  # noqa: BLE001 — one target must not sink the rest
+            print(f"  ❌ {lang_code}/{version_code} failed: {type(e).__name__}: {e}")
+    return summary, out.getvalue()
+
+
+def run_matrix(
+    year: int,
+    targets: list[tuple[str, str]],
+    index: dict,
+    output_dir: str,
+    workers: int | None = None,
+) -> dict[tuple[str, str], dict | None]:
+    """
+    Extract seeds for many (lang_code, version_code) targets in parallel.
+
+    The KJV year JSON, tags_master.json and the bible_books SOT are loaded
+    once here and handed read-only to each worker process; every worker opens
+    its own read-only Bible connection (bible_db). DBs are downloaded and
+    decompressed up front, sequentially, so workers never race on Bibles/.
+    Each target writes the same seed / report files as a single run; its log
+    is printed as a block when it finishes.
+    """
+    languages = index["languages"]
+    workers = max(1, min(workers or os.cpu_count() or 1, len(targets)))
+
+    print(f"\n{SEP}")
+    print("  SEED EXTRACTOR FETCH  —  MATRIX")
+    print(SEP)
+    print(f"  Year        : {year}")
+    print(f"  Targets     : {len(targets)}  ({workers} worker(s))")
+    print(f"  Output      : {output_dir}")
+    print(f"{SEP}\n")
+
+    books_sot = load_books_sot()
+    tags_master = load_tags_master()
+    fetch_kjv(year)
+
+    print("  Preparing Bible DBs...")
+    jobs = []
+    results: dict[tuple[str, str], dict | None] = {}
+    for lang_code, version_code in targets:
+        lang_entry = languages[lang_code]
+        version_entry = lang_entry["versions"][version_code]
+        try:
+            find_or_download_db(version_entry, lang_code)
+            fallback_code = lang_entry.get("fallback_version")
+            fb_entry = lang_entry["versions"].get(fallback_code or "")
+            if fb_entry and fallback_code != version_code:
+                find_or_download_db(fb_entry, lang_code)
+        except Exception as e:
+            print(f"      ❌ {lang_code}/{version_code}: {e} — skipped")
+            results[(lang_code, version_code)] = None
+            continue
+        jobs.append(
+            (year, lang_code, version_code, version_entry, output_dir, lang_entry)
+        )
+    print()
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_matrix_worker,
+        initargs=(books_sot, tags_master, {year: _kjv_cache[year]}),
+    ) as pool:
+        futures = {pool.submit(_run_target, *job): job[1:3] for job in jobs}
+        for future in as_completed(futures):
+            summary, log = future.result()
+            print(log, end="")
+            results[futures[future]] = summary
+
+    print(f"\n{SEP}")
+    print("  MATRIX SUMMARY")
+    print(SEP)
+    for lang_code, version_code in targets:
+        summary = results.get((lang_code, version_code))
+        label = f"{lang_code}/{version_code}"
+        if summary is None:
+            print(f"  ❌ {label:<16} failed")
+        else:
+            flag = "⚠️ " if summary["violations"] else "✅"
+            print(
+                f"  {flag} {label:<16} {summary['ok']:>4} entries  "
+                f"{summary['skipped']:>4} skipped  {summary['violations']:>3} violations"
+            )
+    print(SEP + "\n")
+    return results
 
 
 # ─────────────────────────────────────────────────────────────────────────────
-# 10.  ENTRY POINT
+# 11.  ENTRY POINT
 # ─────────────────────────────────────────────────────────────────────────────
 
 
@@ -907,6 +1089,10 @@ def _parse_cli() -> argparse.Namespace | None:
 
     CLI usage example:
       python seed_extractor_fetch.py --year 2025 --lang ar --version ALAB --output ./seeds/2025
+
+    Matrix mode (--targets instead of --lang/--version):
+      python seed_extractor_fetch.py --year 2026 --targets ar:ALAB,de:LU17,hi --output ./seeds/2026
+      python seed_extractor_fetch.py --year 2026 --targets all --workers 4 --output ./seeds/2026
     """
     parser = argparse.ArgumentParser(
         description="Seed Extractor Fetch — SOT Edition",
@@ -920,9 +1106,20 @@ def _parse_cli() -> argparse.Namespace | None:
         "--version", type=str, help="Bible version code    (e.g. ALAB, LU17, HERV)"
     )
     parser.add_argument("--output", type=str, help="Output folder path")
+    parser.add_argument(
+        "--targets",
+        type=str,
+        help="Matrix mode: lang:VERSION list, a bare lang (all its versions) or 'all'",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Matrix mode: parallel worker processes (default: CPU count)",
+    )
 
     args, _ = parser.parse_known_args()
-    if args.year and args.lang and args.version and args.output:
+    if args.year and args.output and (args.targets or (args.lang and args.version)):
         return args
     return None  # fall through to interactive mode
 
@@ -941,6 +1138,15 @@ def main() -> None:
 
     # ── CLI or interactive? ───────────────────────────────────────────────────
     cli = _parse_cli()
+    if cli and cli.targets:
+        try:
+            targets = parse_targets(cli.targets, index)
+        except ValueError as e:
+            print(f"ERROR: {e}")
+            sys.exit(1)
+        os.makedirs(cli.output, exist_ok=True)
+        run_matrix(cli.year, targets, index, cli.output, workers=cli.workers)
+        return
     if cli:
         year = cli.year
         lang_code = cli.lang.lower()
@@ -0,0 +1,306 @@
+"""
+tolerant_json.py
+────────────────
+Single-pass, fault-tolerant parser for the JSON object in a model response.
+
+Replaces the repair_json cascade (regex rewrite → json.loads, up to six
+times over the full text, then field regexes). One forward scan:
+  - <think>…</think> blocks and ``` fences before the object are skipped
+    with str/regex searches, never copied or rewritten.
+  - The first {...} goes to json's C decoder in place (raw_decode, no
+    copy). Only when that fails is it parsed by the tolerant scanner below,
+    straight into Python objects, tolerating:
+      trailing_comma   ,} / ,]
+      missing_comma    "a": "x" "b": "y"  /  ["x" "y"]
+      raw_newline      literal newline / tab / CR inside a string (kept)
+      control_char     other C0 control characters inside a string (dropped)
+      bad_escape       \\x, \\' … (backslash dropped, character kept)
+      inner_quote      unescaped " inside a string value (kept)
+  - A { that cannot be parsed (prose, broken object) is skipped and the
+    next one is tried. If the broken object already held complete
+    reflexion and oracion strings, those are salvaged.
+  - Text after the object (closing fence, notes, a second object) is ignored.
+
+Each applied repair is reported by name, once, in order of first use; a
+clean response reports none. Also recorded: think_block, code_fence,
+leading_text, trailing_text, salvaged_fields.
+
+Usage:
+    from tolerant_json import parse
+
+    data, repairs = parse(raw_text)
+    # data    → dict, or None when no object could be recovered
+    # repairs → e.g. ["think_block", "code_fence", "trailing_comma"]
+
+Benchmark against the old cascade: bench_tolerant_json.py
+"""
+
+import json
+import re
+from typing import Optional
+
+_SEEK = re.compile(r"\{|<think>|```", re.IGNORECASE)
+_THINK_END = re.compile(r"</think>", re.IGNORECASE)
+_FENCE_LANG = re.compile(r"[A-Za-z]*")
+_WS = re.compile(r"[ \t\r\n]*")
+_STR_RUN = re.compile(r'[^"\\\x00-\x1f]+')
+_NUMBER = re.compile(r"-?(?:0|[1-9][0-9]*)(?:\.[0-9]+)?(?:[eE][+-]?[0-9]+)?")
+_KEY_AHEAD = re.compile(r'"[^"\\\n]*"[ \t\r\n]*:')
+_HEX4 = re.compile(r"[0-9a-fA-F]{4}")
+
+_ESCAPES = {
+    '"': '"',
+    "\\": "\\",
+    "/": "/",
+    "b": "\b",
+    "f": "\f",
+    "n": "\n",
+    "r": "\r",
+    "t": "\t",
+}
+_LITERALS = {"true": True, "false": False, "null": None}
+_STRING_END = frozenset(":}]")
+_AFTER_COMMA = frozenset('"{}[]-0123456789tfn')
+_MAX_DEPTH = 64
+_DECODER = json.JSONDecoder()
+_SALVAGE_KEYS = ("reflexion", "oracion")
+
+
+class _Fail(Exception):
+    """Parse failure; partial holds the top-level members read so far."""
+
+    def __init__(self, reason: str):
+        super().__init__(reason)
+        self.partial: Optional[dict] = None
+
+
+class _Parser:
+    def __init__(self, text: str, repairs: list[str]):
+        self.text = text
+        self.n = len(text)
+        self.repairs = repairs
+
+    def note(self, repair: str) -> None:
+        if repair not in self.repairs:
+            self.repairs.append(repair)
+
+    def ws(self, pos: int) -> int:
+        return _WS.match(self.text, pos).end()
+
+    # ── values ────────────────────────────────────────────────────────────
+
+    def value(self, pos: int, depth: int):
+        if pos >= self.n:
+            raise _Fail("truncated")
+        c = self.text[pos]
+        if c == '"':
+            return self.string(pos)
+        if c == "{":
+            return self.object(pos, depth + 1)
+        if c == "[":
+            return self.array(pos, depth + 1)
+        m = _NUMBER.match(self.text, pos)
+        if m:
+            s = m.group()
+            return (float(s) if any(ch in s for ch in ".eE") else int(s)), m.end()
+        for word, literal in _LITERALS.items():
+            if self.text.startswith(word, pos):
+                return literal, pos + len(word)
+        raise _Fail(f"unexpected {c!r}")
+
+    def object(self, pos: int, depth: int):
+        if depth > _MAX_DEPTH:
+            raise _Fail("too deep")
+        obj: dict = {}
+        pos = self.ws(pos + 1)
+        try:
+            while True:
+                if pos >= self.n:
+                    raise _Fail("truncated")
+                c = self.text[pos]
+                if c == "}":
+                    return obj, pos + 1
+                if c != '"':
+                    raise _Fail(f"expected key, got {c!r}")
+                key, pos = self.string(pos)
+                pos = self.ws(pos)
+                if pos >= self.n or self.text[pos] != ":":
+                    raise _Fail("expected ':'")
+                obj[key], pos = self.value(self.ws(pos + 1), depth)
+                pos = self.ws(pos)
+                if pos >= self.n:
+                    raise _Fail("truncated")
+                c = self.text[pos]
+                if c == ",":
+                    pos = self.ws(pos + 1)
+                    if pos < self.n and self.text[pos] == "}":
+                        self.note("trailing_comma")
+                elif c == '"':
+                    self.note("missing_comma")
+                elif c != "}":
+                    raise _Fail(f"expected ',' or '}}', got {c!r}")
+        except _Fail as e:
+            e.partial = obj  # outermost object wins as the error propagates
+            raise
+
+    def array(self, pos: int, depth: int):
+        if depth > _MAX_DEPTH:
+            raise _Fail("too deep")
+        arr: list = []
+        pos = self.ws(pos + 1)
+        while True:
+            if pos >= self.n:
+                raise _Fail("truncated")
+            if self.text[pos] == "]":
+                return arr, pos + 1
+            if self.text[pos] == '"':
+                item, pos = self.string(pos, in_array=True)
+            else:
+                item, pos = self.value(pos, depth)
+            arr.append(item)
+            pos = self.ws(pos)
+            if pos >= self.n:
+                raise _Fail("truncated")
+            c = self.text[pos]
+            if c == ",":
+                pos = self.ws(pos + 1)
+                if pos < self.n and self.text[pos] == "]":
+                    self.note("trailing_comma")
+            elif c in '"{[':
+                self.note("missing_comma")
+            elif c != "]":
+                raise _Fail(f"expected ',' or ']', got {c!r}")
+
+    def string(self, pos: int, in_array: bool = False):
+        text, n = self.text, self.n
+        parts: list[str] = []
+        pos += 1
+        while True:
+            m = _STR_RUN.match(text, pos)
+            if m:
+                parts.append(m.group())
+                pos = m.end()
+            if pos >= n:
+                raise _Fail("unterminated string")
+            c = text[pos]
+            if c == '"':
+                if self._closes(pos + 1, in_array):
+                    return "".join(parts), pos + 1
+                self.note("inner_quote")
+                parts.append(c)
+                pos += 1
+            elif c == "\\":
+                pos = self._escape(pos + 1, parts)
+            elif c in "\n\r\t":
+                self.note("raw_newline")
+                parts.append(c)
+                pos += 1
+            else:
+                self.note("control_char")
+                pos += 1
+
+    def _closes(self, pos: int, in_array: bool = False) -> bool:
+        """
+        A quote ends the string when structure (or the next key) follows —
+        in an array, also when whitespace and the next item's quote follow.
+        """
+        start, pos = pos, self.ws(pos)
+        if pos >= self.n:
+            return True
+        c = self.text[pos]
+        if c == ",":
+            nxt = self.ws(pos + 1)
+            return nxt >= self.n or self.text[nxt] in _AFTER_COMMA
+        if c in _STRING_END:
+            return True
+        if c != '"':
+            return False
+        return (in_array and pos > start) or bool(_KEY_AHEAD.match(self.text, pos))
+
+    def _escape(self, pos: int, parts: list[str]) -> int:
+        if pos >= self.n:
+            raise _Fail("unterminated string")
+        c = self.text[pos]
+        if c in _ESCAPES:
+            parts.append(_ESCAPES[c])
+            return pos + 1
+        if c == "u" and _HEX4.match(self.text, pos + 1):
+            code = int(self.text[pos + 1 : pos + 5], 16)
+            pos += 5
+            if 0xD800 <= code < 0xDC00 and self.text.startswith("\\u", pos):
+                low = _HEX4.match(self.text, pos + 2)
+                if low and 0xDC00 <= int(low.group(), 16) < 0xE000:
+                    code = (
+                        0x10000
+                        + ((code - 0xD800) << 10)
+                        + int(low.group(), 16)
+                        - 0xDC00
+                    )
+                    pos += 6
+            parts.append(chr(code))
+            return pos
+        self.note("bad_escape")
+        parts.append(c)
+        return pos + 1
+
+
+def _salvage(partial: Optional[dict]) -> Optional[dict]:
+    if partial and all(isinstance(partial.get(k), str) for k in _SALVAGE_KEYS):
+        return {k: partial[k] for k in _SALVAGE_KEYS}
+    return None
+
+
+def _decode(parser: _Parser, pos: int):
+    try:
+        return _DECODER.raw_decode(parser.text, pos)  # well-formed: C speed
+    except ValueError:
+        return parser.object(pos, 1)
+
+
+def parse(raw_text: str) -> tuple[Optional[dict], list[str]]:
+    """
+    (object, repairs) for the first recoverable JSON object in raw_text.
+    object is None when nothing could be recovered.
+    """
+    repairs: list[str] = []
+    parser = _Parser(raw_text or "", repairs)
+    text = parser.text
+    salvaged = None
+    pos = 0
+    while True:
+        m = _SEEK.search(text, pos)
+        if not m:
+            break
+        if text[pos : m.start()].strip():
+            parser.note("leading_text")
+        token = m.group()
+        if token == "```":
+            parser.note("code_fence")
+            pos = _FENCE_LANG.match(text, m.end()).end()
+            continue
+        if token != "{":
+            end = _THINK_END.search(text, m.end())
+            if end:
+                parser.note("think_block")
+                pos = end.end()
+            else:
+                pos = m.end()  # unclosed tag: scan its contents
+            continue
+        mark = len(repairs)
+        try:
+            obj, end = _decode(parser, m.start())
+        except _Fail as e:
+            rescued = None if salvaged else _salvage(e.partial)
+            if rescued:
+                salvaged = rescued
+            else:
+                del repairs[mark:]  # repairs of a discarded attempt
+            pos = m.start() + 1
+            continue
+        if text[end:].replace("```", "").strip():
+            parser.note("trailing_text")
+        return obj, repairs
+    if salvaged:
+        parser.note("salvaged_fields")
+        return salvaged, repairs
+    return None, repairs
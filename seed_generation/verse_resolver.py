@@ -14,7 +14,7 @@ Reusable by any pipeline script — no content-type assumptions.
 Usage:
     from verse_resolver import VerseResolver
 
-    # SQLite path is the only required argument
+    # SQLite path (plain or .gz) is the only required argument
     with VerseResolver("path/to/bible.db") as r:
         cita, texto, error = r.resolve("1 Corinthians 13:4-7")
     # On success : ("1 Korinther 13:4-7", "Die Liebe ist...", None)
@@ -23,6 +23,12 @@ Usage:
     # Optional: supply a local bible_books.json to avoid a network fetch
     with VerseResolver("path/to/bible.db", books_sot_path="devocionales_scripts/bible_books.json") as r:
         cita, texto, error = r.resolve("John 3:16")
+
+    # Many references (e.g. a whole year of seeds): preload the DB once and
+    # resolve in a batch — no SQLite round-trip per reference. A
+    # bible_db.connection_factory() can stand in for the path.
+    with VerseResolver(bible_db.connection_factory("Bibles/ES/RVR1960_es.SQLite3.gz"), preload=True) as r:
+        results = r.resolve_many(["John 3:16", "Psalm 23:1-3"])
 """
 
 import json
@@ -30,6 +36,11 @@ import os
 import re
 import sqlite3
 import urllib.request
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Callable
+
+import bible_db
 
 # ─────────────────────────────────────────────────────────────────────────────
 # CONSTANTS
@@ -43,6 +54,9 @@ BOOKS_SOT_URL = (
 # Devanagari digit → ASCII digit (for Hindi references)
 _DEVA = str.maketrans("०१२३४५६७८९", "0123456789")
 
+# Verse text cleanup: XML tags and circled / parenthesised ref markers
+_MARKUP = re.compile(r"<[^>]+>|[\u2460-\u24FF]")
+
 # Module-level cache — fetched once per Python process
 _books_sot_cache: dict | None = None
 
@@ -133,11 +147,76 @@ def fetch_text(
     rows = cursor.fetchall()
     if not rows:
         return None
-    combined = " ".join(r[0] for r in rows)
-    combined = re.sub(r"<[^>]+>", "", combined)  # strip XML tags
-    combined = re.sub(r"[\u2460-\u24FF]", "", combined)  # strip Unicode ref markers
-    combined = re.sub(r"\s+", " ", combined).strip()
-    return combined
+    return clean_text(r[0] for r in rows)
+
+
+def clean_text(texts) -> str:
+    """Join raw verse texts and strip XML tags / ref markers / extra spaces."""
+    return " ".join(_MARKUP.sub("", " ".join(texts)).split())
+
+
+def _joined(texts: list[str]) -> str | None:
+    """clean_text for a non-empty row list, None (not found) otherwise."""
+    return clean_text(texts) if texts else None
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# IN-MEMORY VERSE INDEX
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+class VerseIndex:
+    """
+    The whole `verses` table held in memory.
+
+    All verse texts sit back to back in one string; row i spans
+    text[offsets[i]:offsets[i + 1]] and has verse number verses[i].
+    chapters maps (book_number, chapter) → (first_row, end_row), rows ordered
+    by verse, so a range lookup is two bisects and a few slices.
+    """
+
+    def __init__(self, cursor: sqlite3.Cursor) -> None:
+        self.chapters: dict[tuple[int, int], tuple[int, int]] = {}
+        self.verses = array("I")
+        self.offsets = array("I", [0])
+        parts: list[str] = []
+        pos = 0
+        key, start = None, 0
+        cursor.execute(
+            "SELECT book_number, chapter, verse, text FROM verses "
+            "ORDER BY book_number, chapter, verse"
+        )
+        for book_number, chapter, verse, text in cursor:
+            row_key = (int(book_number), int(chapter))
+            if row_key != key:
+                if key is not None:
+                    self.chapters[key] = (start, len(self.verses))
+                key, start = row_key, len(self.verses)
+            text = text or ""
+            parts.append(text)
+            pos += len(text)
+            self.offsets.append(pos)
+            self.verses.append(int(verse))
+        if key is not None:
+            self.chapters[key] = (start, len(self.verses))
+        self.text = "".join(parts)
+
+    def __len__(self) -> int:
+        return len(self.verses)
+
+    def lookup(
+        self, book_number: int, chapter: int, v_start: int, v_end: int
+    ) -> tuple[list[str], int | None]:
+        """(raw texts of v_start..v_end, highest verse in the chapter)."""
+        start, end = self.chapters.get((book_number, chapter), (0, 0))
+        if start == end:
+            return [], None
+        lo = bisect_left(self.verses, v_start, start, end)
+        hi = bisect_right(self.verses, v_end, start, end)
+        texts = [
+            self.text[self.offsets[i] : self.offsets[i + 1]] for i in range(lo, hi)
+        ]
+        return texts, self.verses[end - 1]
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -152,14 +231,19 @@ class VerseResolver:
 
     Book numbers come from the bible_books.json SOT (EN name → book_number).
     Native book names are read directly from the DB's `books` table, so no
-    per-language mapping file is needed.
+    per-language mapping file is needed; each is queried once and cached.
 
     Parameters
     ----------
-    sqlite_path    : path to SQLite Bible database
+    sqlite_path    : path to SQLite Bible database (plain or .gz, opened
+                     read-only through bible_db), or a zero-argument
+                     connection factory such as bible_db.connection_factory()
     books_sot_path : optional path to a local bible_books.json for offline use;
                      if absent, the SOT is fetched from BOOKS_SOT_URL once and
                      cached for the lifetime of the process.
+    preload        : read the `verses` and `books` tables into memory once
+                     (VerseIndex); every later lookup is a bisect, no query.
+                     Worth it when resolving hundreds of references.
 
     Example
     -------
@@ -171,12 +255,20 @@ class VerseResolver:
 
     def __init__(
         self,
-        sqlite_path: str,
+        sqlite_path: str | Callable[[], sqlite3.Connection],
         books_sot_path: str | None = None,
+        preload: bool = False,
     ) -> None:
         self.books_sot = load_books_sot(books_sot_path)
-        self.conn = sqlite3.connect(sqlite_path)
+        if callable(sqlite_path):
+            self.conn = sqlite_path()
+        else:
+            self.conn = bible_db.open_bible(sqlite_path)
         self.cursor = self.conn.cursor()
+        self._native_names: dict[int, str | None] = {}
+        self.index: VerseIndex | None = None
+        if preload:
+            self.preload()
 
     # ── context manager support ───────────────────────────────────────────────
 
@@ -187,31 +279,104 @@ class VerseResolver:
         self.close()
 
     def close(self) -> None:
-        """Close the SQLite connection."""
+        """Close the SQLite connection (a preloaded index stays usable)."""
         if self.conn:
             self.conn.close()
             self.conn = None
             self.cursor = None
 
+    def preload(self) -> None:
+        """Read the verses and native book names into memory (idempotent)."""
+        if self.index is not None:
+            return
+        self.index = VerseIndex(self.cursor)
+        try:
+            self.cursor.execute("SELECT book_number, long_name FROM books")
+            for book_number, long_name in self.cursor.fetchall():
+                self._native_names[int(book_number)] = long_name or None
+        except sqlite3.OperationalError:
+            pass  # `books` table absent in some minimal DB builds
+
     # ── internal helpers ──────────────────────────────────────────────────────
 
     def _native_book_name(self, book_number: int, fallback: str) -> str:
         """
-        Query the DB's `books` table for the long_name of this book_number.
+        Look up the DB's `books` table for the long_name of this book_number.
         Returns fallback (the EN book name) if the table is absent or the
         row is missing — ensuring citation building never fails silently.
         """
-        try:
-            self.cursor.execute(
-                "SELECT long_name FROM books WHERE book_number = ?",
-                (book_number,),
+        if book_number not in self._native_names and self.index is None:
+            name = None
+            try:
+                self.cursor.execute(
+                    "SELECT long_name FROM books WHERE book_number = ?",
+                    (book_number,),
+                )
+                row = self.cursor.fetchone()
+                name = row[0] if row and row[0] else None
+            except sqlite3.OperationalError:
+                pass  # `books` table absent in some minimal DB builds
+            self._native_names[book_number] = name
+        return self._native_names.get(book_number) or fallback
+
+    def _range_rows(
+        self, book_number: int, chapter: int, v_start: int, v_end: int
+    ) -> list[tuple[int, str]]:
+        """[(verse, raw_text), ...] for v_start..v_end of one chapter."""
+        self.cursor.execute(
+            "SELECT verse, text FROM verses "
+            "WHERE book_number=? AND chapter=? AND verse>=? AND verse<=? "
+            "ORDER BY verse",
+            (book_number, chapter, v_start, v_end),
+        )
+        return [(int(v), t) for v, t in self.cursor.fetchall()]
+
+    def _max_verse(self, book_number: int, chapter: int) -> int | None:
+        self.cursor.execute(
+            "SELECT MAX(verse) FROM verses WHERE book_number=? AND chapter=?",
+            (book_number, chapter),
+        )
+        row = self.cursor.fetchone()
+        return row[0] if row else None
+
+    def _parse(self, cita_en: str) -> tuple[tuple[int, int, int, int, str] | None, str]:
+        """((book_number, chapter, v_start, v_end, book_en), "") or (None, reason)."""
+        parsed = parse_en_ref(cita_en)
+        if parsed is None:
+            return None, f"could not parse reference: '{cita_en}'"
+
+        book_en, chapter, v_start, v_end = parsed
+
+        # Confirm EN book name against SOT and get book_number
+        book_number = self.books_sot.get(book_en)
+        if book_number is None:
+            return None, f"unknown book: '{book_en}' — not in bible_books.json SOT"
+        return (book_number, chapter, v_start, v_end, book_en), ""
+
+    def _build(
+        self,
+        cita_en: str,
+        parsed: tuple[int, int, int, int, str],
+        texto: str | None,
+        max_verse: int | None,
+    ) -> tuple[str | None, str | None, str | None]:
+        """Citation + text, or the "verse not found" reason when texto is None."""
+        book_number, chapter, v_start, v_end, book_en = parsed
+
+        # Get native book name directly from the DB (no manual mapping needed)
+        local_name = self._native_book_name(book_number, fallback=book_en)
+
+        range_suffix = f"{v_start}-{v_end}" if v_start != v_end else str(v_start)
+        if texto is None:
+            return (
+                None,
+                None,
+                (
+                    f"verse not found: '{cita_en}' → {local_name} {chapter}:{range_suffix} "
+                    f"(chapter has {max_verse or 'unknown'} verses)"
+                ),
             )
-            row = self.cursor.fetchone()
-            if row and row[0]:
-                return row[0]
-        except sqlite3.OperationalError:
-            pass  # `books` table absent in some minimal DB builds
-        return fallback
+        return f"{local_name} {chapter}:{range_suffix}", texto, None
 
     # ── public API ────────────────────────────────────────────────────────────
 
@@ -236,45 +401,20 @@ class VerseResolver:
           - "unknown book: '...' — not in bible_books.json SOT"
           - "verse not found: '...' (chapter has N verses)"
         """
-        parsed = parse_en_ref(cita_en)
+        parsed, reason = self._parse(cita_en)
         if parsed is None:
-            return None, None, f"could not parse reference: '{cita_en}'"
-
-        book_en, chapter, v_start, v_end = parsed
-
-        # Confirm EN book name against SOT and get book_number
-        book_number = self.books_sot.get(book_en)
-        if book_number is None:
-            return (
-                None,
-                None,
-                f"unknown book: '{book_en}' — not in bible_books.json SOT",
-            )
+            return None, None, reason
 
-        # Get native book name directly from the DB (no manual mapping needed)
-        local_name = self._native_book_name(book_number, fallback=book_en)
+        book_number, chapter, v_start, v_end, _ = parsed
+        if self.index is not None:
+            texts, max_verse = self.index.lookup(book_number, chapter, v_start, v_end)
+            return self._build(cita_en, parsed, _joined(texts), max_verse)
 
         texto = fetch_text(self.cursor, book_number, chapter, v_start, v_end)
-        if texto is None:
-            self.cursor.execute(
-                "SELECT MAX(verse) FROM verses WHERE book_number=? AND chapter=?",
-                (book_number, chapter),
-            )
-            row = self.cursor.fetchone()
-            max_verse = row[0] if row and row[0] else "unknown"
-            range_str = f"{v_start}-{v_end}" if v_start != v_end else str(v_start)
-            return (
-                None,
-                None,
-                (
-                    f"verse not found: '{cita_en}' → {local_name} {chapter}:{range_str} "
-                    f"(chapter has {max_verse} verses)"
-                ),
-            )
-
-        range_suffix = f"{v_start}-{v_end}" if v_start != v_end else str(v_start)
-        local_cita = f"{local_name} {chapter}:{range_suffix}"
-        return local_cita, texto, None
+        if texto is not None:
+            return self._build(cita_en, parsed, texto, None)
+        max_verse = self._max_verse(book_number, chapter)
+        return self._build(cita_en, parsed, None, max_verse)
 
     def resolve_many(
         self,
@@ -283,13 +423,43 @@ class VerseResolver:
         """
         Resolve a list of English references in one call.
 
-        Returns list of dicts:
+        References are grouped by (book, chapter): each group costs one query
+        over the union of its verse ranges (none with preload), plus one
+        MAX(verse) query only if a reference in it is not found.
+
+        Returns list of dicts, in the order of refs:
           {"ref": original, "cita": local_cita, "texto": texto, "error": None}
           {"ref": original, "cita": None,       "texto": None,  "error": reason}
         """
+        parsed_refs = [self._parse(ref) for ref in refs]
+
+        rows: dict[tuple[int, int], list[tuple[int, str]]] = {}
+        max_verses: dict[tuple[int, int], int | None] = {}
+        if self.index is None:
+            spans: dict[tuple[int, int], list[int]] = {}
+            for parsed, _ in parsed_refs:
+                if parsed is not None:
+                    span = spans.setdefault(parsed[:2], [parsed[2], parsed[3]])
+                    span[0] = min(span[0], parsed[2])
+                    span[1] = max(span[1], parsed[3])
+            for key, (lo, hi) in spans.items():
+                rows[key] = self._range_rows(*key, lo, hi)
+
         results = []
-        for ref in refs:
-            cita, texto, error = self.resolve(ref)
+        for ref, (parsed, reason) in zip(refs, parsed_refs):
+            if parsed is None:
+                cita, texto, error = None, None, reason
+            elif self.index is not None:
+                texts, max_verse = self.index.lookup(*parsed[:4])
+                cita, texto, error = self._build(ref, parsed, _joined(texts), max_verse)
+            else:
+                key, v_start, v_end = parsed[:2], parsed[2], parsed[3]
+                texts = [t for v, t in rows[key] if v_start <= v <= v_end]
+                if not texts and key not in max_verses:
+                    max_verses[key] = self._max_verse(*key)
+                cita, texto, error = self._build(
+                    ref, parsed, _joined(texts), max_verses.get(key)
+                )
             results.append(
                 {
                     "ref": ref,
@@ -302,5 +472,7 @@ class VerseResolver:
 
     def verse_count(self) -> int:
         """Return total number of verses in the connected DB."""
+        if self.index is not None:
+            return len(self.index)
         self.cursor.execute("SELECT COUNT(*) FROM verses")
         return self.cursor.fetchone()[0]